@@ -1,4 +1,8 @@
 import os
+import json
+import time
+import uuid
+import tempfile
 import subprocess
 import Deadline.Events
 
@@ -44,7 +48,8 @@ class AvalonIntegrateOnJobFinish(Deadline.Events.DeadlineEventListener):
         if "AVALON_POST_TASK_SCRIPTS" in job_environ:
             post = job.GetJobExtraInfoKeyValue("AVALON_POST_TASK_SCRIPTS")
             if "publish_by_task" in post:
-                # Progressive publish job
+                # Progressive publish job, integrated by task
+                self.flush_to_daemon(job)
                 return
 
         print("Avalon job found, prepare to run publish..")
@@ -91,3 +96,48 @@ class AvalonIntegrateOnJobFinish(Deadline.Events.DeadlineEventListener):
         print(output)
         if popen.returncode != 0:
             raise Exception("Publish failed, see log..")
+
+    def flush_to_daemon(self, job):
+        """Let integration daemon integrate pending outputs of this job now
+
+        Progressive task outputs queued in integration daemon are held for
+        merging, flush them when the job finished. The request is written
+        in the format of `reveries.integration.Spool.enqueue` without
+        importing reveries in this process. Return False if daemon is not
+        running on this slave.
+
+        """
+        root = (job.GetJobEnvironmentKeyValue("PYBLISH_INTEGRATION_SPOOL")
+                or os.path.join(tempfile.gettempdir(), "reveries_spool"))
+
+        # See `reveries.integration.HEARTBEAT_TIMEOUT`
+        try:
+            mtime = os.path.getmtime(os.path.join(root, ".heartbeat"))
+        except OSError:
+            return False
+        if time.time() - mtime >= 60:
+            return False
+
+        environ = {
+            key: job.GetJobEnvironmentKeyValue(key)
+            for key in job.GetJobEnvironmentKeys()
+            if key.startswith(("AVALON_", "PYBLISH_"))
+        }
+        request = {
+            "dump": environ["PYBLISH_DUMP_FILE"],
+            "update": [],
+            "progress": -1,
+            "jobid": job.JobId,
+            "flush": True,
+            "environ": environ,
+            "time": time.time(),
+        }
+
+        name = "%.6f.%s" % (request["time"], uuid.uuid4().hex)
+        tmp = os.path.join(root, name + ".tmp")
+        with open(tmp, "w") as file:
+            json.dump(request, file)
+        os.rename(tmp, os.path.join(root, name + ".json"))
+
+        print("Avalon job flushed to integration daemon.")
+        return True
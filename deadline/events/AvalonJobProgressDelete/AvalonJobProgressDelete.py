@@ -1,5 +1,6 @@
 import os
 import json
+import gzip
 import Deadline.Events
 
 
@@ -11,6 +12,19 @@ def CleanupDeadlineEventListener(eventListener):
     eventListener.Cleanup()
 
 
+def load_dump(path):
+    # Plain JSON or compact (gzip'd) dump, see `reveries.dumps`
+    with open(path, "rb") as file:
+        compact = file.read(2) == b"\x1f\x8b"
+
+    if not compact:
+        with open(path, "r") as file:
+            return json.load(file)
+
+    with gzip.open(path, "rb") as file:
+        return json.loads(file.read().decode("utf-8"))["data"]
+
+
 class AvalonJobProgressDelete(Deadline.Events.DeadlineEventListener):
 
     def __init__(self):
@@ -47,16 +61,14 @@ class AvalonJobProgressDelete(Deadline.Events.DeadlineEventListener):
         if not os.path.isfile(dumpfile):
             raise Exception("Instance dump file not found: %s" % dumpfile)
 
-        with open(dumpfile, "r") as file:
-            instance_dump = json.load(file)
+        instance_dump = load_dump(dumpfile)
 
         dumpfile = instance_dump["contextDump"]
 
         if not os.path.isfile(dumpfile):
             raise Exception("Context dump file not found: %s" % dumpfile)
 
-        with open(dumpfile, "r") as file:
-            context_dump = json.load(file)
+        context_dump = load_dump(dumpfile)
 
         for instance in context_dump["instances"]:
             if instance["id"] == instance_dump["id"]:
@@ -1,6 +1,5 @@
 
 import os
-import json
 import pyblish.api
 
 
@@ -10,6 +9,10 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
     Update context and create instances from a JSON format dump file which
     acquired from `sys.argv[1]`.
 
+    Both plain and compact (gzip'd) dumps are supported. When collecting
+    from instance dump, only that instance and its child instances' dumps
+    will be loaded.
+
     """
 
     label = "Collect Instances From Dump"
@@ -17,6 +20,8 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
     hosts = ["filesys"]
 
     def process(self, context):
+        from reveries import dumps
+
         dump_path = context.data.get("_pyblishDumpFile")
         if not dump_path:
             self.log.warning("Did not provide context/instance dump file.")
@@ -24,7 +29,7 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
 
         dump_file = os.path.basename(dump_path)
 
-        if not dump_file.endswith(".json"):
+        if not dumps.is_dump_file(dump_file):
             raise Exception("Invalid file extension: %s" % dump_path)
 
         if dump_file.startswith(".instance."):
@@ -37,10 +42,12 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
             raise Exception("Unknown type of file: %s" % dump_path)
 
     def parse_instance(self, context, dump_path):
+        from reveries import dumps
 
-        with open(dump_path, "r") as file:
-            dump = json.load(file)
-        context = self.parse_context(context, dump["contextDump"])
+        dump = dumps.read(dump_path)
+        context = self.parse_context(context,
+                                     dump["contextDump"],
+                                     root=dump)
 
         instance = next(i for i in context if i.data["dumpId"] == dump["id"])
         children = instance.data["childInstances"]
@@ -51,6 +58,7 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
                 context.remove(other)
 
         for key in ["_progressiveStep",
+                    "_progressiveSteps",
                     "_progressiveOutput",
                     "deadlineJobId"]:
             if key in context.data:
@@ -58,37 +66,67 @@ class CollectInstancesFromDump(pyblish.api.ContextPlugin):
                 # main instance.
                 instance.data[key] = context.data.pop(key)
 
-    def parse_context(self, context, dump_path):
+    def parse_context(self, context, dump_path, root=None):
+        """Create instances from context dump
+
+        Arguments:
+            context (pyblish.api.Context): Context to collect into
+            dump_path (str): Context dump file path
+            root (dict, optional): Loaded instance dump, if given, only
+                that instance and its child instances are created
+
+        """
+        from reveries import dumps
+
+        context_dump = dumps.read(dump_path)
+
+        context.data.update({
+            "user": context_dump["by"],
+            "date": context_dump["date"],
+            "currentMaking": context_dump["from"],
+            "comment": context_dump["comment"],
+        })
+
+        instances = context_dump["instances"]
+        loaded = dict()
+
+        if root is not None:
+            loaded[root["id"]] = root
 
-        with open(dump_path, "r") as file:
-            context_dump = json.load(file)
+            # Lazy load, only walk down from the root instance
+            children = dict((dump["id"], dump["childInstances"])
+                            for dump in instances)
+            wanted = set()
+            stack = [root["id"]]
+            while stack:
+                instance_id = stack.pop()
+                if instance_id not in wanted:
+                    wanted.add(instance_id)
+                    stack.extend(children[instance_id])
 
-            context.data.update({
-                "user": context_dump["by"],
-                "date": context_dump["date"],
-                "currentMaking": context_dump["from"],
-                "comment": context_dump["comment"],
-            })
+            instances = [dump for dump in instances if dump["id"] in wanted]
 
         instance_by_id = dict()
 
-        for dump in context_dump["instances"]:
-            with open(dump["dump"], "r") as file:
-                dump.update(json.load(file))
+        for dump in instances:
+            if dump["id"] in loaded:
+                dump.update(loaded[dump["id"]])
+            else:
+                dump.update(dumps.read(dump["dump"]))
 
-                previous_id = dump.pop("id")
-                child_ids = dump.pop("childInstances")
-                version_num = dump.pop("version")
+            previous_id = dump.pop("id")
+            child_ids = dump.pop("childInstances")
+            version_num = dump.pop("version")
 
-                instance = context.create_instance(dump["name"])
-                instance_by_id[previous_id] = instance
+            instance = context.create_instance(dump["name"])
+            instance_by_id[previous_id] = instance
 
-                instance.data.update(dump)
+            instance.data.update(dump)
 
-                instance.data["versionPin"] = version_num
-                instance.data["dumpId"] = previous_id
-                instance.data["childIds"] = child_ids
-                instance.data["childInstances"] = list()
+            instance.data["versionPin"] = version_num
+            instance.data["dumpId"] = previous_id
+            instance.data["childIds"] = child_ids
+            instance.data["childInstances"] = list()
 
         for instance in context:
             children = instance.data["childInstances"]
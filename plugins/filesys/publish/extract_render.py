@@ -16,6 +16,7 @@ class ExtractRender(pyblish.api.InstancePlugin):
     ]
 
     def process(self, instance):
+        from reveries import lib
 
         staging_dir = instance.data["stagingDir"]
 
@@ -23,7 +24,6 @@ class ExtractRender(pyblish.api.InstancePlugin):
         is_stereo = instance.data["isStereo"]
 
         sequence = dict()
-        patterns = list()
         start = None
         end = None
         for aov_name, data in sequence_data.items():
@@ -37,22 +37,40 @@ class ExtractRender(pyblish.api.InstancePlugin):
                 "fpattern": pattern,
             }
 
-            if is_stereo:
-                patterns.append(pattern.format(stereo="Left"))
-                patterns.append(pattern.format(stereo="Right"))
-            else:
-                patterns.append(pattern)
-
         hardlinks = list()
         missing = False
-        for fname in patterns:
-            for frame_num in range(start, end + 1):
-                full_path = os.path.join(staging_dir, fname % frame_num)
-                if os.path.isfile(full_path):
-                    hardlinks.append(fname % frame_num)
+        for aov_name, data in sequence_data.items():
+            pattern = data["fpattern"]
+            ranges = data.get("frameRanges")
+
+            if is_stereo or ranges is None:
+                # No frame index, or only one side of stereo pair has
+                # been indexed
+                if is_stereo:
+                    patterns = [pattern.format(stereo="Left"),
+                                pattern.format(stereo="Right")]
                 else:
-                    print("%s not exists, skip." % full_path)
-                    missing = True
+                    patterns = [pattern]
+
+                for fname in patterns:
+                    for frame_num in range(start, end + 1):
+                        full_path = os.path.join(staging_dir,
+                                                 fname % frame_num)
+                        if os.path.isfile(full_path):
+                            hardlinks.append(fname % frame_num)
+                        else:
+                            print("%s not exists, skip." % full_path)
+                            missing = True
+                continue
+
+            index = lib.FrameIndex(ranges)
+            hardlinks += [pattern % frame_num for frame_num in index
+                          if start <= frame_num <= end]
+
+            for head, tail in index.gaps(start, end):
+                print("%s frame %d-%d not exists, skip."
+                      % (os.path.join(staging_dir, pattern), head, tail))
+                missing = True
 
         if missing:
             self.log.warning("Some files missing, sequence may incomplete. "
@@ -41,6 +41,7 @@ class RemoveOutdatedProgress(pyblish.api.InstancePlugin):
         repr_dirs = parse_src_dst_dirs(instance)
 
         outdated = set()
+        rerendered = set()
         not_matched = set()
 
         for file in progress:
@@ -53,6 +54,7 @@ class RemoveOutdatedProgress(pyblish.api.InstancePlugin):
                 old = os.path.join(dst, tail).replace("\\", "/")
                 if os.path.isfile(old):
                     outdated.add(old)
+                    rerendered.add(file)
 
                 break
 
@@ -71,7 +73,16 @@ class RemoveOutdatedProgress(pyblish.api.InstancePlugin):
             raise FileNotFoundError("Progress output file not matched.")
 
         if outdated:
-            instance.data["_progressiveStep"] = 0
+            steps = instance.data.get("_progressiveSteps")
+            if steps:
+                # Merged progress (integration daemon), only requests that
+                # re-rendered are not counted
+                step = sum(count for files, count in steps
+                           if not rerendered.intersection(
+                               file.replace("\\", "/") for file in files))
+            else:
+                step = 0
+            instance.data["_progressiveStep"] = step
 
         # Try Remove
 
@@ -0,0 +1,47 @@
+
+import pyblish.api
+
+
+class ValidateRenderEmptyFrames(pyblish.api.InstancePlugin):
+    """No zero-byte frame in render sequences
+
+    Zero-byte frames are recorded while seqparser scanning the sequences,
+    only those frames will be checked again here.
+
+    """
+
+    label = "Render Empty Frames"
+    order = pyblish.api.ValidatorOrder + 0.1
+    hosts = ["filesys"]
+    targets = [
+        "seqparser",
+    ]
+    families = [
+        "reveries.renderlayer"
+    ]
+
+    def process(self, instance):
+        import os
+
+        staging_dir = instance.data["stagingDir"]
+        is_stereo = instance.data["isStereo"]
+
+        invalid = list()
+        for aov_name, data in instance.data["sequences"].items():
+            pattern = data["fpattern"]
+            if is_stereo:
+                patterns = [pattern.format(stereo="Left"),
+                            pattern.format(stereo="Right")]
+            else:
+                patterns = [pattern]
+
+            for frame_num in data.get("emptyFrames", []):
+                for fname in patterns:
+                    path = os.path.join(staging_dir, fname % frame_num)
+                    if os.path.isfile(path) and not os.path.getsize(path):
+                        invalid.append(path)
+
+        if invalid:
+            for path in invalid:
+                self.log.error("Zero-byte frame: %s" % path)
+            raise Exception("Found %d zero-byte frames." % len(invalid))
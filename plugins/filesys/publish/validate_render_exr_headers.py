@@ -0,0 +1,86 @@
+import pyblish.api
+
+
+class ValidateRenderEXRHeaders(pyblish.api.InstancePlugin):
+    """EXR frames in one sequence have the same header
+
+    Channels, display window and compression of each frame should be the
+    same as the first frame. Frames could be different if render settings
+    changed in the middle of rendering, or the frame was not fully written.
+
+    Data window only gets a warning, it changes with what is in view when
+    rendering with auto-crop.
+
+    Zero-byte frames are skipped, they are reported by
+    `ValidateRenderEmptyFrames`.
+
+    """
+
+    label = "Render EXR Headers"
+    order = pyblish.api.ValidatorOrder + 0.1
+    hosts = ["filesys"]
+    targets = [
+        "seqparser",
+    ]
+    families = [
+        "reveries.renderlayer"
+    ]
+
+    warn_only = [
+        "dataWindow",
+    ]
+
+    def process(self, instance):
+        import os
+        from reveries import lib
+        from reveries.vendor import parse_exr_header as exrheader
+
+        staging_dir = instance.data["stagingDir"]
+        is_stereo = instance.data["isStereo"]
+
+        invalid = False
+        for aov_name, data in instance.data["sequences"].items():
+            pattern = data["fpattern"]
+            if not pattern.lower().endswith(".exr"):
+                continue
+
+            if is_stereo:
+                patterns = [pattern.format(stereo="Left"),
+                            pattern.format(stereo="Right")]
+            else:
+                patterns = [pattern]
+
+            empty = set(data.get("emptyFrames", []))
+            ranges = data.get("frameRanges")
+            if ranges:
+                frames = [frame for frame in lib.FrameIndex(ranges)
+                          if frame not in empty]
+            else:
+                frames = range(data["start"], data["end"] + 1)
+
+            for fname in patterns:
+                paths = [os.path.join(staging_dir, fname % frame)
+                         for frame in frames]
+                if not ranges:
+                    # Collected without present frames, check on disk
+                    paths = [path for path in paths
+                             if os.path.isfile(path)
+                             and os.path.getsize(path)]
+
+                summary = exrheader.summarize_sequence(paths)
+
+                for path in summary["failed"]:
+                    self.log.error("[%s] EXR header unreadable: %s"
+                                   % (aov_name, path))
+                    invalid = True
+
+                for path, keys in sorted(summary["differ"].items()):
+                    failed = [key for key in keys
+                              if key not in self.warn_only]
+                    report = self.log.error if failed else self.log.warning
+                    report("[%s] EXR header differs from first frame in "
+                           "%s: %s" % (aov_name, ", ".join(keys), path))
+                    invalid = invalid or bool(failed)
+
+        if invalid:
+            raise Exception("Found EXR frames with inconsistent header.")
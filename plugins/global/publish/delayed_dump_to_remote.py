@@ -4,7 +4,7 @@ import json
 import pyblish.api
 import avalon.api
 from avalon import io
-from reveries import lib, filesys
+from reveries import lib, filesys, extraction, dumps as dumpfile
 
 
 class PyblishEncoder(json.JSONEncoder):
@@ -18,8 +18,8 @@ class PyblishEncoder(json.JSONEncoder):
             return str(obj)
 
 
-def json_dump(dump, file):
-    json.dump(dump, file, indent=4, sort_keys=True, cls=PyblishEncoder)
+def json_dump(dump, path):
+    dumpfile.write(path, dump, cls=PyblishEncoder)
 
 
 class DelayedDumpToRemote(pyblish.api.ContextPlugin):
@@ -36,6 +36,9 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
     context dump file (JSON) and start validating extracted files and publish
     them.
 
+    Set `PYBLISH_COMPACT_DUMP` to write gzip'd compact dumps instead of
+    indented JSON (see `reveries.dumps`).
+
     """
 
     order = pyblish.api.ExtractorOrder + 0.491
@@ -70,14 +73,16 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
 
             extractors = [(key.split(".")[1], value)
                           for key, value in instance.data.items()
-                          if re.match(r"repr\.[a-zA-Z_]*\._delayRun", key)
-                          and not value.get("done")]
+                          if re.match(r"repr\.[a-zA-Z_]*\._delayRun", key)]
+            done = [name for name, value in extractors if value.get("done")]
+            extractors = [(name, value) for name, value in extractors
+                          if name not in done]
             extractors.sort(key=lambda t: t[1].get("order", -1))
 
             if not extractors:
                 continue
             self.log.info("Dumping instance %s .." % instance)
-            dump_path, dump = self.instance_dump(instance, extractors)
+            dump_path, dump = self.instance_dump(instance, extractors, done)
             dumps[instance.name] = (dump_path, dump)
 
             instance.data["dumpPath"] = dump_path
@@ -91,12 +96,12 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
         outpath = self.CONTEXT_DUMP.format(filesys=root,
                                            user=dump_user,
                                            oid=dump_id)
+        outpath = dumpfile.dump_path(outpath)
 
         for name, (dump_path, dump) in dumps.items():
             dump["contextDump"] = outpath
 
-            with open(dump_path, "w") as file:
-                json_dump(dump, file)
+            json_dump(dump, dump_path)
             self.log.debug("Instance %s dumped to '%s'" % (name, dump_path))
 
         # Dump context
@@ -130,14 +135,20 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
         if not os.path.isdir(outdir):
             os.makedirs(outdir)
 
-        with open(outpath, "w") as file:
-            json_dump(dump, file)
+        json_dump(dump, outpath)
         self.log.debug("Context dumped to '%s'" % outpath)
 
-    def instance_dump(self, instance, extractors):
+    def instance_dump(self, instance, extractors, done=None):
 
         instance.data["dumpedExtractors"] = list()
 
+        graph = extraction.dependencies(extractors, done=done)
+        outpaths = dict(
+            (repr_name, dumpfile.dump_path(self.EXTRACTOR_DUMP.format(
+                stage=instance.data["repr.%s._stage" % repr_name])))
+            for repr_name, _ in extractors
+        )
+
         # Dump extractors
         for repr_name, extractor in extractors:
 
@@ -150,16 +161,20 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
                 "func": func.__name__,
                 "args": args,
                 "kwargs": kwargs,
+                "name": repr_name,
+                "order": extractor.get("order", -1),
+                # Remote runner reads dumps by path
+                "dependsOn": [outpaths[name] for name in graph[repr_name]],
+                "status": extraction.PENDING,
             }
 
             stage_dir = instance.data["repr.%s._stage" % repr_name]
-            outpath = self.EXTRACTOR_DUMP.format(stage=stage_dir)
+            outpath = outpaths[repr_name]
 
             if not os.path.isdir(stage_dir):
                 os.makedirs(stage_dir)
 
-            with open(outpath, "w") as file:
-                json_dump(dump, file)
+            json_dump(dump, outpath)
 
             instance.data["dumpedExtractors"].append(outpath)
 
@@ -194,7 +209,7 @@ class DelayedDumpToRemote(pyblish.api.ContextPlugin):
 
         version_dir = instance.data["versionDir"]
         outpath = self.INSTANCE_DUMP.format(version=version_dir)
-        outpath = outpath.replace("\\", "/")
+        outpath = dumpfile.dump_path(outpath.replace("\\", "/"))
 
         return outpath, dump
 
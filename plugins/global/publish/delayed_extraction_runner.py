@@ -1,12 +1,15 @@
-
-import sys
 import re
-import traceback
+import sys
 import pyblish.api
 
 
 class DelayedExtractionRunner(pyblish.api.InstancePlugin):
     """Consume and execute delayed extractors
+
+    Extractors are run by their dependencies (see
+    `reveries.extraction.dependencies`), each one with timing recorded
+    into its `_delayRun` entry.
+
     """
 
     order = pyblish.api.ExtractorOrder + 0.49
@@ -15,6 +18,8 @@ class DelayedExtractionRunner(pyblish.api.InstancePlugin):
     targets = ["localhost"]
 
     def process(self, instance):
+        from reveries import extraction
+
         context = instance.context
         # Skip if any error occurred
         if not all(result["success"] for result in context.data["results"]):
@@ -25,8 +30,14 @@ class DelayedExtractionRunner(pyblish.api.InstancePlugin):
                       for key, value in instance.data.items()
                       if re.match(r"repr\.[a-zA-Z_]*\._delayRun", key)]
         extractors.sort(key=lambda t: t[1].get("order", -1))
+        extractors = dict(extractors)
 
-        for repr_name, extractor in extractors:
+        graph = extraction.dependencies(list(extractors.items()))
+        done = [name for name, ext in extractors.items() if ext.get("done")]
+        errors = dict()
+
+        def execute(repr_name):
+            extractor = extractors[repr_name]
 
             func = extractor["func"]
             args = extractor.get("args", list())
@@ -34,21 +45,31 @@ class DelayedExtractionRunner(pyblish.api.InstancePlugin):
 
             self.log.info("Running extractor [%s] for [%s] to [%s]..."
                           % (func.__name__, instance, repr_name))
-
             try:
                 func(*args, **kwargs)
-            except Exception as e:
-                err_msg = "{file}, line {line}, in {func}: {err}"
-
-                _, _, tb = sys.exc_info()
-                last_callstack = traceback.extract_tb(tb)[-1]
-                lineno = last_callstack[1]
-
-                errMsg = err_msg.format(file=func.im_class.__module__,
-                                        line=lineno,
-                                        func=func.__name__,
-                                        err=str(e))
-                self.log.critical(errMsg)
-                raise Exception("Extraction failed, see log for deatil.")
-            else:
+            except Exception:
+                errors[repr_name] = extraction.format_error(
+                    func.__name__,
+                    func.im_class.__module__,
+                    sys.exc_info())
+                raise
+
+        def on_finish(repr_name, result):
+            extractor = extractors[repr_name]
+            extractor["seconds"] = result["seconds"]
+            if result["status"] == extraction.DONE:
                 extractor["done"] = True
+
+        # Maya/Houdini commands must run in main thread of this session,
+        # so extractors run one by one here.
+        runner = extraction.ExtractionRunner(execute,
+                                             on_finish=on_finish,
+                                             logger=self.log)
+        results = runner.run(graph, done=done)
+
+        failed = [name for name, result in results.items()
+                  if result["status"] != extraction.DONE]
+        if failed:
+            for repr_name in sorted(errors):
+                self.log.critical(errors[repr_name])
+            raise Exception("Extraction failed, see log for deatil.")
@@ -134,6 +134,7 @@ class ExtractAssumedDestination(pyblish.api.InstancePlugin):
         keep = [
             self.LOCK,
             ".instance.json",  # Instance dump file
+            ".instance.json.gz",  # Compact instance dump file
         ]
 
         for item in os.listdir(path):
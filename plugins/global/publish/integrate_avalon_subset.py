@@ -1,11 +1,8 @@
 
 import os
-import shutil
-
-import errno
 import pyblish.api
 from avalon import api, io
-from avalon.vendor import filelink
+from reveries.transfer import FileTransfer
 
 
 class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
@@ -37,6 +34,7 @@ class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
         self.is_progressive = None
         self.progress = 0
         self.progress_output = None
+        self.version_dir = None
         self.transfers = dict(files=list(),
                               hardlinks=list())
 
@@ -119,6 +117,9 @@ class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
         template_publish = instance.data["publishPathTemplate"]
         template_data = instance.data["publishPathTemplateData"]
 
+        self.version_dir = os.path.dirname(
+            template_publish.format(representation="", **template_data))
+
         for key in sorted(instance.data.keys()):
             if not key.startswith("repr."):
                 continue
@@ -170,11 +171,11 @@ class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
         if self.progress_output is None:
             progress_output = None
         else:
-            progress_output = [
+            progress_output = set(
                 os.path.abspath(
                     os.path.normpath(os.path.expandvars(file)))
                 for file in self.progress_output
-            ]
+            )
 
         # Write to disk
         #          _
@@ -187,7 +188,8 @@ class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
         #     \|________|
         #
 
-        transfered = list()
+        journal = os.path.join(self.version_dir, ".transfer.journal")
+        transfer = FileTransfer(journal=journal, logger=self.log)
 
         for job in self.transfers:
             transfers = self.transfers[job]
@@ -209,61 +211,14 @@ class IntegrateAvalonSubset(pyblish.api.InstancePlugin):
                             and src not in progress_output):
                         continue
 
-                print("Copying {0}: {1} \n"
-                      "          -> {2}".format(job, src, dst))
-
                 if src == dst:
                     self.log.debug("Source and destination are the same, "
                                    "will not copy.")
                     continue
 
-                if dst in transfered:
-                    # (TODO) Should not implement like this. This is a hot-fix.
-                    self.log.warning("File transfered: %s" % dst)
-                    continue
-
-                if job == "files":
-                    self.copy_file(src, dst)
-                if job == "hardlinks":
-                    self.hardlink_file(src, dst)
+                transfer.add(job, src, dst)
 
-                transfered.append(dst)
-
-    def copy_file(self, src, dst):
-        file_dir = os.path.dirname(dst)
-        if not os.path.isdir(file_dir):
-            try:
-                os.makedirs(file_dir)
-            except Exception as e:
-                self.log.warning("Makedir error: %s" % e)
-        try:
-            shutil.copy2(src, dst)
-        except OSError:
-            msg = "An unexpected error occurred."
-            self.log.critical(msg)
-            raise OSError(msg)
-
-    def hardlink_file(self, src, dst):
-        if os.path.isfile(dst):
-            self.log.warning("File exists, skip creating hardlink: %s" % dst)
-            return
-
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                raise
-
-        try:
-            filelink.create(src, dst, filelink.HARDLINK)
-        except OSError:
-            msg = "An unexpected error occurred."
-            self.log.critical(msg)
-            raise OSError(msg)
+        transfer.run()
 
     def get_subset(self, instance, families):
 
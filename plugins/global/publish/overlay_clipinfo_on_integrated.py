@@ -1,10 +1,19 @@
 
+import os
+import json
+import tempfile
 import subprocess
 import pyblish.api
-from avalon import io
 
 
 class OverlayClipInfoOnIntegrated(pyblish.api.InstancePlugin):
+    """Overlay clipinfo onto published image sequence
+
+    All frames are processed in one batch by `reveries.clipinfo`, in a
+    separated Python process (`PYBLISH_FILESYS_EXECUTABLE`) so the host
+    does not need `PIL`.
+
+    """
 
     label = "Overlay ClipInfo"
     order = pyblish.api.IntegratorOrder + 0.1
@@ -16,25 +25,89 @@ class OverlayClipInfoOnIntegrated(pyblish.api.InstancePlugin):
     targets = ["localhost"]
 
     def process(self, instance):
+        from avalon import io
+        from avalon.vendor import clique
+        from reveries import clipinfo
 
         context = instance.context
         if not all(result["success"] for result in context.data["results"]):
             self.log.warning("Atomicity not held, aborting.")
             return
 
+        version = io.find_one({"_id": instance.data["insertedVersionId"]})
         representation = io.find_one({
             "type": "representation",
-            "parent": instance.data["insertedVersionId"],
+            "parent": version["_id"],
             "name": "imageSequence"
         })
+        subset = io.find_one({"_id": version["parent"]})
+        asset = instance.data["assetDoc"]
+        project = context.data["projectDoc"]
 
-        id = str(representation["_id"])
+        template_publish = instance.data["publishPathTemplate"]
+        template_data = instance.data["publishPathTemplateData"]
+        publish_dir = template_publish.format(representation="imageSequence",
+                                              **template_data)
 
-        self.log.info("Calling subprocess..")
-        popen = subprocess.Popen(["overlay_clipinfo", id],
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.STDOUT,
-                                 shell=True)
+        files = instance.data.get("repr.imageSequence._files", [])
+        collections, _ = clique.assemble(files, minimum_items=1)
+        if not collections:
+            self.log.warning("No image sequence published, skipping.")
+            return
+
+        frames = list()
+        for collection in collections:
+            for index in sorted(collection.indexes):
+                path = publish_dir + "/" + collection.format(
+                    "{head}{padding}{tail}") % index
+                frames.append((path, path, index))
+
+        data = version["data"]
+        start = data.get("startFrame", asset["data"].get("edit_in", 0))
+        end = data.get("endFrame", asset["data"].get("edit_out", 0))
+        info = {
+            "project": project["name"],
+            "task": data.get("task") or "",
+            "subset": subset["name"],
+            "version": version["name"],
+            "representation_id": str(representation["_id"]),
+            "artist": data.get("author") or "",
+            "date": data["time"],
+            "shot_name": asset["name"],
+            "edit_in": start,
+            "edit_out": end,
+            "handles": data.get("handles", 0),
+            "duration": len(frames),
+            "focal_length": instance.data.get("focalLength", "-"),
+            "fps": context.data.get("fps",
+                                    project["data"].get("fps", 24.0)),
+        }
 
+        fd, job = tempfile.mkstemp(prefix="clipinfo_", suffix=".json")
+        os.close(fd)
+        clipinfo.write_job(job, frames, info)
+
+        python = os.getenv("PYBLISH_FILESYS_EXECUTABLE") or "python"
+        cmd = [python, "-m", "reveries.scripts.overlay_clipinfo", job]
+
+        self.log.info("Overlaying clipinfo onto %d frames.." % len(frames))
+        popen = subprocess.Popen(cmd,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.STDOUT)
         output, _ = popen.communicate()
-        self.log.info(output)
+        output = output.decode("utf-8", "replace").strip()
+        os.remove(job)
+
+        self.log.debug(output)
+        try:
+            report = json.loads(output.splitlines()[-1])
+        except (IndexError, ValueError):
+            raise RuntimeError("Clipinfo overlay failed:\n%s" % output)
+
+        self.log.info("%d frames done in %.2f sec (%.2f fps)."
+                      % (report["frames"], report["seconds"], report["fps"]))
+        if report["failed"]:
+            for path, error in report["failed"].items():
+                self.log.error("%s:\n%s" % (path, error))
+            raise RuntimeError("Failed to overlay clipinfo onto %d frames."
+                               % len(report["failed"]))
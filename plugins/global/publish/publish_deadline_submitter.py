@@ -1,12 +1,14 @@
 
 import os
-import re
+import ast
+import json
 import logging
 import subprocess
 import pyblish.api
 import avalon.api
 import avalon.io
 from avalon.vendor import requests
+from multiprocessing.pool import ThreadPool
 from reveries import utils
 
 
@@ -23,6 +25,96 @@ class PublishDeadlineSubmitter(pyblish.api.ContextPlugin):
         context.data["deadlineSubmitter"] = DeadlineSubmitter(context)
 
 
+def parse_job_id(text):
+    """Return job ID from web service response without evaluating it
+
+    Response is JSON, Python literal is also accepted for older web service
+    that replies with Python dict string.
+
+    """
+    try:
+        document = json.loads(text)
+    except ValueError:
+        try:
+            document = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            document = None
+
+    if not isinstance(document, dict) or not document.get("_id"):
+        raise ValueError("Job ID not found in response: %s" % text)
+
+    return str(document["_id"])
+
+
+def parse_command_output(output, count):
+    """Return job IDs from `deadlinecommand` output, None for failed ones
+
+    Each submitted job reports "Result=" then "JobID=" in order of job
+    info files, a failed job has no job ID.
+
+    Args:
+        output (str): Command output
+        count (int): Number of submitted jobs
+
+    Returns:
+        list: Job IDs in order of submission, length is `count`
+
+    """
+    records = list()
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith("Result="):
+            records.append([line[len("Result="):], None])
+        elif line.startswith("JobID=") and records:
+            records[-1][1] = line[len("JobID="):]
+
+    jobids = [jobid if result == "Success" else None
+              for result, jobid in records[:count]]
+    return jobids + [None] * (count - len(jobids))
+
+
+def resolve_batches(jobs, submitted=None):
+    """Group jobs into batches by `JobDependencies`
+
+    Each batch only depends on jobs in previous batches (or already
+    submitted), so jobs in the same batch can be submitted together.
+
+    Args:
+        jobs (dict): {index: payload}, dependencies are job indexes
+        submitted (dict, optional): {index: job id} of submitted jobs
+
+    Returns:
+        list: A list of batches, each batch is a list of job indexes
+
+    """
+    submitted = submitted or dict()
+
+    depends = dict()
+    for index, payload in jobs.items():
+        deps = payload["JobInfo"].get("JobDependencies") or ""
+        deps = set(dep for dep in deps.split(",") if dep)
+        for dep in deps:
+            if dep not in jobs and dep not in submitted:
+                raise KeyError("Job %s depends on unknown job %s."
+                               % (index, dep))
+        depends[index] = deps - set(submitted)
+
+    batches = list()
+    done = set()
+    while len(done) < len(depends):
+        batch = sorted((index for index, deps in depends.items()
+                        if index not in done and deps <= done),
+                       key=lambda index: int(index))
+        if not batch:
+            pending = sorted(set(depends) - done)
+            raise Exception("Circular job dependencies: %s"
+                            % ", ".join(pending))
+        batches.append(batch)
+        done.update(batch)
+
+    return batches
+
+
 class DeadlineSubmitter(object):
 
     def __init__(self, context):
@@ -35,8 +127,12 @@ class DeadlineSubmitter(object):
         self._cmd = None
         self._url = None
         self._auth = None
+        self._session = None
         self._environment = None
 
+        # Max concurrent web service requests
+        self._workers = int(os.getenv("PYBLISH_DEADLINE_WORKERS", "8"))
+
         if context.data.get("USE_DEADLINE_APP"):
             AVALON_DEADLINE_APP = avalon.api.Session["AVALON_DEADLINE_APP"]
 
@@ -96,55 +192,103 @@ class DeadlineSubmitter(object):
         return index
 
     def submit(self):
-        """Submit all jobs"""
-        while self._jobs:
-            index, payload = self._jobs.popitem()
-            self._pre_submit(index, payload)
-
-    def _pre_submit(self, index, payload):
+        """Submit all jobs
+
+        Dependencies are resolved up front, jobs are submitted in batches
+        that each only depend on previous batches. Jobs in one batch are
+        posted concurrently through one pooled HTTP session, or submitted
+        by one `deadlinecommand` call.
+
+        """
+        batches = resolve_batches(self._jobs, self._submitted)
+
+        for batch in batches:
+            payloads = list()
+            for index in batch:
+                payload = self._jobs.pop(index)
+                self._link_dependencies(payload)
+                payloads.append(payload)
+
+            # (NOTE) "Error: Alternate job auxiliary path <...> doesn't
+            #   exist"
+            #   If Deadline Repository has custom Auxiliary Files path that
+            #   is set to a file server and you got this error, try
+            #   re-connect the file server.
+            if self._cmd:
+                jobids = self._via_command(payloads)
+            else:
+                jobids = self._via_web_service_batch(payloads)
+
+            # Keep submitted jobs even some failed, so they can be found
+            # and depended on
+            submitted = [(index, jobid) for index, jobid
+                         in zip(batch, jobids) if jobid is not None]
+            self._submitted.update(submitted)
+
+            if len(submitted) < len(batch):
+                if submitted:
+                    self.log.error("Jobs submitted before failure: %s"
+                                   % ", ".join(jobid for _, jobid
+                                               in submitted))
+                raise Exception("%d of %d jobs failed to submit."
+                                % (len(batch) - len(submitted), len(batch)))
+
+    def _link_dependencies(self, payload):
         deps = payload["JobInfo"].get("JobDependencies")
         if deps:
-            dep_jobids = list()
-            for _index in deps.split(","):
-                if _index in self._submitted:
-                    _jobid = self._submitted[_index]
-                else:
-                    _payload = self._jobs.pop(_index)
-                    _jobid = self._pre_submit(_index, _payload)
-
-                dep_jobids.append(_jobid)
-
+            dep_jobids = [self._submitted[_index]
+                          for _index in deps.split(",") if _index]
             payload["JobInfo"]["JobDependencies"] = ",".join(dep_jobids)
 
-        return self._submit(index, payload)
-
-    def _submit(self, index, payload):
-        # (NOTE) "Error: Alternate job auxiliary path <...> doesn't exist"
-        #   If Deadline Repository has custom Auxiliary Files path that is
-        #   set to a file server and you got this error, try re-connect the
-        #   file server.
-        if self._cmd:
-            jobid = self._via_command(payload)
-        else:
-            jobid = self._via_web_service(payload)
+    def session(self):
+        """Return HTTP session that keeps connections alive for reuse"""
+        if self._session is None:
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max(self._workers, 1))
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.auth = tuple(self._auth or ())
+            self._session = session
+        return self._session
+
+    def _via_web_service_batch(self, payloads):
+        """Post jobs concurrently, return job IDs, None for failed ones"""
+
+        def post(payload):
+            try:
+                return self._via_web_service(payload)
+            except Exception as e:
+                self.log.error(e)
+                return None
 
-        self._submitted[index] = jobid
+        if len(payloads) < 2 or self._workers < 2:
+            return [post(payload) for payload in payloads]
 
-        return jobid
+        pool = ThreadPool(min(self._workers, len(payloads)))
+        try:
+            return pool.map(post, payloads, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
 
     def _via_web_service(self, payload):
-        response = requests.post(self._url,
-                                 json=payload,
-                                 auth=tuple(self._auth))
+        response = self.session().post(self._url, json=payload)
 
         if not response.ok:
             raise Exception(response.text)
         else:
-            jobid = eval(response.text)["_id"]
+            jobid = parse_job_id(response.text)
             self.log.info("Success. JobID: %s" % jobid)
             return jobid
 
-    def _via_command(self, payload):
+    def _via_command(self, payloads):
+        """Submit jobs with one `deadlinecommand` call
+
+        Return job IDs, None for failed ones.
+
+        """
 
         def to_txt(document, out):
             # Write dict to key-value txt file
@@ -152,26 +296,40 @@ class DeadlineSubmitter(object):
                 for key, val in document.items():
                     fp.write("{key}={val}\n".format(key=key, val=val))
 
-        job_info = payload["JobInfo"]
-        plugin_info = payload["PluginInfo"]
-
         info_dir = utils.stage_dir(prefix="deadline_")
-        job_info_file = os.path.join(info_dir, "job_info.job")
-        plugin_info_file = os.path.join(info_dir, "plugin_info.job")
 
-        to_txt(job_info, job_info_file)
-        to_txt(plugin_info, plugin_info_file)
+        info_files = list()
+        for i, payload in enumerate(payloads):
+            job_info_file = os.path.join(info_dir, "job_info_%d.job" % i)
+            plugin_info_file = os.path.join(info_dir,
+                                            "plugin_info_%d.job" % i)
 
-        cmd = self._cmd
+            to_txt(payload["JobInfo"], job_info_file)
+            to_txt(payload["PluginInfo"], plugin_info_file)
 
-        cmd += " %s %s" % (job_info_file, plugin_info_file)
-        output = subprocess.check_output(cmd)
+            info_files.append((job_info_file, plugin_info_file))
 
-        output = output.decode("utf-8")
-        if "Result=Success" not in output.split():
-            raise Exception("Submission failed...")
+        if len(info_files) == 1:
+            cmd = [self._cmd] + list(info_files[0])
         else:
-            parts = re.split("[=\n\r]", output)
-            jobid = parts[parts.index("JobID") + 1]
-            self.log.info("Success. JobID: %s" % jobid)
-            return jobid
+            cmd = [self._cmd, "-SubmitMultipleJobs"]
+            for job_info_file, plugin_info_file in info_files:
+                cmd += ["-job", job_info_file, plugin_info_file]
+
+        try:
+            output = subprocess.check_output(cmd)
+        except subprocess.CalledProcessError as e:
+            # Some jobs may still be submitted
+            output = e.output or b""
+        output = output.decode("utf-8")
+
+        jobids = parse_command_output(output, len(payloads))
+
+        if None in jobids:
+            self.log.error(output)
+
+        for jobid in jobids:
+            if jobid is not None:
+                self.log.info("Success. JobID: %s" % jobid)
+
+        return jobids
@@ -1,7 +1,6 @@
 
 import pyblish.api
 import avalon.api
-import avalon.io as io
 
 
 class ValidateLatestVersionLoaded(pyblish.api.ContextPlugin):
@@ -14,51 +13,23 @@ class ValidateLatestVersionLoaded(pyblish.api.ContextPlugin):
     label = "Latest Version Loaded"
 
     def process(self, context):
-        host = avalon.api.registered_host()
+        from reveries import lib
 
-        checked = set()
-        outdated = dict()
+        host = avalon.api.registered_host()
 
         # We may have missing representation due to the limited
         # environment. E.g. When Out sourcing the rendering job
         # and the database overthere is incomplete.
-        missing = dict()
-
-        for container in host.ls():
-            container_node = container["objectName"]
-            representation_id = io.ObjectId(container["representation"])
-
-            if representation_id in checked:
-                if representation_id in outdated:
-                    outdated[representation_id].append(container_node)
-
-                if representation_id in missing:
-                    missing[representation_id].append(container_node)
-
-                continue
-
-            checked.add(representation_id)
-
-            representation = io.find_one({"_id": representation_id})
-            if representation is None:
-                missing[representation_id] = [container_node]
-
-                continue
-
-            version = io.find_one({"_id": representation["parent"]})
-            highest_version = io.find_one({"type": "version",
-                                           "parent": version["parent"]},
-                                          sort=[("name", -1)])
-
-            if version["name"] < highest_version["name"]:
-                outdated[representation_id] = [container_node]
+        outdated, missing = lib.ls_outdated(host.ls())
 
         if outdated:
-            nodes = "\n".join(n for x in outdated.values() for n in x)
+            nodes = "\n".join(c["objectName"]
+                              for x in outdated.values() for c in x)
             self.log.warning("The following subsets are outdated :\n"
                              "" + nodes)
 
         if missing:
-            nodes = "\n".join(n for x in missing.values() for n in x)
+            nodes = "\n".join(c["objectName"]
+                              for x in missing.values() for c in x)
             self.log.warning("The following subsets are not in database :\n"
                              "" + nodes)
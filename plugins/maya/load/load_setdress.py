@@ -1,5 +1,4 @@
 
-import contextlib
 import avalon.api
 from reveries.maya.plugins import HierarchicalLoader
 
@@ -41,31 +40,17 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
                 # Ignore all errors
                 pass
 
-    @contextlib.contextmanager
-    def keep_scale_pivot(self, node):
-        import maya.cmds as cmds
-        scale_pivot = cmds.xform(node, query=True, scalePivot=True)
-        try:
-            yield
-        finally:
-            cmds.xform(node, scalePivot=scale_pivot)
-
     def apply_variation(self, data, container):
         """
         """
-        import maya.cmds as cmds
         from reveries.maya.lib import TRANSFORM_ATTRS
+        from reveries.maya.variation import TransformBatch, input_connected
 
         assembly = container["subsetGroup"]
-
-        # Apply matrix to root node (if any matrix edits)
-        matrix = data["matrix"]
-        with self.keep_scale_pivot(assembly):
-            cmds.xform(assembly, objectSpace=True, matrix=matrix)
-
         container_id_map = self.containers_by_id(data["subMatrix"].keys())
 
-        # Apply matrix to components
+        # Resolve all components first, so they could be processed in batch
+        parsed_list = list()
         for parsed in self.parse_sub_matrix(data, container_id_map):
             transform, sub_matrix, is_hidden, inherits = parsed
 
@@ -73,31 +58,47 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
                 continue
 
             if transform == "<alembic>":
-                abc = transform = is_hidden
+                abc = is_hidden
                 alembic = sub_matrix
                 self.set_attr(abc + ".speed", alembic[0])
                 self.set_attr(abc + ".offset", alembic[1])
                 self.set_attr(abc + ".cycleType", alembic[2])
                 continue
 
-            if (is_hidden
-                    and not self.has_input_connections(transform,
-                                                       ["visibility"])):
-                self.set_attr(transform + ".visibility", False)
+            parsed_list.append(parsed)
+
+        transforms = [parsed[0] for parsed in parsed_list]
+        batch = TransformBatch([assembly] + transforms)
+
+        visibility_connected = input_connected(
+            [parsed[0] for parsed in parsed_list if parsed[2]],
+            ["visibility"]
+        )
+        # Possible objects that are part of pointcache
+        transform_connected = input_connected(transforms, TRANSFORM_ATTRS)
+
+        # Apply matrix to root node (if any matrix edits)
+        batch.set_matrix(assembly, data["matrix"])
+
+        # Apply matrix to components
+        for transform, sub_matrix, is_hidden, inherits in parsed_list:
+
+            if is_hidden and transform not in visibility_connected:
+                batch.set_bool(transform, "visibility", False)
 
             # inheritsTransform
-            current_inherits = cmds.getAttr(transform + ".it")
-            if inherits is not None and not current_inherits == inherits:
-                self.set_attr(transform + ".it", inherits)
+            if (inherits is not None
+                    and not batch.get_bool(transform, "it") == inherits):
+                batch.set_bool(transform, "it", inherits)
 
-            if self.has_input_connections(transform, TRANSFORM_ATTRS):
-                # Possible an object that is part of pointcache
+            if transform in transform_connected:
                 continue
 
-            with self.keep_scale_pivot(transform):
-                cmds.xform(transform,
-                           objectSpace=True,
-                           matrix=sub_matrix)
+            batch.set_matrix(transform, sub_matrix)
+
+        seconds = batch.commit()
+        self.log.info("Variation applied on %d transforms of %s in %.3f "
+                      "sec.", len(batch), assembly, seconds)
 
     def update_variation(self, data_new, data_old, container, force=False):
         """
@@ -105,13 +106,33 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
         import maya.cmds as cmds
         from reveries.lib import matrix_equals
         from reveries.maya.lib import TRANSFORM_ATTRS
+        from reveries.maya.variation import TransformBatch, input_connected
 
         assembly = container["subsetGroup"]
 
-        current_matrix = cmds.xform(assembly,
-                                    query=True,
-                                    matrix=True,
-                                    objectSpace=True)
+        container_id_map = self.containers_by_id(
+            # Look up container ids in one batch
+            set(data_old["subMatrix"]).union(data_new["subMatrix"])
+        )
+
+        # Update matrix to components
+        old_data_map = {t: (m, h, i) for t, m, h, i in
+                        self.parse_sub_matrix(data_old, container_id_map)}
+        parsed_list = [
+            parsed for parsed in
+            self.parse_sub_matrix(data_new, container_id_map)
+            if parsed[0]
+        ]
+
+        transforms = [parsed[0] for parsed in parsed_list
+                      if parsed[0] != "<alembic>"]
+        batch = TransformBatch([assembly] + transforms)
+
+        transform_connected = input_connected([assembly] + transforms,
+                                              TRANSFORM_ATTRS)
+        visibility_connected = input_connected(transforms, ["visibility"])
+
+        current_matrix = batch.matrix(assembly)
         origin_matrix = data_old["matrix"]
         has_matrix_override = not matrix_equals(current_matrix,
                                                 origin_matrix)
@@ -119,29 +140,15 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
         if has_matrix_override and not force:
             self.log.warning("Matrix override preserved on %s",
                              assembly)
-        elif self.has_input_connections(assembly, TRANSFORM_ATTRS):
+        elif assembly in transform_connected:
             self.log.warning("Input connection preserved on %s",
                              assembly)
         else:
-            new_matrix = data_new["matrix"]
-            with self.keep_scale_pivot(assembly):
-                cmds.xform(assembly, objectSpace=True, matrix=new_matrix)
-
-        container_id_map = self.containers_by_id(
-            # Look up container ids in one batch
-            set(data_old["subMatrix"]).union(data_new["subMatrix"])
-        )
-
-        # Update matrix to components
-        old_data_map = {t: (m, h, i) for t, m, h, i in
-                        self.parse_sub_matrix(data_old, container_id_map)}
+            batch.set_matrix(assembly, data_new["matrix"])
 
-        for parsed in self.parse_sub_matrix(data_new, container_id_map):
+        for parsed in parsed_list:
             transform, sub_matrix, is_hidden, inherits = parsed
 
-            if not transform:
-                continue
-
             origin = old_data_map.get(transform, (None, False, None))
             origin_sub_matrix, origin_hidden, origin_inherits = origin
 
@@ -159,16 +166,14 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
                 ]
                 current_hidden = None
                 current_inherits = None
-                attributes = ["speed", "offset", "cycleType"]
+                is_connected = self.has_input_connections(
+                    abc, ["speed", "offset", "cycleType"])
 
             else:
-                current_sub_matrix = cmds.xform(transform,
-                                                query=True,
-                                                matrix=True,
-                                                objectSpace=True)
-                current_hidden = not cmds.getAttr(transform + ".visibility")
-                current_inherits = cmds.getAttr(transform + ".it")
-                attributes = TRANSFORM_ATTRS
+                current_sub_matrix = batch.matrix(transform)
+                current_hidden = not batch.get_bool(transform, "visibility")
+                current_inherits = batch.get_bool(transform, "it")
+                is_connected = transform in transform_connected
 
             # Updating matrix
             if origin_sub_matrix:
@@ -180,14 +185,13 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
             if has_matrix_override and not force:
                 self.log.warning("Sub-Matrix override preserved on %s",
                                  transform)
-            elif self.has_input_connections(transform, attributes):
+            elif is_connected:
                 self.log.warning("Input connection preserved on %s",
                                  transform)
             elif _tag == "<alembic>":
                 pass
             else:
-                with self.keep_scale_pivot(transform):
-                    cmds.xform(transform, objectSpace=True, matrix=sub_matrix)
+                batch.set_matrix(transform, sub_matrix)
 
             if _tag == "<alembic>":
                 self.set_attr(abc + ".speed", alembic[0])
@@ -207,17 +211,17 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
             elif inherits is not None:
                 if force:
                     if current_inherits and not inherits:
-                        self.set_attr(transform + ".it", True)
+                        batch.set_bool(transform, "it", True)
                     elif not current_inherits and inherits:
-                        self.set_attr(transform + ".it", False)
+                        batch.set_bool(transform, "it", False)
                 else:
                     if origin_inherits and not inherits:
-                        self.set_attr(transform + ".it", True)
+                        batch.set_bool(transform, "it", True)
                     elif not origin_inherits and inherits:
-                        self.set_attr(transform + ".it", False)
+                        batch.set_bool(transform, "it", False)
 
             # Updating visibility
-            if self.has_input_connections(transform, ["visibility"]):
+            if transform in visibility_connected:
                 continue
 
             if origin_hidden:
@@ -230,14 +234,18 @@ class SetDressLoader(HierarchicalLoader, avalon.api.Loader):
                                  transform)
             elif force:
                 if current_hidden and not is_hidden:
-                    self.set_attr(transform + ".visibility", True)
+                    batch.set_bool(transform, "visibility", True)
                 elif not current_hidden and is_hidden:
-                    self.set_attr(transform + ".visibility", False)
+                    batch.set_bool(transform, "visibility", False)
             else:
                 if origin_hidden and not is_hidden:
-                    self.set_attr(transform + ".visibility", True)
+                    batch.set_bool(transform, "visibility", True)
                 elif not origin_hidden and is_hidden:
-                    self.set_attr(transform + ".visibility", False)
+                    batch.set_bool(transform, "visibility", False)
+
+        seconds = batch.commit()
+        self.log.info("Variation updated on %d transforms of %s in %.3f "
+                      "sec.", len(batch), assembly, seconds)
 
     def containers_by_id(self, container_ids):
         import maya.cmds as cmds
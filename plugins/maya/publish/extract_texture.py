@@ -5,10 +5,6 @@ import pyblish.api
 from collections import OrderedDict
 
 
-def to_tx(path):
-    return os.path.splitext(path)[0] + ".tx"
-
-
 class ExtractTexture(pyblish.api.InstancePlugin):
     """Export texture files
     """
@@ -21,7 +17,7 @@ class ExtractTexture(pyblish.api.InstancePlugin):
     def process(self, instance):
         import avalon.api
         import avalon.io
-        from reveries import lib, utils
+        from reveries import lib, utils, texstore, maketx
         from reveries.maya import plugins, lib as maya_lib
 
         staging_dir = utils.stage_dir(dir=instance.data["_sharedStage"])
@@ -69,6 +65,14 @@ class ExtractTexture(pyblish.api.InstancePlugin):
                 "pathMap": {fn: dir_name + "/" + fn for fn in fnames},
             }
 
+        # Content-addressed store, optional
+        store = texstore.TextureStore.from_environment()
+        file_ids = dict()
+        if store is not None:
+            self.log.info("Hashing textures..")
+            file_ids = store.ids([path for data in CURRENT.values()
+                                  for path in data["pathMap"].values()])
+
         # Extract textures
         #
         self.log.info("Extracting textures..")
@@ -98,6 +102,7 @@ class ExtractTexture(pyblish.api.InstancePlugin):
             for ver_data, tmp_data in versioned_data:
 
                 previous_files = tmp_data["pathMap"]
+                previous_ids = ver_data.get("hashes") if file_ids else None
 
                 all_files = list()
                 for file, abs_path in data["pathMap"].items():
@@ -111,8 +116,13 @@ class ExtractTexture(pyblish.api.InstancePlugin):
                         # Previous file not exists (should not happen)
                         break  # Try previous version
 
-                    # Checking on file size and modification time
-                    same_file = lib.file_cmp(abs_path, abs_previous)
+                    if previous_ids:
+                        # Checking on content hash
+                        current_id = file_ids[abs_path]
+                        same_file = previous_ids.get(file) == current_id
+                    else:
+                        # Checking on file size and modification time
+                        same_file = lib.file_cmp(abs_path, abs_previous)
                     if not same_file:
                         # Possible new files
                         break  # Try previous version
@@ -143,12 +153,18 @@ class ExtractTexture(pyblish.api.InstancePlugin):
                 self.log.info("New texture collected from '%s': %s"
                               "" % (data["node"], fpattern))
 
-                NEW_OR_CHANGED.append({
+                new_data = {
                     "fpattern": fpattern,
                     "version": new_version,
                     "colorSpace": current_color_space,
                     "fnames": data["fnames"],
-                })
+                }
+                if file_ids:
+                    new_data["hashes"] = {
+                        fn: file_ids[path]
+                        for fn, path in data["pathMap"].items()
+                    }
+                NEW_OR_CHANGED.append(new_data)
 
                 all_files = list()
                 for file, abs_path in data["pathMap"].items():
@@ -157,13 +173,11 @@ class ExtractTexture(pyblish.api.InstancePlugin):
 
                     if USE_TX:
                         # Upload .tx file as well
-                        tx_abs_path = to_tx(abs_path)
-                        tx_stage_file = to_tx(file)
+                        tx_abs_path = maketx.to_tx(abs_path)
+                        tx_stage_file = maketx.to_tx(file)
 
-                        if current_color_space == "Raw":
-                            input_colorspace = "linear"
-                        else:
-                            input_colorspace = current_color_space
+                        input_colorspace = maketx.input_colorspace(
+                            current_color_space)
 
                         files_to_copy[tx_stage_file] = tx_abs_path
                         files_to_tx[tx_abs_path] = (abs_path,
@@ -201,7 +215,15 @@ class ExtractTexture(pyblish.api.InstancePlugin):
         instance.data["repr.TexturePack._delayRun"] = {
             "func": self.mock_stage,
         }
-        self.stage_textures(staging_dir, files_to_copy)
+        if store is None:
+            self.stage_textures(staging_dir, files_to_copy)
+        else:
+            self.stage_to_store(instance,
+                                store,
+                                staging_dir,
+                                files_to_copy,
+                                file_ids,
+                                NEW_OR_CHANGED)
 
     def update_file_node_attrs(self, instance, file_nodes, path, color_space):
         # (NOTE) All input `file_nodes` will be set to same `color_space`
@@ -257,6 +279,53 @@ class ExtractTexture(pyblish.api.InstancePlugin):
                 self.log.critical(msg)
                 raise OSError(msg)
 
+    def stage_to_store(self,
+                       instance,
+                       store,
+                       staging_dir,
+                       files_to_copy,
+                       file_ids,
+                       new_or_changed):
+        """Stage textures as hardlinks of content-addressed blobs
+
+        Textures that already exist in store (published by other version or
+        asset) will not be copied again. Files without C4 ID (e.g. `.tx`)
+        are staged by copy.
+
+        """
+        import avalon.api
+
+        fpatterns = {fn: data["fpattern"] for data in new_or_changed
+                     for fn in data["fnames"]}
+        stored = reused = 0
+
+        for file, src in files_to_copy.items():
+            dst = staging_dir + "/" + file
+
+            c4id = file_ids.get(src)
+            if c4id is None:
+                self.stage_textures(staging_dir, {file: src})
+                continue
+
+            if store.add(src, c4id):
+                stored += 1
+                self.log.info("Stored %s" % src)
+            else:
+                reused += 1
+                self.log.info("Reusing stored %s" % src)
+
+            store.link(c4id, dst)
+            store.record(c4id,
+                         project=avalon.api.Session["AVALON_PROJECT"],
+                         asset=avalon.api.Session["AVALON_ASSET"],
+                         subset=instance.data["subset"],
+                         version=instance.data["versionNext"],
+                         fpattern=fpatterns.get(file),
+                         file=file)
+
+        self.log.info("Texture store: %d stored, %d reused." % (stored,
+                                                                reused))
+
     def mock_stage(self, *args, **kwargs):
         # Do nothing, texture files should already been staged by now.
         pass
@@ -0,0 +1,51 @@
+
+import pyblish.api
+
+
+class ExtractTextureTx(pyblish.api.InstancePlugin):
+    """Convert stale .tx maps of textures in parallel
+
+    Every file of UDIM tiles or frame sequence is converted, conversions
+    that are up to date (same source content and colorspace) are skipped.
+    Converter could be set by `PYBLISH_MAKETX_COMMAND`.
+
+    """
+
+    label = "Extract Texture Tx"
+    order = pyblish.api.ExtractorOrder - 0.2  # Run before texture extractor
+    hosts = ["maya"]
+    families = ["reveries.texture"]
+
+    def process(self, instance):
+        import time
+        from reveries import maketx
+
+        if not instance.data.get("useTxMaps"):
+            self.log.debug("No .tx map needed.")
+            return
+
+        jobs = maketx.jobs_from_file_data(
+            instance.data["fileData"],
+            ignore=instance.data.get("fileNodesToIgnore"),
+        )
+        if not jobs:
+            return
+
+        converter = maketx.TxConverter()
+        start = time.time()
+        results = converter.convert(jobs)
+        seconds = time.time() - start
+
+        failed = [tx for tx, result in results.items() if result["error"]]
+        if failed:
+            raise RuntimeError("Failed to convert %d .tx maps, see log."
+                               % len(failed))
+
+        self.log.info("%d .tx maps converted in %.2f sec."
+                      % (len([r for r in results.values()
+                              if not r["skipped"]]), seconds))
+
+        # Per-file conversion time, saved in representation data
+        instance.data["repr.TexturePack.txSeconds"] = {
+            tx: round(result["seconds"], 3) for tx, result in results.items()
+        }
@@ -26,6 +26,7 @@ class ExtractXGenLegacy(pyblish.api.InstancePlugin):
         files = list()
         xgen_files = list()
         descriptions_data = dict()
+        map_index = xgen.MapIndex()
 
         for desc in instance.data["xgenDescriptions"]:
             palette = xgen.get_palette_by_description(desc)
@@ -39,7 +40,7 @@ class ExtractXGenLegacy(pyblish.api.InstancePlugin):
             # Stage maps
             map_stage = staging_dir + "/maps/%s" % palette
 
-            for head, src in xgen.maps_to_transfer(desc):
+            for head, src in xgen.maps_to_transfer(desc, map_index):
                 relative = os.path.relpath(src, head)
                 if os.path.isfile(src):
                     relative = os.path.dirname(relative)
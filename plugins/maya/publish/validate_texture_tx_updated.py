@@ -17,6 +17,9 @@ class ValidateTextureTxMapUpdated(pyblish.api.InstancePlugin):
     to check missing .tx maps, or rendering with 'Auto-convert Textures to TX'
     option enabled.
 
+    Texture instances are not blocked if .tx converter is available, stale
+    maps will be converted by 'Extract Texture Tx'.
+
     """
 
     order = pyblish.api.ValidatorOrder
@@ -37,6 +40,11 @@ class ValidateTextureTxMapUpdated(pyblish.api.InstancePlugin):
             return
 
         invalid = self.get_invalid(instance)
+        if invalid and self.will_convert(instance):
+            self.log.warning("Stale .tx maps will be converted on "
+                             "extraction.")
+            return
+
         if invalid:
             raise Exception("Not all texture have .tx map updated, "
                             "please use 'Tx Manager' or update them "
@@ -69,7 +77,23 @@ class ValidateTextureTxMapUpdated(pyblish.api.InstancePlugin):
 
         return invalid
 
+    @classmethod
+    def will_convert(cls, instance):
+        from reveries import maketx
+
+        family = instance.data["family"]
+        families = instance.data.get("families", [])
+        is_texture = "reveries.texture" in [family] + families
+
+        return is_texture and maketx.available()
+
     @classmethod
     def fix_invalid(cls, instance):
-        # (TODO) maketx for sequence
-        pass
+        from reveries import maketx
+
+        invalid = cls.get_invalid(instance)
+        file_data = [data for data in instance.data.get("fileData", [])
+                     if data["node"] in invalid]
+        # Each file of sequence or UDIM tiles is converted
+        jobs = maketx.jobs_from_file_data(file_data)
+        maketx.TxConverter().convert(jobs)
@@ -22,9 +22,11 @@ class ValidateXGenMapsInDESC(pyblish.api.InstancePlugin):
         import reveries.maya.xgen.legacy as xgen
 
         invalid = list()
+        map_index = xgen.MapIndex()
 
         for desc in instance.data["xgenDescriptions"]:
-            for path, parents in xgen.parse_description_maps(desc):
+            for path, parents in xgen.parse_description_maps(desc,
+                                                             map_index):
                 if not path.startswith("${DESC}"):
                     invalid.append((parents, path))
 
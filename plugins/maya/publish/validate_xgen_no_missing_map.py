@@ -22,6 +22,7 @@ class ValidateXGenNoMissingMap(pyblish.api.InstancePlugin):
         import reveries.maya.xgen.legacy as xgen
 
         invalid = list()
+        map_index = xgen.MapIndex()
 
         cmds.filePathEditor(refresh=True)
         missing = (cmds.filePathEditor(query=True,
@@ -31,11 +32,11 @@ class ValidateXGenNoMissingMap(pyblish.api.InstancePlugin):
                                        unresolved=True) or [])[1::2]
 
         for map_attr in missing:
-            path, parents = xgen.parse_map_path(map_attr)
+            path, parents = xgen.parse_map_path(map_attr, map_index)
             palette, description, obj, attr, index = parents
 
             if description in instance.data["xgenDescriptions"]:
-                if obj in xgen.list_fx_modules(description, activated=False):
+                if obj in map_index.inactive_fx_modules(description):
                     # Ignore if not active
                     continue
 
@@ -72,7 +72,7 @@ class RenderLayerLoader(PackageLoader, avalon.api.Loader):
         return options.get("beauty")
 
     @classmethod
-    def is_singleaov(cls, path, start):
+    def first_frame(cls, path, start):
         import os
 
         path = path % start
@@ -88,10 +88,11 @@ class RenderLayerLoader(PackageLoader, avalon.api.Loader):
                 nuke.critical(message)  # This will pop-up a dialog
                 raise RuntimeError(message)
 
-        try:
-            data = exrheader.read_exr_header(path)
-        except Exception:
-            cls.log.warning("EXR header read failed: %s" % path)
+        return path
+
+    @classmethod
+    def is_singleaov(cls, data):
+        if data is None:
             return False
         return set(data["channels"]) in [{"R", "G", "B", "A"},
                                          {"R", "G", "B"}]
@@ -129,9 +130,20 @@ class RenderLayerLoader(PackageLoader, avalon.api.Loader):
         multiaovs = OrderedDict()
         singleaovs = OrderedDict()
 
+        # Read first frame header of all AOVs at once
+        first_frames = dict(
+            (aov_name, cls.first_frame(data["_resolved"], start))
+            for aov_name, data in sequences.items()
+        )
+        headers = exrheader.read_exr_headers(first_frames.values())
+
         for aov_name in sorted(sequences, key=lambda k: k.lower()):
             data = sequences[aov_name]
-            if cls.is_singleaov(data["_resolved"], start):
+            header = headers[first_frames[aov_name]]
+            if header is None:
+                cls.log.warning("EXR header read failed: %s"
+                                % first_frames[aov_name])
+            if cls.is_singleaov(header):
                 singleaovs[aov_name] = data
             else:
                 multiaovs[aov_name] = data
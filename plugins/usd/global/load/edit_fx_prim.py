@@ -405,6 +405,7 @@ class RePublisFxPrimitive(object):
     def republish(self):
         from reveries.common.publish import publish_version, \
             publish_representation
+        from reveries.common.publish.engine import PublishEngine
 
         usd_file = os.path.join(self.tmp_dir, "fx_prim.usda")
         if os.path.exists(usd_file):
@@ -415,8 +416,11 @@ class RePublisFxPrimitive(object):
             }
             subset_data = io.find_one(_filter)
 
+            engine = PublishEngine()
+
             # Publish version
-            version_id = publish_version.publish(subset_data["_id"])
+            version_id = publish_version.publish(subset_data["_id"],
+                                                 engine=engine)
 
             # Publish representation
             reps_data = {
@@ -424,7 +428,9 @@ class RePublisFxPrimitive(object):
             }
             publish_representation.publish(
                 version_id, "USD", [usd_file],
-                delete_source=True, data=reps_data
+                delete_source=True, engine=engine, data=reps_data
             )
 
+            engine.commit()
+
         return True
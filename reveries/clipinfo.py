@@ -0,0 +1,382 @@
+
+import os
+import json
+import time
+import logging
+import traceback
+import multiprocessing
+
+
+log = logging.getLogger(__name__)
+
+
+FONT_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                         "res",
+                         "fonts",
+                         "SourceCodePro",
+                         "Sauce Code Powerline Regular.otf").replace("\\", "/")
+
+# Templates
+
+_TOP_LEFT = """
+  Shot: {shot_name}  ver {version:0>3}
+ Frame: {frame_num:0>4}
+FocalL: {focal_length} mm
+"""[1:-1]
+
+# Per-frame field, the second line of top left
+_FRAME = "\n Frame: {frame_num:0>4}"
+
+_TOP_RIGHT = """
+  Date: {date}
+Artist: {artist}
+  Task: {task}
+"""[1:-1]
+
+_BTM = "{frame_num:0>4}"
+
+_BTM_LEFT = """
+   Range: {edit_in:0>4} - {edit_out:0>4}
+Duration: {duration:0>4}
+ Handles: {handles}  FPS: {fps}
+"""[1:-1]
+
+_BTM_RIGHT = """
+    Subset: {subset}
+      RPID: {representation_id}
+Resolution: {width}px * {height}px
+"""[1:-1]
+
+FIELDS = (
+    "project",
+    "task",
+    "subset",
+    "version",
+    "representation_id",
+    "artist",
+    "date",
+    "shot_name",
+    "edit_in",
+    "edit_out",
+    "handles",
+    "duration",
+    "focal_length",
+    "fps",
+)
+
+
+def _textsize(draw, text, font, spacing):
+    if hasattr(draw, "multiline_textbbox"):
+        # Pillow >= 8
+        box = draw.multiline_textbbox((0, 0), text, font=font,
+                                      spacing=spacing)
+        return box[2], box[3]
+    return draw.textsize(text, font=font, spacing=spacing)
+
+
+class ClipInfoOverlay(object):
+    """Overlay clipinfo onto frames of one image sequence
+
+    All text that does not change between frames is rendered once into a
+    layer, along with the layout for placing source image. Each frame only
+    copies the layer, pastes the image and draws frame number.
+
+    (NOTE): This requires package `PIL` be installed in the environment,
+            or `ImportError` raised.
+
+    Args:
+        info (dict): Clip info, see `FIELDS`
+        resolution (tuple): Image resolution
+        expand_hight (bool): Instead of scaling down the source image, expand
+            hight for clipinfo
+
+    """
+
+    def __init__(self, info, resolution, expand_hight=False):
+        from PIL import Image, ImageDraw, ImageFont
+
+        self.expand_hight = expand_hight
+
+        width, height = resolution
+
+        # Compute font size and spacing base on image resolution
+
+        spacing = int(width / 320)    # 6 in Full HD
+        titlesize = int(width / 48)  # 40 in Full HD
+        datasize = int(width / 96)   # 20 in Full HD
+        border = datasize
+
+        expand = 0
+        if expand_hight:
+            expand = ((datasize + spacing) * 3 +  # 3 lines of info
+                      border * 2)
+            height += expand * 2  # Above and below
+
+        self.spacing = spacing
+        self.expand = expand
+        self.titlefont = ImageFont.truetype(FONT_FILE, size=titlesize)
+        self.datafont = ImageFont.truetype(FONT_FILE, size=datasize)
+
+        # Static layer
+
+        layer = Image.new("RGBA", size=(width, height), color=(0, 0, 0, 255))
+        draw = ImageDraw.Draw(layer)
+
+        def textsize(text, title=False):
+            font = self.titlefont if title else self.datafont
+            return _textsize(draw, text, font, spacing)
+
+        fields = dict(info, width=resolution[0], height=resolution[1])
+        top = "{}".format(info["project"].split("_", 1)[-1])
+        top_left = _TOP_LEFT.format(frame_num=0, **fields)
+        top_right = _TOP_RIGHT.format(**fields)
+        btm = _BTM.format(frame_num=0)
+        btm_left = _BTM_LEFT.format(**fields)
+        btm_right = _BTM_RIGHT.format(**fields)
+
+        # Top Center
+        size_top = textsize(top, title=True)
+        pos_top = ((width - size_top[0]) / 2, border)
+        self._puttext(draw, top, pos_top, title=True)
+
+        # Bottom Center
+        size_btm = textsize(btm, title=True)
+        pos_btm = ((width - size_btm[0]) / 2, height - border - size_btm[1])
+        # Disabled, but still take into calculation
+
+        # Top Left, frame number will be drawn on each frame
+        size_top_left = textsize(top_left)
+        pos_top_left = (border, border)
+        lines = top_left.split("\n")
+        lines[1] = ""
+        self._puttext(draw, "\n".join(lines), pos_top_left)
+        self.frame_pos = pos_top_left
+
+        # Top Right
+        size_top_right = textsize(top_right)
+        pos_top_right = (width - size_top_right[0] - border, border)
+        self._puttext(draw, top_right, pos_top_right)
+
+        # Bottom Left
+        size_btm_left = textsize(btm_left)
+        pos_btm_left = (border, height - size_btm_left[1] - border)
+        self._puttext(draw, btm_left, pos_btm_left)
+
+        # Bottom Right
+        size_btm_right = textsize(btm_right)
+        pos_btm_right = (width - size_btm_right[0] - border,
+                         height - size_btm_right[1] - border)
+        self._puttext(draw, btm_right, pos_btm_right)
+
+        self.layer = layer
+        self._holdouts = dict()
+
+        if not expand_hight:
+            # Comput the size that the original image need to be scaled
+            # after the clipinfo applied on.
+            retract = (max(pos_top[1] + size_top[1],
+                           pos_top_left[1] + size_top_left[1],
+                           pos_top_right[1] + size_top_right[1]) +
+                       max(height - pos_btm[1] + size_btm[1],
+                           height - pos_btm_left[1] + size_btm_left[1],
+                           height - pos_btm_right[1] + size_btm_right[1]))
+
+            scale = float(height) / (height + retract)
+            scaled_w = int(width * scale) - border
+            scaled_h = int(height * scale) - border
+            self.scaled = (scaled_w, scaled_h)
+            self.box = (int((width - scaled_w) / 2),
+                        int((height - scaled_h) / 2))
+
+    def _puttext(self, draw, text, pos, title=False):
+        font = self.titlefont if title else self.datafont
+        align = "center" if title else "left"
+        draw.text(pos, text, fill=(200, 200, 200, 255),
+                  font=font, align=align, spacing=self.spacing)
+
+    def _holdout_layer(self, size):
+        """Return static layer with transparent hole for source image"""
+        from PIL import Image
+
+        if size not in self._holdouts:
+            layer = self.layer.copy()
+            holdout = Image.new("L", size)
+            background = Image.new("L", layer.size, 255)
+            background.paste(holdout, box=(0, self.expand))
+            layer.putalpha(background)
+            self._holdouts[size] = layer
+
+        return self._holdouts[size]
+
+    def render(self, image_path, output_path, frame_num):
+        """Overlay clipinfo onto one frame
+
+        Args:
+            image_path (str): Image file path
+            output_path (str): Output file path, could be the same as
+                `image_path`
+            frame_num (int): Frame number of this image
+
+        """
+        from PIL import Image, ImageDraw
+
+        src = Image.open(image_path)
+
+        if self.expand_hight:
+            im = self._holdout_layer(src.size).copy()
+
+        else:
+            im = self.layer.copy()
+
+            src.load()  # required for src.split()
+            background = Image.new("RGB", src.size, (255, 255, 255))
+            background.paste(src)
+            if "A" in src.getbands():
+                background.paste(src, mask=src.split()[-1])
+            # Put resized original image into new image that has clipinfo
+            # overlaied
+            im.paste(background.resize(self.scaled, resample=Image.BICUBIC),
+                     box=self.box)
+
+        self._puttext(ImageDraw.Draw(im),
+                      _FRAME.format(frame_num=frame_num),
+                      self.frame_pos)
+
+        im.save(output_path)
+
+
+_overlay = None
+
+
+def _init_worker(info, resolution, expand_hight):
+    global _overlay
+    _overlay = ClipInfoOverlay(info, resolution, expand_hight)
+
+
+def _render(frame):
+    """Render one frame, return (image path, seconds, error), never raise"""
+    image_path, output_path, frame_num = frame
+    start = time.time()
+    try:
+        _overlay.render(image_path, output_path, frame_num)
+    except Exception:
+        error = traceback.format_exc()
+    else:
+        error = None
+
+    return image_path, time.time() - start, error
+
+
+def render_sequence(frames,
+                    info,
+                    resolution,
+                    expand_hight=False,
+                    workers=None,
+                    callback=None):
+    """Overlay clipinfo onto frames in a process pool
+
+    Each worker process loads fonts and renders the static layer once, and
+    finished frames are streamed back as they are done.
+
+    Args:
+        frames (list): List of (image path, output path, frame number)
+        info (dict): Clip info, see `FIELDS`
+        resolution (tuple): Image resolution
+        expand_hight (bool, optional): See `ClipInfoOverlay`
+        workers (int, optional): Process count, default is cpu count
+        callback (callable, optional): Called with (image path, seconds,
+            error) of each frame when it's done
+
+    Returns:
+        dict: Timing report
+
+    """
+    workers = workers or multiprocessing.cpu_count()
+    initargs = (info, resolution, expand_hight)
+
+    start = time.time()
+    pool = None
+    if workers < 2 or len(frames) < 2:
+        _init_worker(*initargs)
+        results = (_render(frame) for frame in frames)
+    else:
+        pool = multiprocessing.Pool(min(workers, len(frames)),
+                                    _init_worker,
+                                    initargs)
+        results = pool.imap_unordered(_render, frames, chunksize=4)
+
+    seconds = 0
+    failed = dict()
+    try:
+        for image_path, elapsed, error in results:
+            seconds += elapsed
+            if error:
+                failed[image_path] = error
+            if callback is not None:
+                callback(image_path, elapsed, error)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    total = time.time() - start
+    report = {
+        "frames": len(frames),
+        "failed": failed,
+        "seconds": total,
+        "frameSeconds": seconds / max(len(frames), 1),
+        "fps": len(frames) / max(total, 1e-6),
+    }
+    log.info("Clipinfo overlaid on %d frames in %.2f sec (%.2f fps), "
+             "%d failed." % (report["frames"],
+                             report["seconds"],
+                             report["fps"],
+                             len(failed)))
+    return report
+
+
+def write_job(path, frames, info, resolution=None, expand_hight=False):
+    """Save overlay job into JSON file, for running in other process
+
+    Args:
+        path (str): Job file path
+        frames (list): List of (image path, output path, frame number)
+        info (dict): Clip info, see `FIELDS`
+        resolution (tuple, optional): Read from first frame if not given
+        expand_hight (bool, optional): See `ClipInfoOverlay`
+
+    """
+    missing = set(FIELDS) - set(info)
+    if missing:
+        raise KeyError("Missing clip info: %s" % ", ".join(sorted(missing)))
+
+    job = {
+        "frames": [list(frame) for frame in frames],
+        "info": info,
+        "resolution": resolution,
+        "expandHight": expand_hight,
+    }
+    with open(path, "w") as file:
+        json.dump(job, file, indent=4)
+
+
+def run_job(path, workers=None, callback=None):
+    """Run overlay job saved by `write_job`, return timing report"""
+    with open(path, "r") as file:
+        job = json.load(file)
+
+    frames = [tuple(frame) for frame in job["frames"]]
+    if not frames:
+        return render_sequence([], job["info"], (0, 0))
+
+    resolution = job["resolution"]
+    if not resolution:
+        from PIL import Image
+        resolution = Image.open(frames[0][0]).size
+
+    return render_sequence(frames,
+                           job["info"],
+                           tuple(resolution),
+                           expand_hight=job["expandHight"],
+                           workers=workers,
+                           callback=callback)
@@ -1,4 +1,140 @@
-import copy
+import sys
+import logging
+
+
+log = logging.getLogger(__name__)
+
+
+if sys.version_info.major == 3:
+    _SCALAR_TYPES = (type(None), bool, int, float, str)
+else:
+    _SCALAR_TYPES = (type(None), bool, int, long, float, str, unicode)  # noqa
+
+_SCALARS = frozenset(_SCALAR_TYPES)
+
+_DROP = object()
+
+
+def _is_object(value):
+    """Value that can not be dumped, e.g. pyblish instance or Maya node"""
+    return hasattr(value, '__dict__')
+
+
+def _sequence(value, items):
+    """Return items in the same kind of sequence as value"""
+    for kind in (tuple, frozenset, set):
+        if isinstance(value, kind):
+            return kind(items)
+    return list(items)
+
+
+def _format(path):
+    """Format path chain `((None, "a"), 0)` as `"a[0]"`"""
+    keys = list()
+    while path is not None:
+        path, key = path
+        keys.append(key)
+
+    formatted = ""
+    for key in reversed(keys):
+        if isinstance(key, int):
+            formatted += "[%d]" % key
+        else:
+            formatted += ".%s" % key if formatted else str(key)
+    return formatted
+
+
+def _prune(value, path, dropped, active):
+    """Return pruned copy of value, or `_DROP`
+
+    `path` is a chain of (parent path, key) and only be formatted when
+    being dropped.
+
+    """
+    value_type = type(value)
+
+    if value_type in _SCALARS:
+        return value
+
+    if isinstance(value, dict):
+        if id(value) in active:
+            # Circular reference
+            dropped.append(_format(path))
+            return _DROP
+
+        active.add(id(value))
+        copied = dict()
+        for key, item in value.items():
+            if type(item) not in _SCALARS:
+                item = _prune(item, (path, key), dropped, active)
+                if item is _DROP:
+                    continue
+            copied[key] = item
+        active.discard(id(value))
+
+        return copied
+
+    if (isinstance(value, (list, tuple, set, frozenset))
+            # Not pyblish instance (a list subclass)
+            and not _is_object(value)):
+        if _SCALARS.issuperset(map(type, value)):
+            # Fast path for node names, frame lists.. etc.
+            if isinstance(value, (tuple, frozenset)):
+                return value
+            return _sequence(value, value)
+
+        if id(value) in active:
+            dropped.append(_format(path))
+            return _DROP
+
+        active.add(id(value))
+        mark = len(dropped)
+        items = list()
+        for index, item in enumerate(value):
+            if (type(item) is tuple
+                    and _SCALARS.issuperset(map(type, item))):
+                # E.g. point positions, shared as is
+                items.append(item)
+                continue
+            item = _prune(item, (path, index), dropped, active)
+            if item is _DROP:
+                # Object bearing sequence, drop as a whole
+                del dropped[mark:]
+                dropped.append(_format(path))
+                items = _DROP
+                break
+            items.append(item)
+        active.discard(id(value))
+
+        return items if items is _DROP else _sequence(value, items)
+
+    if isinstance(value, _SCALAR_TYPES):
+        # Subclass of str, int.. etc.
+        return value
+
+    if _is_object(value):
+        dropped.append(_format(path))
+        return _DROP
+
+    # Other immutable values like ObjectId, datetime, shared as is
+    return value
+
+
+def prune(data, dropped=None):
+    """Copy dict with only dumpable values in one pass
+
+    Scalars and other immutable values (e.g. ObjectId) are shared, dicts,
+    lists and sets are copied. Keys which value is an object (has
+    `__dict__`), or a list that contains object, are skipped before
+    being copied.
+
+    :param data: (dict) Data to copy
+    :param dropped: (list) Optional, append skipped key paths into, e.g.
+        `["instance", "hierarchy.root", "members[2].node"]`
+    :return: (dict) Pruned copy
+    """
+    dropped = [] if dropped is None else dropped
+    return _prune(data, None, dropped, set())
 
 
 class DelayRunBuilder(object):
@@ -6,6 +142,7 @@ class DelayRunBuilder(object):
         self.delete_data = []
         self.instance_data = {}
         self.context_data = {}
+        self.dropped_keys = {"instance": [], "context": []}
 
         self._copy_dict(instance)
 
@@ -14,45 +151,17 @@ class DelayRunBuilder(object):
         return _data
 
     def _copy_dict(self, instance):
-        self.delete_data = []
+        dropped = self.dropped_keys
 
         _data = self.__remove_item(dict(instance.data))
-        instance_data = copy.deepcopy(_data)
+        self.instance_data = prune(_data, dropped["instance"])
+        self.context_data = prune(instance.context.data, dropped["context"])
 
-        self.walk_dict(instance_data)
-        self.instance_data = self.delete_keys_from_dict(
-            instance_data, self.delete_data
-        )
+        # Dropped key names
+        self.delete_data = sorted(set(
+            path.rsplit(".", 1)[-1].split("[", 1)[0]
+            for path in dropped["instance"] + dropped["context"]
+        ))
 
-        self.delete_data = []
-        context_data = dict(instance.context.data).copy()
-        self.walk_dict(context_data)
-        self.context_data = self.delete_keys_from_dict(
-            context_data, self.delete_data)
-
-    def walk_dict(self, d):
-        for k, v in sorted(d.items(), key=lambda x: x[0]):
-            if isinstance(v, dict):
-                self.walk_dict(v)
-            elif hasattr(v, '__dict__'):
-                self.delete_data.append(k)
-            elif isinstance(v, list):
-                for _v in v:
-                    if hasattr(_v, '__dict__'):
-                        self.delete_data.append(k)
-                        continue
-
-    def delete_keys_from_dict(self, dictionary, keys):
-        from collections import MutableMapping
-
-        keys_set = set(keys)
-
-        modified_dict = {}
-        for key, value in dictionary.items():
-            if key not in keys_set:
-                if isinstance(value, MutableMapping):
-                    modified_dict[key] = \
-                        self.delete_keys_from_dict(value, keys_set)
-                else:
-                    modified_dict[key] = value
-        return modified_dict
+        log.debug("Dropped from instance data: %s", dropped["instance"])
+        log.debug("Dropped from context data: %s", dropped["context"])
@@ -15,6 +15,8 @@ def get(shot_name):
 
         show_data = io.find_one({'type': 'project'}, projection={"name": True})
         shotgun = ShotgunIO(db_show_name=show_data['name'])
+        # One query for all shots, shared by tasks through the cache mirror
+        shotgun.prefetch()
 
         shotgun_shot_name = _mapping_shot_name_to_shotgun(shot_name)
         print("shotgun_shot_name from db: {}\n".format(shotgun_shot_name))
@@ -0,0 +1,253 @@
+import os
+import shutil
+import logging
+
+from avalon import io, api
+
+from reveries.common import str_to_objectid
+from reveries.transfer import FileTransfer, FILES
+
+
+log = logging.getLogger(__name__)
+
+
+def _child_key(document):
+    return (str_to_objectid(document.get("parent")),
+            document["type"],
+            document["name"])
+
+
+class ParenthoodCache(object):
+    """Project, asset, subset and version documents, fetched once
+
+    Documents are kept until project changed. Documents are added by
+    `PublishEngine` only after they are written into database, so
+    publishing many subsets or representations does not look up their
+    parents again.
+
+    """
+
+    def __init__(self):
+        self._project_name = None
+        self._project = None
+        self._documents = dict()
+        self._children = dict()
+
+    def clear(self):
+        self._project = None
+        self._documents.clear()
+        self._children.clear()
+
+    def _validate(self):
+        project_name = api.Session.get("AVALON_PROJECT")
+        if project_name != self._project_name:
+            self.clear()
+            self._project_name = project_name
+
+    def project(self):
+        self._validate()
+        if self._project is None:
+            self._project = io.find_one({"name": self._project_name,
+                                         "type": "project"})
+        return self._project
+
+    def add(self, document):
+        self._validate()
+        self._documents[document["_id"]] = document
+        self._children[_child_key(document)] = document
+
+    def get(self, _id):
+        """Return document by id"""
+        self._validate()
+        _id = str_to_objectid(_id)
+        document = self._documents.get(_id)
+        if document is None:
+            document = io.find_one({"_id": _id})
+            if document is not None:
+                self.add(document)
+        return document
+
+    def child(self, parent_id, doc_type, name):
+        """Return child document by name, not found result is not cached"""
+        self._validate()
+        parent_id = str_to_objectid(parent_id)
+        document = self._children.get((parent_id, doc_type, name))
+        if document is None:
+            document = io.find_one({"type": doc_type,
+                                    "parent": parent_id,
+                                    "name": name})
+            if document is not None:
+                self.add(document)
+        return document
+
+
+parenthood = ParenthoodCache()
+
+
+class PublishEngine(object):
+    """Batch database writes and file transfers of publish helpers
+
+    Documents are inserted with pre-generated ids when committed, one
+    `insert_many` for each document type, and queued updates of existing
+    documents are applied after that. Queued documents can be looked up
+    with `get` and `child` before commit, but they only go into the shared
+    `ParenthoodCache` once written. Files are transferred in parallel by
+    `reveries.transfer.FileTransfer`, which skips files that have the same
+    size and modification time as source. Files go first, so nothing is
+    written into database if transfer failed.
+
+    Usage:
+        >> engine = PublishEngine()
+        >> for asset_name, files in jobs:
+        ..     publish_set_group(asset_name, files, engine=engine)
+        >> engine.commit()
+
+    Arguments:
+        workers (int, optional): Max transfer thread count
+        cache (ParenthoodCache, optional): Default is the shared one
+
+    """
+
+    DOC_TYPES = ("subset", "version", "representation")
+
+    def __init__(self, workers=None, cache=None):
+        self.workers = workers
+        self.cache = cache or parenthood
+        self._reset()
+
+    def _reset(self):
+        self._documents = dict((doc_type, list())
+                               for doc_type in self.DOC_TYPES)
+        self._pending = dict()
+        self._pending_children = dict()
+        self._updates = list()
+        self._transfer = FileTransfer(workers=self.workers, logger=log)
+        self._dirs = set()
+        self._removes = list()
+
+    def insert(self, document):
+        """Queue document for insertion
+
+        Arguments:
+            document (dict): Subset, version or representation document
+
+        Returns:
+            ObjectId: Document id, pre-generated if not given
+
+        """
+        document.setdefault("_id", io.ObjectId())
+        self._documents[document["type"]].append(document)
+        self._pending[document["_id"]] = document
+        self._pending_children[_child_key(document)] = document
+        return document["_id"]
+
+    def update(self, filter_, update):
+        """Queue `io.update_many`, applied after insertions
+
+        Arguments:
+            filter_ (dict): Query of documents to update
+            update (dict): Update operators
+
+        """
+        self._updates.append((filter_, update))
+
+    def get(self, _id):
+        """Return document by id, queued or from database"""
+        document = self._pending.get(str_to_objectid(_id))
+        if document is None:
+            document = self.cache.get(_id)
+        return document
+
+    def child(self, parent_id, doc_type, name):
+        """Return child document by name, queued or from database"""
+        key = (str_to_objectid(parent_id), doc_type, name)
+        document = self._pending_children.get(key)
+        if document is None:
+            document = self.cache.child(parent_id, doc_type, name)
+        return document
+
+    def discard(self):
+        """Drop all queued documents, updates and transfers"""
+        self._reset()
+
+    def transfer(self, src, dst, job=FILES):
+        """Queue one file transfer, and create its dir before transfer"""
+        self._dirs.add(os.path.dirname(dst))
+        self._transfer.add(job, src, dst)
+
+    def remove_after(self, path):
+        """Remove directory after all transfers and insertions are done"""
+        self._removes.append(path)
+
+    def next_version(self, subset_id):
+        """Return next version number, including versions not committed"""
+        subset_id = str_to_objectid(subset_id)
+        latest = io.find_one({"type": "version", "parent": subset_id},
+                             sort=[("name", -1)],
+                             projection={"name": True})
+        names = [int(latest["name"])] if latest else [0]
+        names += [int(version["name"])
+                  for version in self._documents["version"]
+                  if str_to_objectid(version["parent"]) == subset_id]
+        return max(names) + 1
+
+    def publish_dir(self, version_id, name):
+        """Return representation publish dir from project template"""
+        version = self.get(version_id)
+        subset = self.get(version["parent"])
+        asset = self.get(subset["parent"])
+        project = self.cache.project()
+        template = project["config"]["template"]["publish"]
+
+        return template.format(**{
+            "root": api.registered_root(),
+            "project": project["name"],
+            "asset": asset["name"],
+            "silo": asset["silo"],
+            "subset": subset["name"],
+            "version": version["name"],
+            "representation": name,
+        })
+
+    def commit(self):
+        """Transfer files then insert and update all queued documents
+
+        Returns:
+            dict: Transfer statistics, see `FileTransfer.run`
+
+        """
+        try:
+            for dirname in sorted(self._dirs):
+                if not os.path.isdir(dirname):
+                    os.makedirs(dirname)
+                    try:
+                        os.chmod(dirname, 0o777)
+                    except OSError as e:
+                        log.warning("Can't change mode of %s: %s",
+                                    dirname, e)
+
+            stats = self._transfer.run()
+
+            for doc_type in self.DOC_TYPES:
+                documents = self._documents[doc_type]
+                if documents:
+                    log.info("Registering %d %s(s) ..",
+                             len(documents), doc_type)
+                    io.insert_many(documents)
+                    for document in documents:
+                        self.cache.add(document)
+
+            for filter_, update in self._updates:
+                io.update_many(filter_, update)
+
+        except Exception:
+            self._reset()
+            raise
+
+        for path in self._removes:
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+        self._reset()
+
+        return stats
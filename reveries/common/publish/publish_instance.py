@@ -1,16 +1,14 @@
 import os
-import shutil
-import errno
 
 from avalon import api, io
-from avalon.vendor import filelink
 
 from reveries.common import str_to_objectid
+from reveries.common.publish.engine import PublishEngine
 
 
 class PublishInstance(object):
-    def __init__(self):
-        pass
+    def __init__(self, engine=None):
+        self.engine = engine or PublishEngine()
 
     def publish(self, instance):
 
@@ -27,17 +25,13 @@ class PublishInstance(object):
         subset, version, representations = instance.data["toDatabase"]
 
         # Write subset if not exists
-        _filter = {
-            "parent": str_to_objectid(asset["_id"]), "name": subset["name"]
-        }
-        if io.find_one(_filter) is None:
-            io.insert_one(subset)
+        if self.engine.child(asset["_id"], "subset", subset["name"]) is None:
+            self.engine.insert(subset)
 
         # Write version if not exists
-        _filter = {
-            "parent": str_to_objectid(subset["_id"]), "name": version["name"]
-        }
-        existed_version = io.find_one(_filter)
+        existed_version = self.engine.child(subset["_id"],
+                                            "version",
+                                            version["name"])
 
         if existed_version is None:
             # Write version and representations to database
@@ -65,15 +59,15 @@ class PublishInstance(object):
                         update["$inc"] = {"data.progress.current": progress}
                     else:
                         pass  # progress == -1, no progress update needed.
-                    io.update_many(filter_, update)
+                    self.engine.update(filter_, update)
 
             else:
                 print("Version existed, representation file has been "
-                              "overwritten.")
+                      "overwritten.")
                 # Update version document "data.time"
                 filter_ = {"_id": existed_version["_id"]}
                 update = {"$set": {"data.time": context.data["time"]}}
-                io.update_many(filter_, update)
+                self.engine.update(filter_, update)
 
                 # Update representation documents "data"
                 for representation in representations:
@@ -82,7 +76,7 @@ class PublishInstance(object):
                         "parent": existed_version["_id"],
                     }
                     update = {"$set": {"data": representation["data"]}}
-                    io.update_many(filter_, update)
+                    self.engine.update(filter_, update)
 
     def write_database(self, instance, version, representations):
         """Write version and representations to database
@@ -98,15 +92,15 @@ class PublishInstance(object):
         if "pregeneratedVersionId" in instance.data:
             version["_id"] = instance.data["pregeneratedVersionId"]
 
-        version_id = io.insert_one(version).inserted_id
+        version_id = self.engine.insert(version)
 
         # Write representations
-        print("Registering {} representations ...".format(len(representations)))
+        print("Registering {} representations ...".format(
+            len(representations)))
 
         for representation in representations:
             representation["parent"] = version_id
-
-        io.insert_many(representations)
+            self.engine.insert(representation)
 
         return version_id
 
@@ -118,13 +112,14 @@ class PublishInstance(object):
         for version_id_, data in instance.data["dependencies"].items():
             filter_ = {"_id": io.ObjectId(version_id_)}
             update = {"$set": {field: {"count": data["count"]}}}
-            io.update_many(filter_, update)
+            self.engine.update(filter_, update)
 
 
 class IntegrateAvalonSubset(object):
 
-    def __init__(self, *args, **kwargs):
-        super(IntegrateAvalonSubset, self).__init__(*args, **kwargs)
+    def __init__(self, engine=None):
+        super(IntegrateAvalonSubset, self).__init__()
+        self.engine = engine or PublishEngine()
         self.is_progressive = None
         self.progress = 0
         self.progress_output = None
@@ -276,8 +271,6 @@ class IntegrateAvalonSubset(object):
         #     \|________|
         #
 
-        transfered = list()
-
         for job in self.transfers:
             transfers = self.transfers[job]
 
@@ -294,60 +287,20 @@ class IntegrateAvalonSubset(object):
                             and src not in progress_output):
                         continue
 
-                print("Copying {0}: {1} \n"
-                      "          -> {2}".format(job, src, dst))
-
                 if src == dst:
-                    print("Source and destination are the same, will not copy.")
+                    print("Source and destination are the same, "
+                          "will not copy.")
                     continue
 
-                if dst in transfered:
-                    # (TODO) Should not implement like this. This is a hot-fix.
-                    print("File transfered: %s" % dst)
-                    continue
-
-                if job == "files":
-                    self.copy_file(src, dst)
-                if job == "hardlinks":
-                    self.hardlink_file(src, dst)
-
-                transfered.append(dst)
-
-    def copy_file(self, src, dst):
-        file_dir = os.path.dirname(dst)
-        if not os.path.isdir(file_dir):
-            os.makedirs(file_dir)
-
-        try:
-            shutil.copy2(src, dst)
-        except OSError:
-            msg = "An unexpected error occurred."
-            print(msg)
-            raise OSError(msg)
-
-    def hardlink_file(self, src, dst):
-        if os.path.isfile(dst):
-            print("File exists, skip creating hardlink: %s" % dst)
-            return
-
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                print("An unexpected error occurred.")
-                raise
-
-        filelink.create(src, dst, filelink.HARDLINK)
+                # Queued, transferred in parallel when engine commits
+                self.engine.transfer(src, dst, job=job)
 
     def get_subset(self, instance, families):
         asset_id = str_to_objectid(instance.data["assetDoc"]["_id"])
 
-        subset = io.find_one({"type": "subset",
-                              "parent": asset_id,
-                              "name": instance.data["subset"]})
+        subset = self.engine.child(asset_id,
+                                   "subset",
+                                   instance.data["subset"])
 
         if subset is None:
             subset_name = instance.data["subset"]
@@ -494,12 +447,31 @@ class ContextReCreator(object):
         self.data = context
 
 
-def run(instance, context=None):
+def run(instance, context=None, engine=None):
+    """Integrate files and write database of the instance
+
+    :param instance: (obj/dict) Pyblish instance or instance data
+    :param context: (dict) Context data, required if instance is a dict
+    :param engine: (PublishEngine) Optional. If given, files and documents
+        are queued in the engine until `engine.commit()`, otherwise
+        committed right away.
+    """
+    commit = engine is None
+    engine = engine or PublishEngine()
+
     if instance and context:
         instance = InstanceReCreator(instance, context)
 
-    integrater = IntegrateAvalonSubset()
-    instance = integrater.process(instance)
+    try:
+        integrater = IntegrateAvalonSubset(engine)
+        instance = integrater.process(instance)
+
+        publisher = PublishInstance(engine)
+        publisher.publish(instance)
+    except Exception:
+        # Not to commit a partially queued instance later
+        engine.discard()
+        raise
 
-    publisher = PublishInstance()
-    publisher.publish(instance)
+    if commit:
+        engine.commit()
@@ -1,14 +1,18 @@
-from avalon import io
+from reveries.common.publish.engine import PublishEngine
 
 
-def publish(asset_id, subset_name, families):
+def publish(asset_id, subset_name, families, engine=None):
     """
     Publish subset.
     :param asset_id: (object)
     :param subset_name: (str)
     :param families: (list)
+    :param engine: (PublishEngine) Optional. If given, new subset is queued
+        in the engine until `engine.commit()`, otherwise inserted right away.
     :return:
     """
+    commit = engine is None
+    engine = engine or PublishEngine()
 
     subset_context = {
         'name': subset_name,
@@ -20,11 +24,12 @@ def publish(asset_id, subset_name, families):
         },
         'schema': 'avalon-core:subset-3.0'}
 
-    _filter = {"parent": asset_id, "name": subset_name}
-    subset_data = io.find_one(_filter)
+    subset_data = engine.child(asset_id, 'subset', subset_name)
 
     if subset_data is None:
-        subset_id = io.insert_one(subset_context).inserted_id
+        subset_id = engine.insert(subset_context)
+        if commit:
+            engine.commit()
     else:
         subset_id = subset_data['_id']
 
@@ -1,21 +1,26 @@
 import getpass
 
-from avalon import io, api
+from avalon import api
 
+from reveries.common.publish.engine import PublishEngine
+
+
+def publish(subset_id, engine=None, **kwargs):
+    """
+    Publish version.
+    :param subset_id: (obj/str) Subset id
+    :param engine: (PublishEngine) Optional. If given, version is queued
+        in the engine until `engine.commit()`, otherwise inserted right away.
+    :param kwargs: (dict) Version name and data
+    :return: Version id
+    """
+    commit = engine is None
+    engine = engine or PublishEngine()
 
-def publish(subset_id, **kwargs):
     # Check publish version name
     version_name = kwargs.get('version_name', None)
     if not version_name:
-        _filter = {
-            "type": "version",
-            "parent": io.ObjectId(subset_id)
-        }
-        version_data = io.find_one(_filter, sort=[("name", -1)])
-        if version_data:
-            version_name = int(version_data['name']) + 1
-        else:
-            version_name = 1
+        version_name = engine.next_version(subset_id)
 
     # Get publish value
     source = kwargs.get('source', '')
@@ -43,5 +48,9 @@ def publish(subset_id, **kwargs):
         },
         'schema': 'avalon-core:version-3.0'
     }
-    version_id = io.insert_one(version_context).inserted_id
+    version_id = engine.insert(version_context)
+
+    if commit:
+        engine.commit()
+
     return version_id
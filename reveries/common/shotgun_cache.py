@@ -0,0 +1,322 @@
+"""Read-through cache for Shotgun queries
+
+Lookups go through backends in order (usually an in-process LRU then an
+on-disk mirror shared by all processes on the machine). Expired or
+missing entries are fetched once, concurrent requests of the same key in
+one process wait for that fetch. If fetching fails (e.g. Shotgun server
+unreachable), the last known value is returned even it has expired.
+
+Environment:
+    REVERIES_SHOTGUN_CACHE: Path of on-disk mirror, `.json` for a JSON
+        file, SQLite database otherwise. Set to empty string to disable.
+        Default is `reveries_shotgun.sqlite` in temp dir.
+    REVERIES_SHOTGUN_CACHE_TTL: Seconds before entries expire, default
+        3600.
+
+"""
+import os
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+log = logging.getLogger(__name__)
+
+
+def make_key(*parts):
+    """Return cache key string from JSON serializable parts"""
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+class MemoryBackend(object):
+    """In-process LRU backend
+
+    :param maxsize: (int) Max entry count
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (stamp, value) or None"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set_many(self, items, stamp):
+        with self._lock:
+            for key, value in items:
+                self._entries.pop(key, None)
+                self._entries[key] = (stamp, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend(object):
+    """On-disk mirror in SQLite database, safe for concurrent processes
+
+    :param path: (str) Database file path
+    """
+
+    def __init__(self, path):
+        self.path = path
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS cache "
+                             "(key TEXT PRIMARY KEY, stamp REAL, value TEXT)")
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key):
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT stamp, value FROM cache WHERE key=?",
+                               (key,)).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def set_many(self, items, stamp):
+        rows = [(key, stamp, json.dumps(value, default=str))
+                for key, value in items]
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO cache "
+                                 "(key, stamp, value) VALUES (?, ?, ?)",
+                                 rows)
+        finally:
+            conn.close()
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache")
+        finally:
+            conn.close()
+
+
+class JSONBackend(object):
+    """On-disk mirror in one JSON file, replaced atomically on write
+
+    :param path: (str) JSON file path
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as fp:
+                return json.load(fp)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def get(self, key):
+        entry = self._load().get(key)
+        return None if entry is None else tuple(entry)
+
+    def set_many(self, items, stamp):
+        with self._lock:
+            entries = self._load()
+            for key, value in items:
+                entries[key] = [stamp, value]
+
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".",
+                                       suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                json.dump(entries, fp, default=str)
+            try:
+                os.replace(tmp, self.path)
+            except AttributeError:
+                # Python 2
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                os.rename(tmp, self.path)
+
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def default_backends():
+    """Return in-process LRU and the on-disk mirror from environment"""
+    backends = [MemoryBackend()]
+
+    path = os.environ.get("REVERIES_SHOTGUN_CACHE")
+    if path is None:
+        path = os.path.join(tempfile.gettempdir(), "reveries_shotgun.sqlite")
+    if not path:
+        return backends
+
+    try:
+        if path.endswith(".json"):
+            backends.append(JSONBackend(path))
+        else:
+            backends.append(SQLiteBackend(path))
+    except Exception as e:
+        log.warning("Shotgun cache mirror %s not available: %s", path, e)
+
+    return backends
+
+
+class ShotgunCache(object):
+    """Read-through cache with request coalescing and offline fallback
+
+    Example:
+        >> cache = ShotgunCache()
+        >> project = cache.get(make_key("Project", name),
+        ..                     lambda: shotgun.find_one("Project", filters))
+
+    :param backends: (list) Backends to look up in order, default from
+        `default_backends`
+    :param ttl: (float) Seconds before entries expire
+    """
+
+    def __init__(self, backends=None, ttl=None):
+        if backends is None:
+            backends = default_backends()
+        if ttl is None:
+            ttl = float(os.environ.get("REVERIES_SHOTGUN_CACHE_TTL", 3600))
+
+        self.backends = backends
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._inflight = dict()
+
+    def _lookup(self, key):
+        """Return (stamp, value, backend index) of the newest entry or None
+
+        Stop at the first unexpired entry, so an expired entry in memory
+        could be refreshed by the mirror which other process updated.
+
+        """
+        found = None
+        now = time.time()
+        for index, backend in enumerate(self.backends):
+            try:
+                entry = backend.get(key)
+            except Exception as e:
+                log.debug("Shotgun cache read failed: %s", e)
+                continue
+            if entry is None:
+                continue
+            if found is None or entry[0] > found[0]:
+                found = (entry[0], entry[1], index)
+            if now - entry[0] < self.ttl:
+                break
+        return found
+
+    def _fresh(self, key):
+        entry = self._lookup(key)
+        if entry is None:
+            return None, None
+
+        stamp, value, index = entry
+        if time.time() - stamp >= self.ttl:
+            return None, entry
+
+        if index:
+            # Promote to faster backends
+            for backend in self.backends[:index]:
+                backend.set_many([(key, value)], stamp)
+        return entry, entry
+
+    def peek(self, key):
+        """Return unexpired cached value or None, never fetch"""
+        fresh, _ = self._fresh(key)
+        return None if fresh is None else fresh[1]
+
+    def set_many(self, items):
+        """Store (key, value) pairs in all backends"""
+        items = list(items)
+        stamp = time.time()
+        for backend in self.backends:
+            try:
+                backend.set_many(items, stamp)
+            except Exception as e:
+                log.warning("Shotgun cache write failed: %s", e)
+
+    def get(self, key, fetch):
+        """Return cached value, or fetch and cache it
+
+        :param key: (str) Cache key from `make_key`
+        :param fetch: (callable) Return value to cache, called without args
+        :return: Value
+        """
+        fresh, entry = self._fresh(key)
+        if fresh is not None:
+            return fresh[1]
+
+        with self._lock:
+            event = self._inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self._inflight[key] = threading.Event()
+
+        if not owner:
+            # Same key being fetched in other thread
+            event.wait()
+            fresh, entry = self._fresh(key)
+            if fresh is not None:
+                return fresh[1]
+            if entry is not None:
+                return entry[1]
+            # Other thread failed, try ourself
+            return self._fetch(key, fetch, entry)
+
+        try:
+            return self._fetch(key, fetch, entry)
+        finally:
+            with self._lock:
+                self._inflight.pop(key)
+            event.set()
+
+    def _fetch(self, key, fetch, stale):
+        try:
+            value = fetch()
+        except Exception as e:
+            if stale is None:
+                raise
+            log.warning("Shotgun query failed, using cached result from "
+                        "%s: %s", time.ctime(stale[0]), e)
+            return stale[1]
+
+        self.set_many([(key, value)])
+        return value
+
+    def clear(self):
+        for backend in self.backends:
+            backend.clear()
+
+
+_cache = {"_": None}
+
+
+def shared():
+    """Return the process-wide cache, created on first use"""
+    if _cache["_"] is None:
+        _cache["_"] = ShotgunCache()
+    return _cache["_"]
@@ -1,68 +1,200 @@
 import sys
+import logging
 sys.path.append(r'Q:\Resource\python_modules')
 
 from pprint import pprint
 
-import shotgun_api3
+try:
+    import shotgun_api3
+except ImportError:
+    shotgun_api3 = None
+
+from reveries.common.shotgun_cache import make_key, shared  # noqa: E402
+
+
+log = logging.getLogger(__name__)
+
+
+SHOT_FIELDS = ["sg_cut_in", "code", "sg_cut_out"]
+ASSET_FIELDS = ['id', 'code', 'name', 'sg_asset_type']
+# Asset fields fetched in `ShotgunIO.prefetch`
+PREFETCH_ASSET_FIELDS = ASSET_FIELDS + ['tags', 'assets']
+
+
+def _is_local_filter(_filter):
+    """Return True if filter could be resolved on prefetched assets
+
+    Only single value fields, "is" on multi-entity fields (e.g. 'tags') is
+    membership test in Shotgun.
+    """
+    return (len(_filter) == 3
+            and _filter[1] == 'is'
+            and _filter[0] in ASSET_FIELDS)
+
+
+def _match(entity, filters):
+    return all(entity.get(field) == value for field, _, value in filters)
 
 
 class ShotgunIO(object):
+    """Query show data from Shotgun through read-through cache
+
+    Queries are cached in `reveries.common.shotgun_cache` (in-process and
+    on-disk mirror), connection is made only if cache missed. Cached
+    results are used if Shotgun server is unreachable.
+
+    :param cache: (ShotgunCache) Cache to use, default is the shared one
+    """
+
     def __init__(self, server='https://moonshine.shotgunstudio.com/',
                  login='artist', password='Artist1234',
-                 sg_show_name=None, db_show_name=None):
+                 sg_show_name=None, db_show_name=None, cache=None):
+        self.server = server
+        self.cache = cache or shared()
         self.sg_project = None
 
+        self._login = login
+        self._password = password
+        self._shotgun = None
+
         if not sg_show_name and not db_show_name:
             return
 
-        self.shotgun = shotgun_api3.Shotgun(
-            server, login=login, password=password
+        try:
+            if sg_show_name:
+                self._get_current_project(sg_show_name)
+            else:
+                self._get_shotgun_show_name_from_db(db_show_name)
+        except Exception as e:
+            log.warning("Can't get Shotgun project: %s", e)
+
+    @property
+    def shotgun(self):
+        """Shotgun connection, connect on first access"""
+        if self._shotgun is None:
+            if shotgun_api3 is None:
+                raise ImportError("Module 'shotgun_api3' not found.")
+            self._shotgun = shotgun_api3.Shotgun(
+                self.server, login=self._login, password=self._password
+            )
+        return self._shotgun
+
+    def _find_project(self, field, value):
+        return self.cache.get(
+            make_key(self.server, 'Project', field, value),
+            lambda: self.shotgun.find_one('Project', [[field, 'is', value]])
         )
 
-        if sg_show_name:
-            self._get_current_project(sg_show_name)
-        else:
-            self._get_shotgun_show_name_from_db(db_show_name)
-
     def _get_shotgun_show_name_from_db(self, db_show_name):
         # fields = ['cached_display_name', 'tank_name']
-        filters = [
-            ['tank_name', 'is', db_show_name]
-        ]
-
-        self.sg_project = self.shotgun.find_one('Project', filters)
+        self.sg_project = self._find_project('tank_name', db_show_name)
 
         # Double check show name
         if not self.sg_project:
             _name = db_show_name.split('_')
-            if _name:
-                filters = [['name', 'is', _name[1]]]
-                self.sg_project = self.shotgun.find_one('Project', filters)
+            if len(_name) > 1:
+                self.sg_project = self._find_project('name', _name[1])
 
     def _get_current_project(self, sg_show_name):
-        self.sg_project = self.shotgun.find_one(
-            'Project', [['name', 'is', sg_show_name]]
-        )
+        self.sg_project = self._find_project('name', sg_show_name)
+
+    def _shot_key(self, shot_name):
+        return make_key(self.server, 'Shot', self.sg_project['id'], shot_name)
 
-    def get_assets(self, fields=[], filters=[]):
-        fields += ['id', 'code', 'name', 'sg_asset_type']  # , 'tags'
-        filters += [
+    def _assets_key(self):
+        return make_key(self.server, 'Asset', self.sg_project['id'])
+
+    def prefetch(self):
+        """Fetch all shots and assets of the show in two queries
+
+        Results are stored in cache, so following `get_frame_range` and
+        `get_assets` calls (in this or other processes that share the
+        on-disk mirror) are resolved without connecting to Shotgun.
+
+        :return: (bool) False if nothing could be fetched
+        """
+        if not self.sg_project:
+            return False
+
+        project = self.sg_project
+
+        def fetch_all():
+            project_filter = [['project', 'is', project]]
+            shots = self.shotgun.find('Shot', project_filter, SHOT_FIELDS)
+            assets = self.shotgun.find('Asset',
+                                       project_filter,
+                                       PREFETCH_ASSET_FIELDS)
+
+            items = [(self._shot_key(shot['code']), shot) for shot in shots]
+            items.append((self._assets_key(), assets))
+            self.cache.set_many(items)
+
+            return [len(shots), len(assets)]
+
+        try:
+            counts = self.cache.get(
+                make_key(self.server, 'Prefetch', project['id']),
+                fetch_all
+            )
+        except Exception as e:
+            log.warning("Can't prefetch from Shotgun: %s", e)
+            return False
+
+        log.debug("Prefetched %d shots and %d assets.", *counts)
+        return True
+
+    def get_assets(self, fields=None, filters=None):
+        fields = list(fields or []) + ASSET_FIELDS  # , 'tags'
+        filters = list(filters or [])
+
+        if (set(fields).issubset(PREFETCH_ASSET_FIELDS)
+                and all(_is_local_filter(f) for f in filters)):
+            prefetched = self.cache.peek(self._assets_key())
+            if prefetched is not None:
+                return [asset for asset in prefetched
+                        if _match(asset, filters)]
+
+        _filters = filters + [
             ['project', 'is', self.sg_project],
             # ['sg_asset_type', 'is', 'Set'],
             # ['code', 'is', 'BillboardGroup'],
         ]
 
-        assets = self.shotgun.find('Asset', filters, fields)
+        assets = self.cache.get(
+            make_key(self.server, 'Asset', self.sg_project['id'],
+                     sorted(set(fields)), filters),
+            lambda: self.shotgun.find('Asset', _filters, fields)
+        )
         return assets
 
-    def get_frame_range(self, shot_name, fields=[], filters=[]):
-        _fields = ["sg_cut_in", "code", "sg_cut_out"] + fields  # , 'tags'
+    def get_frame_range(self, shot_name, fields=None, filters=None):
+        if not self.sg_project:
+            return {}
+
+        fields = list(fields or [])
+        filters = list(filters or [])
+
+        _fields = SHOT_FIELDS + fields  # , 'tags'
         _filters = [
             ['project', 'is', self.sg_project],
             ['code', 'is', shot_name],
         ] + filters
 
-        frame_range = self.shotgun.find_one('Shot', _filters, _fields)
+        if fields or filters:
+            key = make_key(self.server, 'Shot', self.sg_project['id'],
+                           shot_name, fields, filters)
+        else:
+            key = self._shot_key(shot_name)
+
+        try:
+            frame_range = self.cache.get(
+                key, lambda: self.shotgun.find_one('Shot', _filters, _fields)
+            )
+        except Exception as e:
+            log.warning("Can't get frame range of %s from Shotgun: %s",
+                        shot_name, e)
+            frame_range = None
+
         return frame_range or {}
 
 
@@ -0,0 +1,98 @@
+
+import os
+import json
+import gzip
+
+
+SCHEMA = "reveries:dump-1.0"
+
+COMPACT_EXT = ".gz"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class DumpSchemaError(Exception):
+    pass
+
+
+def compact_enabled():
+    """Return True if compact dump is enabled by `PYBLISH_COMPACT_DUMP`"""
+    value = os.getenv("PYBLISH_COMPACT_DUMP", "")
+    return value.lower() in ("1", "true", "yes")
+
+
+def dump_path(path, compact=None):
+    """Return dump file path for writing
+
+    Compact dumps have an extra `.gz` extension, e.g. `.instance.json.gz`.
+
+    Arguments:
+        path (str): Plain JSON dump file path
+        compact (bool, optional): Default by `compact_enabled()`
+
+    """
+    if compact is None:
+        compact = compact_enabled()
+    if compact and not path.endswith(COMPACT_EXT):
+        path += COMPACT_EXT
+    return path
+
+
+def find(path):
+    """Return existing dump file path in either format, or None"""
+    base = path[:-len(COMPACT_EXT)] if path.endswith(COMPACT_EXT) else path
+    for candidate in (path, base, base + COMPACT_EXT):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def is_dump_file(file_name):
+    return file_name.endswith((".json", ".json" + COMPACT_EXT))
+
+
+def write(path, data, cls=None):
+    """Write dump, in compact format if path ends with `.gz`
+
+    Plain JSON dumps are written with indent for human reading, compact
+    dumps are gzip'd JSON without whitespace, wrapped with schema version.
+
+    Arguments:
+        path (str): Dump file path
+        data (dict): Dump data
+        cls (json.JSONEncoder, optional): Custom JSON encoder
+
+    """
+    if path.endswith(COMPACT_EXT):
+        wrapped = {"schema": SCHEMA, "data": data}
+        content = json.dumps(wrapped, separators=(",", ":"), cls=cls)
+        with gzip.open(path, "wb", compresslevel=1) as file:
+            file.write(content.encode("utf-8"))
+    else:
+        with open(path, "w") as file:
+            json.dump(data, file, indent=4, sort_keys=True, cls=cls)
+
+
+def read(path):
+    """Read dump in either format
+
+    The format is detected from file content, not the extension.
+
+    Raises:
+        DumpSchemaError: If compact dump has unsupported schema
+
+    """
+    with open(path, "rb") as file:
+        magic = file.read(2)
+
+    if magic != _GZIP_MAGIC:
+        with open(path, "r") as file:
+            return json.load(file)
+
+    with gzip.open(path, "rb") as file:
+        wrapped = json.loads(file.read().decode("utf-8"))
+
+    if wrapped.get("schema") != SCHEMA:
+        raise DumpSchemaError("Unsupported dump schema %r: %s"
+                              % (wrapped.get("schema"), path))
+    return wrapped["data"]
@@ -0,0 +1,308 @@
+
+import sys
+import time
+import logging
+import traceback
+import multiprocessing
+
+from . import dumps
+
+
+log = logging.getLogger(__name__)
+
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+BLOCKED = "blocked"
+
+_TIMED_OUT = "Timed out, worker process may have died."
+
+
+def dependencies(extractors, done=None):
+    """Resolve dependencies between delayed extractors of one instance
+
+    An extractor may list the representation names it depends on in
+    `dependsOn`. If not, it depends on every extractor that has a lower
+    `order`, which keeps the old sequential behavior for ordered extractors,
+    and extractors sharing the same order (default -1) are independent.
+
+    Arguments:
+        extractors (list): List of (repr_name, extractor) tuples
+        done (iterable, optional): Names of extractors that were done and
+            not in `extractors`, they are dropped from dependencies
+
+    Returns:
+        dict: {repr_name: [repr_name, ...]}
+
+    """
+    done = set(done or [])
+    names = set(name for name, _ in extractors)
+    graph = dict()
+
+    for name, extractor in extractors:
+        if "dependsOn" in extractor:
+            depends = [dep for dep in extractor["dependsOn"]
+                       if dep not in done]
+            missing = set(depends) - names
+            if missing:
+                raise ValueError("Extractor %s depends on unknown "
+                                 "representation: %s"
+                                 % (name, ", ".join(sorted(missing))))
+        else:
+            order = extractor.get("order", -1)
+            depends = [other for other, ext in extractors
+                       if ext.get("order", -1) < order]
+
+        graph[name] = sorted(depends)
+
+    return graph
+
+
+def load_dump(path):
+    return dumps.read(path)
+
+
+def save_dump(path, data):
+    dumps.write(path, data)
+
+
+def update_dump(path, **status):
+    """Write extractor status and timing back into the dump file"""
+    data = load_dump(path)
+    data.update(status)
+    save_dump(path, data)
+
+
+def format_error(func_name, module, exc_info):
+    """Format exception into one line message with last callstack"""
+    _, error, tb = exc_info
+    last_callstack = traceback.extract_tb(tb)[-1]
+    lineno = last_callstack[1]
+
+    err_msg = "{file}, line {line}, in {func}: {err}"
+    return err_msg.format(file=module,
+                          line=lineno,
+                          func=func_name,
+                          err=str(error))
+
+
+def _timed(execute, name):
+    """Run one job and return (name, seconds, error), never raise"""
+    start = time.time()
+    try:
+        execute(name)
+    except Exception:
+        error = "".join(traceback.format_exception(*sys.exc_info()))
+    else:
+        error = None
+
+    return name, time.time() - start, error
+
+
+class ExtractionRunner(object):
+    """Run jobs by dependency, independent jobs run in a process pool
+
+    Jobs are streamed into the pool as soon as their dependencies are done,
+    so one slow job does not hold back others which are not depending on it.
+    If a job failed, jobs depending on it will be marked as `blocked` and
+    not run.
+
+    With `workers` less than 2, jobs are run one by one in current process,
+    which is required when extractors need the scene of current session.
+    Otherwise the `execute` function must be picklable (module level), and
+    `initializer` could be used to prepare each worker process, e.g. open
+    the scene file.
+
+    Arguments:
+        execute (callable): Function that takes job name and run it
+        workers (int, optional): Process count, default 1
+        initializer (callable, optional): Worker process initializer
+        initargs (tuple, optional): Arguments for `initializer`
+        on_finish (callable, optional): Called with (name, result) in main
+            process right after each job finished, blocked jobs included
+        logger (logging.Logger, optional): Logger for progress report
+        timeout (float, optional): Seconds that one pooled job may take
+            before it is marked as failed, e.g. the worker process died.
+            Default None, no limit
+
+    """
+
+    def __init__(self,
+                 execute,
+                 workers=1,
+                 initializer=None,
+                 initargs=(),
+                 on_finish=None,
+                 logger=None,
+                 timeout=None):
+        self.execute = execute
+        self.workers = workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self.on_finish = on_finish
+        self.log = logger or log
+        self.timeout = timeout
+
+    def run(self, jobs, done=None):
+        """Run jobs
+
+        Arguments:
+            jobs (dict): {name: [dependency name, ...]}
+            done (iterable, optional): Names of jobs that were already done
+                in previous run, they satisfy the dependencies but won't be
+                run again.
+
+        Returns:
+            dict: {name: {"status": str, "seconds": float, "error": str}}
+
+        """
+        done = set(done or [])
+        pending = dict((name, set(depends) - done)
+                       for name, depends in jobs.items()
+                       if name not in done)
+
+        unknown = set()
+        for depends in pending.values():
+            unknown.update(depends - set(pending))
+        if unknown:
+            raise ValueError("Unknown dependencies: %s"
+                             % ", ".join(sorted(unknown)))
+
+        self._check_cycle(pending)
+
+        results = dict()
+        if not pending:
+            return results
+
+        if self.workers < 2 or len(pending) < 2:
+            self._run_inline(pending, results)
+        else:
+            self._run_pool(pending, results)
+
+        return results
+
+    def _check_cycle(self, pending):
+        remaining = dict((name, set(deps)) for name, deps in pending.items())
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError("Cyclic dependencies: %s"
+                                 % ", ".join(sorted(remaining)))
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    def _pop_ready(self, pending):
+        ready = sorted(name for name, deps in pending.items() if not deps)
+        for name in ready:
+            del pending[name]
+        return ready
+
+    def _finish(self, pending, results, name, seconds, error):
+        result = {
+            "status": FAILED if error else DONE,
+            "seconds": seconds,
+            "error": error,
+        }
+        results[name] = result
+
+        if error:
+            self.log.error("Extraction [%s] failed:\n%s" % (name, error))
+        else:
+            self.log.info("Extraction [%s] done in %.2f sec."
+                          % (name, seconds))
+        if self.on_finish is not None:
+            self.on_finish(name, result)
+
+        if error:
+            self._block(pending, results, name)
+        else:
+            for deps in pending.values():
+                deps.discard(name)
+
+    def _block(self, pending, results, failed):
+        blocked = [name for name, deps in pending.items() if failed in deps]
+        for name in blocked:
+            if name not in pending:
+                continue  # Blocked by recursion
+            del pending[name]
+            result = {
+                "status": BLOCKED,
+                "seconds": 0,
+                "error": "Dependency %s failed." % failed,
+            }
+            results[name] = result
+
+            self.log.warning("Extraction [%s] blocked." % name)
+            if self.on_finish is not None:
+                self.on_finish(name, result)
+
+            self._block(pending, results, name)
+
+    def _run_inline(self, pending, results):
+        while pending:
+            ready = self._pop_ready(pending)
+            if not ready:
+                break
+            for name in ready:
+                self._finish(pending, results, *_timed(self.execute, name))
+
+    def _run_pool(self, pending, results):
+        pool = multiprocessing.Pool(min(self.workers, len(pending)),
+                                    self.initializer,
+                                    self.initargs)
+        running = dict()  # {name: (AsyncResult, start time)}
+        timed_out = False
+        try:
+            while pending or running:
+                for name in self._pop_ready(pending):
+                    async_result = pool.apply_async(_timed,
+                                                    (self.execute, name))
+                    running[name] = (async_result, time.time())
+
+                if not running:
+                    break
+
+                for args in self._collect(running):
+                    timed_out = timed_out or args[2] == _TIMED_OUT
+                    self._finish(pending, results, *args)
+        finally:
+            if timed_out or running:
+                # Stuck or interrupted jobs will never return
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+
+    def _collect(self, running):
+        """Wait and pop finished jobs from `running`
+
+        Jobs that could not be sent to or returned from worker, or were
+        timed out, are returned as failed instead of waiting forever.
+
+        """
+        while True:
+            finished = list()
+            for name, (async_result, start) in sorted(running.items()):
+                seconds = time.time() - start
+                if async_result.ready():
+                    try:
+                        finished.append(async_result.get())
+                    except Exception:
+                        error = "".join(
+                            traceback.format_exception(*sys.exc_info()))
+                        finished.append((name, seconds, error))
+                elif self.timeout is not None and seconds > self.timeout:
+                    finished.append((name, seconds, _TIMED_OUT))
+                else:
+                    continue
+                del running[name]
+
+            if finished:
+                return finished
+
+            # Blocking `wait` with timeout so KeyboardInterrupt works
+            oldest = min(running.values(), key=lambda item: item[1])
+            oldest[0].wait(0.1)
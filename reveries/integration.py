@@ -0,0 +1,251 @@
+
+import os
+import time
+import json
+import uuid
+import errno
+import shutil
+import logging
+import tempfile
+
+
+log = logging.getLogger(__name__)
+
+
+# Also written in Deadline event plugin `AvalonJobIntegrator`
+HEARTBEAT_TIMEOUT = 60
+
+# Environment variables that will be passed to integration daemon
+ENVIRON_PREFIXES = ("AVALON_", "PYBLISH_")
+
+
+def default_spool_dir():
+    return (os.getenv("PYBLISH_INTEGRATION_SPOOL")
+            or os.path.join(tempfile.gettempdir(), "reveries_spool"))
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+
+class Spool(object):
+    """File system spool for queuing integration requests to daemon
+
+    Each request is one JSON file in spool dir, written to a temp file then
+    renamed, so the daemon never reads a half-written request. The daemon
+    moves requests into `working` dir while processing, and into `failed`
+    dir if integration failed.
+
+    The daemon touches a heartbeat file on each poll, clients should check
+    `alive()` and fallback to run publish process by themselves if daemon
+    is not running.
+
+    Arguments:
+        root (str, optional): Spool dir, default from
+            `PYBLISH_INTEGRATION_SPOOL` or temp dir
+
+    """
+
+    def __init__(self, root=None):
+        self.root = root or default_spool_dir()
+        self.working = os.path.join(self.root, "working")
+        self.failed = os.path.join(self.root, "failed")
+        self.heartbeat_file = os.path.join(self.root, ".heartbeat")
+
+    def alive(self, timeout=HEARTBEAT_TIMEOUT):
+        """Return True if daemon's heartbeat is fresh"""
+        try:
+            mtime = os.path.getmtime(self.heartbeat_file)
+        except OSError:
+            return False
+        return time.time() - mtime < timeout
+
+    def heartbeat(self):
+        for path in (self.root, self.working, self.failed):
+            _makedirs(path)
+        with open(self.heartbeat_file, "w") as file:
+            file.write(str(os.getpid()))
+
+    def enqueue(self, dump, update=None, progress=-1, jobid="",
+                flush=False, environ=None):
+        """Add one integration request
+
+        Arguments:
+            dump (str): Instance or context dump file path
+            update (list, optional): Progressive output files, None for
+                integrating the whole dump
+            progress (int, optional): Progressive frame count
+            jobid (str, optional): Deadline job id
+            flush (bool, optional): Integrate pending requests of this dump
+                immediately, e.g. on job finished
+            environ (dict, optional): Environment for publish, default
+                AVALON_* and PYBLISH_* variables of current process
+
+        Returns:
+            str: Request file path
+
+        """
+        if environ is None:
+            environ = os.environ
+        environ = dict((key, value) for key, value in environ.items()
+                       if key.startswith(ENVIRON_PREFIXES))
+
+        request = {
+            "dump": dump,
+            "update": update,
+            "progress": progress,
+            "jobid": jobid,
+            "flush": flush,
+            "environ": environ,
+            "time": time.time(),
+        }
+
+        _makedirs(self.root)
+        name = "%.6f.%s" % (request["time"], uuid.uuid4().hex)
+        tmp = os.path.join(self.root, name + ".tmp")
+        path = os.path.join(self.root, name + ".json")
+
+        with open(tmp, "w") as file:
+            json.dump(request, file)
+        os.rename(tmp, path)
+
+        return path
+
+    def pending(self):
+        """Return pending request file paths, oldest first"""
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return []
+        return [os.path.join(self.root, name)
+                for name in sorted(names) if name.endswith(".json")]
+
+    def claim(self, paths):
+        """Move requests into working dir and load them
+
+        Returns:
+            list: List of (working path, request) tuples
+
+        """
+        _makedirs(self.working)
+        claimed = list()
+        for path in paths:
+            working = os.path.join(self.working, os.path.basename(path))
+            try:
+                os.rename(path, working)
+                with open(working, "r") as file:
+                    request = json.load(file)
+            except (OSError, IOError, ValueError) as e:
+                log.error("Failed to claim request %s: %s" % (path, e))
+                continue
+            claimed.append((working, request))
+
+        return claimed
+
+    def recover(self):
+        """Move requests left in working dir back, when daemon restarted"""
+        if not os.path.isdir(self.working):
+            return
+        for name in os.listdir(self.working):
+            os.rename(os.path.join(self.working, name),
+                      os.path.join(self.root, name))
+
+    def done(self, paths):
+        for path in paths:
+            os.remove(path)
+
+    def fail(self, paths, message=""):
+        _makedirs(self.failed)
+        for path in paths:
+            dst = os.path.join(self.failed, os.path.basename(path))
+            shutil.move(path, dst)
+            if message:
+                with open(dst + ".log", "w") as file:
+                    file.write(message)
+
+
+def merge(requests):
+    """Merge requests of the same dump into batches
+
+    Progressive requests of one dump are merged into one batch with all
+    updated files, and their frame count summed. Requests that integrate the
+    whole dump (no `update` given) are merged into another batch.
+
+    Frame count of each progressive request is also kept in batch "steps"
+    as `[files, count]`, so a re-rendered request could be excluded from
+    the count on its own, instead of resetting the count of whole batch.
+    A request that re-renders files of an earlier request in the same batch
+    counts zero, like it would if integrated one by one.
+
+    Arguments:
+        requests (list): List of (path, request) tuples, oldest first
+
+    Returns:
+        list: List of batch dict, with "paths" of merged requests
+
+    """
+    batches = dict()
+    seen = dict()
+    order = list()
+
+    for path, request in requests:
+        key = (request["dump"], request["update"] is None)
+        batch = batches.get(key)
+        if batch is None:
+            batch = {
+                "dump": request["dump"],
+                "update": None if key[1] else list(),
+                "progress": -1,
+                "jobid": "",
+                "flush": False,
+                "environ": dict(),
+                "time": request["time"],
+                "paths": list(),
+                "steps": list(),
+            }
+            batches[key] = batch
+            seen[key] = set()
+            order.append(key)
+
+        batch["paths"].append(path)
+        batch["flush"] |= bool(request["flush"])
+        batch["jobid"] = request["jobid"] or batch["jobid"]
+        batch["environ"].update(request["environ"])
+
+        if request["update"] is not None:
+            rerendered = False
+            for file in request["update"]:
+                if file in seen[key]:
+                    rerendered = True
+                else:
+                    seen[key].add(file)
+                    batch["update"].append(file)
+            if request["progress"] >= 0:
+                count = 0 if rerendered else request["progress"]
+                batch["steps"].append([request["update"], count])
+                batch["progress"] = max(batch["progress"], 0) + count
+
+    return [batches[key] for key in order]
+
+
+def ready_batches(batches, delay, now=None):
+    """Return batches that should be integrated now
+
+    A batch of progressive requests is held for `delay` seconds since its
+    oldest request, so more finished tasks could be merged into it, unless
+    it was flushed. A flushed progressive batch may have no file in it (all
+    integrated already), which should be dropped by caller.
+
+    """
+    now = time.time() if now is None else now
+    ready = list()
+    for batch in batches:
+        if batch["update"] is None or batch["flush"]:
+            ready.append(batch)
+        elif now - batch["time"] >= delay:
+            ready.append(batch)
+    return ready
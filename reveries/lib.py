@@ -2,6 +2,8 @@
 import os
 import sys
 import math
+import time
+import bisect
 import logging
 import contextlib
 import datetime
@@ -10,6 +12,7 @@ import pyblish.util
 import avalon.io
 import avalon.api
 from avalon.vendor import requests
+from collections import OrderedDict
 
 try:
     import bson
@@ -110,6 +113,107 @@ def file_cmp(A, B):
     return same_size and same_time
 
 
+class FrameIndex(object):
+    """Run-length encoded set of frame numbers
+
+    Frames are stored as sorted, inclusive `[start, end]` ranges, which is
+    compact for rendered sequences that usually have no or only a few holes.
+    Membership test is a binary search over ranges, so it's constant time
+    for a sequence without gaps.
+
+    Example:
+        >>> index = FrameIndex.from_frames([1, 2, 3, 7, 8, 10])
+        >>> index.ranges
+        [[1, 3], [7, 8], [10, 10]]
+        >>> 7 in index
+        True
+        >>> index.gaps()
+        [[4, 6], [9, 9]]
+
+    """
+
+    def __init__(self, ranges=None):
+        self.ranges = [list(r) for r in ranges or []]
+        self._starts = [start for start, _ in self.ranges]
+
+    @classmethod
+    def from_frames(cls, frames):
+        ranges = list()
+        for frame in sorted(set(frames)):
+            if ranges and frame == ranges[-1][1] + 1:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+        return cls(ranges)
+
+    def __contains__(self, frame):
+        i = bisect.bisect_right(self._starts, frame) - 1
+        return i >= 0 and frame <= self.ranges[i][1]
+
+    def __iter__(self):
+        for start, end in self.ranges:
+            for frame in range(start, end + 1):
+                yield frame
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def __eq__(self, other):
+        return isinstance(other, FrameIndex) and self.ranges == other.ranges
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "FrameIndex(%r)" % self.ranges
+
+    @property
+    def start(self):
+        return self.ranges[0][0] if self.ranges else None
+
+    @property
+    def end(self):
+        return self.ranges[-1][1] if self.ranges else None
+
+    def gaps(self, start=None, end=None):
+        """Return missing frame ranges between start and end
+
+        Args:
+            start (int, optional): Default is the first frame of index
+            end (int, optional): Default is the last frame of index
+
+        Returns:
+            list: Inclusive `[start, end]` ranges of missing frames
+
+        """
+        start = self.start if start is None else start
+        end = self.end if end is None else end
+        if start is None or end is None:
+            return []
+
+        gaps = list()
+        cursor = start
+        for head, tail in self.ranges:
+            if tail < cursor:
+                continue
+            if head > end:
+                break
+            if head > cursor:
+                gaps.append([cursor, head - 1])
+            cursor = tail + 1
+
+        if cursor <= end:
+            gaps.append([cursor, end])
+
+        return gaps
+
+    def missing(self, start=None, end=None):
+        """Iterate missing frames between start and end"""
+        for head, tail in self.gaps(start, end):
+            for frame in range(head, tail + 1):
+                yield frame
+
+
 def iter_uri(path, sep):
     """Iter parents of node from its long name.
 
@@ -199,6 +303,247 @@ def get_deadline_pools():
     return pools
 
 
+def _aggregate(pipeline):
+    """Run aggregation pipeline on current project collection"""
+    if hasattr(avalon.io, "aggregate"):
+        return avalon.io.aggregate(pipeline)
+
+    collection = avalon.io._database[avalon.api.Session["AVALON_PROJECT"]]
+    return collection.aggregate(pipeline)
+
+
+class VersionResolver(object):
+    """Resolve representations' version and latest version in bulk
+
+    All representations are resolved with one aggregation pipeline:
+    representation -> version -> latest version of the subset, and results
+    are memoised for `ttl` seconds, so scene open callback, publish
+    validator and other tools can share one lookup.
+
+    Example:
+        >> resolved = version_resolver.resolve(representation_ids)
+        >> resolved[representation_id]
+        {'version': 3, 'latest': 5,
+         'versionId': ObjectId('...'), 'subset': ObjectId('...')}
+
+    Representations that are missing in database resolved as None.
+
+    Arguments:
+        ttl (float): Seconds to keep the resolved result
+
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._project = None
+        self._cache = dict()
+
+    def clear(self):
+        self._cache.clear()
+
+    def resolve(self, representation_ids):
+        """Resolve representations
+
+        Args:
+            representation_ids (list): Representation ObjectIds
+
+        Returns:
+            dict: Resolved data or None, keyed by representation id
+
+        """
+        project = avalon.api.Session.get("AVALON_PROJECT")
+        if project != self._project:
+            self._project = project
+            self.clear()
+
+        now = time.time()
+        resolved = dict()
+        to_query = set()
+
+        for _id in representation_ids:
+            cached = self._cache.get(_id)
+            if cached is not None and now - cached[0] < self.ttl:
+                resolved[_id] = cached[1]
+            else:
+                to_query.add(_id)
+
+        if to_query:
+            fetched = dict((_id, None) for _id in to_query)
+            fetched.update(self._query(list(to_query)))
+
+            for _id, result in fetched.items():
+                self._cache[_id] = (now, result)
+            resolved.update(fetched)
+
+        return resolved
+
+    def _query(self, representation_ids):
+        collection = avalon.api.Session["AVALON_PROJECT"]
+        pipeline = [
+            {"$match": {"_id": {"$in": representation_ids},
+                        "type": "representation"}},
+            {"$project": {"parent": True}},
+            {"$lookup": {"from": collection,
+                         "localField": "parent",
+                         "foreignField": "_id",
+                         "as": "version"}},
+            {"$unwind": "$version"},
+            {"$lookup": {"from": collection,
+                         "localField": "version.parent",
+                         "foreignField": "parent",
+                         "as": "sibling"}},
+            {"$unwind": "$sibling"},
+            {"$match": {"sibling.type": "version"}},
+            {"$group": {"_id": "$_id",
+                        "version": {"$first": "$version.name"},
+                        "versionId": {"$first": "$version._id"},
+                        "subset": {"$first": "$version.parent"},
+                        "latest": {"$max": "$sibling.name"}}},
+        ]
+
+        for doc in _aggregate(pipeline):
+            _id = doc.pop("_id")
+            yield _id, doc
+
+
+version_resolver = VersionResolver()
+
+
+class RepresentationCache(object):
+    """Bounded cache of representation documents and their loaders
+
+    Documents are fetched in bulk with `$in` queries by `prefetch`, e.g.
+    every member of a set-dress tree before loading it, and looked up by
+    `get` one at a time afterward. Least recently used documents are
+    dropped when the cache is full, and will be queried again if needed.
+
+    Loader plugins are discovered once, and the compatible loader of each
+    representation is cached.
+
+    Everything is cleared when `AVALON_PROJECT` changed, call `clear` on
+    other session changes (e.g. task changed or loader paths registered).
+
+    Arguments:
+        maxsize (int): Max number of documents or loaders to keep
+        batch (int): Max number of ids in one `$in` query
+
+    """
+
+    def __init__(self, maxsize=10000, batch=1000):
+        self.maxsize = maxsize
+        self.batch = batch
+        self._project = None
+        self._documents = OrderedDict()
+        self._loaders = OrderedDict()
+        self._all_loaders = None
+
+    def clear(self):
+        self._documents.clear()
+        self._loaders.clear()
+        self._all_loaders = None
+
+    def _validate(self):
+        project = avalon.api.Session.get("AVALON_PROJECT")
+        if project != self._project:
+            self._project = project
+            self.clear()
+
+    def _hit(self, cache, key):
+        value = cache.pop(key)
+        cache[key] = value  # Most recently used goes last
+        return value
+
+    def _put(self, cache, key, value):
+        cache.pop(key, None)
+        cache[key] = value
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+    def prefetch(self, representation_ids):
+        """Query uncached representations in batches
+
+        Args:
+            representation_ids (list): Representation ids, str or ObjectId
+
+        Returns:
+            int: Number of documents fetched from database
+
+        """
+        self._validate()
+
+        missing = sorted(set(str(_id) for _id in representation_ids)
+                         - set(self._documents))
+        if len(missing) > self.maxsize:
+            log.warning("Prefetching %d representations, more than cache "
+                        "size %d." % (len(missing), self.maxsize))
+
+        fetched = 0
+        for i in range(0, len(missing), self.batch):
+            chunk = [avalon.io.ObjectId(_id)
+                     for _id in missing[i:i + self.batch]]
+            for document in avalon.io.find({"_id": {"$in": chunk},
+                                            "type": "representation"}):
+                self._put(self._documents, str(document["_id"]), document)
+                fetched += 1
+
+        return fetched
+
+    def get(self, representation_id):
+        """Return representation document
+
+        Raises:
+            RuntimeError: If representation not found in database
+
+        """
+        self._validate()
+
+        key = str(representation_id)
+        if key in self._documents:
+            return self._hit(self._documents, key)
+
+        document = avalon.io.find_one({"_id": avalon.io.ObjectId(key)})
+        if document is None:
+            raise RuntimeError("Representation not found, this is a bug.")
+
+        self._put(self._documents, key, document)
+        return document
+
+    def all_loaders(self):
+        """Return discovered loader plugins, discover only once"""
+        self._validate()
+
+        if self._all_loaders is None:
+            self._all_loaders = avalon.api.discover(avalon.api.Loader)
+        return self._all_loaders
+
+    def loader(self, loader_name, representation_id):
+        """Return loader plugin that is compatible with the representation
+
+        Raises:
+            RuntimeError: If loader not found
+
+        """
+        self._validate()
+
+        key = (loader_name, str(representation_id))
+        if key in self._loaders:
+            return self._hit(self._loaders, key)
+
+        loaders = avalon.api.loaders_from_representation(
+            self.all_loaders(), self.get(representation_id))
+        Loader = next((x for x in loaders if x.__name__ == loader_name),
+                      None)
+
+        if Loader is None:
+            raise RuntimeError("Loader is missing: %s" % loader_name)
+
+        self._put(self._loaders, key, Loader)
+        return Loader
+
+
+representation_cache = RepresentationCache()
+
+
 def is_latest(representation):
     """Return whether the representation is from latest version
 
@@ -209,47 +554,58 @@ def is_latest(representation):
         bool: Whether the representation is of latest version.
 
     """
+    resolved = version_resolver.resolve([representation["_id"]])
+    result = resolved[representation["_id"]]
+    if result is None:
+        raise ValueError("Representation %s not found in database."
+                         % representation["_id"])
 
-    version = avalon.io.find_one({"_id": representation['parent']})
+    return result["version"] == result["latest"]
 
-    # Get highest version under the parent
-    highest_version = avalon.io.find_one({
-        "type": "version",
-        "parent": version["parent"]
-    }, sort=[("name", -1)], projection={"name": True})
 
-    if version["name"] == highest_version["name"]:
-        return True
-    else:
-        return False
+def ls_outdated(containers):
+    """Find outdated and missing representations of containers
+
+    Args:
+        containers (list): Containers from `host.ls()`
+
+    Returns:
+        tuple: Two dicts, containers of outdated and of missing
+            representations, keyed by representation id
+
+    """
+    containers = list(containers)
+    ids = set(avalon.io.ObjectId(container["representation"])
+              for container in containers)
+    resolved = version_resolver.resolve(ids)
+
+    outdated = dict()
+    missing = dict()
+    for container in containers:
+        _id = avalon.io.ObjectId(container["representation"])
+        result = resolved[_id]
+
+        if result is None:
+            missing.setdefault(_id, list()).append(container)
+        elif result["version"] < result["latest"]:
+            outdated.setdefault(_id, list()).append(container)
+
+    return outdated, missing
 
 
 def any_outdated():
     """Return whether the current scene has any outdated content"""
 
-    checked = set()
     host = avalon.api.registered_host()
-    for container in host.ls():
-        representation = avalon.io.ObjectId(container["representation"])
-        if representation in checked:
-            continue
-
-        representation_doc = avalon.io.find_one(
-            {"_id": representation, "type": "representation"},
-            projection={"parent": True}
-        )
+    outdated, missing = ls_outdated(host.ls())
 
-        if representation_doc and not is_latest(representation_doc):
-            return True
-
-        elif not representation_doc:
+    for containers in missing.values():
+        for container in containers:
             log.debug("Container '{objectName}' has an invalid "
                       "representation, it is missing in the "
                       "database".format(**container))
 
-        checked.add(representation)
-
-    return False
+    return bool(outdated)
 
 
 class pindict(dict):  # For experimental code style
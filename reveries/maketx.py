@@ -0,0 +1,287 @@
+
+import os
+import json
+import time
+import shlex
+import logging
+import tempfile
+import threading
+import subprocess
+import multiprocessing
+
+from multiprocessing.pool import ThreadPool
+from distutils.spawn import find_executable
+
+
+log = logging.getLogger(__name__)
+
+
+DEFAULT_COMMAND = [
+    "maketx",
+    "-v",
+    "--oiio",
+    "--colorconvert", "{colorspace}", "linear",
+    "{src}",
+    "-o", "{dst}",
+]
+
+
+def to_tx(path):
+    return os.path.splitext(path)[0] + ".tx"
+
+
+def input_colorspace(color_space):
+    """Return colorspace for converter from file node's colorSpace"""
+    return "linear" if color_space == "Raw" else color_space
+
+
+def default_command():
+    """Return converter command template
+
+    Could be set by `PYBLISH_MAKETX_COMMAND`, with placeholders `{src}`,
+    `{dst}` and `{colorspace}`.
+
+    """
+    command = os.getenv("PYBLISH_MAKETX_COMMAND")
+    if command:
+        return shlex.split(command)
+    return list(DEFAULT_COMMAND)
+
+
+def default_index_path():
+    return (os.getenv("PYBLISH_MAKETX_INDEX")
+            or os.path.join(tempfile.gettempdir(), "reveries_maketx.json"))
+
+
+def available(command=None):
+    """Return True if converter executable can be found"""
+    command = command or default_command()
+    return bool(find_executable(command[0]) or os.path.isfile(command[0]))
+
+
+def jobs_from_file_data(file_data, ignore=None):
+    """Return conversion jobs of every file in texture file data
+
+    Each file of UDIM tiles or frame sequence in `fnames` is one job,
+    missing files are skipped.
+
+    Arguments:
+        file_data (list): `instance.data["fileData"]`
+        ignore (list, optional): File nodes to skip
+
+    Returns:
+        dict: {tx path: (source path, colorspace)}
+
+    """
+    ignore = set(ignore or [])
+    jobs = dict()
+    for data in file_data:
+        if data["node"] in ignore:
+            continue
+        color_space = input_colorspace(data["colorSpace"])
+        for fname in data["fnames"]:
+            src = data["dir"] + "/" + fname
+            if not os.path.isfile(src):
+                log.warning("Texture not exists, skip: %s" % src)
+                continue
+            jobs[to_tx(src)] = (src, color_space)
+    return jobs
+
+
+class FreshnessIndex(object):
+    """Persistent record of converted .tx files
+
+    A .tx file is fresh if it was converted from the source content with the
+    same C4 ID, in the same colorspace, and the .tx file itself has not been
+    changed since.
+
+    A .tx file that is not in the index yet (e.g. first publish on this
+    machine) is checked by modification time instead, like Arnold's
+    'Tx Manager' does, and recorded into the index if it's up to date.
+
+    Arguments:
+        path (str, optional): JSON file path to load from and save to.
+            Index will only live in memory if not provided.
+
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = dict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if path and os.path.isfile(path):
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r") as fp:
+                self._entries = json.load(fp)
+        except (IOError, OSError, ValueError):
+            self._entries = dict()
+        self._dirty = False
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+
+        with self._lock:
+            with open(self.path, "w") as fp:
+                json.dump(self._entries, fp)
+            self._dirty = False
+
+    def is_fresh(self, tx, source_id, color_space, src=None):
+        """Return True if .tx file is up to date
+
+        Arguments:
+            tx (str): .tx file path
+            source_id (str): Source content C4 ID
+            color_space (str): Converter input colorspace
+            src (str, optional): Source file path, for checking modification
+                time if .tx file is not in index
+
+        """
+        try:
+            stat = os.stat(tx)
+        except OSError:
+            return False
+
+        entry = self._entries.get(tx)
+        if entry is not None:
+            return entry == [source_id,
+                             color_space,
+                             stat.st_size,
+                             stat.st_mtime]
+
+        if src is None:
+            return False
+        try:
+            # TX map's modification time takes no decimal places.
+            if int(os.path.getmtime(src)) != int(stat.st_mtime):
+                return False
+        except OSError:
+            return False
+
+        self.update(tx, source_id, color_space)
+        return True
+
+    def update(self, tx, source_id, color_space):
+        stat = os.stat(tx)
+        with self._lock:
+            self._entries[tx] = [source_id,
+                                 color_space,
+                                 stat.st_size,
+                                 stat.st_mtime]
+            self._dirty = True
+
+
+def _run(args):
+    """Convert one file, return (tx, seconds, error), never raise"""
+    command, src, dst, color_space = args
+    cmd = [arg.format(src=src, dst=dst, colorspace=color_space)
+           for arg in command]
+
+    start = time.time()
+    try:
+        subprocess.check_output(cmd, stderr=subprocess.STDOUT)
+    except subprocess.CalledProcessError as e:
+        error = "%s\n%s" % (e, e.output)
+    except OSError as e:
+        error = "Converter not found: %s (%s)" % (cmd[0], e)
+    else:
+        error = None
+        # Keep modification time the same as source, as Arnold's
+        # 'Tx Manager' and `validate_texture_tx_updated` expect.
+        mtime = int(os.path.getmtime(src))
+        os.utime(dst, (mtime, mtime))
+
+    return dst, time.time() - start, error
+
+
+class TxConverter(object):
+    """Convert textures into .tx maps in parallel
+
+    Each conversion runs in it's own converter process, at most `workers`
+    processes at a time. Sources are hashed first, and conversions that are
+    fresh in `index` are skipped.
+
+    Arguments:
+        command (list, optional): Command template, default from
+            `default_command()`
+        workers (int, optional): Concurrent conversions, default is
+            cpu count
+        index (FreshnessIndex, optional): Default one saved in
+            `PYBLISH_MAKETX_INDEX` or temp dir
+        hasher (AssetHasher, optional): Source content hasher
+
+    """
+
+    def __init__(self, command=None, workers=None, index=None, hasher=None):
+        self.command = command or default_command()
+        self.workers = workers or multiprocessing.cpu_count()
+        self.index = (FreshnessIndex(default_index_path())
+                      if index is None else index)
+
+        if hasher is None:
+            from .utils import AssetHasher, HashCache
+            from .texstore import default_cache_path
+            hasher = AssetHasher(cache=HashCache(default_cache_path()))
+        self.hasher = hasher
+
+    def source_ids(self, sources):
+        sources = sorted(set(sources))
+        digests = self.hasher.file_digests(sources)
+        if self.hasher.cache is not None:
+            self.hasher.cache.save()
+        return dict((src, self.hasher.encode(digest))
+                    for src, digest in zip(sources, digests))
+
+    def convert(self, jobs):
+        """Convert stale .tx maps
+
+        Arguments:
+            jobs (dict): {tx path: (source path, colorspace)}
+
+        Returns:
+            dict: {tx path: {"seconds": float, "skipped": bool,
+                             "error": str or None}}
+
+        """
+        ids = self.source_ids(src for src, _ in jobs.values())
+
+        results = dict()
+        pending = list()
+        for tx, (src, color_space) in sorted(jobs.items()):
+            if self.index.is_fresh(tx, ids[src], color_space, src):
+                results[tx] = {"seconds": 0, "skipped": True, "error": None}
+            else:
+                pending.append((self.command, src, tx, color_space))
+
+        log.info("Converting %d .tx maps, %d are up to date."
+                 % (len(pending), len(results)))
+
+        if len(pending) < 2 or self.workers < 2:
+            finished = [_run(args) for args in pending]
+        else:
+            pool = ThreadPool(min(self.workers, len(pending)))
+            try:
+                finished = pool.map(_run, pending, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+
+        for (_, src, _, color_space), (tx, seconds, error) in zip(pending,
+                                                                  finished):
+            results[tx] = {"seconds": seconds,
+                           "skipped": False,
+                           "error": error}
+            if error:
+                log.error("Failed to convert %s:\n%s" % (src, error))
+            else:
+                log.debug("Converted %s in %.2f sec." % (tx, seconds))
+                self.index.update(tx, ids[src], color_space)
+
+        self.index.save()
+
+        return results
@@ -35,6 +35,9 @@ def _pop_sceneinventory():
 def on_task_changed(_, *args):
     avalon.logger.info("Changing Task module..")
 
+    # Loaders and documents may differ in new session
+    lib.representation_cache.clear()
+
     utils.init_app_workdir()
     maya.pipeline._on_task_changed()
 
@@ -96,6 +99,9 @@ def before_new(_):
 
 
 def on_new(_):
+    # Mesh nodes are gone, drop their hash terms and dirty callbacks
+    maya_utils._mesh_hash_cache.clear()
+
     try:
         pipeline.set_scene_timeline()
         pipeline.set_linear_unit()
@@ -104,6 +110,8 @@ def on_new(_):
 
 
 def on_open(_):
+    maya_utils._mesh_hash_cache.clear()
+
     sticker.reveal()  # Show custom icon
 
     # (Medicine)
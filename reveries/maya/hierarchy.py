@@ -11,6 +11,7 @@ from avalon.maya.pipeline import (
 )
 
 from ..plugins import message_box_error
+from .. import lib as reveries_lib
 
 from . import lib
 from . import capsule
@@ -266,55 +267,58 @@ def container_from_id_path(plugin, container_id_path, parent_namespace):
     return container
 
 
-_cached_representations = dict()
-
-
 def get_representation(representation_id):
+    """Return representation document from the shared bounded cache
     """
-    """
-    try:
-
-        return _cached_representations[representation_id]
+    return reveries_lib.representation_cache.get(representation_id)
 
-    except KeyError:
-        representation = avalon.io.find_one(
-            {"_id": avalon.io.ObjectId(representation_id)})
 
-        if representation is None:
-            raise RuntimeError("Representation not found, this is a bug.")
-
-        _cached_representations[representation_id] = representation
+def get_loader(loader_name, representation_id):
+    """Return loader of the representation from the shared bounded cache
+    """
+    return reveries_lib.representation_cache.loader(loader_name,
+                                                    representation_id)
 
-        return representation
 
+def iter_member_representations(members):
+    """Yield representation ids of set-dress members and all descendants
 
-_cached_loaders = dict()
+    Args:
+        members (list): Members data from set-dress members file, or
+            parsed from parent's hierarchy
 
+    Yields:
+        str: representation id
 
-def get_loader(loader_name, representation_id):
     """
-    """
-    try:
+    def walk(hierarchy):
+        for sub_hierarchy in hierarchy.values():
+            for child_ident, member_data in sub_hierarchy.items():
+                yield child_ident.split("|")[0]
+                for repr_id in walk(member_data):
+                    yield repr_id
 
-        return _cached_loaders[representation_id]
+    for data in members:
+        yield data["representation"]
+        for repr_id in walk(data.get("hierarchy") or {}):
+            yield repr_id
 
-    except KeyError:
-        # Get all loaders
-        all_loaders = avalon.api.discover(avalon.api.Loader)
-        # Find the compatible loaders
-        loaders = avalon.api.loaders_from_representation(
-            all_loaders, get_representation(representation_id))
-        # Get the used loader
-        Loader = next((x for x in loaders if
-                       x.__name__ == loader_name),
-                      None)
 
-        if Loader is None:
-            raise RuntimeError("Loader is missing: %s", loader_name)
+def prefetch_members(members):
+    """Fetch representations of the whole set-dress tree in bulk
 
-        _cached_loaders[representation_id] = Loader
+    Args:
+        members (list): Members data from set-dress members file
+
+    Returns:
+        int: Number of documents fetched from database
 
-        return Loader
+    """
+    ids = set(iter_member_representations(members))
+    fetched = reveries_lib.representation_cache.prefetch(ids)
+    _log.debug("Prefetched %d of %d member representations."
+               % (fetched, len(ids)))
+    return fetched
 
 
 def _attach_subset(slot, namespace, root, subset_group):
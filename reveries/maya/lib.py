@@ -1078,80 +1078,88 @@ def serialise_shaders(nodes, by_name=False):
         objectsOnly=True,
         type="transform"
     )
+    if not valid_nodes:
+        return {}
 
-    surfaces_by_id = {}
-    for transform in valid_nodes:
-        shapes = cmds.listRelatives(transform,
-                                    shapes=True,
-                                    fullPath=True,
-                                    type="surfaceShape") or list()
-        shapes = cmds.ls(shapes, noIntermediate=True)
+    valid_nodes = set(valid_nodes)
 
-        try:
-            surface = shapes[0]
-        except IndexError:
-            continue
+    ids = {}
 
-        id_ = _get_id(transform)
-
-        if id_ is None:
+    def get_id(transform):
+        try:
+            return ids[transform]
+        except KeyError:
+            id_ = ids[transform] = _get_id(transform)
+            return id_
+
+    # Query shapes of all transforms at once, the parent of each shape is
+    # the leading part of it's full path.
+    shapes = cmds.listRelatives(list(valid_nodes),
+                                shapes=True,
+                                fullPath=True,
+                                type="surfaceShape") or list()
+    shapes = cmds.ls(shapes, noIntermediate=True, long=True) if shapes else []
+
+    surfaces = list()
+    shaped = set()
+    for shape in shapes:
+        transform = shape.rsplit("|", 1)[0]
+        if transform in shaped or transform not in valid_nodes:
             continue
-
-        if id_ not in surfaces_by_id:
-            surfaces_by_id[id_] = list()
-
-        surfaces_by_id[id_].append(surface)
-
-    surfaces_by_shader = {}
-    for id_, surfaces in surfaces_by_id.items():
-
-        for shader in cmds.listConnections(surfaces,
-                                           type="shadingEngine",
-                                           source=False,
-                                           destination=True) or list():
-
-            # Objects in this group are those that haven't got
-            # any shaders. These are expected to be managed
-            # elsewhere, such as by the default model loader.
-            if shader == "initialShadingGroup":
-                continue
-
-            if shader not in surfaces_by_shader:
-                surfaces_by_shader[shader] = list()
-
-            shaded = cmds.ls(cmds.sets(shader, query=True), long=True)
-            surfaces_by_shader[shader].extend(shaded)
+        shaped.add(transform)  # Only the first shape, as before
+
+        if get_id(transform) is not None:
+            surfaces.append(shape)
+
+    if not surfaces:
+        return {}
+
+    shaders = set(cmds.listConnections(surfaces,
+                                       type="shadingEngine",
+                                       source=False,
+                                       destination=True) or list())
+    # Objects in this group are those that haven't got
+    # any shaders. These are expected to be managed
+    # elsewhere, such as by the default model loader.
+    shaders.discard("initialShadingGroup")
+
+    members_by_shader = {}
+    member_names = set()
+    for shader in shaders:
+        members = cmds.sets(shader, query=True)
+        members = cmds.ls(members, long=True) if members else []
+        members_by_shader[shader] = members
+        # Enable shader assignment to mesh faces.
+        member_names.update(member.split(".f[")[0] for member in members)
+
+    # Members which are shape, their transform is the parent
+    shape_members = set(cmds.ls(list(member_names),
+                                type="surfaceShape",
+                                long=True) or []) if member_names else set()
 
     shader_by_id = {}
-    for shader, shaded in surfaces_by_shader.items():
-
-        for surface in shaded:
+    for shader, members in members_by_shader.items():
+        shaded = set()
 
-            # Enable shader assignment to mesh faces.
+        for surface in members:
             name = surface.split(".f[")[0]
 
             transform = name
-            if cmds.objectType(transform, isAType="surfaceShape"):
-                transform = cmds.listRelatives(name,
-                                               parent=True,
-                                               fullPath=True)[0]
+            if name in shape_members:
+                transform = name.rsplit("|", 1)[0]
 
             if transform not in valid_nodes:
                 # Ignore nodes which were not in the query list
                 continue
 
-            id_ = _get_id(transform)
+            id_ = get_id(transform)
 
             if id_ is None:
                 continue
 
-            if shader not in shader_by_id:
-                shader_by_id[shader] = list()
-
-            shader_by_id[shader].append(surface.replace(name, id_))
+            shaded.add(surface.replace(name, id_))
 
-        # Remove duplicates
-        shader_by_id[shader] = list(set(shader_by_id.get(shader, [])))
+        shader_by_id[shader] = list(shaded)
 
     return shader_by_id
 
@@ -34,6 +34,7 @@ from .hierarchy import (
     parse_sub_containers,
     get_representation,
     get_loader,
+    prefetch_members,
     add_subset,
     change_subset,
     get_updatable_containers,
@@ -645,6 +646,7 @@ class HierarchicalLoader(MayaBaseLoader):
         update_id_verifiers(hierarchy)
 
         # Load sub-subsets
+        prefetch_members(members)
         cache_container_by_id(self)
         sub_containers = []
         for data in members:
@@ -741,6 +743,7 @@ class HierarchicalLoader(MayaBaseLoader):
                 current_members[namespace_old] = data_old
 
         # Update sub-subsets
+        prefetch_members(members)
         cache_container_by_id(self, update=container["namespace"])
         namespace = container["namespace"]
         group_name = self.group_name(namespace, container["name"])
@@ -0,0 +1,157 @@
+
+import logging
+from maya import cmds
+from avalon.maya.pipeline import AVALON_CONTAINER_ID
+
+from . import callbacks
+
+
+log = logging.getLogger(__name__)
+
+
+class SceneIndex(object):
+    """Inverted index of container membership in current scene
+
+    Every container objectSet is queried once, and the index maps each
+    member transform back to its container, so looking up the owner of many
+    nodes does not have to loop over all containers.
+
+    The index is built on first use and invalidated through
+    `reveries.maya.callbacks` event callbacks when scene changed (opened,
+    renewed, set membership or node name changed, undo/redo), then rebuilt
+    lazily on next query.
+
+    Container data has keys:
+        objectName, name, namespace, loader, representation, assetId,
+        subsetId, subsetGroup (long name of group node or None)
+
+    """
+
+    EVENTS = (
+        "SceneOpened",
+        "NewSceneOpened",
+        "SetModified",
+        "NameChanged",
+        "Undo",
+        "Redo",
+    )
+
+    ATTRS = (
+        "name",
+        "namespace",
+        "loader",
+        "representation",
+        "assetId",
+        "subsetId",
+    )
+
+    TOKEN = "reveries.maya.sceneindex"
+
+    def __init__(self):
+        self._containers = None
+        self._members = None
+        self._owners = None
+
+    def _tokens(self):
+        return ["%s.%s" % (self.TOKEN, event) for event in self.EVENTS]
+
+    def install(self):
+        """Register event callbacks for invalidating the index"""
+        for token, event in zip(self._tokens(), self.EVENTS):
+            callbacks.register_event_callback(token, event, self.invalidate)
+
+    def uninstall(self):
+        for token in self._tokens():
+            callbacks.deregister_event_callback(token)
+        self.invalidate()
+
+    def is_tracking(self):
+        """Return True if all invalidation callbacks are registered"""
+        registered = callbacks._event_callbacks
+        return all(token in registered for token in self._tokens())
+
+    def invalidate(self, *args):
+        self._containers = None
+        self._members = None
+        self._owners = None
+
+    def _ensure(self):
+        if self._containers is not None and self.is_tracking():
+            return
+
+        if not self.is_tracking():
+            self.install()
+
+        containers = dict()
+        members = dict()
+        owners = dict()
+
+        for node in cmds.ls("*.id",
+                            objectsOnly=True,
+                            type="objectSet",
+                            recursive=True):
+            if cmds.getAttr(node + ".id") != AVALON_CONTAINER_ID:
+                continue
+
+            data = {"objectName": node}
+            for attr in self.ATTRS:
+                try:
+                    data[attr] = cmds.getAttr(node + "." + attr)
+                except ValueError:
+                    data[attr] = None
+
+            group = None
+            if cmds.attributeQuery("subsetGroup", node=node, exists=True):
+                group = cmds.listConnections(node + ".subsetGroup",
+                                             source=True,
+                                             destination=False,
+                                             plugs=False)
+                group = cmds.ls(group, long=True)[0] if group else None
+            data["subsetGroup"] = group
+
+            containers[node] = data
+
+            node_members = cmds.sets(node, query=True) or []
+            members[node] = node_members
+            for member in cmds.ls(node_members, type="transform"):
+                # First container wins, like the previous linear search
+                owners.setdefault(member, node)
+
+        self._containers = containers
+        self._members = members
+        self._owners = owners
+
+        log.debug("Scene index built, %d containers, %d members."
+                  % (len(containers), len(owners)))
+
+    def containers(self):
+        """Return {container node: container data}"""
+        self._ensure()
+        return self._containers
+
+    def ls(self, **attrs):
+        """Return data of containers that match all given attributes
+
+        Example:
+            >> index.ls(loader="LookLoader", assetId=asset_id)
+
+        """
+        self._ensure()
+        return [data for data in self._containers.values()
+                if all(data.get(k) == v for k, v in attrs.items())]
+
+    def members(self, container):
+        """Return member nodes of container, as `cmds.sets` query"""
+        self._ensure()
+        return self._members.get(container, [])
+
+    def owner(self, node):
+        """Return data of the container that owns the transform node"""
+        self._ensure()
+        container = self._owners.get(node)
+        if container is None:
+            return None
+        return self._containers[container]
+
+
+scene_index = SceneIndex()
@@ -12,10 +12,9 @@ from ....utils import get_representation_path_
 from ....maya import lib, utils
 from ...pipeline import (
     get_container_from_namespace,
-    iter_containers_from_namespace,
-    get_group_from_container,
     parse_container,
 )
+from ...sceneindex import scene_index
 
 from .models import UNDEFINED_SUBSET
 
@@ -46,8 +45,8 @@ def group_from_namespace(namespace):
         str: group node in long name
 
     """
-    for container in iter_containers_from_namespace(namespace):
-        yield get_group_from_container(container)
+    for container in scene_index.ls(namespace=namespace):
+        yield container["subsetGroup"]
 
 
 def get_asset_id(node):
@@ -90,32 +89,22 @@ def get_session_asset_id():
 
 def get_selected_asset_nodes():
 
-    def get_member(node):
-        return set(cmds.ls(cmds.sets(node, query=True), type="transform"))
-
     nodes = list()
     session_asset_id = None
 
     selection = cmds.ls(selection=True)
     hierarchy = list_descendents(selection)
 
-    containers = {
-        node: get_member(node) for node in
-        cmds.ls("*.id", objectsOnly=True, type="objectSet", recursive=True)
-        if cmds.getAttr(node + ".id") == "pyblish.avalon.container"
-    }
-
     for node in set(selection + hierarchy):
 
         asset_id = get_asset_id(node)
         if asset_id is None:
             session_asset_id = session_asset_id or get_session_asset_id()
 
-        for container, members in containers.items():
-            if node in members:
-                subset = cmds.getAttr(container + ".name")
-                namespace = cmds.getAttr(container + ".namespace")
-                break
+        container = scene_index.owner(node)
+        if container is not None:
+            subset = container["name"]
+            namespace = container["namespace"]
         else:
             subset = UNDEFINED_SUBSET
             namespace = lib.get_ns(node)
@@ -133,12 +122,10 @@ def get_selected_asset_nodes():
 def get_all_asset_nodes():
     """Get all assets from the scene, container based"""
 
-    host = api.registered_host()
-
     nodes = list()
     session_asset_id = None
 
-    for container in host.ls():
+    for container in list(scene_index.containers().values()):
         # We only interested in surface assets !
         # (TODO): This black list should be somewhere else
         if container["loader"] in ("LookLoader",
@@ -159,7 +146,7 @@ def get_all_asset_nodes():
         group = container.get("subsetGroup")
         if not group:
             if container["loader"] == "XGenLegacyLoader":
-                members = cmds.sets(container["objectName"], query=True)
+                members = scene_index.members(container["objectName"])
                 palette = cmds.ls(members, type="xgmPalette")
                 if palette:
                     group = palette[0]
@@ -294,18 +281,17 @@ def list_loaded_looks(asset_id):
     look_subsets = list()
     cached_look = dict()
 
-    for container in lib.lsAttrs({"id": AVALON_CONTAINER_ID,
-                                  "loader": "LookLoader",
-                                  "assetId": str(asset_id)}):
+    for container in scene_index.ls(loader="LookLoader",
+                                    assetId=str(asset_id)):
 
-        subset_id = cmds.getAttr(container + ".subsetId")
+        subset_id = container["subsetId"]
         if subset_id in cached_look:
             look = cached_look[subset_id].copy()
         else:
             look = io.find_one({"_id": io.ObjectId(subset_id)})
             cached_look[subset_id] = look
 
-        namespace = cmds.getAttr(container + ".namespace")
+        namespace = container["namespace"]
         # Example: ":Zombie_look_02_"
         # result: "Zombie 02"
         asset = namespace[1:].rsplit("_", 3)[0]  # Zombie
@@ -512,7 +498,7 @@ def _look_via_uv(look, relationships, nodes, by_name=False):
 
     """
 
-    hasher = utils.MeshHasher()
+    hasher = utils.MeshHasher(cache=True)
     uv_via_id = dict()
     id_via_uv = dict()
 
@@ -626,13 +612,11 @@ def _look_via_uv(look, relationships, nodes, by_name=False):
 def remove_look(nodes, asset_ids):
 
     look_sets = set()
-    for container in lib.lsAttrs({"id": AVALON_CONTAINER_ID,
-                                  "loader": "LookLoader"}):
-        container = parse_container(container)
+    for container in scene_index.ls(loader="LookLoader"):
         if container["assetId"] not in asset_ids:
             continue
 
-        members = cmds.sets(container["objectName"], query=True)
+        members = scene_index.members(container["objectName"])
         look_sets.update(cmds.ls(members, type="objectSet"))
 
     shaded = cmds.ls(nodes, type=("transform", "surfaceShape"))
@@ -47,7 +47,7 @@ def show():
         module.window = window
 
 
-_hasher = utils.MeshHasher()
+_hasher = utils.MeshHasher(cache=True)
 
 
 def _hash(mesh):
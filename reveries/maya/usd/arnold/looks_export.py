@@ -1,5 +1,7 @@
 from pxr import Sdf, Usd, UsdShade, UsdGeom
 
+from reveries.maya.usd.shader_memo import ShaderNodeMemo
+
 # Maya Attributes to USD post process
 
 
@@ -1120,6 +1122,9 @@ class RedshiftShadersToUSD:
     def ExportMaterials(self):
         import maya.cmds as cmds
 
+        # Maya queries of shared shading nodes, reused by all materials
+        self.memo = ShaderNodeMemo()
+
         # Build Stage
         self.stage = Usd.Stage.CreateInMemory()
         # Build Root Scope
@@ -1198,54 +1203,57 @@ class RedshiftShadersToUSD:
         return False
 
     def rebuildShader(self, source_shader, usd_target, source_attr, target_attr, usdShadingGroup):
-        import maya.cmds as cmds
-
-        nodeType = cmds.nodeType(source_shader)
+        memo = self.memo
+        nodeType = memo.node_type(source_shader)
 
         # Creating the Shader
-        if nodeType in self.translator.keys():  # Check nodeType if in translator dictionary
+        if nodeType in self.translator:  # Check nodeType if in translator dictionary
             attr_table = self.translator[nodeType]
-            if self.procNamespace(source_shader) not in [x.GetName() for x in
-                                                         usdShadingGroup.GetPrim().GetAllChildren()]:
-                usdShader = UsdShade.Shader.Define(self.stage, usdShadingGroup.GetPath().AppendChild(
-                    self.procNamespace(source_shader)))
+            shader_name = self.procNamespace(source_shader)
+            shader_path = usdShadingGroup.GetPath().AppendChild(shader_name)
+            if not self.stage.GetPrimAtPath(shader_path):
+                usdShader = UsdShade.Shader.Define(self.stage, shader_path)
                 usdShader.CreateIdAttr(self.translator[nodeType]['info:id']['name'])
             else:
-                usdShader = UsdShade.Shader.Get(self.stage, usdShadingGroup.GetPath().AppendChild(
-                    self.procNamespace(source_shader)))
+                usdShader = UsdShade.Shader.Get(self.stage, shader_path)
 
-            if source_attr in attr_table.keys():  # Check connection input if in translator dictionary
-                if attr_table[source_attr]['name'] not in [x.GetBaseName() for x in usdShader.GetOutputs()]:
+            if source_attr in attr_table:  # Check connection input if in translator dictionary
+                usdShaderOutput = usdShader.GetOutput(attr_table[source_attr]['name'])
+                if not usdShaderOutput:
                     usdShaderOutput = usdShader.CreateOutput(attr_table[source_attr]['name'],
                                                              attr_table[source_attr]['type'])
 
-                else:
-                    usdShaderOutput = usdShader.GetOutput(attr_table[source_attr]['name'])
-
                 # Connect
                 usd_target.GetInput(target_attr).ConnectToSource(usdShaderOutput)
             else:
                 return
 
+            # Attributes and upstream network only need to be built once in each material
+            built = memo.built(usdShadingGroup.GetPath())
+            if shader_name in built:
+                return
+            built.add(shader_name)
+
             # Creating the attributes and setting the value
-            for attr in cmds.listAttr(source_shader, hd=True):
-                if attr in attr_table.keys():
+            for attr in memo.attrs(source_shader):
+                if attr in attr_table:
                     if nodeType == 'file' and attr == 'fileTextureName':
-                        _value = self._get_fileTextureName(source_shader)
+                        _value = memo.value(source_shader, attr,
+                                            lambda node, _: self._get_fileTextureName(node))
                     else:
-                        _value = cmds.getAttr('{}.{}'.format(source_shader, attr), x=True)
+                        _value = memo.value(source_shader, attr)
                     usdShader.CreateInput(attr_table[attr]['name'], attr_table[attr]['type']).Set(
                         attr_table[attr]['convert'](_value))
 
             if attr_table['post_proc'](source_shader, usdShader, usdShadingGroup):
-                if cmds.listConnections(source_shader, d=False, c=True, p=True):
-                    connections = iter(cmds.listConnections(source_shader, d=False, c=True, p=True))
+                if memo.connections(source_shader):
+                    connections = iter(memo.connections(source_shader))
                     for connectDest, connectSource in zip(connections, connections):
                         connectSourceNode = connectSource.split('.')[0]
                         connectSourceAttr = connectSource.split('.')[-1]
                         # connectDestNode = connectDest.split('.')[0]
                         connectDestAttr = connectDest.split('.')[-1]
-                        if connectDestAttr in attr_table.keys():
+                        if connectDestAttr in attr_table:
                             self.rebuildShader(source_shader=connectSourceNode, usd_target=usdShader,
                                                source_attr=connectSourceAttr,
                                                target_attr=attr_table[connectDestAttr]['name'],
@@ -1309,14 +1317,15 @@ class RedshiftShadersToUSD:
         import maya.cmds as cmds
 
         connections = cmds.listConnections(mayaShader + '.uvCoord')
-        if connections and cmds.nodeType(connections[0]) == 'place2dTexture':
+        if connections and self.memo.node_type(connections[0]) == 'place2dTexture':
             uv_coord = connections[0]
-            usdShader.CreateInput('mirrorU', Sdf.ValueTypeNames.Int).Set(cmds.getAttr(uv_coord + '.mirrorU'))
-            usdShader.CreateInput('mirrorV', Sdf.ValueTypeNames.Int).Set(cmds.getAttr(uv_coord + '.mirrorV'))
-            usdShader.CreateInput('wrapU', Sdf.ValueTypeNames.Int).Set(cmds.getAttr(uv_coord + '.wrapU'))
-            usdShader.CreateInput('wrapV', Sdf.ValueTypeNames.Int).Set(cmds.getAttr(uv_coord + '.wrapV'))
-            usdShader.CreateInput('rotate', Sdf.ValueTypeNames.Float).Set(cmds.getAttr(uv_coord + '.rotateUV'))
-            usdShader.CreateInput('offset', Sdf.ValueTypeNames.Float2).Set(cmds.getAttr(uv_coord + '.offset')[0])
+            value = self.memo.value
+            usdShader.CreateInput('mirrorU', Sdf.ValueTypeNames.Int).Set(value(uv_coord, 'mirrorU'))
+            usdShader.CreateInput('mirrorV', Sdf.ValueTypeNames.Int).Set(value(uv_coord, 'mirrorV'))
+            usdShader.CreateInput('wrapU', Sdf.ValueTypeNames.Int).Set(value(uv_coord, 'wrapU'))
+            usdShader.CreateInput('wrapV', Sdf.ValueTypeNames.Int).Set(value(uv_coord, 'wrapV'))
+            usdShader.CreateInput('rotate', Sdf.ValueTypeNames.Float).Set(value(uv_coord, 'rotateUV'))
+            usdShader.CreateInput('offset', Sdf.ValueTypeNames.Float2).Set(value(uv_coord, 'offset')[0])
 
     def post_TextureSampler(self, mayaShader, usdShader, usdShadingGroup):
         import maya.cmds as cmds
@@ -2,6 +2,8 @@ import re
 
 from pxr import Sdf, Usd, UsdShade, UsdGeom
 
+from reveries.maya.usd.shader_memo import ShaderNodeMemo
+
 # Maya Attributes to USD post process
 
 
@@ -1298,6 +1300,9 @@ class RedshiftShadersToUSD:
     def ExportMaterials(self):
         import maya.cmds as cmds
 
+        # Maya queries of shared shading nodes, reused by all materials
+        self.memo = ShaderNodeMemo()
+
         # Build Stage
         self.stage = Usd.Stage.CreateInMemory()
         # Build Root Scope
@@ -1414,35 +1419,24 @@ class RedshiftShadersToUSD:
 
     def rebuildShader(self, source_shader, usd_target, source_attr,
                       target_attr, usdShadingGroup):
-        import maya.cmds as cmds
-
-        nodeType = cmds.nodeType(source_shader)
+        memo = self.memo
+        nodeType = memo.node_type(source_shader)
 
         # Creating the Shader. Check nodeType if in translator dictionary
-        if nodeType in self.translator.keys():
+        if nodeType in self.translator:
             attr_table = self.translator[nodeType]
-            if self.procNamespace(source_shader) not in \
-                    [x.GetName() for x in
-                     usdShadingGroup.GetPrim().GetAllChildren()]:
-                usdShader = UsdShade.Shader.Define(
-                    self.stage,
-                    usdShadingGroup.GetPath().AppendChild(
-                        self.procNamespace(source_shader)
-                    )
-                )
+            shader_name = self.procNamespace(source_shader)
+            shader_path = usdShadingGroup.GetPath().AppendChild(shader_name)
+            if not self.stage.GetPrimAtPath(shader_path):
+                usdShader = UsdShade.Shader.Define(self.stage, shader_path)
                 usdShader.CreateIdAttr(
                     self.translator[nodeType]['info:id']['name']
                 )
             else:
-                usdShader = UsdShade.Shader.Get(
-                    self.stage,
-                    usdShadingGroup.GetPath().AppendChild(
-                        self.procNamespace(source_shader)
-                    )
-                )
+                usdShader = UsdShade.Shader.Get(self.stage, shader_path)
 
             # Check connection input if in translator dictionary
-            if source_attr in attr_table.keys():
+            if source_attr in attr_table:
                 if attr_table[source_attr].get('attr_proc', None):
                     attr_table[source_attr]['attr_proc'](
                         source_shader, usdShader, usdShadingGroup,
@@ -1451,15 +1445,13 @@ class RedshiftShadersToUSD:
                         source_attr=source_attr
                     )
                 else:
-                    if attr_table[source_attr]['name'] not in \
-                            [x.GetBaseName() for x in usdShader.GetOutputs()]:
+                    usdShaderOutput = usdShader.GetOutput(
+                        attr_table[source_attr]['name'])
+                    if not usdShaderOutput:
                         usdShaderOutput = usdShader.CreateOutput(
                             attr_table[source_attr]['name'],
                             attr_table[source_attr]['type']
                         )
-                    else:
-                        usdShaderOutput = usdShader.GetOutput(
-                            attr_table[source_attr]['name'])
 
                     # Connect
                     usd_target.GetInput(target_attr).\
@@ -1469,10 +1461,17 @@ class RedshiftShadersToUSD:
                 print("Source attribute not in dict: {}".format(msg))
                 return
 
+            # Attributes and upstream network only need to be built once
+            # in each material
+            built = memo.built(usdShadingGroup.GetPath())
+            if shader_name in built:
+                return
+            built.add(shader_name)
+
             # Creating the attributes and setting the value
-            for attr in cmds.listAttr(source_shader, hd=True):
-                if attr in attr_table.keys():
-                    if "attr_proc" in attr_table[attr].keys():
+            for attr in memo.attrs(source_shader):
+                if attr in attr_table:
+                    if "attr_proc" in attr_table[attr]:
                         continue
 
                     if attr_table[attr]['type'] == Sdf.ValueTypeNames.Token \
@@ -1482,16 +1481,17 @@ class RedshiftShadersToUSD:
                     if nodeType == 'RedshiftColorLayer':
                         match = re.findall('(layer+\S)', attr)
                         if match:
-                            if not cmds.getAttr("{}.{}_enable".format(source_shader, match[0])):
+                            if not memo.value(source_shader,
+                                              match[0] + "_enable"):
                                 continue
 
                     if nodeType == 'file' and attr == 'fileTextureName':
-                        _value = self._get_fileTextureName(source_shader)
-                    else:
-                        _value = cmds.getAttr(
-                            '{}.{}'.format(source_shader, attr),
-                            x=True
+                        _value = memo.value(
+                            source_shader, attr,
+                            lambda node, _: self._get_fileTextureName(node)
                         )
+                    else:
+                        _value = memo.value(source_shader, attr)
 
                     usdShader.CreateInput(
                         attr_table[attr]['name'],
@@ -1501,7 +1501,7 @@ class RedshiftShadersToUSD:
             if attr_table['post_proc'](
                     source_shader, usdShader, usdShadingGroup):
 
-                all_connections = cmds.listConnections(source_shader, d=False, c=True, p=True)
+                all_connections = memo.connections(source_shader)
                 if all_connections:
                     connections = iter(all_connections)
 
@@ -1513,12 +1513,12 @@ class RedshiftShadersToUSD:
                         connectDestAttr = connectDest.split('.')[-1]
 
                         _target_attr = ""
-                        if cmds.nodeType(connectSourceNode) == "setRange" and \
+                        if memo.node_type(connectSourceNode) == "setRange" and \
                                 connectSourceAttr != "outValue":
                             connectDestAttr = self._attr_remove_rgb(connectDestAttr)
                             _target_attr = connectDestAttr
 
-                        if connectDestAttr in attr_table.keys():
+                        if connectDestAttr in attr_table:
                             if not _target_attr:
                                 _target_attr = attr_table[connectDestAttr]['name']
                             self.rebuildShader(
@@ -1607,7 +1607,6 @@ class RedshiftShadersToUSD:
         )
 
     def post_setRange(self, mayaShader, usdShader, usdShadingGroup):
-        import maya.cmds as cmds
         from set_range_builder import SetRangeBuilder
 
         set_range_builder = SetRangeBuilder(
@@ -1615,10 +1614,9 @@ class RedshiftShadersToUSD:
             self.translator,
             self.procNamespace)
 
-        if cmds.listConnections(mayaShader, d=False, c=True, p=True):
+        if self.memo.connections(mayaShader):
 
-            connections = iter(cmds.listConnections(
-                mayaShader, d=False, c=True, p=True))
+            connections = iter(self.memo.connections(mayaShader))
 
             for connectDest, connectSource in \
                     zip(connections, connections):
@@ -1627,7 +1625,7 @@ class RedshiftShadersToUSD:
                 # connectDestNode = connectDest.split('.')[0]
                 connectDestAttr = connectDest.split('.')[-1]
 
-                node_type = cmds.nodeType(connectSourceNode)
+                node_type = self.memo.node_type(connectSourceNode)
 
                 if node_type == "RedshiftUserDataScalar":
                     set_range_builder.pre_setRange(
@@ -1719,20 +1717,22 @@ class RedshiftShadersToUSD:
         import maya.cmds as cmds
 
         connections = cmds.listConnections(mayaShader + '.uvCoord')
-        if connections and cmds.nodeType(connections[0]) == 'place2dTexture':
+        if connections and \
+                self.memo.node_type(connections[0]) == 'place2dTexture':
             uv_coord = connections[0]
+            value = self.memo.value
             usdShader.CreateInput('mirrorU', Sdf.ValueTypeNames.Int).Set(
-                cmds.getAttr(uv_coord + '.mirrorU'))
+                value(uv_coord, 'mirrorU'))
             usdShader.CreateInput('mirrorV', Sdf.ValueTypeNames.Int).Set(
-                cmds.getAttr(uv_coord + '.mirrorV'))
+                value(uv_coord, 'mirrorV'))
             usdShader.CreateInput('wrapU', Sdf.ValueTypeNames.Int).Set(
-                cmds.getAttr(uv_coord + '.wrapU'))
+                value(uv_coord, 'wrapU'))
             usdShader.CreateInput('wrapV', Sdf.ValueTypeNames.Int).Set(
-                cmds.getAttr(uv_coord + '.wrapV'))
+                value(uv_coord, 'wrapV'))
             usdShader.CreateInput('rotate', Sdf.ValueTypeNames.Float).Set(
-                cmds.getAttr(uv_coord + '.rotateUV'))
+                value(uv_coord, 'rotateUV'))
             usdShader.CreateInput('offset', Sdf.ValueTypeNames.Float2).Set(
-                cmds.getAttr(uv_coord + '.offset')[0])
+                value(uv_coord, 'offset')[0])
 
     def post_TextureSampler(self, mayaShader, usdShader, usdShadingGroup):
         import maya.cmds as cmds
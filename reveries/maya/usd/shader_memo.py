@@ -0,0 +1,78 @@
+
+class ShaderNodeMemo(object):
+    """Memo of Maya shading node queries for one look export
+
+    Shading networks are usually shared between materials, e.g. one file
+    texture used by many shaders. Node type, attribute list, attribute
+    values and upstream connections are queried from Maya once per node and
+    reused by every material that includes the node.
+
+    It also keeps the names of shader nodes which have been fully
+    translated in each USD material, so a node reached again through another
+    path in the same network will only be connected, not rebuilt.
+
+    """
+
+    def __init__(self):
+        self._types = dict()
+        self._attrs = dict()
+        self._values = dict()
+        self._connections = dict()
+        self._built = dict()
+
+    def node_type(self, node):
+        try:
+            return self._types[node]
+        except KeyError:
+            import maya.cmds as cmds
+            value = self._types[node] = cmds.nodeType(node)
+            return value
+
+    def attrs(self, node):
+        """Return `cmds.listAttr(node, hd=True)`"""
+        try:
+            return self._attrs[node]
+        except KeyError:
+            import maya.cmds as cmds
+            value = self._attrs[node] = cmds.listAttr(node, hd=True) or []
+            return value
+
+    def value(self, node, attr, getter=None):
+        """Return attribute value, `cmds.getAttr(plug, x=True)` by default
+
+        Arguments:
+            node (str): Node name
+            attr (str): Attribute name
+            getter (callable, optional): Function that takes node and
+                attribute name and returns the value
+
+        """
+        key = (node, attr)
+        try:
+            return self._values[key]
+        except KeyError:
+            if getter is None:
+                import maya.cmds as cmds
+                value = cmds.getAttr(node + "." + attr, x=True)
+            else:
+                value = getter(node, attr)
+            self._values[key] = value
+            return value
+
+    def connections(self, node):
+        """Return `cmds.listConnections(node, d=False, c=True, p=True)`"""
+        try:
+            return self._connections[node]
+        except KeyError:
+            import maya.cmds as cmds
+            value = cmds.listConnections(node, d=False, c=True, p=True) or []
+            self._connections[node] = value
+            return value
+
+    def built(self, material_path):
+        """Return set of shader names that have been built in material"""
+        try:
+            return self._built[material_path]
+        except KeyError:
+            value = self._built[material_path] = set()
+            return value
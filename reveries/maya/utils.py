@@ -1,6 +1,7 @@
 
 import os
 import uuid
+import ctypes
 import hashlib
 import contextlib
 import logging
@@ -11,17 +12,28 @@ try:
 except ImportError:
     pass
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from avalon import api, io
 from avalon.maya.pipeline import AVALON_CONTAINERS
 
 import avalon_sftpc
 
-from maya import cmds, mel
+from maya import cmds, mel, OpenMaya
 from maya.api import OpenMaya as om
 
 from .. import lib as reveries_lib
 from ..vendor import six
-from ..utils import _C4Hasher, get_representation_path_
+from ..utils import (
+    _C4Hasher,
+    get_representation_path_,
+    as_hash_rows,
+    geometry_hash_terms,
+    accumulate_hash,
+)
 from .pipeline import (
     find_stray_textures,
     env_embedded_path,
@@ -242,24 +254,109 @@ def fix_texture_file_nodes(nodes=lib._no_val, file_path=None, dry_run=False):
 #       implement __eq__ to compare files
 
 
-def _hash_MPoint(x, y, z, w):
-    x = (x + 1) * 233
-    y = (y + x) * 239
-    z = (z + y) * 241
-    return (x + y + z) * w
+class _MeshHashCache(object):
+    """Per-mesh hash terms cache for `MeshHasher`
+
+    Entries of a mesh will be dropped once the mesh node got dirty, through
+    `MNodeMessage.addNodeDirtyCallback`.
+
+    """
+
+    def __init__(self):
+        self._entries = dict()
+        self._callbacks = dict()
+
+    def get(self, node, key):
+        handle = om.MObjectHandle(node)
+        entry = self._entries.get(handle.hashCode())
+        if entry is None:
+            return None
+
+        cached_handle, terms = entry
+        if not cached_handle.isValid():
+            # Node deleted, hash code may be reused by other node
+            self.invalidate(handle.hashCode())
+            return None
+
+        return terms.get(key)
+
+    def set(self, node, key, value):
+        handle = om.MObjectHandle(node)
+        code = handle.hashCode()
+
+        if code not in self._callbacks:
+            self._callbacks[code] = om.MNodeMessage.addNodeDirtyCallback(
+                node, self._on_dirty, code)
+
+        if code not in self._entries:
+            self._entries[code] = (handle, dict())
+        self._entries[code][1][key] = value
+
+    def invalidate(self, code):
+        self._entries.pop(code, None)
+        callback = self._callbacks.pop(code, None)
+        if callback is not None:
+            om.MMessage.removeCallback(callback)
+
+    def clear(self):
+        self._entries.clear()
+        if self._callbacks:
+            om.MMessage.removeCallbacks(list(self._callbacks.values()))
+        self._callbacks.clear()
+
+    def _on_dirty(self, node, code):
+        self.invalidate(code)
+
+
+_mesh_hash_cache = _MeshHashCache()
+
 
+def _raw_mesh_rows(dag_path, kind):
+    """Read mesh points or normals from raw float buffer in one copy
 
-def _hash_MFloatVectors(x, y, z):
-    x = (x + 1) * 383
-    y = (y + x) * 389
-    z = (z + y) * 397
-    return x + y + z
+    `MPointArray` and `MFloatVectorArray` from API 2.0 can only be converted
+    element by element in Python. API 1.0 `getRawPoints`/`getRawNormals`
+    give the internal float buffer, which is copied into NumPy array at once.
+    Values are the same as `getPoints`/`getNormals` in object space.
 
+    Arguments:
+        dag_path (str): Mesh node's DAG path
+        kind (str): "points" or "normals"
 
-def _hash_UV(u, v):
-    u = (u + 1) * 547
-    v = (v + u) * 557
-    return u * v
+    Returns:
+        numpy.ndarray or None: Rows for `geometry_hash_terms`, or None if
+            NumPy not available or buffer can't be read.
+
+    """
+    if numpy is None:
+        return None
+
+    try:
+        sel_list = OpenMaya.MSelectionList()
+        sel_list.add(dag_path)
+        dag = OpenMaya.MDagPath()
+        sel_list.getDagPath(0, dag)
+        mesh = OpenMaya.MFnMesh(dag)
+
+        if kind == "points":
+            pointer, count = mesh.getRawPoints(), mesh.numVertices()
+        else:
+            pointer, count = mesh.getRawNormals(), mesh.numNormals()
+
+        buffer = (ctypes.c_float * (count * 3)).from_address(int(pointer))
+        values = numpy.frombuffer(buffer, dtype=numpy.float32)
+
+    except Exception as e:
+        log.debug("Raw %s of %s not read: %s", kind, dag_path, e)
+        return None
+
+    # Copy out from Maya's buffer
+    rows = values.reshape(-1, 3).astype(numpy.float64)
+    if kind == "points":
+        # MPoint.w
+        rows = numpy.column_stack((rows, numpy.ones(count)))
+
+    return numpy.ascontiguousarray(rows)
 
 
 class MeshHasher(object):
@@ -294,13 +391,27 @@ class MeshHasher(object):
         You can still adding more meshes until you call `clear`
         >> hasher.clear()
 
+    Components are hashed in bulk with NumPy if available, see
+    `reveries.utils.geometry_hash_terms`.
+
+    Arguments:
+        decimals (int, optional): Quantise component values to given decimal
+            places before hashing. Default None, digest is then compatible
+            with previously published hash values.
+        cache (bool, optional): Cache hash terms of each mesh until the mesh
+            node got dirty, default False.
+
     """
 
-    def __init__(self):
+    def __init__(self, decimals=None, cache=False):
+        self.decimals = decimals
+        self.cache = cache
         self.clear()
 
     def clear(self):
         self._mesh = None
+        self._node = None
+        self._dag_path = None
         self._points = 0
         self._normals = 0
         self._uvmap = 0
@@ -316,18 +427,49 @@ class MeshHasher(object):
         sel_list.add(dag_path)
         sel_obj = sel_list.getDagPath(0)
         self._mesh = om.MFnMesh(sel_obj)
+        self._node = self._mesh.object()
+        self._dag_path = sel_obj.fullPathName()
+
+    def _hash_terms(self, kind, get_rows, uv_set=None):
+        key = (kind, uv_set, self.decimals)
+        if self.cache:
+            terms = _mesh_hash_cache.get(self._node, key)
+            if terms is not None:
+                return terms
+
+        terms = geometry_hash_terms(kind, get_rows(), self.decimals)
+
+        if self.cache:
+            _mesh_hash_cache.set(self._node, key, terms)
+
+        return terms
 
     def update_points(self):
-        for i, vt in enumerate(self._mesh.getPoints()):
-            self._points += _hash_MPoint(*vt) + i
+        def get_rows():
+            rows = _raw_mesh_rows(self._dag_path, "points")
+            if rows is None:
+                rows = as_hash_rows(self._mesh.getPoints(), 4)
+            return rows
+
+        terms = self._hash_terms("points", get_rows)
+        self._points = accumulate_hash(self._points, terms)
 
     def update_normals(self):
-        for i, vt in enumerate(self._mesh.getNormals()):
-            self._normals += _hash_MFloatVectors(*vt) + i
+        def get_rows():
+            rows = _raw_mesh_rows(self._dag_path, "normals")
+            if rows is None:
+                rows = as_hash_rows(self._mesh.getNormals(), 3)
+            return rows
+
+        terms = self._hash_terms("normals", get_rows)
+        self._normals = accumulate_hash(self._normals, terms)
 
     def update_uvmap(self, uv_set=""):
-        for i, uv in enumerate(zip(*self._mesh.getUVs(uv_set))):
-            self._uvmap += _hash_UV(*uv) + i
+        def get_rows():
+            return as_hash_rows(zip(*self._mesh.getUVs(uv_set)), 2)
+
+        terms = self._hash_terms("uvmap", get_rows, uv_set)
+        self._uvmap = accumulate_hash(self._uvmap, terms)
 
     def digest(self):
         result = dict()
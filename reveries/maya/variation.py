@@ -0,0 +1,148 @@
+
+"""Batched transform variation for set-dress loading
+
+Resolve all target transforms once, check incoming connections with one
+DG query and read current values through OpenMaya, instead of running a
+dozen of commands per transform. Edits are applied with commands in one
+undo chunk, so loading or updating a set can be undone in one step.
+
+"""
+import time
+
+from maya import cmds
+from maya.api import OpenMaya as om
+
+
+def _handle(node):
+    """Return hashable handle code of the node, or None if not found"""
+    selection = om.MSelectionList()
+    try:
+        selection.add(node)
+    except RuntimeError:
+        return None
+    return om.MObjectHandle(selection.getDependNode(0)).hashCode()
+
+
+def input_connected(nodes, attributes):
+    """Return nodes that have input connection on any of the attributes
+
+    All plugs are queried in one `listConnections` call, the returned
+    plugs are mapped back to the input node names by their `MObject`, so
+    node name format (short, long or namespaced) does not matter.
+
+    Args:
+        nodes (list): Node names
+        attributes (list): Attribute names
+
+    Returns:
+        set: Node names (as given) which have input connection
+
+    """
+    nodes = list(set(nodes))
+    if not nodes:
+        return set()
+
+    plugs = [node + "." + attr for node in nodes for attr in attributes]
+    conns = cmds.listConnections(plugs,
+                                 source=True,
+                                 destination=False,
+                                 connections=True,
+                                 plugs=True) or []
+    # With `connections` flag, plug on the queried node comes first
+    connected = set(_handle(plug.split(".", 1)[0]) for plug in conns[0::2])
+    if not connected:
+        return set()
+
+    return set(node for node in nodes if _handle(node) in connected)
+
+
+class TransformBatch(object):
+    """Collect transform edits and apply them in one undo chunk
+
+    Current values are read through OpenMaya. Edits are applied with
+    `cmds.setAttr` and `cmds.xform` so they enter the undo queue, matrices
+    are set in object space while keeping the scale pivot. Locked bool
+    plugs are left untouched.
+
+    Example:
+        >>> batch = TransformBatch(["|set|a", "|set|b"])
+        >>> batch.set_bool("|set|a", "visibility", False)
+        >>> batch.set_matrix("|set|b", matrix)
+        >>> seconds = batch.commit()
+
+    Args:
+        nodes (list): Transform node names to resolve
+
+    """
+
+    def __init__(self, nodes):
+        self._start = time.time()
+        self._paths = dict()
+        self._bools = list()
+        self._matrices = list()
+        self.edits = 0
+
+        for node in nodes:
+            if node in self._paths:
+                continue
+            selection = om.MSelectionList()
+            selection.add(node)
+            self._paths[node] = selection.getDagPath(0)
+
+    def __len__(self):
+        return len(self._paths)
+
+    def _fn(self, node):
+        return om.MFnTransform(self._paths[node])
+
+    def _plug(self, node, attr):
+        return self._fn(node).findPlug(attr, False)
+
+    def matrix(self, node):
+        """Return object space matrix as a list of 16 floats"""
+        matrix = self._fn(node).transformation().asMatrix()
+        return [matrix.getElement(row, column)
+                for row in range(4) for column in range(4)]
+
+    def get_bool(self, node, attr):
+        return self._plug(node, attr).asBool()
+
+    def set_bool(self, node, attr, value):
+        plug = self._plug(node, attr)
+        if plug.isLocked:
+            return
+        attr = self._paths[node].fullPathName() + "." + attr
+        self._bools.append((attr, bool(value)))
+        self.edits += 1
+
+    def set_matrix(self, node, matrix):
+        self._matrices.append((self._paths[node].fullPathName(), matrix))
+        self.edits += 1
+
+    def commit(self):
+        """Apply all queued edits, undoable as one step
+
+        Returns:
+            float: Seconds elapsed since this batch was created
+
+        """
+        cmds.undoInfo(openChunk=True)
+        try:
+            for attr, value in self._bools:
+                try:
+                    cmds.setAttr(attr, value)
+                except RuntimeError:
+                    # Ignore like `SetDressLoader.set_attr` did
+                    pass
+
+            for node, matrix in self._matrices:
+                scale_pivot = cmds.xform(node, query=True, scalePivot=True)
+                cmds.xform(node, objectSpace=True, matrix=matrix)
+                cmds.xform(node, scalePivot=scale_pivot)
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+        self._bools = list()
+        self._matrices = list()
+
+        return time.time() - self._start
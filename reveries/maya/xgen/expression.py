@@ -0,0 +1,120 @@
+
+"""XGen map expression tokenizer
+
+This module must not import Maya, so it could be used and tested outside
+of Maya.
+
+"""
+import re
+import collections
+
+
+MapToken = collections.namedtuple("MapToken", ["name", "file", "mode", "pos"])
+
+# Patterns from `ExpressionUI.parseMapString`, with extended path characters
+# for explicit .ptx file path. These are matched one after another in the
+# original parser, kept here for reference and `QRegExp` users.
+PATTERNS = (
+    ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#3dpaint,(-?[\\d.]*)'),
+    ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#file'),
+    ('\\$(\\w+)\\s*=\\s*vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#vpaint'),
+    ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\);'),
+    ('\\$(\\w+)\\s*=\\s*vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\);'),
+    ('map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\)'),
+    ('vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
+     '[\"\'][,.$()a-zA-Z0-9 ]*\\)'),
+)
+
+# Map path and the rest arguments inside `map()` or `vmap()`
+_ARGS = (r"[\"']([\w${}\-\\/%.,]+)"
+         r"[\"'][,.$()a-zA-Z0-9 ]*")
+
+# Single compiled pattern, matched at every position in one pass with
+# lookahead, so overlapping matches (e.g. the `map(` inside a named map)
+# are all found like scanning each pattern with offset `pos + 1`. The
+# leading character class rejects most positions early.
+_TOKENIZER = re.compile(
+    r"(?=[$mv])(?=(?:"
+    # $name = map(...); #comment
+    r"\$(?P<name>\w+)\s*=\s*(?P<named_v>v?)map\(" + _ARGS + r"\);"
+    r"(?:\s*#(?P<comment>3dpaint,(?P<weight>-?[\d.]*)|file|vpaint))?"
+    r"|"
+    # plain map(...)
+    r"(?P<plain_v>v?)map\(" + _ARGS + r"\)"
+    r"))"
+)
+
+# Token modes ordered by the pattern priority of `ExpressionUI.parseMapString`
+_NAMED_3DPAINT = 0
+_NAMED_FILE = 1
+_NAMED_VPAINT = 2
+_NAMED_MAP = 3
+_NAMED_VMAP = 4
+_PLAIN_MAP = 5
+_PLAIN_VMAP = 6
+
+
+def tokenize(text):
+    """Return map tokens from expression text
+
+    Expression examples:
+
+        $a=map('${DESC}/${HAHA}/mask');#3dpaint,5.0
+        $c=map('${DESC}/paintmaps/mask_${PAL,mySeq}.ptx');#file
+        $g=map('${DESC}/map-%d.ptx', cycle($objectId, 10, 20));
+        map('${DESC}/groom/orient/',0)
+
+    Tokens are returned in the same order as seven patterns being matched
+    one after another, which is what `ExpressionUI.parseMapString` does:
+    `$name = map()` with `#3dpaint`, `#file`, `$name = vmap()` with
+    `#vpaint`, `$name = map()`, `$name = vmap()`, plain `map()` then plain
+    `vmap()`, each in text position order.
+
+    Args:
+        text (str): Expression text
+
+    Returns:
+        list: A list of `MapToken`
+
+    """
+    groups = [[] for _ in range(7)]
+
+    for match in _TOKENIZER.finditer(text):
+        pos = match.start()
+        name = match.group("name")
+
+        if name is not None:
+            file = match.group(3)
+            comment = match.group("comment") or ""
+
+            if match.group("named_v"):
+                if comment == "vpaint":
+                    groups[_NAMED_VPAINT].append(
+                        MapToken(name, file, "vpaint", pos))
+                else:
+                    groups[_NAMED_VMAP].append(MapToken(name, file, "", pos))
+
+            elif comment.startswith("3dpaint"):
+                mode = "3dpaint," + match.group("weight")
+                groups[_NAMED_3DPAINT].append(MapToken(name, file, mode, pos))
+
+            elif comment == "file":
+                groups[_NAMED_FILE].append(MapToken(name, file, "file", pos))
+
+            else:
+                groups[_NAMED_MAP].append(MapToken(name, file, "", pos))
+
+        else:
+            file = match.group(7)
+            if match.group("plain_v"):
+                groups[_PLAIN_VMAP].append(MapToken("", file, "", pos))
+            else:
+                groups[_PLAIN_MAP].append(MapToken("", file, "", pos))
+
+    return [token for group in groups for token in group]
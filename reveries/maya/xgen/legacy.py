@@ -7,8 +7,8 @@ import xgenm.xgGlobal as xgg
 
 import pymel.core as pmc
 from maya import cmds, mel
-from avalon.vendor.Qt import QtCore
 from .. import capsule
+from . import expression
 
 
 # Legacy work steps
@@ -40,88 +40,27 @@ def _getMapExprStrings():
     from this function does.
 
     """
-    exprStr0 = ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#3dpaint,(-?[\\d.]*)')
-
-    exprStr1 = ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#file')
-
-    exprStr2 = ('\\$(\\w+)\\s*=\\s*vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\);\\s*#vpaint')
-
-    exprStr3 = ('\\$(\\w+)\\s*=\\s*map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\);')
-
-    exprStr4 = ('\\$(\\w+)\\s*=\\s*vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\);')
-
-    exprStr5 = ('map\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\)')
-
-    exprStr6 = ('vmap\\([\"\']([\\w${}\\-\\\\/%.${,}]+)'
-                '[\"\'][,.$()a-zA-Z0-9 ]*\\)')
-
-    exprStrings = [exprStr0, exprStr1, exprStr2, exprStr3,
-                   exprStr4, exprStr5, exprStr6]
-
-    return exprStrings
+    return list(expression.PATTERNS)
 
 
 def _parseMapString(exprText):
     """Return a list of map file item from expression in an object attribute
 
-    This function was modified from `ExpressionUI.parseMapString`.
+    This function was modified from `ExpressionUI.parseMapString`, the
+    patterns are now matched in one pass by `expression.tokenize`.
 
     """
     from xgenm.ui.widgets.xgExpressionUI import ExpressionUI
 
-    # vmap and map expressions
-    mapExprStrings = _getMapExprStrings()
-
-    exprStrings = [
-        [mapExprStrings[0], "3dpaint"],
-        [mapExprStrings[1], "file"],
-        [mapExprStrings[2], "vpaint"],
-        [mapExprStrings[3], ""],  # map() without comment
-        [mapExprStrings[4], ""],  # vmap() without comment
-        [mapExprStrings[5], "_plain"],  # plain map(), no comment
-        [mapExprStrings[6], "_plain"],  # plain vmap(), no comment
-    ]
-
-    poses = []
     retMaps = []
-    for s in exprStrings:
-        re = QtCore.QRegExp(s[0])
-        offset = 0
-        while True:
-            item = ExpressionUI.MapItem()
-            pos = re.indexIn(exprText, offset)
-            if (pos < 0):
-                break
-
-            offset = pos + 1
-
-            if pos in poses:
-                # Possible already matched via previous regex if current
-                # regex does no matching comment string.
-                continue
-            poses.append(pos)
-
-            if s[1] == "_plain":
-                item.name = ""
-                item.file = re.cap(1)
-                item.mode = ""
-            else:
-                item.name = re.cap(1)
-                item.file = re.cap(2)
-                item.mode = s[1]
+    for token in expression.tokenize(exprText):
+        item = ExpressionUI.MapItem()
+        item.name = token.name
+        item.file = token.file
+        item.mode = token.mode
+        item.pos = token.pos
 
-            if s[1] == "3dpaint":
-                item.mode = item.mode + "," + re.cap(3)
-
-            item.pos = pos
-
-            retMaps.append(item)
+        retMaps.append(item)
 
     return retMaps
 
@@ -616,7 +555,7 @@ def parse_objects(map_attr):
         raise Exception("Object not found, this is a bug: {}".format(map_attr))
 
 
-def parse_map_path(map_attr):
+def parse_map_path(map_attr, map_index=None):
     """Parse attribute returned from `filePathEditor` into file path
 
     (NOTE) Remember to refresh filePathEditor by calling
@@ -625,6 +564,7 @@ def parse_map_path(map_attr):
 
     Args:
         map_attr (str): An attribute path returned from `cmds.filePathEditor`
+        map_index (MapIndex, optional): Serve parsed expression from index
 
     Returns:
         str: File path
@@ -633,7 +573,10 @@ def parse_map_path(map_attr):
     """
     palette, description, obj, attr, index = parse_objects(map_attr)
 
-    expr_maps = parse_expr_maps(attr, palette, description, obj)
+    if map_index is None:
+        expr_maps = parse_expr_maps(attr, palette, description, obj)
+    else:
+        expr_maps = map_index.expr_maps(attr, palette, description, obj)
 
     if not expr_maps:
         # Not expression type
@@ -646,33 +589,98 @@ def parse_map_path(map_attr):
     return path, parents
 
 
-def parse_description_maps(description):
+class MapIndex(object):
+    """Index of XGen Legacy maps in scene, for collecting many descriptions
+
+    Resolved maps from `filePathEditor` are queried and grouped by
+    description once, and each palette's expanded data paths, inactive
+    fx modules and parsed expressions of each description are cached
+    on first use. So collecting maps from every description of a palette
+    will not refresh `filePathEditor` or query the same thing again.
+
+    (NOTE) The index is a snapshot, create a new one if the scene has been
+           changed.
+
+    """
+
+    def __init__(self):
+        self._resolved = None
+        self._data_paths = dict()
+        self._inactive = dict()
+        self._exprs = dict()
+
+    def _build(self):
+        cmds.filePathEditor(refresh=True)
+        resloved = (cmds.filePathEditor(query=True,
+                                        listFiles="",
+                                        withAttribute=True,
+                                        byType="xgmDescription",
+                                        unresolved=False) or [])
+
+        shapes = dict()
+        self._resolved = dict()
+
+        for map_attr, fname in zip(resloved[1::2], resloved[0::2]):
+            desc_shape = map_attr.split(".", 1)[0]
+            if desc_shape not in shapes:
+                shapes[desc_shape] = cmds.ls(desc_shape,
+                                             type="xgmDescription",
+                                             long=True)
+            for desc_shape_long in shapes[desc_shape]:
+                maps = self._resolved.setdefault(desc_shape_long, [])
+                maps.append((map_attr, fname))
+
+    def resolved(self, description):
+        """Return resolved (map attribute, file name) of the description"""
+        if self._resolved is None:
+            self._build()
+        desc_shape_long = get_description_long_name(description, shape=True)
+        return self._resolved.get(desc_shape_long, [])
+
+    def data_paths(self, palette):
+        """Return expanded xgDataPath of the palette"""
+        try:
+            return self._data_paths[palette]
+        except KeyError:
+            paths = current_data_paths(palette, expand=True)
+            self._data_paths[palette] = paths
+            return paths
+
+    def inactive_fx_modules(self, description):
+        try:
+            return self._inactive[description]
+        except KeyError:
+            modules = set(list_fx_modules(description, activated=False))
+            self._inactive[description] = modules
+            return modules
+
+    def expr_maps(self, attr, palette, description, object):
+        """Return cached `parse_expr_maps` result"""
+        key = (attr, palette, description, object)
+        try:
+            return self._exprs[key]
+        except KeyError:
+            maps = parse_expr_maps(attr, palette, description, object)
+            self._exprs[key] = maps
+            return maps
+
+
+def parse_description_maps(description, map_index=None):
     """Get all path of maps and attributes which used them by description
 
     Args:
         description (str): XGen Legacy description name
+        map_index (MapIndex, optional): Scene map index, pass the same one
+            when parsing multiple descriptions
 
     Returns:
         list: A list of tuple of file path and attribute objects
 
     """
-    cmds.filePathEditor(refresh=True)
-    resloved = (cmds.filePathEditor(query=True,
-                                    listFiles="",
-                                    withAttribute=True,
-                                    byType="xgmDescription",
-                                    unresolved=False) or [])
-
-    desc_shape_long = get_description_long_name(description, shape=True)
-
-    for map_attr, fname in zip(resloved[1::2], resloved[0::2]):
-        desc_shape = map_attr.split(".", 1)[0]
-        if desc_shape_long not in cmds.ls(desc_shape,
-                                          type="xgmDescription",
-                                          long=True):
-            continue
+    map_index = map_index or MapIndex()
 
-        path, parents = parse_map_path(map_attr)
+    for map_attr, fname in map_index.resolved(description):
+        path, parents = parse_map_path(map_attr, map_index)
 
         if not (path.endswith(".ptx") or path.endswith(".abc")):
             sep = "" if path.endswith("/") else "/"
@@ -681,21 +689,24 @@ def parse_description_maps(description):
         yield path, parents
 
 
-def maps_to_transfer(description):
+def maps_to_transfer(description, map_index=None):
     """Get all expanded map file/dir path from description for transfer
 
     Args:
         description (str): XGen Legacy description name
+        map_index (MapIndex, optional): Scene map index, pass the same one
+            when collecting multiple descriptions
 
     Returns:
         list: A list of tuples of palette root dir and collected map file
 
     """
     transfer = set()
+    map_index = map_index or MapIndex()
 
-    for path, parents in parse_description_maps(description):
+    for path, parents in parse_description_maps(description, map_index):
         palette, _, obj, _, _ = parents
-        if obj in list_fx_modules(description, activated=False):
+        if obj in map_index.inactive_fx_modules(description):
             # Ignore if not active
             cmds.warning("FxModule %s not active, transfer skipped." % obj)
             continue
@@ -703,7 +714,7 @@ def maps_to_transfer(description):
         if "${FXMODULE}" in path:
             path = path.replace("${FXMODULE}", parents[2])
 
-        data_paths = current_data_paths(palette, expand=True)
+        data_paths = map_index.data_paths(palette)
 
         if "${DESC}" in path:
             for root in data_paths:
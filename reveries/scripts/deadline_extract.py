@@ -2,10 +2,15 @@
 import os
 import sys
 import logging
-import json
+import functools
 import pyblish.api
 import pyblish.lib
 
+from reveries import extraction
+
+
+log = logging.getLogger("Pyblish")
+
 
 def get_plugin(classname):
     # Find extractor plugin
@@ -20,53 +25,133 @@ def get_plugin(classname):
     return Plugin
 
 
+def is_task_sliced(data):
+    """Return True if the extractor takes frame range from Deadline task
+
+    Each task only extracts a part of frames, so the status recorded in dump
+    can not be used to skip the extractor.
+
+    """
+    Plugin = get_plugin(data["class"])
+    return data["class"] == "ExtractArnoldStandIn" and "maya" in Plugin.hosts
+
+
+def task_frame_range():
+    # Set frame range from Deadline task (Maya Only)
+    from maya import mel
+    start = int(mel.eval("DeadlineValue(\"StartFrame\")"))
+    end = int(mel.eval("DeadlineValue(\"EndFrame\")"))
+    return {"start": start, "end": end}
+
+
+def extract(path, overrides=None):
+    data = extraction.load_dump(path)
+
+    args = data["args"]
+    kwargs = data["kwargs"]
+    kwargs.update(overrides or {})
+
+    Plugin = get_plugin(data["class"])
+
+    # Export
+    plugin = Plugin()
+    extractor = getattr(plugin, data["func"])
+    try:
+        extractor(*args, **kwargs)
+    except Exception as error:
+        pyblish.lib.extract_traceback(error, Plugin.__module__)
+        message = "Failed {p.__name__}: {e} -- {e.traceback}"
+        log.error(message.format(p=Plugin, e=error))
+        raise
+
+
+def init_worker(scene):
+    """Open current scene in worker process"""
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+
+    from maya import cmds
+    from avalon import api, maya
+    api.install(maya)
+
+    cmds.file(scene, open=True, force=True)
+
+
 def deadline_extract():
+    """Run dumped extractors, independent ones run in parallel
+
+    Set `PYBLISH_EXTRACTOR_WORKERS` to more than 1 for running extractors in
+    a process pool, each worker process opens the scene on its own. Status
+    and timing of each extractor are written back to its dump, extractors
+    that were done will be skipped when the job retries.
+
+    Returns:
+        dict: {dump path: result}, see `extraction.ExtractionRunner.run`
+
+    """
     dumps = os.environ["PYBLISH_EXTRACTOR_DUMPS"].split(";")
+    workers = int(os.environ.get("PYBLISH_EXTRACTOR_WORKERS", 1))
+
+    jobs = dict()
+    done = list()
+    overrides = dict()
+
     for path in dumps:
-        with open(path, "r") as file:
-            data = json.load(file)
-
-        args = data["args"]
-        kwargs = data["kwargs"]
-        classname = data["class"]
-        function = data["func"]
-
-        Plugin = get_plugin(classname)
-        yield Plugin  # For debug/error message
-
-        # Export
-        plugin = Plugin()
-
-        if (classname == "ExtractArnoldStandIn"
-                and "maya" in Plugin.hosts):
-            # Set frame range from Deadline task (Maya Only)
-            from maya import mel
-            start = int(mel.eval("DeadlineValue(\"StartFrame\")"))
-            end = int(mel.eval("DeadlineValue(\"EndFrame\")"))
-            kwargs["start"] = start
-            kwargs["end"] = end
-
-        extractor = getattr(plugin, function)
-        extractor(*args, **kwargs)
+        data = extraction.load_dump(path)
+        # Dumps from earlier version have no dependency recorded
+        jobs[path] = [dep for dep in data.get("dependsOn", [])
+                      if dep in dumps]
+
+        if is_task_sliced(data):
+            overrides[path] = task_frame_range()
+        elif data.get("status") == extraction.DONE:
+            log.info("Extractor done previously, skipping: %s" % path)
+            done.append(path)
+
+    # Must be picklable when running in process pool
+    execute = functools.partial(_execute, overrides=overrides)
+
+    initializer = initargs = None
+    if workers > 1 and len(jobs) - len(done) > 1:
+        from maya import cmds
+        initializer = init_worker
+        initargs = (cmds.file(query=True, sceneName=True),)
+
+    def on_finish(path, result):
+        extraction.update_dump(path,
+                               status=result["status"],
+                               seconds=result["seconds"],
+                               error=result["error"])
+
+    runner = extraction.ExtractionRunner(execute,
+                                         workers=workers,
+                                         initializer=initializer,
+                                         initargs=initargs or (),
+                                         on_finish=on_finish,
+                                         logger=log)
+    return runner.run(jobs, done=done)
+
+
+def _execute(path, overrides):
+    extract(path, overrides.get(path))
 
 
 if __name__ == "__main__":
-    log = logging.getLogger("Pyblish")
-    Plugin = None
     try:
-        for Plugin in deadline_extract():
-            pass
+        results = deadline_extract()
 
     except Exception as error:
+        pyblish.lib.extract_traceback(error)
+        message = "Failed: {e} -- {e.traceback}"
 
-        if Plugin is None:
-            pyblish.lib.extract_traceback(error)
-            message = "Failed: {e} -- {e.traceback}"
-        else:
-            pyblish.lib.extract_traceback(error, Plugin.__module__)
-            message = "Failed {p.__name__}: {e} -- {e.traceback}"
+        log.error(message.format(e=error))
+        log.error("Fatal Error: Errors occurred during extract, see log..")
+        sys.exit(2)
 
-        log.error(message.format(p=Plugin, e=error))
+    failed = [path for path, result in results.items()
+              if result["status"] != extraction.DONE]
+    if failed:
+        log.error("Failed extractors:\n    " + "\n    ".join(sorted(failed)))
         log.error("Fatal Error: Errors occurred during extract, see log..")
         sys.exit(2)
 
@@ -2,10 +2,11 @@
 import os
 import sys
 import logging
-import json
 import pyblish.api
 import pyblish.lib
 
+from reveries import extraction
+
 
 def get_plugin(classname):
     # Find extractor plugin
@@ -65,8 +66,7 @@ def deadline_extract():
     sys_args = _get_sys_args()
 
     for path in dumps:
-        with open(path, "r") as file:
-            data = json.load(file)
+        data = extraction.load_dump(path)
 
         args = data["args"]
         kwargs = data["kwargs"]
@@ -0,0 +1,144 @@
+
+import os
+import sys
+import time
+import logging
+import argparse
+import traceback
+import avalon.io
+import avalon.api
+import pyblish.api
+from reveries import filesys, lib, integration
+
+
+log = logging.getLogger("Pyblish.IntegrationDaemon")
+
+
+# Daemon's own environment and Avalon session, saved on start
+_initial = {"environ": None, "session": None}
+
+
+def save_environ():
+    _initial["environ"] = dict(os.environ)
+    _initial["session"] = dict(avalon.api.Session)
+
+
+def apply_environ(environ):
+    """Switch Avalon session to the job's, connection is kept
+
+    Environment and session are restored to the daemon's own before
+    applying, so variables of previous job will not leak into this one.
+
+    """
+    os.environ.clear()
+    os.environ.update(_initial["environ"])
+    os.environ.update(environ)
+
+    session = dict(_initial["session"])
+    session.update((key, value) for key, value in environ.items()
+                   if key.startswith("AVALON_"))
+    for target in (avalon.api.Session, avalon.io.Session):
+        target.clear()
+        target.update(session)
+
+
+def integrate(batch):
+    """Run filesys publish in this process, like `filesys_publish.py`"""
+    data = {"_pyblishDumpFile": batch["dump"]}
+
+    if batch["update"] is not None:
+        data["_progressivePublishing"] = True
+        data["_progressiveStep"] = batch["progress"]
+        data["_progressiveSteps"] = batch["steps"]
+        data["_progressiveOutput"] = batch["update"]
+
+    if batch["jobid"]:
+        data["deadlineJobId"] = batch["jobid"]
+
+    apply_environ(batch["environ"])
+
+    context = pyblish.api.Context()
+    context.data.update(data)
+
+    return lib.publish_remote(context)
+
+
+def process(spool, claimed, delay):
+    """Integrate ready batches, return claimed requests still on hold"""
+    batches = integration.merge(claimed)
+    ready = integration.ready_batches(batches, delay)
+
+    for batch in ready:
+        if batch["update"] is not None and not batch["update"]:
+            # Flushed without pending progress
+            spool.done(batch["paths"])
+            continue
+
+        log.info("Integrating %d requests of %s .."
+                 % (len(batch["paths"]), batch["dump"]))
+        start = time.time()
+        try:
+            returncode = integrate(batch)
+        except Exception:
+            message = traceback.format_exc()
+            returncode = -1
+        else:
+            message = "Publish returned %d." % returncode
+
+        if returncode == 0:
+            spool.done(batch["paths"])
+            log.info("Integrated %s files in %.2f sec."
+                     % (len(batch["update"] or []) or "all",
+                        time.time() - start))
+        else:
+            log.error("Integration failed: %s" % message)
+            spool.fail(batch["paths"], message)
+
+    done = set(path for batch in ready for path in batch["paths"])
+    return [(path, request) for path, request in claimed
+            if path not in done]
+
+
+def main(spool_dir=None, interval=5, delay=30):
+    spool = integration.Spool(spool_dir)
+    spool.heartbeat()
+    spool.recover()
+
+    avalon.api.install(filesys)
+    pyblish.api.register_target("localhost")
+    save_environ()
+
+    log.info("Integration daemon started, spool: %s" % spool.root)
+
+    claimed = list()
+    while True:
+        spool.heartbeat()
+        claimed += spool.claim(spool.pending())
+        if claimed:
+            claimed = process(spool, claimed, delay)
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="Pyblish integration daemon",
+                                     description="Integrate queued progress "
+                                                 "in batches.")
+    parser.add_argument("-s", "--spool",
+                        type=str,
+                        default=None,
+                        help="Spool dir, default $PYBLISH_INTEGRATION_SPOOL "
+                             "or temp dir.")
+    parser.add_argument("-i", "--interval",
+                        type=float,
+                        default=5,
+                        help="Seconds between each spool polling.")
+    parser.add_argument("-d", "--delay",
+                        type=float,
+                        default=30,
+                        help="Seconds to hold progressive requests for "
+                             "merging, unless flushed.")
+
+    args = parser.parse_args(sys.argv[1:])
+    main(args.spool, args.interval, args.delay)
@@ -0,0 +1,33 @@
+
+import sys
+import json
+import logging
+import argparse
+from reveries import clipinfo
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(prog="overlay_clipinfo",
+                                     description="Overlay clipinfo onto "
+                                                 "image sequence")
+
+    parser.add_argument("job",
+                        type=str,
+                        help="Job file path, saved by "
+                             "`reveries.clipinfo.write_job`.")
+    parser.add_argument("-w", "--workers",
+                        type=int,
+                        default=0,
+                        help="Process count, default is cpu count.")
+
+    args = parser.parse_args(sys.argv[1:])
+
+    logging.basicConfig(level=logging.INFO)
+
+    report = clipinfo.run_job(args.job, workers=args.workers or None)
+    # Last line of output is the report, for caller to parse
+    print(json.dumps(report))
+
+    if report["failed"]:
+        sys.exit(1)
@@ -12,6 +12,11 @@ def __main__(*args):
     This script will run publish on any task completed, if the subset of this
     task already been published, run file integration.
 
+    If the integration daemon (`reveries/scripts/integration_daemon.py`) is
+    running on this machine, output files are queued to it instead, so they
+    could be integrated in batches without starting a publish process for
+    each task.
+
     (NOTE) Post task script will not run if task has error.
 
     Args:
@@ -34,6 +39,9 @@ def __main__(*args):
     script = os.getenv("PYBLISH_FILESYS_SCRIPT")
     dumpfile = os.getenv("PYBLISH_DUMP_FILE")
 
+    if enqueue(dumpfile, files, len(frames), job.JobId):
+        return
+
     log.info("Publish executable:  %s" % python)
     log.info("Publish script:      %s" % script)
     log.info("Publish dump file:   %s" % dumpfile)
@@ -59,6 +67,23 @@ def __main__(*args):
         raise Exception("Publish failed, see log..")
 
 
+def enqueue(dumpfile, files, progress, jobid):
+    """Queue output files to integration daemon, return False if not alive
+    """
+    from reveries import integration
+
+    spool = integration.Spool()
+    if not spool.alive():
+        return False
+
+    path = spool.enqueue(dumpfile,
+                         update=files,
+                         progress=progress,
+                         jobid=jobid)
+    log.info("Queued to integration daemon: %s" % path)
+    return True
+
+
 def get_output_files(job, frames):
     files = list()
 
@@ -0,0 +1,192 @@
+
+import os
+import json
+import uuid
+import errno
+import shutil
+import logging
+import tempfile
+
+from avalon.vendor import filelink
+
+
+log = logging.getLogger(__name__)
+
+
+def default_store_dir():
+    """Return store root from `PYBLISH_TEXTURE_STORE`, None if not set"""
+    return os.getenv("PYBLISH_TEXTURE_STORE") or None
+
+
+def default_cache_path():
+    return (os.getenv("PYBLISH_TEXTURE_HASH_CACHE")
+            or os.path.join(tempfile.gettempdir(), "reveries_c4cache.json"))
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+
+class TextureStore(object):
+    """Content-addressed file store keyed by C4 ID
+
+    Each unique file content is stored once as a blob, published files are
+    hardlinked to the blob, so the same texture published by different
+    versions or assets shares one copy on disk.
+
+    An index records which project/asset/subset/version/fpattern each blob
+    was published as, one JSON line per publish, appended so concurrent
+    publishers do not overwrite each other.
+
+        <root>/blobs/<shard>/<c4id>
+        <root>/index/<shard>/<c4id>.jsonl
+
+    (NOTE) Blobs are shared by hardlinks, published texture files must not
+           be modified in place.
+
+    Arguments:
+        root (str): Store root dir, must be on the same file system with
+            staging and publish dir for hardlinking
+        hasher (AssetHasher, optional): Default one with `HashCache` saved
+            in `PYBLISH_TEXTURE_HASH_CACHE` or temp dir
+
+    """
+
+    def __init__(self, root, hasher=None):
+        self.root = root
+        self.blobs = os.path.join(root, "blobs")
+        self.index = os.path.join(root, "index")
+
+        if hasher is None:
+            from .utils import AssetHasher, HashCache
+            hasher = AssetHasher(cache=HashCache(default_cache_path()))
+        self.hasher = hasher
+
+    @classmethod
+    def from_environment(cls):
+        """Return store if `PYBLISH_TEXTURE_STORE` is set, else None"""
+        root = default_store_dir()
+        return cls(root) if root else None
+
+    def _shard(self, c4id):
+        # Leading characters of C4 ID are prefix and padding
+        return c4id[-2:]
+
+    def blob_path(self, c4id):
+        return os.path.join(self.blobs, self._shard(c4id), c4id)
+
+    def index_path(self, c4id):
+        return os.path.join(self.index, self._shard(c4id), c4id + ".jsonl")
+
+    def has(self, c4id):
+        return os.path.isfile(self.blob_path(c4id))
+
+    def ids(self, paths):
+        """Return C4 ID of each file, files are hashed in parallel
+
+        Digests are cached by file size and modification time, files that
+        were hashed before will not be read again.
+
+        Arguments:
+            paths (list): File paths
+
+        Returns:
+            dict: {path: c4id}
+
+        """
+        paths = sorted(set(paths))
+        digests = self.hasher.file_digests(paths)
+
+        if self.hasher.cache is not None:
+            self.hasher.cache.save()
+
+        return dict((path, self.hasher.encode(digest))
+                    for path, digest in zip(paths, digests))
+
+    def add(self, path, c4id):
+        """Copy file into store if the content is not stored yet
+
+        Arguments:
+            path (str): Source file path
+            c4id (str): C4 ID of the file
+
+        Returns:
+            bool: True if file was copied, False if blob already exists
+
+        """
+        blob = self.blob_path(c4id)
+        if os.path.isfile(blob):
+            return False
+
+        _makedirs(os.path.dirname(blob))
+        # Copy to temp file then rename, so a half-written blob never exists
+        tmp = "%s.%s.tmp" % (blob, uuid.uuid4().hex)
+        shutil.copy2(path, tmp)
+        try:
+            os.rename(tmp, blob)
+        except OSError:
+            # Stored by other publisher in the meantime (Windows)
+            os.remove(tmp)
+            if not os.path.isfile(blob):
+                raise
+            return False
+
+        return True
+
+    def link(self, c4id, dst):
+        """Hardlink blob to destination, fallback to copy
+
+        Returns:
+            bool: True if hardlinked
+
+        """
+        blob = self.blob_path(c4id)
+        if os.path.isfile(dst):
+            os.remove(dst)
+        _makedirs(os.path.dirname(dst))
+
+        try:
+            filelink.create(blob, dst, filelink.HARDLINK)
+        except OSError as e:
+            log.warning("Failed to hardlink %s, copying instead: %s"
+                        % (dst, e))
+            shutil.copy2(blob, dst)
+            return False
+
+        return True
+
+    def record(self, c4id, **entry):
+        """Append one index entry of the blob
+
+        Example:
+            >> store.record(c4id,
+            ..              asset="Foo",
+            ..              subset="textureDefault",
+            ..              version=3,
+            ..              fpattern="diffuse.####.tif",
+            ..              file="diffuse.1001.tif")
+
+        """
+        path = self.index_path(c4id)
+        _makedirs(os.path.dirname(path))
+        with open(path, "a") as file:
+            file.write(json.dumps(entry, sort_keys=True) + "\n")
+
+    def owners(self, c4id):
+        """Return all index entries of the blob"""
+        path = self.index_path(c4id)
+        if not os.path.isfile(path):
+            return []
+
+        entries = list()
+        with open(path, "r") as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue  # Interrupted write
+        return entries
@@ -0,0 +1,188 @@
+
+import heapq
+
+
+MATCH_ID = 1
+MATCH_NAME = 2
+
+
+def related(this, that):
+    return this == that or this.endswith(that) or that.endswith(this)
+
+
+def _components(path):
+    """Return path components in reversed order, root excluded"""
+    return [part for part in reversed(path.split("|")) if part]
+
+
+class _Node(object):
+    __slots__ = ("children", "ends", "below")
+
+    def __init__(self):
+        self.children = dict()
+        self.ends = list()   # Entries which path ends at this node
+        self.below = list()  # Entries in this subtree, including `ends`
+
+
+class SuffixTrie(object):
+    """Trie of reversed DAG paths for finding paths related by suffix
+
+    Paths are split into components, so for full paths (start with "|"),
+    a path ending with another is the same as string `endswith`.
+
+    Entries are kept in heaps by their order, and taken entries are lazily
+    dropped, so finding the first related entry that has not been taken is
+    about O(path depth * log n).
+
+    """
+
+    def __init__(self):
+        self._root = _Node()
+
+    def add(self, path, order):
+        """Add entry, must be added by ascending order"""
+        node = self._root
+        for part in _components(path):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            node = child
+            # Sorted list is a valid heap
+            node.below.append(order)
+        node.ends.append(order)
+
+    @staticmethod
+    def _top(heap, taken):
+        while heap and heap[0] in taken:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def first(self, path, taken):
+        """Return first entry's order which path is related to given path
+
+        Arguments:
+            path (str): DAG path
+            taken (set): Orders of entries that should be skipped
+
+        Returns:
+            int or None
+
+        """
+        best = None
+        node = self._root
+        parts = _components(path)
+
+        for depth, part in enumerate(parts):
+            node = node.children.get(part)
+            if node is None:
+                break
+
+            if depth == len(parts) - 1:
+                # Entries which path ends with given path
+                candidate = self._top(node.below, taken)
+            else:
+                # Entries which path is the tail of given path
+                candidate = self._top(node.ends, taken)
+
+            if candidate is not None and (best is None or candidate < best):
+                best = candidate
+
+        return best
+
+
+class _OrderIndex(object):
+    """Hash key to entry orders, for finding the first not taken entry"""
+
+    def __init__(self):
+        self._heaps = dict()
+
+    def add(self, key, order):
+        """Add entry, must be added by ascending order"""
+        heap = self._heaps.get(key)
+        if heap is None:
+            heap = self._heaps[key] = list()
+        heap.append(order)
+
+    def first(self, key, taken):
+        heap = self._heaps.get(key)
+        if not heap:
+            return None
+        return SuffixTrie._top(heap, taken)
+
+
+def match(items, data_list):
+    """Match profile data to existing comparer items
+
+    Same as matching in three passes, for each data, the first not matched
+    item (by row) will be taken:
+        1. Same avalonId (and related longName, if possible)
+        2. Related longName, one ends with the other
+        3. Same shortName with the data from the other side
+
+    Arguments:
+        items (list): List of (id, name, other side shortName) tuples in
+            row order
+        data_list (list): List of profile data dict, in matching order
+
+    Returns:
+        matched (list): List of (data index, item index, match state)
+        not_matched (list): Data indexes that did not match any item
+
+    """
+    by_id = _OrderIndex()
+    for row, (id, _, _) in enumerate(items):
+        by_id.add(id, row)
+
+    taken = set()
+    matched = list()
+
+    # Matching avalonId & longName
+    remaining = list()
+    for index, data in enumerate(data_list):
+        row = by_id.first(data["avalonId"], taken)
+        if row is None:
+            remaining.append(index)
+            continue
+
+        state = MATCH_ID
+        if related(items[row][1], data["longName"]):
+            state |= MATCH_NAME
+
+        taken.add(row)
+        matched.append((index, row, state))
+
+    # Try matching only by longName
+    if remaining:
+        by_name = SuffixTrie()
+        for row, (_, name, _) in enumerate(items):
+            if row not in taken:
+                by_name.add(name, row)
+
+    data_indexes, remaining = remaining, list()
+    for index in data_indexes:
+        row = by_name.first(data_list[index]["longName"], taken)
+        if row is None:
+            remaining.append(index)
+            continue
+
+        taken.add(row)
+        matched.append((index, row, MATCH_NAME))
+
+    # Finally, try matching by shortName
+    if remaining:
+        by_short = _OrderIndex()
+        for row, (_, _, short_name) in enumerate(items):
+            if row not in taken:
+                by_short.add(short_name, row)
+
+    data_indexes, remaining = remaining, list()
+    for index in data_indexes:
+        row = by_short.first(data_list[index]["shortName"], taken)
+        if row is None:
+            remaining.append(index)
+            continue
+
+        taken.add(row)
+        matched.append((index, row, 0))
+
+    return matched, remaining
@@ -5,7 +5,7 @@ from avalon.tools import models
 from avalon.vendor.Qt import Qt, QtGui, QtCore
 from avalon import api, io
 
-from . import lib
+from . import lib, matcher
 
 main_logger = logging.getLogger("modeldiffer")
 
@@ -217,31 +217,31 @@ class ComparerModel(models.TreeModel):
         # Remove previous data of this side
 
         to_remove = list()
-        for item in items:
+        for row, item in enumerate(items):
             if item.has_other(side):
                 item.pop_this(side)
             else:
-                to_remove.append(item)
+                to_remove.append(row)
+
+        # Remove rows in contiguous blocks, from bottom to top
+        while to_remove:
+            last = first = to_remove.pop()
+            while to_remove and to_remove[-1] == first - 1:
+                first = to_remove.pop()
 
-        for item in to_remove:
-            row = item.row()
-            self.beginRemoveRows(root_index, row, row)
-            items.remove(item)
+            self.beginRemoveRows(root_index, first, last)
+            del items[first:last + 1]
             self.endRemoveRows()
 
         # Place new data
 
-        not_matched_items = list(items)
-        not_matched_data = list()
-
         def short(name):  # No namespace
             return name.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
 
         def long(name):  # No namespace
             return "|".join(n.rsplit(":", 1)[-1] for n in name.split("|"))
 
-        def related(this, that):
-            return this == that or this.endswith(that) or that.endswith(this)
+        not_matched_data = list()
 
         for name, data in profile.items():
             data = {
@@ -258,53 +258,29 @@ class ComparerModel(models.TreeModel):
 
         not_matched_data.sort(key=lambda d: d["longName"] + d["fullPath"])
 
-        for data in list(not_matched_data):
-            # Matching avalonId & longName
-            state = 0
-            for item in not_matched_items:
-                if item.id == data["avalonId"]:
-                    state |= 1
-
-                    if related(item.name, data["longName"]):
-                        state |= 2
-
-                if state:
-                    not_matched_items.remove(item)
-                    not_matched_data.remove(data)
-                    item.add_this(side, data, matched=state)
-                    item.compare()
-                    break
-
-        for data in list(not_matched_data):
-            # Try matching only by longName
-            state = 0
-            for item in not_matched_items:
-
-                if related(item.name, data["longName"]):
-                    state |= 2
-                    not_matched_items.remove(item)
-                    not_matched_data.remove(data)
-                    item.add_this(side, data, matched=state)
-                    item.compare()
-                    break
-
-        for data in not_matched_data:
-            # Finally, try matching by shortName
-            for item in not_matched_items:
-                other_side = item[item.get_other(side)]
-
-                if other_side["shortName"] == data["shortName"]:
-                    not_matched_items.remove(item)
-                    item.add_this(side, data, matched=0)
-                    item.compare()
-                    break
-            else:
-                item = ComparerItem(data["longName"], data["avalonId"])
-                item.add_this(side, data)
-                last = self.rowCount(root_index)
-                self.beginInsertRows(root_index, last, last)
-                self.add_child(item)
-                self.endInsertRows()
+        keys = list()
+        for item in items:
+            other_side = item[item.get_other(side)]
+            keys.append((item.id, item.name, other_side["shortName"]))
+
+        matched, not_matched = matcher.match(keys, not_matched_data)
+
+        for index, row, state in matched:
+            item = items[row]
+            item.add_this(side, not_matched_data[index], matched=state)
+            item.compare()
+
+        if not not_matched:
+            return
+
+        last = self.rowCount(root_index)
+        self.beginInsertRows(root_index, last, last + len(not_matched) - 1)
+        for index in not_matched:
+            data = not_matched_data[index]
+            item = ComparerItem(data["longName"], data["avalonId"])
+            item.add_this(side, data)
+            self.add_child(item)
+        self.endInsertRows()
 
     def set_fouced(self, side, index):
         self._focused_indexes[side] = index
@@ -1,10 +1,11 @@
 
-from .command import ls_sequences, save_cache, load_cache
+from .command import ls_sequences, scan_sequences, save_cache, load_cache
 from .app import show, show_on_stray
 
 
 __all__ = [
     "ls_sequences",
+    "scan_sequences",
     "save_cache",
     "load_cache",
     "show",
@@ -189,6 +189,9 @@ class Window(QtWidgets.QDialog):
 
         for name, item in cache.items():
             item["name"] = name
+            # Frame index may be outdated, let publish check files again
+            item.pop("frameRanges", None)
+            item.pop("emptyFrames", None)
 
             if cache_padding is not None:
                 item["paddingStr"] = cache_padding
@@ -212,8 +215,9 @@ class Window(QtWidgets.QDialog):
     def ls_sequences(self, path):
         min_length = 1 if self.is_single else 2
 
-        sequences = list()
+        count = 0
         max_sequence = 50
+        self.add_sequences([])  # Clear view
         # Pop up a progress dialog for interruption
         with tool_widgets.Interrupter(
                 title="Scanning sequences",
@@ -224,12 +228,11 @@ class Window(QtWidgets.QDialog):
         ) as progress:
             # (TODO) Run in worker thread
 
-            for i, item in enumerate(command.ls_sequences(path,
-                                                          min_length)):
+            for _, sequences in command.scan_sequences(path, min_length):
                 if progress.is_canceled():
                     return
 
-                if i > max_sequence:
+                if count + len(sequences) > max_sequence:
                     # Prompt dialog asking continue the process or not
                     respond = plugins.message_box_warning(
                         title="Warning",
@@ -243,13 +246,13 @@ class Window(QtWidgets.QDialog):
                     else:
                         return
 
-                sequences.append(item)
+                count += len(sequences)
+                # Stream directory result into view
+                self.add_sequences(sequences, clear=False)
                 progress.bump()  # Also keep dialog responsive
 
-        self.add_sequences(sequences)
-
-    def add_sequences(self, sequences):
-        self.data["sequences"]["view"].add_sequences(sequences)
+    def add_sequences(self, sequences, clear=True):
+        self.data["sequences"]["view"].add_sequences(sequences, clear)
 
     def on_nhead_changed(self, head):
         tail = self.data["sequences"]["nTail"].text()
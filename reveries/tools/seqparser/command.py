@@ -1,8 +1,25 @@
 
 import os
+import re
 import json
+import hashlib
+import logging
+import tempfile
 from avalon.vendor import clique
 
+from ...lib import FrameIndex
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir  # Python 2 backport
+    except ImportError:
+        scandir = None
+
+
+log = logging.getLogger(__name__)
+
 
 def assemble(root, files, min_length=2):
 
@@ -39,49 +56,258 @@ def assemble(root, files, min_length=2):
         "fpattern": fpattern,
         "start": start,
         "end": end,
+        "frameRanges": FrameIndex.from_frames(indexes).ranges,
     }
 
 
-def ls_sequences(path, min_length=2):
+_FRAME_TOKEN = re.compile(r"(?P<index>\d+)(?P<tail>\D*)$")
 
-    patterns = [
-        clique.PATTERNS["frames"],
-        clique.DIGITS_PATTERN,
+
+def tokenize(file_name):
+    """Split file name into (head, index, tail) by it's frame number
+
+    The frame number is the last digit group of the file name that is not
+    in the file extension, e.g.
+
+        "beauty.0001.exr" -> ("beauty.", "0001", ".exr")
+        "beauty_v2_1001.png" -> ("beauty_v2_", "1001", ".png")
+
+    Returns None if no frame number in the name.
+
+    """
+    stem, dot, ext = file_name.rpartition(".")
+    if not dot or ext.isdigit():
+        stem, ext = file_name, ""
+    else:
+        ext = dot + ext
+
+    match = _FRAME_TOKEN.search(stem)
+    if match is None:
+        return None
+
+    head = stem[:match.start()]
+    return head, match.group("index"), match.group("tail") + ext
+
+
+def find_sequences(files, empty=None):
+    """Group file names into sequences in one pass
+
+    Padding follows the same rule as `clique`, frame number that has leading
+    zero is padded to it's length, and unpadded frames that have the same
+    length will be merged into the padded sequence.
+
+    Args:
+        files (list): File names
+        empty (set, optional): Names of zero-byte files
+
+    Returns:
+        list: Sequences in dict, with keys "head", "padding", "tail", sorted
+            "indexes" and "empty" (indexes of zero-byte frames)
+
+    """
+    collections = dict()
+
+    for name in files:
+        token = tokenize(name)
+        if token is None:
+            continue
+
+        head, index, tail = token
+        padding = len(index) if index[0] == "0" and len(index) > 1 else 0
+        key = (head, tail, padding)
+        collections.setdefault(key, set()).add(int(index))
+
+    # Merge unpadded frames into padded sequence if length matched
+    paddings = dict()
+    for head, tail, padding in collections:
+        if padding:
+            paddings.setdefault((head, tail), list()).append(padding)
+
+    for head, tail in paddings:
+        indexes = collections.get((head, tail, 0))
+        if not indexes:
+            continue
+
+        for padding in paddings[(head, tail)]:
+            fitted = set(i for i in indexes if len(str(i)) == padding)
+            collections[(head, tail, padding)].update(fitted)
+            indexes.difference_update(fitted)
+
+        if not indexes:
+            del collections[(head, tail, 0)]
+
+    empty_frames = dict()
+    for name in empty or []:
+        token = tokenize(name)
+        if token is None:
+            continue
+
+        head, index, tail = token
+        frame = int(index)
+        for padding in paddings.get((head, tail), []) + [0]:
+            key = (head, tail, padding)
+            if frame in collections.get(key, ()):
+                empty_frames.setdefault(key, list()).append(frame)
+                break
+
+    return [
+        {
+            "head": key[0],
+            "padding": key[2],
+            "tail": key[1],
+            "indexes": sorted(indexes),
+            "empty": sorted(empty_frames.get(key, [])),
+        }
+        for key, indexes in sorted(collections.items())
     ]
 
-    for root, dirs, files in os.walk(path):
-        collections, remainder = clique.assemble(files,
-                                                 patterns=patterns,
-                                                 minimum_items=min_length)
-        for collection in collections:
-            indexes = list(collection.indexes)
-
-            head = collection.head
-            padding = collection.padding
-            tail = collection.tail
-            start = indexes[0]
-            end = indexes[-1]
-
-            relative = os.path.relpath(root, path).replace("\\", "/")
-            relative = "" if relative == "." else (relative + "/")
-            frame_str = "%%0%dd" % padding
-            fpattern = "%s%s%s%s" % (relative, head, frame_str, tail)
-
-            yield {
-                "root": path.replace("\\", "/"),
-                "head": head,
-                "padding": padding,
-                "paddingStr": frame_str,
-                "tail": tail,
-                "fpattern": fpattern,
-                "start": start,
-                "end": end,
+
+def _list_dir(path):
+    dirs = list()
+    files = list()
+    empty = set()
+
+    if scandir is not None:
+        for entry in scandir(path):
+            if not entry.is_dir():
+                files.append(entry.name)
+                if not entry.stat().st_size:
+                    empty.add(entry.name)
+            elif not entry.is_symlink():
+                dirs.append(entry.name)
+    else:
+        for name in os.listdir(path):
+            entry = os.path.join(path, name)
+            if not os.path.isdir(entry):
+                files.append(name)
+                if not os.path.getsize(entry):
+                    empty.add(name)
+            elif not os.path.islink(entry):
+                dirs.append(name)
+
+    return sorted(dirs), files, empty
+
+
+def scan_sequences(path, min_length=2, use_cache=True):
+    """Find sequences under path, yield them per directory
+
+    Directories that have not been modified since last scan will not be
+    listed again, the scanning result is saved into local scan cache dir,
+    not into `path`, see `save_scan` and `load_scan`.
+
+    Each sequence comes with "frameRanges", the present frames as
+    `lib.FrameIndex` ranges, and "emptyFrames", frames that were zero-byte
+    when the directory been listed.
+
+    Args:
+        path (str): Root directory path
+        min_length (int): Minimum length of sequence
+        use_cache (bool): Use and update previous scanning result
+
+    Yields:
+        tuple: Relative directory path and sequence list of that directory
+
+    """
+    previous = (load_scan(path) if use_cache else None) or dict()
+    current = dict()
+
+    stack = [""]
+    while stack:
+        relative = stack.pop()
+        dir_path = os.path.join(path, relative) if relative else path
+
+        try:
+            mtime = os.stat(dir_path).st_mtime
+        except OSError:
+            continue
+
+        state = previous.get(relative)
+        if state is None or state["mtime"] != mtime:
+            try:
+                dirs, files, empty = _list_dir(dir_path)
+            except OSError as e:
+                log.warning("Unable to list %s: %s" % (dir_path, e))
+                continue
+
+            state = {
+                "mtime": mtime,
+                "dirs": dirs,
+                "sequences": [_summarize(sequence)
+                              for sequence in find_sequences(files, empty)],
             }
 
+        current[relative] = state
+        stack.extend(reversed([
+            (relative + "/" + name) if relative else name
+            for name in state["dirs"]
+        ]))
+
+        prefix = (relative + "/") if relative else ""
+        sequences = [
+            _sequence_item(path, prefix, sequence)
+            for sequence in state["sequences"]
+            if sequence["count"] >= min_length
+        ]
+        if sequences:
+            yield relative, sequences
+
+    if use_cache and current != previous:
+        save_scan(path, current)
+
+
+def _summarize(sequence):
+    indexes = sequence.pop("indexes")
+    sequence["start"] = indexes[0]
+    sequence["end"] = indexes[-1]
+    sequence["count"] = len(indexes)
+    sequence["ranges"] = FrameIndex.from_frames(indexes).ranges
+    return sequence
+
+
+def _sequence_item(root, relative, sequence):
+    frame_str = "%%0%dd" % sequence["padding"]
+    fpattern = "%s%s%s%s" % (relative,
+                             sequence["head"],
+                             frame_str,
+                             sequence["tail"])
+    return {
+        "root": root.replace("\\", "/"),
+        "head": sequence["head"],
+        "padding": sequence["padding"],
+        "paddingStr": frame_str,
+        "tail": sequence["tail"],
+        "fpattern": fpattern,
+        "start": sequence["start"],
+        "end": sequence["end"],
+        "frameRanges": sequence["ranges"],
+        "emptyFrames": sequence["empty"],
+    }
+
+
+def ls_sequences(path, min_length=2, use_cache=True):
+    for _, sequences in scan_sequences(path, min_length, use_cache):
+        for sequence in sequences:
+            yield sequence
+
 
 CACHE_FILE_NAME = ".sequences.json"
 
 
+def _read_cache_file(dir_path):
+    file_path = os.path.join(dir_path, CACHE_FILE_NAME)
+    if not os.path.isfile(file_path):
+        return
+
+    with open(file_path, "r") as fp:
+        return json.load(fp)
+
+
+def _write_cache_file(dir_path, data):
+    file_path = os.path.join(dir_path, CACHE_FILE_NAME)
+    with open(file_path, "w") as fp:
+        json.dump(data, fp, indent=4, sort_keys=True)
+
+
 def save_cache(cache,
                output_dir,
                padding_string,
@@ -93,7 +319,8 @@ def save_cache(cache,
     if not os.path.isdir(output_dir):
         os.makedirs(output_dir)
 
-    data = {
+    data = _read_cache_file(output_dir) or dict()
+    data.update({
         "cache": cache,
         "paddingStr": padding_string,
         "start": start,
@@ -101,18 +328,57 @@ def save_cache(cache,
         "isStereo": is_stereo,
         "isSingle": is_single,
         "createdBy": created_by,
-    }
-    file_path = os.path.join(output_dir, CACHE_FILE_NAME)
-    with open(file_path, "w") as fp:
-        json.dump(data, fp, indent=4, sort_keys=True)
+    })
+    _write_cache_file(output_dir, data)
 
 
 def load_cache(dir_path):
-    file_path = os.path.join(dir_path, CACHE_FILE_NAME)
-    if not os.path.isfile(file_path):
+    data = _read_cache_file(dir_path)
+    if data is None or "cache" not in data:
+        # No sequence been collected
         return
 
-    with open(file_path, "r") as fp:
-        data = json.load(fp)
-
     return data
+
+
+def default_scan_dir():
+    return (os.getenv("REVERIES_SEQPARSER_SCAN_DIR")
+            or os.path.join(tempfile.gettempdir(), "reveries_seqparser"))
+
+
+def _scan_file_path(dir_path):
+    """Return scan cache file path of `dir_path` in local scan cache dir"""
+    key = os.path.normcase(os.path.abspath(dir_path)).replace("\\", "/")
+    name = hashlib.md5(key.encode("utf-8")).hexdigest() + ".json"
+    return os.path.join(default_scan_dir(), name)
+
+
+def save_scan(dir_path, scan):
+    """Save scanning result of `dir_path` into local scan cache dir
+
+    Scanning result is not written into `dir_path`, so browsing render
+    outputs does not leave files in there or change their mtime.
+
+    """
+    file_path = _scan_file_path(dir_path)
+    try:
+        cache_dir = os.path.dirname(file_path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        with open(file_path, "w") as fp:
+            json.dump(scan, fp)
+    except (IOError, OSError, ValueError) as e:
+        log.warning("Unable to save scanning result: %s" % e)
+
+
+def load_scan(dir_path):
+    """Load previous scanning result of `dir_path`"""
+    file_path = _scan_file_path(dir_path)
+    if not os.path.isfile(file_path):
+        return
+
+    try:
+        with open(file_path, "r") as fp:
+            return json.load(fp)
+    except (IOError, OSError, ValueError):
+        return
@@ -4,6 +4,7 @@ import re
 from avalon.vendor.Qt import QtWidgets, QtCore, QtGui
 from avalon.vendor import qtawesome
 from avalon.tools import models
+from ... import lib
 from . import delegates
 
 
@@ -102,9 +103,10 @@ class SequenceWidget(QtWidgets.QWidget):
     def search_channel_name(self, head, tail):
         self.data["model"].search_channel_name(head, tail)
 
-    def add_sequences(self, sequences):
+    def add_sequences(self, sequences, clear=True):
         model = self.data["model"]
-        model.clear()
+        if clear:
+            model.clear()
         for sequence in sequences:
             model.add_sequence(sequence)
 
@@ -185,6 +187,11 @@ class SequenceModel(models.TreeModel):
         item["fpattern"] = sequence["fpattern"]
         item["paddingStr"] = sequence["paddingStr"]
         item["frames"] = "%d-%d" % (sequence["start"], sequence["end"])
+        if sequence.get("frameRanges"):
+            index = lib.FrameIndex(sequence["frameRanges"])
+            missing = sum(tail - head + 1 for head, tail in index.gaps())
+            if missing:
+                item["frames"] += " (%d missing)" % missing
         # Optional
         item["name"] = sequence.get("name", "")
 
@@ -128,9 +128,18 @@ def build():
             pub_msg_text = 'Some setGroup publish failed.'
             pub_msg += '{} publish failed.<br>'.format(set_name)
 
+    try:
+        set_group_publisher.commit()
+    except Exception as e:
+        print('Set group publish commit failed: {}'.format(e))
+        pub_msg_type = QtWidgets.QMessageBox.Critical
+        pub_msg_text = 'SetGroup publish failed.'
+        pub_msg = 'Files transfer or database writing failed:<br>{}'.format(e)
+
     if usd_done.get('failed', []):
-        pub_msg_type = QtWidgets.QMessageBox.Warning
-        pub_msg_text = 'Some setGroup publish failed.'
+        if pub_msg_type != QtWidgets.QMessageBox.Critical:
+            pub_msg_type = QtWidgets.QMessageBox.Warning
+            pub_msg_text = 'Some setGroup publish failed.'
         pub_msg += '<br>Below setGroup publish failed: <br> {}'.format('<br>'.join(usd_done.get('failed', [])))
 
     if not usd_done:
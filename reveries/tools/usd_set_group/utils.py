@@ -17,14 +17,24 @@ def check_set_asset_exists(set_name):
 
 class PublishSetGroup(object):
     def __init__(self):
+        from reveries.common.publish.engine import PublishEngine
+
         self.version_name = None
         self.reps_id = None
+        # Queue all set groups and write them in one commit
+        self.engine = PublishEngine()
 
     def publish(self, asset_name, publish_files):
         from reveries.common.publish import publish_subset, \
             publish_version, \
             publish_representation
 
+        # Check files before queuing any document
+        for _file in publish_files:
+            if not os.path.isfile(_file):
+                print('Publish file not found: {}'.format(_file))
+                return False
+
         # Get asset data
         asset_data = io.find_one({
             "type": "asset",
@@ -34,10 +44,11 @@ class PublishSetGroup(object):
         # === Publish subset === #
         subset_name = 'assetPrim'
         families = ['reveries.look.asset_prim']
-        subset_id = publish_subset.publish(asset_data['_id'], subset_name, families)
+        subset_id = publish_subset.publish(asset_data['_id'], subset_name,
+                                           families, engine=self.engine)
 
         # === Publish version === #
-        version_id = publish_version.publish(subset_id)
+        version_id = publish_version.publish(subset_id, engine=self.engine)
 
         # === Publish representation === #
         name = 'USD'
@@ -47,20 +58,22 @@ class PublishSetGroup(object):
         }
         self.reps_id = publish_representation.publish(version_id, name, publish_files,
                                                       delete_source=True,
+                                                      engine=self.engine,
                                                       data=reps_data)
         if self.reps_id:
             self._get_version_name(version_id)
-            print('{} publish done.\n'.format(asset_name))
+            print('{} publish queued.\n'.format(asset_name))
             return True
 
         return False
 
+    def commit(self):
+        """Transfer files and write database of all queued set groups"""
+        self.engine.commit()
+        print('Set group publish done.\n')
+
     def _get_version_name(self, version_id):
-        _filter = {
-            'type': 'version',
-            '_id': version_id
-        }
-        ver_data = io.find_one(_filter)
+        ver_data = self.engine.get(version_id)
         self.version_name = ver_data.get('name', None)
 
 
@@ -102,6 +115,7 @@ class GetSetAssets(object):
             return False
 
         # Generate asset data
+        shotgun_io.prefetch()
         asset_data_shotgun = shotgun_io.get_assets(
             fields=['tags', 'assets'],
             filters=[['sg_asset_type', 'is', 'Set']]
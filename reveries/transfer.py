@@ -0,0 +1,274 @@
+
+import os
+import time
+import json
+import errno
+import shutil
+import logging
+import threading
+import multiprocessing
+
+from multiprocessing.pool import ThreadPool
+from avalon.vendor import filelink
+
+from . import lib
+
+
+log = logging.getLogger(__name__)
+
+
+FILES = "files"
+HARDLINKS = "hardlinks"
+
+
+class TransferJournal(object):
+    """Append-only record of finished transfers
+
+    Each finished transfer is written as one JSON line right after it's done,
+    so if the process crashed in the middle of integration, the next run can
+    skip the files that already been transferred without comparing them to
+    the source again.
+
+    A journal entry only counts if the destination file still has the same
+    size and modification time as recorded.
+
+    Arguments:
+        path (str): Journal file path
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = dict()
+        self._lock = threading.Lock()
+        self._file = None
+
+        if os.path.isfile(path):
+            self.load()
+
+    def load(self):
+        with open(self.path, "r") as fp:
+            for line in fp:
+                try:
+                    dst, size, mtime = json.loads(line)
+                except ValueError:
+                    # Last line may be half-written when crashed
+                    continue
+                self._entries[dst] = (size, mtime)
+
+        log.info("Resuming from journal, %d transfers done previously."
+                 % len(self._entries))
+
+    def done(self, dst):
+        """Return True if the destination is recorded and unchanged"""
+        entry = self._entries.get(dst)
+        if entry is None:
+            return False
+
+        try:
+            size = os.path.getsize(dst)
+            mtime = lib.soft_mtime(dst)
+        except OSError:
+            return False
+
+        return (size, mtime) == tuple(entry)
+
+    def record(self, dst):
+        line = json.dumps([dst, os.path.getsize(dst), lib.soft_mtime(dst)])
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """Close and remove journal file, when all transfers completed"""
+        self.close()
+        if os.path.isfile(self.path):
+            os.remove(self.path)
+
+
+class FileTransfer(object):
+    """Concurrent file transfer with resume support
+
+    Usage:
+        >> transfer = FileTransfer(journal="/path/to/.transfer.journal")
+        >> transfer.add("files", "/stage/a.exr", "/publish/a.exr")
+        >> transfer.add("hardlinks", "/stage/b.exr", "/publish/b.exr")
+        >> transfer.run()
+
+    Transfers are grouped by job ("files" or "hardlinks") and each job is
+    processed in a thread pool. Duplicated destinations are only transferred
+    once, and file copy will be skipped if the destination already has the
+    same size and modification time as source (see `lib.file_cmp`).
+
+    Arguments:
+        workers (int, optional): Max thread count, default `cpu_count * 2`
+        journal (str, optional): Journal file path for resuming
+        logger (logging.Logger, optional): Logger for progress report
+
+    """
+
+    JOBS = (FILES, HARDLINKS)
+
+    def __init__(self, workers=None, journal=None, logger=None):
+        self.workers = workers or (multiprocessing.cpu_count() * 2)
+        self.journal = TransferJournal(journal) if journal else None
+        self.log = logger or log
+
+        self._jobs = dict((job, list()) for job in self.JOBS)
+        self._destinations = set()
+
+    def add(self, job, src, dst):
+        """Add one transfer
+
+        Arguments:
+            job (str): "files" or "hardlinks"
+            src (str): Source file path
+            dst (str): Destination file path
+
+        Returns:
+            bool: False if the destination has already been added
+
+        """
+        if job not in self._jobs:
+            raise ValueError("Unknown transfer job: %s" % job)
+
+        if dst in self._destinations:
+            self.log.warning("File transfered: %s" % dst)
+            return False
+
+        self._destinations.add(dst)
+        self._jobs[job].append((src, dst))
+        return True
+
+    def __len__(self):
+        return len(self._destinations)
+
+    def run(self):
+        """Run all transfers
+
+        Returns:
+            dict: Statistics of each job, e.g.
+                {"files": {"count": 10, "skipped": 2,
+                           "bytes": 1024, "seconds": 0.1}}
+
+        """
+        # Create each destination dir only once
+        dirs = set(os.path.dirname(dst) for dst in self._destinations)
+        for dirname in sorted(dirs):
+            self._makedirs(dirname)
+
+        stats = dict()
+        try:
+            for job in self.JOBS:
+                if self._jobs[job]:
+                    stats[job] = self._run_job(job, self._jobs[job])
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+
+        if self.journal is not None:
+            self.journal.remove()
+
+        return stats
+
+    def _run_job(self, job, transfers):
+        transfer = self._copy if job == FILES else self._hardlink
+
+        start = time.time()
+        if len(transfers) < 2 or self.workers < 2:
+            results = [transfer(pair) for pair in transfers]
+        else:
+            pool = ThreadPool(min(self.workers, len(transfers)))
+            try:
+                results = pool.map(transfer, transfers, chunksize=4)
+            finally:
+                pool.close()
+                pool.join()
+        elapsed = time.time() - start
+
+        transferred = [size for size in results if size is not None]
+        stats = {
+            "count": len(transferred),
+            "skipped": len(results) - len(transferred),
+            "bytes": sum(transferred),
+            "seconds": elapsed,
+        }
+        self.log.info(self.format_stats(job, stats))
+
+        return stats
+
+    @staticmethod
+    def format_stats(job, stats):
+        elapsed = max(stats["seconds"], 1e-6)
+        megabytes = stats["bytes"] / (1024.0 * 1024.0)
+
+        return ("Transferred {job}: {count} done, {skipped} skipped, "
+                "{mb:.2f} MB in {sec:.2f} sec ({mbps:.2f} MB/s, "
+                "{fps:.2f} files/s)".format(job=job,
+                                            count=stats["count"],
+                                            skipped=stats["skipped"],
+                                            mb=megabytes,
+                                            sec=stats["seconds"],
+                                            mbps=megabytes / elapsed,
+                                            fps=stats["count"] / elapsed))
+
+    def _makedirs(self, dirname):
+        try:
+            os.makedirs(dirname)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                self.log.critical("An unexpected error occurred.")
+                raise
+
+    def _skip(self, src, dst):
+        if self.journal is not None and self.journal.done(dst):
+            return True
+        return os.path.isfile(dst) and lib.file_cmp(src, dst)
+
+    def _copy(self, pair):
+        src, dst = pair
+        if self._skip(src, dst):
+            self.log.debug("File not changed, skip copying: %s" % dst)
+            return None
+
+        self.log.debug("Copying files: {0} \n"
+                       "          -> {1}".format(src, dst))
+        try:
+            shutil.copy2(src, dst)
+        except (OSError, IOError):
+            msg = "An unexpected error occurred."
+            self.log.critical(msg)
+            raise OSError(msg)
+
+        return self._done(dst)
+
+    def _hardlink(self, pair):
+        src, dst = pair
+        if os.path.isfile(dst):
+            self.log.warning("File exists, skip creating hardlink: %s" % dst)
+            return None
+
+        self.log.debug("Copying hardlinks: {0} \n"
+                       "          -> {1}".format(src, dst))
+        try:
+            filelink.create(src, dst, filelink.HARDLINK)
+        except OSError:
+            msg = "An unexpected error occurred."
+            self.log.critical(msg)
+            raise OSError(msg)
+
+        return self._done(dst)
+
+    def _done(self, dst):
+        if self.journal is not None:
+            self.journal.record(dst)
+        return os.path.getsize(dst)
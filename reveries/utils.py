@@ -1,13 +1,26 @@
 
 import os
+import json
+import math
+import logging
+import mmap
 import tempfile
 import hashlib
 import codecs
 import weakref
 import getpass
+import threading
+import multiprocessing
 import pymongo
 
-from distutils import dir_util, errors as distutils_err
+from multiprocessing.pool import ThreadPool
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from collections import OrderedDict
 
 from avalon import io, Session
 
@@ -18,6 +31,9 @@ from pyblish_qml.ipc import formatting
 from .plugins import message_box_error
 
 
+log = logging.getLogger(__name__)
+
+
 def stage_dir(prefix=None, dir=None):
     """Provide a temporary directory for staging
 
@@ -299,8 +315,13 @@ class _C4Hasher(object):
     def digest(self):
         """Return hash value of data added so far
         """
+        return self.encode(self.hash_obj.digest())
+
+    def encode(self, digest):
+        """Encode SHA-512 digest bytes as C4 ID
+        """
         c4_id_length = 90
-        b58_hash = self._b58encode(self.hash_obj.digest())
+        b58_hash = self._b58encode(digest)
 
         padding = ""
         if len(b58_hash) < (c4_id_length - 2):
@@ -310,6 +331,80 @@ class _C4Hasher(object):
         return c4id
 
 
+class HashCache(object):
+    """Persistent file digest cache for `AssetHasher`
+
+    Digests are keyed by file path and only reused when the file size and
+    modification time are still the same as when it was hashed, so a file
+    that has not been touched since the last run will not be read again.
+
+    Usage:
+        >> cache = HashCache("/path/to/.c4cache.json")
+        >> hasher = AssetHasher(cache=cache)
+        >> hasher.add_dir("/path/to/dir")
+        >> cache.save()
+
+    Arguments:
+        path (str, optional): JSON file path to load from and save to.
+            Cache will only live in memory if not provided.
+
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = dict()
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if path and os.path.isfile(path):
+            self.load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def load(self):
+        """Load cached entries from file"""
+        try:
+            with open(self.path, "r") as fp:
+                self._entries = json.load(fp)
+        except (IOError, OSError, ValueError):
+            # Corrupted or unreadable cache, start over.
+            self._entries = dict()
+        self._dirty = False
+
+    def save(self):
+        """Write cached entries to file if anything changed"""
+        if not self.path or not self._dirty:
+            return
+
+        with self._lock:
+            with open(self.path, "w") as fp:
+                json.dump(self._entries, fp)
+            self._dirty = False
+
+    def get(self, path, stat):
+        """Return cached hex digest if the file has not been changed
+
+        Arguments:
+            path (str): File path
+            stat (os.stat_result): Current stat result of the file
+
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+
+        size, mtime, digest = entry
+        if size == stat.st_size and mtime == stat.st_mtime:
+            return digest
+
+    def set(self, path, stat, digest):
+        """Record hex digest of the file with it's size and mtime"""
+        with self._lock:
+            self._entries[path] = [stat.st_size, stat.st_mtime, digest]
+            self._dirty = True
+
+
 class AssetHasher(_C4Hasher):
     """A data hasher for digital content creation
 
@@ -335,8 +430,25 @@ class AssetHasher(_C4Hasher):
         Until you call `clear`
         >> hasher.clear()
 
+    Files in directory are hashed in a thread pool, each file produces it's
+    own SHA-512 digest and those digests are fed into this hasher in sorted
+    path order, so the result is stable no matter which file finished first.
+
+    Arguments:
+        workers (int, optional): Number of threads for hashing directory
+            files, default is `cpu_count + 4`.
+        cache (HashCache, optional): Reuse digest of unchanged files.
+
     """
 
+    READ_SIZE = 1024 * 1024  # Large reads, hashlib releases the GIL
+    MMAP_THRESHOLD = 1024 * 1024 * 16
+
+    def __init__(self, workers=None, cache=None):
+        super(AssetHasher, self).__init__()
+        self.workers = workers or (multiprocessing.cpu_count() + 4)
+        self.cache = cache
+
     def add_file(self, file_path):
         """Add one file to hasher
 
@@ -353,23 +465,190 @@ class AssetHasher(_C4Hasher):
     def add_dir(self, dir_path, recursive=True, followlinks=True):
         """Add one directory to hasher
 
+        Every file under the directory will be hashed exactly once.
+
         Arguments:
             dir_path (str): Directory path string
             recursive (bool, optional): Add sub-dir as well, default is True
             followlinks (bool, optional): Add directories pointed to by
                 symlinks, default is True
 
+        """
+        files = list(self.walk(dir_path, recursive, followlinks))
+
+        for digest in self.file_digests(files):
+            self.hash_obj.update(digest)
+
+        if self.cache is not None:
+            self.cache.save()
+
+    def walk(self, dir_path, recursive=True, followlinks=True):
+        """Yield file paths under directory in sorted order
+
+        Arguments:
+            dir_path (str): Directory path string
+            recursive (bool, optional): Walk into sub-dir, default is True
+            followlinks (bool, optional): Walk into directories pointed to by
+                symlinks, default is True
+
         """
         for root, dirs, files in os.walk(dir_path, followlinks=followlinks):
-            for name in files:
-                self.add_file(os.path.join(root, name))
+            if recursive:
+                dirs.sort()  # Sort in-place so `os.walk` follows the order
+            else:
+                del dirs[:]
 
-            if not recursive:
-                continue
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+    def file_digests(self, file_paths):
+        """Return SHA-512 digest of each file in the same order
+
+        Arguments:
+            file_paths (list): List of file path string
+
+        """
+        if len(file_paths) < 2 or self.workers < 2:
+            return [self._file_digest(path) for path in file_paths]
+
+        pool = ThreadPool(min(self.workers, len(file_paths)))
+        try:
+            return pool.map(self._file_digest, file_paths, chunksize=16)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _file_digest(self, file_path):
+        stat = os.stat(file_path)
+
+        if self.cache is not None:
+            cached = self.cache.get(file_path, stat)
+            if cached is not None:
+                return codecs.decode(cached, "hex_codec")
+
+        hash_obj = hashlib.sha512()
+
+        with open(file_path, "rb") as file:
+            if stat.st_size >= self.MMAP_THRESHOLD:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    hash_obj.update(mapped)
+                finally:
+                    mapped.close()
+            else:
+                read_size = self.READ_SIZE
+                for chunk in iter(lambda: file.read(read_size), b""):
+                    hash_obj.update(chunk)
+
+        if self.cache is not None:
+            self.cache.set(file_path, stat, hash_obj.hexdigest())
+
+        return hash_obj.digest()
+
+
+def _hash_MPoint(x, y, z, w):
+    x = (x + 1) * 233
+    y = (y + x) * 239
+    z = (z + y) * 241
+    return (x + y + z) * w
+
+
+def _hash_MFloatVectors(x, y, z):
+    x = (x + 1) * 383
+    y = (y + x) * 389
+    z = (z + y) * 397
+    return x + y + z
+
+
+def _hash_UV(u, v):
+    u = (u + 1) * 547
+    v = (v + u) * 557
+    return u * v
+
+
+_GEOMETRY_HASH_FUNCS = {
+    "points": _hash_MPoint,
+    "normals": _hash_MFloatVectors,
+    "uvmap": _hash_UV,
+}
 
-            for name in dirs:
-                path = os.path.join(root, name)
-                self.add_dir(path, recursive=True, followlinks=followlinks)
+
+def as_hash_rows(data, width):
+    """Convert geometry component data into rows for `geometry_hash_terms`
+
+    If NumPy is available, data will be converted into a contiguous float64
+    buffer in shape (N, width), or a list of tuples otherwise.
+
+    Arguments:
+        data (sequence): Flatten or nested component values, e.g. points
+            as `[(x, y, z, w), ...]`
+        width (int): Component value count of each element
+
+    """
+    if not hasattr(data, "__len__"):
+        data = list(data)
+
+    if numpy is not None:
+        array = numpy.array(data, dtype=numpy.float64)
+        return numpy.ascontiguousarray(array.reshape(-1, width))
+
+    data = list(data)
+    if data and not hasattr(data[0], "__len__"):
+        data = list(zip(*[iter(data)] * width))
+    return [tuple(row) for row in data]
+
+
+def geometry_hash_terms(kind, rows, decimals=None):
+    """Compute hash term of each geometry component
+
+    This is the hashing core of `reveries.maya.utils.MeshHasher`, and it's
+    vectorised by NumPy if available. Both code path produce exactly the same
+    terms as computing them one by one in Python, so the digest will not be
+    changed by having NumPy or not.
+
+    Arguments:
+        kind (str): "points", "normals" or "uvmap"
+        rows: Component rows from `as_hash_rows`
+        decimals (int, optional): Quantise component values to given decimal
+            places before hashing, so float noise will not change the result.
+            Default is None, not quantised.
+
+    Returns:
+        numpy.ndarray or list: Terms to feed into `accumulate_hash`
+
+    """
+    func = _GEOMETRY_HASH_FUNCS[kind]
+
+    if numpy is not None and isinstance(rows, numpy.ndarray):
+        if decimals is not None:
+            scale = 10.0 ** decimals
+            rows = numpy.floor(rows * scale + 0.5) / scale
+        return func(*rows.T) + numpy.arange(len(rows))
+
+    if decimals is not None:
+        scale = 10.0 ** decimals
+        rows = [[math.floor(value * scale + 0.5) / scale for value in row]
+                for row in rows]
+    return [func(*row) + i for i, row in enumerate(rows)]
+
+
+def accumulate_hash(value, terms):
+    """Sum up hash terms onto value, sequentially
+
+    Terms are summed in order (not pairwise), so the result stays the same
+    as the Python loop `value += term`.
+
+    """
+    if not len(terms):
+        return value
+
+    if numpy is not None and isinstance(terms, numpy.ndarray):
+        accumulated = numpy.cumsum(numpy.concatenate(([value], terms)))
+        return float(accumulated[-1])
+
+    for term in terms:
+        value += term
+    return value
 
 
 def get_representation_path_(representation, parents):
@@ -421,6 +700,12 @@ class AssetGraber(object):
     This is used for copying asset representation and all it's dependency
     assets from current project to another project.
 
+    The full dependency closure is resolved first, level by level with `$in`
+    queries, so a representation shared by many dependencies is planned
+    only once. Then documents are written in bulk, and package files are
+    copied in a thread pool, files that have the same size and modification
+    time in destination are skipped.
+
     Example:
         >>> # Init with the name of the destination project
         >>> graber = AssetGraber("other_project")
@@ -428,11 +713,20 @@ class AssetGraber(object):
         >>> graber.grab("5c6159dbed9f0d0509a34e27")
         >>> # Grab another...
         >>> graber.grab("5c6159dbed9f0d0509a34e38")
+        >>> # Or grab many, and see the plan without copying anything
+        >>> graber.grab_many(representation_ids, dry_run=True)
+        {'documents': 120, 'updates': 0, 'packages': 30, 'files': 1024,
+         'bytes': 5368709120, 'missing': []}
+
+    Args:
+        project (str): Destination project name
+        workers (int, optional): Max thread count for copying files
 
     """
 
-    def __init__(self, project):
+    def __init__(self, project, workers=None):
         self.project = project
+        self.workers = workers
 
         self.this_project = io.find_one({"type": "project"})
         self.that_project = None
@@ -448,12 +742,51 @@ class AssetGraber(object):
         Args:
             representation_id (str or ObjectId): representation id
 
+        """
+        return self.grab_many([representation_id], overwrite)
+
+    def grab_many(self, representation_ids, overwrite=False, dry_run=False):
+        """Copy representations and their dependencies to project
+
+        Args:
+            representation_ids (list): List of representation id
+            overwrite (bool, optional): Copy package again for existing
+                representations, and their dependencies
+            dry_run (bool, optional): Only report the plan
+
+        Returns:
+            dict: Plan report, see `report`
+
         """
         if not self._connected:
             self._connect()
-        if isinstance(representation_id, str):
-            representation_id = io.ObjectId(representation_id)
-        self._copy_representations(representation_id, overwrite)
+
+        representation_ids = [
+            io.ObjectId(_id) if isinstance(_id, str) else _id
+            for _id in representation_ids
+        ]
+        plan = self.plan(representation_ids, overwrite)
+        report = self.report(plan)
+
+        log.info("Grabbing to '%s': %d documents, %d packages, %d files, "
+                 "%.2f MB" % (self.project,
+                              report["documents"],
+                              report["packages"],
+                              report["files"],
+                              report["bytes"] / (1024.0 * 1024.0)))
+        if dry_run:
+            return report
+
+        if report["missing"]:
+            message = ("Packages not exists:\n%s"
+                       % "\n".join(report["missing"]))
+            message_box_error("Error", message)
+            raise OSError(message)
+
+        self._write(plan)
+        self._transfer(plan)
+
+        return report
 
     def _connect(self):
         timeout = int(Session["AVALON_TIMEOUT"])
@@ -469,10 +802,6 @@ class AssetGraber(object):
 
         self.that_project = that_project
 
-    def _insert_one(self, item):
-        assert isinstance(item, dict), "item must be of type <dict>"
-        return self._collection.insert_one(item)
-
     def _find_one(self, filter, projection=None, sort=None):
         assert isinstance(filter, dict), "filter must be <dict>"
         return self._collection.find_one(
@@ -481,117 +810,272 @@ class AssetGraber(object):
             sort=sort
         )
 
-    def _update_one(self, filter, item):
-        return self._collection.update_one(filter, item)
+    def _find(self, filter, projection=None):
+        assert isinstance(filter, dict), "filter must be <dict>"
+        return self._collection.find(filter=filter, projection=projection)
+
+    @staticmethod
+    def _by_id(documents):
+        return dict((doc["_id"], doc) for doc in documents)
+
+    def _closure(self, representation_ids, overwrite):
+        """Resolve representations to copy, with all dependencies
 
-    def _copy_representations(self, representation_id, overwrite):
-        """Copy all documents and files of representation and dependencies"""
-        this = io
-        that = self
+        Returns:
+            representations (dict): {_id: (this doc, that doc or None)}
+            versions (dict): {_id: this version doc}
+
+        """
+        representations = dict()
+        versions = dict()
+
+        visited = set()
+        frontier = set(representation_ids)
+
+        while frontier:
+            visited.update(frontier)
+            ids = list(frontier)
+
+            existing = self._by_id(self._find({"_id": {"$in": ids}}))
+            level = list()
+            for doc in io.find({"_id": {"$in": ids}}):
+                that = existing.get(doc["_id"])
+                if that is not None and not overwrite:
+                    continue  # Already copied, dependencies included
+                representations[doc["_id"]] = (doc, that)
+                level.append(doc)
+
+            version_ids = list(set(doc["parent"] for doc in level)
+                               - set(versions))
+            if version_ids:
+                versions.update(
+                    self._by_id(io.find({"_id": {"$in": version_ids}})))
+
+            next_ids = set()
+
+            # Dependencies
+            dependencies = set()
+            for doc in level:
+                version = versions[doc["parent"]]
+                dependencies.update(
+                    io.ObjectId(_id)
+                    for _id in version["data"].get("dependencies", []))
+
+            if dependencies:
+                next_ids.update(doc["_id"] for doc in io.find(
+                    {"type": "representation",
+                     "parent": {"$in": list(dependencies)}},
+                    projection={"_id": True}))
+
+            # Previous version of TexturePack, for textures that were
+            # not changed in the latest version
+            previous = [{"parent": versions[doc["parent"]]["parent"],
+                         "name": versions[doc["parent"]]["name"] - 1}
+                        for doc in level if doc["name"] == "TexturePack"]
+            if previous:
+                previous = [doc["_id"] for doc in io.find(
+                    {"type": "version", "$or": previous},
+                    projection={"_id": True})]
+            if previous:
+                next_ids.update(doc["_id"] for doc in io.find(
+                    {"type": "representation",
+                     "name": "TexturePack",
+                     "parent": {"$in": previous}},
+                    projection={"_id": True}))
+
+            frontier = next_ids - visited
+
+        return representations, versions
+
+    def plan(self, representation_ids, overwrite=False):
+        """Resolve documents to write and packages to copy
+
+        Args:
+            representation_ids (list): List of representation ObjectId
+            overwrite (bool, optional): Include existing representations
+
+        Returns:
+            dict: Plan with keys
+                "inserts": documents to insert
+                "updates": list of (filter, update) pairs
+                "packages": list of (src dir, dst dir) pairs
+
+        """
         this_project = self.this_project
         that_project = self.that_project
 
-        # Representation
-        this_representation = this.find_one({"_id": representation_id})
-        that_representation = that._find_one({"_id": representation_id})
-        if not that_representation:
-            that._insert_one(this_representation)
-            that_representation = this_representation
+        representations, versions = self._closure(representation_ids,
+                                                  overwrite)
+        used_versions = set(this["parent"]
+                            for this, _ in representations.values())
+        versions = dict((_id, versions[_id]) for _id in used_versions)
+
+        subsets = self._by_id(io.find({"_id": {"$in": list(
+            set(doc["parent"] for doc in versions.values()))}}))
+        assets = self._by_id(io.find({"_id": {"$in": list(
+            set(doc["parent"] for doc in subsets.values()))}}))
+        visual_parents = self._by_id(io.find({"_id": {"$in": list(
+            set(io.ObjectId(doc["data"]["visualParent"])
+                for doc in assets.values()
+                if doc["data"].get("visualParent")))}}))
+
+        # Existing documents in destination project
+        existing = self._by_id(self._find({"_id": {"$in": list(
+            set(versions) | set(subsets) | set(assets) | set(visual_parents)
+        )}}))
+        existing_names = dict(
+            (doc["name"], doc) for doc in self._find(
+                {"type": "asset",
+                 "name": {"$in": [doc["name"] for doc in assets.values()]}}
+            )
+        )
 
-        elif not overwrite:
-            return
+        inserts = OrderedDict()
+        updates = list()
 
-        # Version
-        this_version = this.find_one({"_id": this_representation["parent"]})
-        that_version = that._find_one({"_id": that_representation["parent"]})
-        if not that_version:
-            that._insert_one(this_version)
-            that_version = this_version
-
-        # Subset
-        this_subset = this.find_one({"_id": this_version["parent"]})
-        that_subset = that._find_one({"_id": that_version["parent"]})
-        if not that_subset:
-            that._insert_one(this_subset)
-            that_subset = this_subset
-
-        # Asset
-        this_asset = this.find_one({"_id": this_subset["parent"]})
-        that_asset = that._find_one({"_id": that_subset["parent"]})
-        if not that_asset:
-
-            name_exists = that._find_one({"type": "asset",
-                                          "name": this_asset["name"]})
-            if name_exists:
-                that_asset = name_exists
-                # Update subset's parent
-                that._update_one(
-                    {"_id": that_subset["_id"]},
-                    {"$set": {"parent": that_asset["_id"]}}
-                )
-            else:
-                that_asset = this_asset.copy()
-                that_asset["parent"] = that_project["_id"]
-                that._insert_one(that_asset)
-
-                # Asset Visual Parent
-                parent = this_asset["data"]["visualParent"]
-                if parent:
-                    parent = io.ObjectId(parent)
-                    if not that._find_one({"_id": parent}):
-                        parent_ast = this.find_one({"_id": parent})
-                        parent_ast["parent"] = that_project["_id"]
-                        that._insert_one(parent_ast)
-
-        # Dependencies
-        for dependency in this_version["data"]["dependencies"]:
-            dependency = io.ObjectId(dependency)
-            for representation_ in this.find({"parent": dependency}):
-                self._copy_representations(representation_["_id"], overwrite)
-
-        # Copy package
-        src_package = get_representation_path_(
-            this_representation,
-            parents=[this_version, this_subset, this_asset, this_project]
-        )
+        # Assets
+        that_assets = dict()
+        renamed = set()
+        for _id, asset in assets.items():
+            if _id in existing:
+                that_assets[_id] = existing[_id]
+                continue
+
+            if asset["name"] in existing_names:
+                # Same asset in destination project with different id
+                that_assets[_id] = existing_names[asset["name"]]
+                renamed.add(_id)
+                continue
 
+            that_asset = inserts.get(_id) or dict(asset,
+                                                  parent=that_project["_id"])
+            inserts[_id] = that_assets[_id] = that_asset
+
+            # Asset Visual Parent
+            parent = asset["data"].get("visualParent")
+            if parent:
+                parent = io.ObjectId(parent)
+                if (parent not in existing
+                        and parent not in inserts
+                        and parent in visual_parents):
+                    inserts[parent] = dict(visual_parents[parent],
+                                           parent=that_project["_id"])
+
+        # Subsets
+        that_subsets = dict()
+        for _id, subset in subsets.items():
+            that_subset = existing.get(_id)
+            if that_subset is None:
+                that_subset = inserts[_id] = dict(subset)
+
+            if subset["parent"] in renamed:
+                # Update subset's parent
+                parent = that_assets[subset["parent"]]["_id"]
+                if _id in existing and that_subset["parent"] != parent:
+                    updates.append(({"_id": _id},
+                                    {"$set": {"parent": parent}}))
+                that_subset["parent"] = parent
+
+            that_subsets[_id] = that_subset
+
+        # Versions
+        that_versions = dict()
+        for _id, version in versions.items():
+            that_version = existing.get(_id)
+            if that_version is None:
+                that_version = inserts[_id] = version
+            that_versions[_id] = that_version
+
+        # Representations and packages
         that_root = that_project["data"].get("root")
-        if that_root:
-            that_representation["data"]["reprRoot"] = that_root
-        dst_package = get_representation_path_(
-            that_representation,
-            parents=[that_version, that_subset, that_asset, that_project]
-        )
+        packages = list()
+        for _id, (this, that) in representations.items():
+            if that is None:
+                that = inserts[_id] = this
+
+            version = versions[this["parent"]]
+            subset = subsets[version["parent"]]
+            asset = assets[subset["parent"]]
+
+            src_package = get_representation_path_(
+                this,
+                parents=[version, subset, asset, this_project]
+            )
+
+            if that_root:
+                that = dict(that, data=dict(that["data"], reprRoot=that_root))
+            dst_package = get_representation_path_(
+                that,
+                parents=[that_versions[version["_id"]],
+                         that_subsets[subset["_id"]],
+                         that_assets[asset["_id"]],
+                         that_project]
+            )
+
+            package = (os.path.normpath(src_package),
+                       os.path.normpath(dst_package))
+            if package not in packages:
+                packages.append(package)
+
+        return {
+            "inserts": list(inserts.values()),
+            "updates": updates,
+            "packages": packages,
+        }
 
-        self._copy_dir(src_package, dst_package)
-
-        if this_representation["name"] == "TexturePack":
-            previous_version = this.find_one({
-                "type": "version",
-                "name": this_version["name"] - 1,
-                "parent": this_subset["_id"],
-            })
-            if previous_version:
-                previous_representation = this.find_one({
-                    "type": "representation",
-                    "name": "TexturePack",
-                    "parent": previous_version["_id"],
-                }, projection={"_id": True})
-
-                self._copy_representations(previous_representation["_id"],
-                                           overwrite)
-
-    def _copy_dir(self, src, dst):
-        """ Copy given source to destination"""
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        print("Copying: %s" % src)
-        print("     To: %s" % dst)
-        try:
-            dir_util.copy_tree(src, dst)
-        except distutils_err.DistutilsFileError as e:
-            message_box_error("Error", e)
-            raise e
+    def _package_files(self, plan):
+        """Return (src, dst) file pairs of all packages, and missing dirs"""
+        if "files" in plan:
+            return plan["files"], plan["missing"]
+
+        files = list()
+        missing = list()
+        for src, dst in plan["packages"]:
+            if not os.path.isdir(src):
+                missing.append(src)
+                continue
+
+            for root, _, names in os.walk(src):
+                relative = os.path.relpath(root, src)
+                for name in names:
+                    files.append((os.path.join(root, name),
+                                  os.path.normpath(
+                                      os.path.join(dst, relative, name))))
+
+        plan["files"], plan["missing"] = files, missing
+        return files, missing
+
+    def report(self, plan):
+        """Return document count, package count, file count and bytes"""
+        files, missing = self._package_files(plan)
+        return {
+            "documents": len(plan["inserts"]),
+            "updates": len(plan["updates"]),
+            "packages": len(plan["packages"]),
+            "files": len(files),
+            "bytes": sum(os.path.getsize(src) for src, _ in files),
+            "missing": missing,
+        }
+
+    def _write(self, plan):
+        if plan["inserts"]:
+            self._collection.insert_many(plan["inserts"], ordered=False)
+        if plan["updates"]:
+            self._collection.bulk_write([
+                pymongo.UpdateOne(filter, update)
+                for filter, update in plan["updates"]
+            ])
+
+    def _transfer(self, plan):
+        from .transfer import FileTransfer, FILES
+
+        files, _ = self._package_files(plan)
+
+        transfer = FileTransfer(workers=self.workers, logger=log)
+        for src, dst in files:
+            transfer.add(FILES, src, dst)
+
+        return transfer.run()
 
 
 def get_versions_from_sourcefile(source, project):
@@ -650,6 +1134,9 @@ def overlay_clipinfo_on_image(image_path,
     (NOTE): This function requires package `PIL` be installed in the
             environment, or `ImportError` raised.
 
+    For image sequence, use `reveries.clipinfo.render_sequence` which only
+    renders the static clipinfo once.
+
     Args:
         image_path (str): Image file path
         output_path (str): Output file path
@@ -673,169 +1160,23 @@ def overlay_clipinfo_on_image(image_path,
             hight for clipinfo
 
     """
-    from PIL import Image, ImageDraw, ImageFont
-
-    width, height = resolution
-
-    # Templates
-
-    _TOP = "{project}".format(project=project.split("_", 1)[-1])
-
-    _TOP_LEFT = """
-  Shot: {shot_name}  ver {version:0>3}
- Frame: {frame_num:0>4}
-FocalL: {focal_length} mm
-"""[1:-1].format(frame_num=frame_num,
-                 shot_name=shot_name,
-                 version=version,
-                 focal_length=focal_length)
-
-    _TOP_RIGHT = """
-  Date: {date}
-Artist: {artist}
-  Task: {task}
-"""[1:-1].format(date=date, artist=artist, task=task)
-
-    _BTM = "{frame_num:0>4}".format(frame_num=frame_num)
-
-    _BTM_LEFT = """
-   Range: {edit_in:0>4} - {edit_out:0>4}
-Duration: {duration:0>4}
- Handles: {handles}  FPS: {fps}
-"""[1:-1].format(edit_in=edit_in,
-                 edit_out=edit_out,
-                 duration=duration,
-                 handles=handles,
-                 fps=fps)
-
-    _BTM_RIGHT = """
-    Subset: {subset_name}
-      RPID: {representation_id}
-Resolution: {width}px * {height}px
-"""[1:-1].format(subset_name=subset,
-                 representation_id=representation_id,
-                 width=width,
-                 height=height)
-
-    # Compute font size and spacing base on image resolution
-
-    spacing = int(width / 320)    # 6 in Full HD
-    titlesize = int(width / 48)  # 40 in Full HD
-    datasize = int(width / 96)   # 20 in Full HD
-    border = datasize
-
-    if expand_hight:
-        expand = ((datasize + spacing) * 3 +  # 3 lines of info
-                  border * 2)
-        height += expand * 2  # Above and below
-
-    # Get font
-
-    FONTDIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
-                           "res",
-                           "fonts").replace("\\", "/")
-
-    fontfile = FONTDIR + "/SourceCodePro/Sauce Code Powerline Regular.otf"
-    titlefont = ImageFont.truetype(fontfile, size=titlesize)
-    datafont = ImageFont.truetype(fontfile, size=datasize)
-
-    # Create new image
-
-    im = Image.new("RGBA", size=(width, height), color=(0, 0, 0, 255))
-    draw = ImageDraw.Draw(im)
-
-    def textsize(text, title=False):
-        font = titlefont if title else datafont
-        return draw.textsize(text, font=font, spacing=spacing)
-
-    def puttext(text, pos, title=False):
-        font = titlefont if title else datafont
-        align = "center" if title else "left"
-        draw.text(pos, text, fill=(200, 200, 200, 255),
-                  font=font, align=align, spacing=spacing)
-
-    # Start painting
-
-    # Top Center
-    size_top = textsize(_TOP, title=True)
-    x = (width - size_top[0]) / 2
-    y = border
-    pos_top = (x, y)
-    puttext(_TOP, pos_top, title=True)
-
-    # Bottom Center
-    size_btm = textsize(_BTM, title=True)
-    x = (width - size_btm[0]) / 2
-    y = height - border - size_btm[1]
-    pos_btm = (x, y)
-    # Disabled, but still take into calculation
-    # puttext(_BTM, pos_btm, title=True)
-
-    # Top Left
-    size_top_left = textsize(_TOP_LEFT)
-    x = border
-    y = border
-    pos_top_left = (x, y)
-    puttext(_TOP_LEFT, pos_top_left)
-
-    # Top Right
-    size_top_right = textsize(_TOP_RIGHT)
-    x = width - size_top_right[0] - border
-    y = border
-    pos_top_right = (x, y)
-    puttext(_TOP_RIGHT, pos_top_right)
-
-    # Bottom Left
-    size_btm_left = textsize(_BTM_LEFT)
-    x = border
-    y = height - size_btm_left[1] - border
-    pos_btm_left = (x, y)
-    puttext(_BTM_LEFT, pos_btm_left)
-
-    # Bottom Right
-    size_btm_right = textsize(_BTM_RIGHT)
-    x = width - size_btm_right[0] - border
-    y = height - size_btm_right[1] - border
-    pos_btm_right = (x, y)
-    puttext(_BTM_RIGHT, pos_btm_right)
-
-    # Assemble
-
-    if expand_hight:
-
-        src = Image.open(image_path)
-        holdout = Image.new("L", src.size)
-        background = Image.new("L", im.size, 255)
-        background.paste(holdout, box=(0, expand))
-        im.putalpha(background)
-
-    else:
-
-        # Comput the size that the original image need to be scaled
-        # after the clipinfo applied on.
-        retract = (max(pos_top[1] + size_top[1],
-                       pos_top_left[1] + size_top_left[1],
-                       pos_top_right[1] + size_top_right[1]) +
-                   max(height - pos_btm[1] + size_btm[1],
-                       height - pos_btm_left[1] + size_btm_left[1],
-                       height - pos_btm_right[1] + size_btm_right[1]))
-
-        scale = float(height) / (height + retract)
-        scaled_w = int(width * scale) - border
-        scaled_h = int(height * scale) - border
-        box = (int((width - scaled_w) / 2), int((height - scaled_h) / 2))
-
-        src = Image.open(image_path)
-        src.load()  # required for src.split()
-
-        background = Image.new("RGB", src.size, (255, 255, 255))
-        background.paste(src)
-        background.paste(src, mask=src.split()[3])  # 3 is the alpha channel
-        # Put resized original image into new image that has clipinfo
-        # overlaied
-        im.paste(background.resize((scaled_w, scaled_h),
-                                   resample=Image.BICUBIC),
-                 box=box)
-
-    # save over to original image
-    im.save(output_path)
+    from .clipinfo import ClipInfoOverlay
+
+    info = {
+        "project": project,
+        "task": task,
+        "subset": subset,
+        "version": version,
+        "representation_id": representation_id,
+        "artist": artist,
+        "date": date,
+        "shot_name": shot_name,
+        "edit_in": edit_in,
+        "edit_out": edit_out,
+        "handles": handles,
+        "duration": duration,
+        "focal_length": focal_length,
+        "fps": fps,
+    }
+    overlay = ClipInfoOverlay(info, resolution, expand_hight=expand_hight)
+    overlay.render(image_path, output_path, frame_num)
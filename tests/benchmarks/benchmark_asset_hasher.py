@@ -0,0 +1,72 @@
+"""Benchmark `AssetHasher.add_dir` against the previous implementation
+
+Usage:
+    python -m tests.benchmarks.benchmark_asset_hasher [file count]
+
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from reveries.utils import AssetHasher, HashCache
+
+
+def legacy_add_dir(hasher, dir_path, recursive=True, followlinks=True):
+    """The `add_dir` before the threaded engine, for comparison"""
+    for root, dirs, files in os.walk(dir_path, followlinks=followlinks):
+        for name in files:
+            hasher.add_file(os.path.join(root, name))
+
+        if not recursive:
+            continue
+
+        for name in dirs:
+            path = os.path.join(root, name)
+            legacy_add_dir(hasher, path, recursive=True,
+                           followlinks=followlinks)
+
+
+def make_tree(root, count, per_dir=100, size=4096 * 4):
+    for i in range(count):
+        sub = os.path.join(root,
+                           "d%03d" % (i // (per_dir * 10)),
+                           "d%03d" % (i // per_dir))
+        if not os.path.isdir(sub):
+            os.makedirs(sub)
+        with open(os.path.join(sub, "f%06d.bin" % i), "wb") as fp:
+            fp.write(os.urandom(size))
+
+
+def timeit(label, func):
+    start = time.time()
+    func()
+    print("%-24s %8.3f sec" % (label, time.time() - start))
+
+
+def main(count=10000):
+    root = tempfile.mkdtemp(prefix="benchmark_hasher_")
+    cache_path = os.path.join(tempfile.mkdtemp(), "cache.json")
+    try:
+        print("Generating %d files.." % count)
+        make_tree(root, count)
+
+        timeit("legacy add_dir",
+               lambda: legacy_add_dir(AssetHasher(), root))
+        timeit("add_dir (1 worker)",
+               lambda: AssetHasher(workers=1).add_dir(root))
+        timeit("add_dir",
+               lambda: AssetHasher().add_dir(root))
+        timeit("add_dir (cold cache)",
+               lambda: AssetHasher(cache=HashCache(cache_path)).add_dir(root))
+        timeit("add_dir (warm cache)",
+               lambda: AssetHasher(cache=HashCache(cache_path)).add_dir(root))
+
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+        shutil.rmtree(os.path.dirname(cache_path), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
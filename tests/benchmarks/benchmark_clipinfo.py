@@ -0,0 +1,84 @@
+"""Benchmark clipinfo overlay on a synthetic playblast sequence
+
+Compares overlaying frame by frame (layer and fonts rebuilt on every frame,
+as `utils.overlay_clipinfo_on_image` does) with `clipinfo.render_sequence`.
+
+Usage:
+    python -m tests.benchmarks.benchmark_clipinfo [frame count] [workers]
+
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from PIL import Image
+
+from reveries import clipinfo, utils
+
+
+INFO = {
+    "project": "2020_Demo",
+    "task": "layout",
+    "subset": "playblastDefault",
+    "version": 3,
+    "representation_id": "5e1f8c0a9b7d2a0001a1b2c3",
+    "artist": "someone",
+    "date": "20200101T120000Z",
+    "shot_name": "sh0010",
+    "edit_in": 1001,
+    "edit_out": 1100,
+    "handles": 0,
+    "duration": 100,
+    "focal_length": 35.0,
+    "fps": 24.0,
+}
+
+RESOLUTION = (1920, 1080)
+
+
+def make_frames(root, count):
+    frames = list()
+    for frame in range(1001, 1001 + count):
+        path = os.path.join(root, "img.%04d.png" % frame)
+        Image.new("RGBA", RESOLUTION, (frame % 255, 80, 160, 255)).save(path)
+        frames.append((path, path, frame))
+    return frames
+
+
+def main(count=100, workers=0):
+    root = tempfile.mkdtemp()
+    try:
+        frames = make_frames(root, count)
+
+        start = time.time()
+        for path, output, frame in frames:
+            overlay = clipinfo.ClipInfoOverlay(INFO, RESOLUTION)
+            overlay.render(path, output, frame)
+        elapsed = time.time() - start
+        print("Frame by frame: %.3f sec (%.2f fps)"
+              % (elapsed, count / elapsed))
+
+        frames = make_frames(root, count)
+        report = clipinfo.render_sequence(frames, INFO, RESOLUTION,
+                                          workers=1)
+        print("Static layer, 1 process: %.3f sec (%.2f fps)"
+              % (report["seconds"], report["fps"]))
+
+        frames = make_frames(root, count)
+        report = clipinfo.render_sequence(frames, INFO, RESOLUTION,
+                                          workers=workers or None)
+        print("Static layer, process pool: %.3f sec (%.2f fps)"
+              % (report["seconds"], report["fps"]))
+
+        # Make sure the single image entry still works
+        path, output, frame = frames[0]
+        utils.overlay_clipinfo_on_image(path, output, frame_num=frame,
+                                        resolution=RESOLUTION, **INFO)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,143 @@
+"""Benchmark DelayRunBuilder pruning against deepcopy and walk
+
+Usage:
+    python -m tests.benchmarks.benchmark_delay_run [node count]
+
+"""
+import sys
+import copy
+import time
+import tracemalloc
+
+from reveries.common.build_delay_run import DelayRunBuilder
+
+
+class Node(object):
+    """Stand-in of Maya node or other live object"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Context(object):
+    def __init__(self, data):
+        self.data = data
+
+
+class Instance(list):
+    def __init__(self, data, context):
+        super(Instance, self).__init__()
+        self.data = data
+        self.context = context
+
+
+def make_instance(count):
+    """Mimic a large USD pointcache instance"""
+    nodes = ["|ROOT|geo_GRP|part%05d_GRP|part%05d_GEO" % (i, i)
+             for i in range(count)]
+    context = Context({
+        "currentMaking": "/proj/work/scene.ma",
+        "startFrame": 1001,
+        "endFrame": 1240,
+        "projectDoc": {"name": "proj", "data": {"fps": 24}},
+        "plugins": [Node("plugin%d" % i) for i in range(200)],
+    })
+    instance = Instance({
+        "subset": "pointcacheHero",
+        "startFrame": 1001,
+        "endFrame": 1240,
+        "outCache": nodes[:count // 10],
+        "_cache_nodes": [Node(node) for node in nodes[:count // 10]],
+        "hierarchy": dict(
+            ("group%03d" % g, {"nodes": nodes[g::100],
+                               "matrix": [1.0, 0.0, 0.0, 0.0] * 4})
+            for g in range(100)
+        ),
+        "geometry": [[(float(i), float(i), 0.0) for i in range(64)]
+                     for _ in range(count // 10)],
+        "ids": dict((node, "5e8f0a1b2c3d:%x" % i)
+                    for i, node in enumerate(nodes)),
+        "instance": Node("instance"),
+    }, context)
+    instance.data["instance"] = instance
+    context.data["instance"] = instance
+
+    return instance
+
+
+def legacy_copy(instance):
+    """Previous implementation, deepcopy then walk and rebuild"""
+    delete_data = []
+
+    def walk_dict(d):
+        for k, v in sorted(d.items(), key=lambda x: x[0]):
+            if isinstance(v, dict):
+                walk_dict(v)
+            elif hasattr(v, '__dict__'):
+                delete_data.append(k)
+            elif isinstance(v, list):
+                for _v in v:
+                    if hasattr(_v, '__dict__'):
+                        delete_data.append(k)
+
+    def delete_keys_from_dict(dictionary, keys):
+        keys_set = set(keys)
+        modified_dict = {}
+        for key, value in dictionary.items():
+            if key not in keys_set:
+                if isinstance(value, dict):
+                    modified_dict[key] = delete_keys_from_dict(value, keys)
+                else:
+                    modified_dict[key] = value
+        return modified_dict
+
+    _data = dict(instance.data)
+    _data.pop("_cache_nodes", None)
+    _data.pop("instance", None)  # deepcopy would copy whole context
+    instance_data = copy.deepcopy(_data)
+    walk_dict(instance_data)
+    instance_data = delete_keys_from_dict(instance_data, delete_data)
+
+    delete_data = []
+    context_data = dict(instance.context.data)
+    walk_dict(context_data)
+    context_data = delete_keys_from_dict(context_data, delete_data)
+
+    return instance_data, context_data
+
+
+def measure(func, *args):
+    """Return result, seconds and peak memory (traced in another run)"""
+    start = time.time()
+    result = func(*args)
+    elapsed = time.time() - start
+
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def main(count=100000):
+    instance = make_instance(count)
+
+    print("Instance with %d nodes" % count)
+    (legacy, _), legacy_time, legacy_peak = measure(legacy_copy, instance)
+    builder, pruned_time, pruned_peak = measure(DelayRunBuilder, instance)
+
+    for label, elapsed, peak in [("deepcopy", legacy_time, legacy_peak),
+                                 ("prune", pruned_time, pruned_peak)]:
+        print("  %-10s %.3f sec  peak %8.2f MB"
+              % (label, elapsed, peak / 1024.0 / 1024.0))
+
+    print("  dropped: %s" % builder.dropped_keys)
+
+    # Tuples are kept, deepcopy kept them, too
+    assert builder.instance_data == legacy
+    assert pruned_time < legacy_time
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,72 @@
+"""Benchmark compact dump against indented JSON dump
+
+Usage:
+    python -m tests.benchmarks.benchmark_dumps [node count]
+
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+from reveries import dumps
+
+
+def make_instance_dump(count):
+    """Mimic a large pointcache/look instance dump"""
+    nodes = ["|ROOT|geo_GRP|part%05d_GRP|part%05d_GEO" % (i, i)
+             for i in range(count)]
+    return {
+        "id": "5e8f0a1b2c3d4e5f6a7b8c9d",
+        "contextDump": "/proj/filesys/dumps/.context.user.0.json",
+        "startFrame": 1001,
+        "endFrame": 1240,
+        "repr.Alembic._stage": "/proj/stage/abc",
+        "repr.Alembic._hardlinks": ["model.abc"],
+        "repr.LookDev.shaderBy": dict(
+            ("shader%04d" % (i % 500), nodes[i::500]) for i in range(500)
+        ),
+        "repr.LookDev.ids": dict(
+            (node, "5e8f0a1b2c3d4e5f6a7b%04x:%x" % (i % 9999, i))
+            for i, node in enumerate(nodes)
+        ),
+    }
+
+
+def bench(path, data, loops=5):
+    start = time.time()
+    for _ in range(loops):
+        dumps.write(path, data)
+    write_time = (time.time() - start) / loops
+
+    start = time.time()
+    for _ in range(loops):
+        loaded = dumps.read(path)
+    read_time = (time.time() - start) / loops
+
+    assert loaded == json.loads(json.dumps(data))
+
+    return os.path.getsize(path), write_time, read_time
+
+
+def main(count=50000):
+    data = make_instance_dump(count)
+    root = tempfile.mkdtemp(prefix="benchmark_dumps")
+    try:
+        plain = os.path.join(root, ".instance.json")
+        compact = dumps.dump_path(plain, compact=True)
+
+        print("Instance dump with %d nodes" % count)
+        for label, path in [("json (indent)", plain),
+                            ("json.gz (compact)", compact)]:
+            size, write_time, read_time = bench(path, data)
+            print("  %-18s %8.2f KB  write %.3f sec  read %.3f sec"
+                  % (label, size / 1024.0, write_time, read_time))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
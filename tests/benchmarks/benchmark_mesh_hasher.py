@@ -0,0 +1,57 @@
+"""Benchmark vectorised mesh hashing against the Python loop
+
+This runs without Maya, with plain arrays shaped like what `MFnMesh`
+returns.
+
+Usage:
+    python -m tests.benchmarks.benchmark_mesh_hasher [vertex count]
+
+"""
+import sys
+import time
+import random
+
+from reveries import utils
+
+
+def legacy_points(points):
+    value = 0
+    for i, vt in enumerate(points):
+        value += utils._hash_MPoint(*vt) + i
+    return value
+
+
+def vectorised_points(points, decimals=None):
+    rows = utils.as_hash_rows(points, 4)
+    terms = utils.geometry_hash_terms("points", rows, decimals)
+    return utils.accumulate_hash(0, terms)
+
+
+def timeit(label, func):
+    start = time.time()
+    result = func()
+    print("%-24s %8.3f sec" % (label, time.time() - start))
+    return result
+
+
+def main(count=2000000):
+    if utils.numpy is None:
+        print("NumPy not available, nothing to compare.")
+        return
+
+    print("Generating %d vertices.." % count)
+    rand = random.random
+    points = [(rand(), rand(), rand(), 1.0) for _ in range(count)]
+
+    expected = timeit("legacy loop", lambda: legacy_points(points))
+    result = timeit("vectorised", lambda: vectorised_points(points))
+    timeit("vectorised (quantised)", lambda: vectorised_points(points, 5))
+
+    array = utils.as_hash_rows(points, 4)
+    timeit("vectorised (buffer)", lambda: vectorised_points(array))
+
+    assert result == expected, "Hash value changed."
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,69 @@
+"""Benchmark MeshHasher reading mesh components from Maya
+
+Compare element-wise `MPointArray`/`MFloatVectorArray` conversion with the
+raw float buffer read, on a real mesh, and check digests are the same.
+
+Requires `mayapy`.
+
+Usage:
+    mayapy -m tests.benchmarks.benchmark_mesh_hasher_maya [subdivisions]
+
+"""
+import sys
+import time
+
+
+def build_mesh(subdivisions):
+    from maya import cmds
+
+    mesh = cmds.polyPlane(subdivisionsX=subdivisions,
+                          subdivisionsY=subdivisions,
+                          constructionHistory=False)[0]
+    # Non-trivial point positions and normals
+    cmds.polyMoveVertex(mesh + ".vtx[::7]", translateY=0.3)
+    cmds.delete(mesh, constructionHistory=True)
+    return cmds.listRelatives(mesh, shapes=True, fullPath=True)[0]
+
+
+def timeit(label, func):
+    start = time.time()
+    result = func()
+    print("%-24s %8.3f sec" % (label, time.time() - start))
+    return result
+
+
+def hash_mesh(shape):
+    from reveries.maya import utils
+
+    hasher = utils.MeshHasher()
+    hasher.set_mesh(shape)
+    hasher.update_points()
+    hasher.update_normals()
+    return hasher.digest()
+
+
+def main(subdivisions=1000):
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from reveries.maya import utils
+
+    shape = build_mesh(subdivisions)
+    print("Vertices: %d" % ((subdivisions + 1) ** 2))
+
+    raw_mesh_rows = utils._raw_mesh_rows
+    utils._raw_mesh_rows = lambda dag_path, kind: None
+    try:
+        expected = timeit("element-wise", lambda: hash_mesh(shape))
+    finally:
+        utils._raw_mesh_rows = raw_mesh_rows
+
+    assert utils._raw_mesh_rows(shape, "points") is not None, (
+        "Raw buffer not readable.")
+    result = timeit("raw buffer", lambda: hash_mesh(shape))
+
+    assert result == expected, "Hash value changed."
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,134 @@
+"""Benchmark modeldiffer matcher against the previous nested-loop matching
+
+The matcher module is loaded from file, so this runs without Qt.
+
+Usage:
+    python -m tests.benchmarks.benchmark_modeldiffer_matcher [entry count]
+
+"""
+import os
+import sys
+import time
+import random
+import runpy
+
+from reveries import PACKAGE_DIR
+
+
+matcher = runpy.run_path(os.path.join(PACKAGE_DIR,
+                                      "tools",
+                                      "modeldiffer",
+                                      "matcher.py"))
+
+
+def legacy_match(items, data_list):
+    """The three passes matching before the matcher, for comparison"""
+    related = matcher["related"]
+
+    not_matched_items = list(range(len(items)))
+    not_matched_data = list(range(len(data_list)))
+    matched = list()
+
+    for index in list(not_matched_data):
+        data = data_list[index]
+        state = 0
+        for row in not_matched_items:
+            if items[row][0] == data["avalonId"]:
+                state |= 1
+                if related(items[row][1], data["longName"]):
+                    state |= 2
+
+            if state:
+                not_matched_items.remove(row)
+                not_matched_data.remove(index)
+                matched.append((index, row, state))
+                break
+
+    for index in list(not_matched_data):
+        data = data_list[index]
+        for row in not_matched_items:
+            if related(items[row][1], data["longName"]):
+                not_matched_items.remove(row)
+                not_matched_data.remove(index)
+                matched.append((index, row, 2))
+                break
+
+    remaining = list()
+    for index in not_matched_data:
+        data = data_list[index]
+        for row in not_matched_items:
+            if items[row][2] == data["shortName"]:
+                not_matched_items.remove(row)
+                matched.append((index, row, 0))
+                break
+        else:
+            remaining.append(index)
+
+    return matched, remaining
+
+
+def make_profiles(count, seed=0):
+    """Two sides of a character model, with renames, re-ids and re-groups"""
+    rand = random.Random(seed)
+
+    items = list()
+    data_list = list()
+    for i in range(count):
+        group = "|ROOT|geo|part%03d|sub%02d" % (i // 200, (i // 20) % 10)
+        short = "mesh%05d" % i
+        name = "%s|%s" % (group, short)
+        id = "5e8f%020x" % i
+        items.append((id, name, short))
+
+        roll = rand.random()
+        if roll < 0.7:
+            pass  # Unchanged
+        elif roll < 0.8:
+            id = "5e8f%020x" % (i + count)  # Re-id
+        elif roll < 0.9:
+            id = "new%020x" % i  # Re-id and re-group
+            name = "|ROOT|geo|moved%03d|%s" % (i // 200, short)
+        else:
+            id = "new%020x" % i  # New mesh
+            short = "added%05d" % i
+            name = "%s|%s" % (group, short)
+
+        data_list.append({"avalonId": id,
+                          "longName": name,
+                          "shortName": short})
+
+    rand.shuffle(items)
+    data_list.sort(key=lambda d: d["longName"])
+
+    return items, data_list
+
+
+def main(count=50000, legacy_count=5000):
+    items, data_list = make_profiles(legacy_count)
+
+    start = time.time()
+    expected = legacy_match(items, data_list)
+    legacy_time = time.time() - start
+
+    start = time.time()
+    result = matcher["match"](items, data_list)
+    new_time = time.time() - start
+
+    assert sorted(result[0]) == sorted(expected[0])
+    assert result[1] == expected[1]
+
+    print("%d entries, legacy: %.3f sec, matcher: %.3f sec"
+          % (legacy_count, legacy_time, new_time))
+
+    items, data_list = make_profiles(count)
+
+    start = time.time()
+    matched, remaining = matcher["match"](items, data_list)
+    new_time = time.time() - start
+
+    print("%d entries, matcher: %.3f sec (%d matched, %d new)"
+          % (count, new_time, len(matched), len(remaining)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
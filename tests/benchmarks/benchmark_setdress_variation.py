@@ -0,0 +1,117 @@
+"""Benchmark set-dress variation, per transform commands vs batched
+
+Requires `mayapy`.
+
+Usage:
+    mayapy -m tests.benchmarks.benchmark_setdress_variation [piece count]
+
+"""
+import sys
+import time
+import random
+
+
+def build_scene(count):
+    """Create `count` pieces with random matrices, half of them hidden"""
+    from maya import cmds
+
+    rng = random.Random(0)
+    pieces = list()
+    for i in range(count):
+        node = cmds.createNode("transform", name="piece%05d" % i)
+        cmds.xform(node, scalePivot=(rng.random(), 0, 0))
+        matrix = cmds.xform(node, query=True, matrix=True, objectSpace=True)
+        matrix[12:15] = [rng.uniform(-100, 100) for _ in range(3)]
+        pieces.append((node, matrix, bool(i % 2), not bool(i % 3)))
+
+    return pieces
+
+
+def apply_legacy(pieces):
+    """Per transform commands, like `SetDressLoader` used to do"""
+    from maya import cmds
+    from reveries.maya.lib import TRANSFORM_ATTRS
+
+    def connected(node, attributes):
+        return any(cmds.listConnections(node + "." + attr,
+                                        source=True,
+                                        destination=False)
+                   for attr in attributes)
+
+    for node, matrix, is_hidden, inherits in pieces:
+        if is_hidden and not connected(node, ["visibility"]):
+            cmds.setAttr(node + ".visibility", False)
+        if not cmds.getAttr(node + ".it") == inherits:
+            cmds.setAttr(node + ".it", inherits)
+        if connected(node, TRANSFORM_ATTRS):
+            continue
+        scale_pivot = cmds.xform(node, query=True, scalePivot=True)
+        cmds.xform(node, objectSpace=True, matrix=matrix)
+        cmds.xform(node, scalePivot=scale_pivot)
+
+
+def apply_batched(pieces):
+    from reveries.maya.lib import TRANSFORM_ATTRS
+    from reveries.maya.variation import TransformBatch, input_connected
+
+    nodes = [piece[0] for piece in pieces]
+    batch = TransformBatch(nodes)
+    visibility_connected = input_connected(nodes, ["visibility"])
+    transform_connected = input_connected(nodes, TRANSFORM_ATTRS)
+
+    for node, matrix, is_hidden, inherits in pieces:
+        if is_hidden and node not in visibility_connected:
+            batch.set_bool(node, "visibility", False)
+        if not batch.get_bool(node, "it") == inherits:
+            batch.set_bool(node, "it", inherits)
+        if node in transform_connected:
+            continue
+        batch.set_matrix(node, matrix)
+
+    return batch.commit()
+
+
+def main(count=5000):
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+    from reveries.lib import matrix_equals
+
+    def state(pieces):
+        return [
+            (cmds.xform(node, query=True, matrix=True, objectSpace=True),
+             cmds.xform(node, query=True, scalePivot=True),
+             cmds.getAttr(node + ".visibility"),
+             cmds.getAttr(node + ".it"))
+            for node, _, _, _ in pieces
+        ]
+
+    cmds.undoInfo(state=True, infinity=True)
+
+    results = dict()
+    for name, apply in [("legacy", apply_legacy), ("batched", apply_batched)]:
+        cmds.file(new=True, force=True)
+        pieces = build_scene(count)
+        before = state(pieces)
+
+        start = time.time()
+        apply(pieces)
+        elapsed = time.time() - start
+
+        results[name] = state(pieces)
+        print("%s: %d pieces in %.3f sec" % (name, count, elapsed))
+
+    # Batched edits are undone in one step
+    cmds.undo()
+    assert state(pieces) == before, "Variation not undone."
+
+    for legacy, batched in zip(results["legacy"], results["batched"]):
+        assert matrix_equals(legacy[0], batched[0], 1e-6), (legacy, batched)
+        assert matrix_equals(legacy[1], batched[1], tolerance=1e-6)
+        assert legacy[2:] == batched[2:]
+    print("Results identical.")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,91 @@
+"""Benchmark USD look export on a synthetic scene with shared textures
+
+Requires `mayapy` with Redshift and USD (pxr) available.
+
+Usage:
+    mayapy -m tests.benchmarks.benchmark_usd_looks_export [material count]
+
+"""
+import sys
+import time
+import functools
+
+
+QUERIES = ("getAttr", "listAttr", "listConnections", "nodeType")
+
+
+def build_scene(count, texture_count=10):
+    """Create `count` materials sharing `texture_count` file textures"""
+    from maya import cmds
+
+    textures = list()
+    for i in range(texture_count):
+        place = cmds.shadingNode("place2dTexture", asUtility=True,
+                                 name="place2d%02d" % i)
+        file_node = cmds.shadingNode("file", asTexture=True,
+                                     name="texture%02d" % i)
+        cmds.setAttr(file_node + ".fileTextureName",
+                     "/textures/diffuse%02d.tif" % i,
+                     type="string")
+        cmds.connectAttr(place + ".outUV", file_node + ".uvCoord")
+        textures.append(file_node)
+
+    shading_groups = list()
+    for i in range(count):
+        shader = cmds.shadingNode("RedshiftMaterial", asShader=True,
+                                  name="material%04d" % i)
+        sg = cmds.sets(renderable=True, noSurfaceShader=True, empty=True,
+                       name="material%04dSG" % i)
+        cmds.connectAttr(shader + ".outColor", sg + ".surfaceShader")
+        texture = textures[i % texture_count]
+        cmds.connectAttr(texture + ".outColor", shader + ".diffuse_color")
+        cmds.connectAttr(texture + ".outColor", shader + ".refl_color")
+        shading_groups.append(sg)
+
+    return shading_groups
+
+
+def count_queries():
+    """Wrap Maya query commands with call counters"""
+    from maya import cmds
+
+    counter = dict.fromkeys(QUERIES, 0)
+
+    def wrap(name, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            counter[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name in QUERIES:
+        setattr(cmds, name, wrap(name, getattr(cmds, name)))
+
+    return counter
+
+
+def main(count=1000):
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+    cmds.loadPlugin("redshift4maya", quiet=True)
+
+    from reveries.maya.usd.redshift.looks_export import RedshiftShadersToUSD
+
+    shading_groups = build_scene(count)
+    counter = count_queries()
+
+    start = time.time()
+    exporter = RedshiftShadersToUSD(shadingGroups=shading_groups)
+    elapsed = time.time() - start
+
+    prims = len(list(exporter.GetStage().Traverse()))
+    print("%d materials, %d prims, export: %.3f sec"
+          % (count, prims, elapsed))
+    print("Maya queries: " + ", ".join("%s %d" % (name, counter[name])
+                                       for name in QUERIES))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from bson import ObjectId
+
+from reveries import utils
+
+
+TEMPLATE = ("{root}/{project}/{silo}/{asset}/{subset}/v{version:03}/"
+            "{representation}")
+
+
+def _project(collection, name, root):
+    return collection.insert_one({
+        "type": "project",
+        "name": name,
+        "data": {"root": root},
+        "config": {"template": {"publish": TEMPLATE}},
+    }).inserted_id
+
+
+def _publish(collection, root, project, asset_name, subset_name,
+             dependencies=(), visual_parent=None):
+    asset = collection.find_one({"type": "asset", "name": asset_name})
+    if asset is None:
+        asset = {"type": "asset",
+                 "name": asset_name,
+                 "silo": "assets",
+                 "parent": project,
+                 "data": {"visualParent": visual_parent}}
+        collection.insert_one(asset)
+
+    subset = {"type": "subset", "name": subset_name, "parent": asset["_id"]}
+    collection.insert_one(subset)
+    version = {"type": "version",
+               "name": 1,
+               "parent": subset["_id"],
+               "data": {"dependencies": [str(_id) for _id in dependencies]}}
+    collection.insert_one(version)
+    representation = {"type": "representation",
+                      "name": "mayaBinary",
+                      "parent": version["_id"],
+                      "data": {"reprRoot": root}}
+    collection.insert_one(representation)
+
+    package = TEMPLATE.format(root=root,
+                              project="Library",
+                              silo="assets",
+                              asset=asset_name,
+                              subset=subset_name,
+                              version=1,
+                              representation="mayaBinary")
+    os.makedirs(package)
+    with open(os.path.join(package, "model.mb"), "w") as file:
+        file.write(asset_name * 100)
+
+    return version["_id"], representation["_id"]
+
+
+@pytest.fixture
+def graber():
+    mongomock = pytest.importorskip("mongomock")
+    client = mongomock.MongoClient()
+    this = client.db["Library"]
+    that = client.db["NewShow"]
+
+    root = tempfile.mkdtemp(prefix="test_asset_graber")
+    this_root = os.path.join(root, "library").replace("\\", "/")
+    that_root = os.path.join(root, "show").replace("\\", "/")
+
+    project = _project(this, "Library", this_root)
+    that_project = _project(that, "NewShow", that_root)
+    that.insert_one({"type": "asset",
+                     "name": "table",
+                     "silo": "assets",
+                     "parent": that_project,
+                     "data": {}})
+
+    io_patch = mock.patch.multiple(utils.io,
+                                   find=this.find,
+                                   find_one=this.find_one,
+                                   ObjectId=ObjectId,
+                                   create=True)
+    with io_patch:
+        graber = utils.AssetGraber("NewShow", workers=2)
+        graber._collection = that
+        graber._connected = True
+        graber.that_project = that.find_one({"type": "project"})
+        graber.root = root
+        graber.publish = lambda *args, **kwargs: _publish(
+            this, this_root, project, *args, **kwargs)
+        yield graber
+
+    shutil.rmtree(root)
+
+
+def test_grab_closure(graber):
+    graber.publish("env", "modelDefault")
+    env = utils.io.find_one({"type": "asset", "name": "env"})["_id"]
+    table, _ = graber.publish("table", "modelDefault")
+    chair, _ = graber.publish("chair", "modelDefault",
+                              dependencies=[table],
+                              visual_parent=str(env))
+    # Shared dependency and cyclic dependency
+    _, room = graber.publish("room", "setdressDefault",
+                             dependencies=[table, chair])
+    graber._collection.database["Library"].update_one(
+        {"_id": table}, {"$set": {"data.dependencies": [str(chair)]}})
+
+    report = graber.grab_many([room], dry_run=True)
+    assert report["missing"] == []
+    # 3 assets (env as visual parent, table exists by name)
+    # + 3 subsets + 3 versions + 3 representations
+    assert report["documents"] == 12
+    assert report["updates"] == 0  # New table subset is re-parented
+    assert report["packages"] == 3
+    assert report["files"] == 3
+    assert graber._collection.count_documents({}) == 2  # Nothing written
+
+    graber.grab_many([room])
+    that = graber._collection
+    assert that.count_documents({"type": "representation"}) == 3
+    assert that.count_documents({"type": "asset"}) == 4
+
+    table_asset = that.find_one({"type": "asset", "name": "table"})
+    table_subset = that.find_one({"type": "subset",
+                                  "parent": table_asset["_id"]})
+    assert table_subset is not None
+
+    copied = os.path.join(graber.root, "show", "NewShow", "assets", "table",
+                          "modelDefault", "v001", "mayaBinary", "model.mb")
+    assert os.path.isfile(copied)
+
+    # Existing representations are skipped
+    report = graber.grab_many([room], dry_run=True)
+    assert report["documents"] == 0
+    assert report["packages"] == 0
+
+    # Overwrite, files are not changed and will be skipped by transfer
+    report = graber.grab_many([room], overwrite=True)
+    assert report["documents"] == 0
+    assert report["packages"] == 3
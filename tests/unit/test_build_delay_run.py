@@ -0,0 +1,107 @@
+
+import datetime
+import collections
+
+from bson import ObjectId
+
+from reveries.common.build_delay_run import DelayRunBuilder, prune
+
+
+class _Node(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class _Context(object):
+    def __init__(self, data):
+        self.data = data
+
+
+class _Instance(list):
+    """Like pyblish instance, a list with attributes"""
+
+    def __init__(self, data, context):
+        super(_Instance, self).__init__(["|node"])
+        self.data = data
+        self.context = context
+
+
+Point = collections.namedtuple("Point", ["x", "y"])
+
+
+def test_prune():
+    nodes = ["|a", "|b"]
+    stamp = datetime.datetime(2020, 1, 1)
+    data = {
+        "name": "hero",
+        "nodes": nodes,
+        "frames": (1001, 1002),
+        "point": Point(1, 2),
+        "tags": {"a", "b"},
+        "id": ObjectId("5e8f0a1b2c3d4e5f6a7b8c9d"),
+        "time": stamp,
+        "node": _Node("a"),
+        "members": [_Node("b"), _Node("c")],
+        "nested": {
+            "node": _Node("d"),
+            "keep": {"matrix": [1.0, 0.0]},
+            "children": [{"name": "x", "node": _Node("e")}, "y"],
+            "deep": [[1, 2], [3, _Node("f")]],
+        },
+    }
+    data["nested"]["self"] = data
+
+    dropped = list()
+    copied = prune(data, dropped)
+
+    assert sorted(dropped) == sorted([
+        "node",
+        "members",
+        "nested.node",
+        "nested.self",
+        "nested.children[0].node",
+        "nested.deep",
+    ])
+    assert copied == {
+        "name": "hero",
+        "nodes": ["|a", "|b"],
+        "frames": (1001, 1002),
+        "point": Point(1, 2),
+        "tags": {"a", "b"},
+        "id": ObjectId("5e8f0a1b2c3d4e5f6a7b8c9d"),
+        "time": stamp,
+        "nested": {
+            "keep": {"matrix": [1.0, 0.0]},
+            "children": [{"name": "x"}, "y"],
+        },
+    }
+
+    # Mutable containers are copied, immutable values are shared
+    assert copied["nodes"] is not nodes
+    assert copied["frames"] is data["frames"]
+    assert copied["id"] is data["id"]
+    assert copied["nested"]["keep"] is not data["nested"]["keep"]
+
+
+def test_delay_run_builder():
+    context = _Context({"currentMaking": "/scene.ma",
+                        "plugins": [_Node("plugin")]})
+    instance = _Instance({"subset": "pointcacheHero",
+                          "outCache": ["|geo"],
+                          "_cache_nodes": ["|geo"],
+                          "parent": None},
+                         context)
+    instance.data["instance"] = instance
+    context.data["instances"] = [instance]
+
+    builder = DelayRunBuilder(instance)
+
+    assert builder.instance_data == {"subset": "pointcacheHero",
+                                     "outCache": ["|geo"],
+                                     "parent": None}
+    assert builder.context_data == {"currentMaking": "/scene.ma"}
+    assert builder.dropped_keys == {"instance": ["instance"],
+                                    "context": ["plugins", "instances"]}
+    assert builder.delete_data == ["instance", "instances", "plugins"]
+    # Source data untouched
+    assert "_cache_nodes" in instance.data
@@ -0,0 +1,234 @@
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from reveries import clipinfo
+
+Image = pytest.importorskip("PIL.Image")
+
+
+INFO = {
+    "project": "2020_Demo",
+    "task": "layout",
+    "subset": "playblastDefault",
+    "version": 3,
+    "representation_id": "5e1f8c0a9b7d2a0001a1b2c3",
+    "artist": "someone",
+    "date": "20200101T120000Z",
+    "shot_name": "sh0010",
+    "edit_in": 1001,
+    "edit_out": 1004,
+    "handles": 0,
+    "duration": 4,
+    "focal_length": 35.0,
+    "fps": 24.0,
+}
+
+RESOLUTION = (320, 180)
+
+
+def reference_overlay(image_path, output_path, frame_num, resolution,
+                      project, task, subset, version, representation_id,
+                      artist, date, shot_name, edit_in, edit_out, handles,
+                      duration, focal_length, fps):
+    """Single image renderer before `ClipInfoOverlay`, for comparison
+
+    Only text measuring is changed, `ImageDraw.textsize` has been removed
+    since Pillow 10.
+
+    """
+    from PIL import ImageDraw, ImageFont
+
+    width, height = resolution
+
+    _TOP = "{project}".format(project=project.split("_", 1)[-1])
+
+    _TOP_LEFT = """
+  Shot: {shot_name}  ver {version:0>3}
+ Frame: {frame_num:0>4}
+FocalL: {focal_length} mm
+"""[1:-1].format(frame_num=frame_num,
+                 shot_name=shot_name,
+                 version=version,
+                 focal_length=focal_length)
+
+    _TOP_RIGHT = """
+  Date: {date}
+Artist: {artist}
+  Task: {task}
+"""[1:-1].format(date=date, artist=artist, task=task)
+
+    _BTM = "{frame_num:0>4}".format(frame_num=frame_num)
+
+    _BTM_LEFT = """
+   Range: {edit_in:0>4} - {edit_out:0>4}
+Duration: {duration:0>4}
+ Handles: {handles}  FPS: {fps}
+"""[1:-1].format(edit_in=edit_in,
+                 edit_out=edit_out,
+                 duration=duration,
+                 handles=handles,
+                 fps=fps)
+
+    _BTM_RIGHT = """
+    Subset: {subset_name}
+      RPID: {representation_id}
+Resolution: {width}px * {height}px
+"""[1:-1].format(subset_name=subset,
+                 representation_id=representation_id,
+                 width=width,
+                 height=height)
+
+    spacing = int(width / 320)
+    titlesize = int(width / 48)
+    datasize = int(width / 96)
+    border = datasize
+
+    titlefont = ImageFont.truetype(clipinfo.FONT_FILE, size=titlesize)
+    datafont = ImageFont.truetype(clipinfo.FONT_FILE, size=datasize)
+
+    im = Image.new("RGBA", size=(width, height), color=(0, 0, 0, 255))
+    draw = ImageDraw.Draw(im)
+
+    def textsize(text, title=False):
+        font = titlefont if title else datafont
+        box = draw.multiline_textbbox((0, 0), text, font=font,
+                                      spacing=spacing)
+        return box[2], box[3]
+
+    def puttext(text, pos, title=False):
+        font = titlefont if title else datafont
+        align = "center" if title else "left"
+        draw.text(pos, text, fill=(200, 200, 200, 255),
+                  font=font, align=align, spacing=spacing)
+
+    size_top = textsize(_TOP, title=True)
+    pos_top = ((width - size_top[0]) / 2, border)
+    puttext(_TOP, pos_top, title=True)
+
+    size_btm = textsize(_BTM, title=True)
+    pos_btm = ((width - size_btm[0]) / 2, height - border - size_btm[1])
+
+    size_top_left = textsize(_TOP_LEFT)
+    pos_top_left = (border, border)
+    puttext(_TOP_LEFT, pos_top_left)
+
+    size_top_right = textsize(_TOP_RIGHT)
+    pos_top_right = (width - size_top_right[0] - border, border)
+    puttext(_TOP_RIGHT, pos_top_right)
+
+    size_btm_left = textsize(_BTM_LEFT)
+    pos_btm_left = (border, height - size_btm_left[1] - border)
+    puttext(_BTM_LEFT, pos_btm_left)
+
+    size_btm_right = textsize(_BTM_RIGHT)
+    pos_btm_right = (width - size_btm_right[0] - border,
+                     height - size_btm_right[1] - border)
+    puttext(_BTM_RIGHT, pos_btm_right)
+
+    retract = (max(pos_top[1] + size_top[1],
+                   pos_top_left[1] + size_top_left[1],
+                   pos_top_right[1] + size_top_right[1]) +
+               max(height - pos_btm[1] + size_btm[1],
+                   height - pos_btm_left[1] + size_btm_left[1],
+                   height - pos_btm_right[1] + size_btm_right[1]))
+
+    scale = float(height) / (height + retract)
+    scaled_w = int(width * scale) - border
+    scaled_h = int(height * scale) - border
+    box = (int((width - scaled_w) / 2), int((height - scaled_h) / 2))
+
+    src = Image.open(image_path)
+    src.load()
+
+    background = Image.new("RGB", src.size, (255, 255, 255))
+    background.paste(src)
+    background.paste(src, mask=src.split()[3])
+    im.paste(background.resize((scaled_w, scaled_h),
+                               resample=Image.BICUBIC),
+             box=box)
+
+    im.save(output_path)
+
+
+class TestClipInfo(object):
+
+    def setup_method(self):
+        self.root = tempfile.mkdtemp()
+        self.frames = list()
+        for i, frame in enumerate(range(1001, 1005)):
+            path = os.path.join(self.root, "img.%04d.png" % frame)
+            color = (40 * i, 80, 160, 255)
+            Image.new("RGBA", RESOLUTION, color).save(path)
+            self.frames.append((path, path, frame))
+
+    def teardown_method(self):
+        shutil.rmtree(self.root)
+
+    def test_render_sequence(self):
+        report = clipinfo.render_sequence(self.frames,
+                                          INFO,
+                                          RESOLUTION,
+                                          workers=2)
+
+        assert report["frames"] == 4
+        assert report["failed"] == {}
+
+        images = [Image.open(path).convert("RGB") for path, _, _ in
+                  self.frames]
+        assert all(image.size == RESOLUTION for image in images)
+
+        # Static clipinfo (top right) is the same on every frame, while
+        # frame number (top left) and source image are not.
+        overlay = clipinfo.ClipInfoOverlay(INFO, RESOLUTION)
+        top_right = (RESOLUTION[0] // 2, 0, RESOLUTION[0], overlay.box[1])
+        top_left = (0, 0, RESOLUTION[0] // 2, overlay.box[1])
+        first, second = images[0], images[1]
+        assert (first.crop(top_right).tobytes() ==
+                second.crop(top_right).tobytes())
+        assert (first.crop(top_left).tobytes() !=
+                second.crop(top_left).tobytes())
+
+        center = (RESOLUTION[0] // 2, RESOLUTION[1] // 2)
+        assert first.getpixel(center) != second.getpixel(center)
+
+    def test_same_as_single_image(self):
+        from reveries import utils
+
+        path, _, frame = self.frames[0]
+        single = os.path.join(self.root, "single.png")
+        utils.overlay_clipinfo_on_image(path,
+                                        single,
+                                        frame_num=frame,
+                                        resolution=RESOLUTION,
+                                        **INFO)
+        reference = os.path.join(self.root, "reference.png")
+        reference_overlay(path, reference, frame, RESOLUTION, **INFO)
+
+        assert (Image.open(single).tobytes() ==
+                Image.open(reference).tobytes())
+
+        clipinfo.render_sequence(self.frames[:1], INFO, RESOLUTION)
+
+        assert (Image.open(path).tobytes() ==
+                Image.open(reference).tobytes())
+
+    def test_job(self):
+        job = os.path.join(self.root, "job.json")
+        clipinfo.write_job(job, self.frames, INFO)
+
+        done = list()
+        report = clipinfo.run_job(job,
+                                  workers=1,
+                                  callback=lambda *args: done.append(args))
+
+        assert report["frames"] == 4
+        assert len(done) == 4
+
+        info = dict(INFO)
+        info.pop("fps")
+        with pytest.raises(KeyError):
+            clipinfo.write_job(job, self.frames, info)
@@ -0,0 +1,271 @@
+
+import os
+import sys
+import json
+import time
+import runpy
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+
+
+PLUGIN = os.path.join(os.path.dirname(__file__),
+                      "..", "..", "plugins", "global", "publish",
+                      "publish_deadline_submitter.py")
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Stand-in Deadline web service, reply job ID in JSON"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+
+        time.sleep(0.05)
+
+        if "bad" in payload["JobInfo"]["Name"]:
+            with server.lock:
+                server.active -= 1
+            body = "Error: bad job"
+            self.send_response(500)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+            return
+
+        with server.lock:
+            server.active -= 1
+            deps = payload["JobInfo"].get("JobDependencies") or ""
+            for dep in deps.split(","):
+                # Dependency must be submitted before
+                assert not dep or dep in server.issued, dep
+            jobid = "job%03d" % len(server.issued)
+            server.issued.append(jobid)
+            server.payloads[jobid] = payload
+            server.connections.add(self.client_address)
+
+        body = json.dumps({"_id": jobid, "Props": {"Ex0": True}})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+# Stub deadlinecommand, echo one job ID for each job info file
+STUB = """#!{python}
+import sys
+args = sys.argv[1:]
+infos = [arg for arg in args if arg.endswith(".job")][::2]
+with open(infos[0] + ".calls", "w") as log:
+    log.write(" ".join(args))
+for i, _ in enumerate(infos):
+    print("Submitting to Repository...")
+    print("Result=Success")
+    print("JobID=cmd%d" % i)
+"""
+
+
+def _payload(name, deps=None):
+    job_info = {"Name": name}
+    if deps:
+        job_info["JobDependencies"] = ",".join(deps)
+    return {"JobInfo": job_info, "PluginInfo": {}, "AuxFiles": []}
+
+
+@pytest.fixture
+def module(monkeypatch):
+    import avalon.api
+
+    monkeypatch.setenv("AVALON_DEADLINE_AUTH", "user:pass")
+    monkeypatch.setenv("PYBLISH_FILESYS_EXECUTABLE", "python")
+    monkeypatch.setenv("PYBLISH_FILESYS_SCRIPT", "filesys_publish.py")
+    monkeypatch.setattr(avalon.api, "Session", dict(), raising=False)
+    return runpy.run_path(PLUGIN)
+
+
+class _Context(object):
+    def __init__(self, **data):
+        self.data = data
+
+
+def _add_graph(submitter):
+    """Render layers depend on caches, publish jobs depend on renders"""
+    cache = submitter.add_job(_payload("cache"))
+    renders = [submitter.add_job(_payload("render%d" % i, [cache]))
+               for i in range(6)]
+    publish = submitter.add_job(_payload("publish", renders))
+    return cache, renders, publish
+
+
+def test_resolve_batches(module):
+    resolve = module["resolve_batches"]
+    jobs = {
+        "0": _payload("a"),
+        "1": _payload("b", ["0"]),
+        "2": _payload("c", ["0", "1"]),
+        "3": _payload("d"),
+        "10": _payload("e", ["3"]),
+    }
+    assert resolve(jobs) == [["0", "3"], ["1", "10"], ["2"]]
+    assert resolve({"1": jobs["1"]}, submitted={"0": "x"}) == [["1"]]
+
+    with pytest.raises(KeyError):
+        resolve({"1": jobs["1"]})
+
+    with pytest.raises(Exception):
+        resolve({"0": _payload("a", ["1"]), "1": _payload("b", ["0"])})
+
+
+def test_parse_job_id(module):
+    parse = module["parse_job_id"]
+    assert parse('{"_id": "5e0f", "Props": {"Ex0": true}}') == "5e0f"
+    assert parse("{'_id': u'5e0f'}") == "5e0f"
+    with pytest.raises(ValueError):
+        parse("__import__('os').getcwd()")
+    with pytest.raises(ValueError):
+        parse("Error: no permission")
+
+
+def test_parse_command_output(module):
+    parse = module["parse_command_output"]
+    output = "\n".join([
+        "Submitting to Repository...",
+        "Result=Success",
+        "JobID=a",
+        "Submitting to Repository...",
+        "Result=Failed",
+        "Submitting to Repository...",
+        "Result=Success",
+        "JobID=c",
+    ])
+    assert parse(output, 3) == ["a", None, "c"]
+    # Command stopped early
+    assert parse(output, 4) == ["a", None, "c", None]
+    assert parse("", 1) == [None]
+
+
+@pytest.fixture
+def server():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.active = server.peak = 0
+    server.issued = list()
+    server.payloads = dict()
+    server.connections = set()
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_submit_via_web_service(module, server, monkeypatch):
+    import avalon.api
+
+    monkeypatch.setitem(avalon.api.Session, "AVALON_DEADLINE",
+                        "http://127.0.0.1:%d" % server.server_address[1])
+    submitter = module["DeadlineSubmitter"](_Context())
+    cache, renders, publish = _add_graph(submitter)
+    submitter.submit()
+
+    assert len(server.issued) == 8
+    assert server.peak > 1  # Render jobs were posted concurrently
+
+    # Pooled session reuses connections
+    assert len(server.connections) <= 6
+
+    publish_id = submitter._submitted[publish]
+    render_ids = [submitter._submitted[index] for index in renders]
+    deps = server.payloads[publish_id]["JobInfo"]["JobDependencies"]
+    assert sorted(deps.split(",")) == sorted(render_ids)
+    assert (server.payloads[render_ids[0]]["JobInfo"]["JobDependencies"] ==
+            submitter._submitted[cache])
+
+
+def test_submit_partially_failed(module, server, monkeypatch):
+    import avalon.api
+
+    monkeypatch.setitem(avalon.api.Session, "AVALON_DEADLINE",
+                        "http://127.0.0.1:%d" % server.server_address[1])
+    submitter = module["DeadlineSubmitter"](_Context())
+    good = [submitter.add_job(_payload("render%d" % i)) for i in range(3)]
+    bad = submitter.add_job(_payload("bad"))
+
+    with pytest.raises(Exception):
+        submitter.submit()
+
+    # Submitted jobs are recorded
+    assert sorted(submitter._submitted) == sorted(good)
+    assert sorted(submitter._submitted.values()) == sorted(server.issued)
+    assert bad not in submitter._submitted
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Shebang stub")
+def test_submit_via_command(module, monkeypatch):
+    import avalon.api
+
+    root = tempfile.mkdtemp(prefix="test_deadline")
+    stage_dirs = list()
+    try:
+        stub = os.path.join(root, "deadlinecommand")
+        with open(stub, "w") as file:
+            file.write(STUB.format(python=sys.executable))
+        os.chmod(stub, 0o755)
+
+        monkeypatch.setitem(avalon.api.Session, "AVALON_DEADLINE_APP", stub)
+        submitter = module["DeadlineSubmitter"](
+            _Context(USE_DEADLINE_APP=True))
+        cache, renders, publish = _add_graph(submitter)
+
+        stage_dir = module["utils"].stage_dir
+
+        def _stage_dir(*args, **kwargs):
+            path = stage_dir(*args, **kwargs)
+            stage_dirs.append(path)
+            return path
+
+        monkeypatch.setattr(module["utils"], "stage_dir", _stage_dir)
+        submitter.submit()
+
+        # One call for each batch
+        assert len(stage_dirs) == 3
+        with open(os.path.join(stage_dirs[1], "job_info_0.job.calls")) as f:
+            args = f.read().split()
+        assert args[0] == "-SubmitMultipleJobs"
+        assert args.count("-job") == 6
+
+        with open(os.path.join(stage_dirs[1], "job_info_0.job")) as f:
+            assert "JobDependencies=cmd0\n" in f.read()
+        assert submitter._submitted[publish] == "cmd0"
+
+    finally:
+        for path in stage_dirs + [root]:
+            shutil.rmtree(path, ignore_errors=True)
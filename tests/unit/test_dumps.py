@@ -0,0 +1,102 @@
+import os
+import gzip
+import json
+import runpy
+import shutil
+import tempfile
+
+import pytest
+import pyblish.api
+
+from reveries import dumps, PLUGINS_DIR
+
+
+def _load_plugin(module, name):
+    path = os.path.join(PLUGINS_DIR, "filesys", "publish", module + ".py")
+    return runpy.run_path(path)[name]
+
+
+def test_round_trip():
+    root = tempfile.mkdtemp(prefix="test_dumps")
+    try:
+        data = {"id": "abc", "repr.Alembic._stage": "/stage",
+                "nodes": ["|root|node%d" % i for i in range(1000)]}
+
+        plain = os.path.join(root, ".instance.json")
+        dumps.write(plain, data)
+        compact = dumps.dump_path(plain, compact=True)
+        dumps.write(compact, data)
+
+        assert compact == plain + ".gz"
+        assert dumps.read(plain) == data
+        assert dumps.read(compact) == data
+        assert os.path.getsize(compact) < os.path.getsize(plain)
+
+        os.remove(plain)
+        assert dumps.find(plain) == compact
+
+        with open(plain, "w") as file:
+            json.dump(data, file)
+        assert dumps.find(compact) == compact
+    finally:
+        shutil.rmtree(root)
+
+
+def test_schema_version():
+    root = tempfile.mkdtemp(prefix="test_dumps")
+    try:
+        path = os.path.join(root, ".instance.json.gz")
+        with gzip.open(path, "wb") as file:
+            file.write(b'{"schema": "reveries:dump-9.0", "data": {}}')
+
+        with pytest.raises(dumps.DumpSchemaError):
+            dumps.read(path)
+    finally:
+        shutil.rmtree(root)
+
+
+def test_collect_instance_lazy():
+    Plugin = _load_plugin("collect_instance_from_dump",
+                          "CollectInstancesFromDump")
+    root = tempfile.mkdtemp(prefix="test_dumps")
+    try:
+        entries = list()
+        for name, children in [("A", ["B"]), ("B", []), ("C", [])]:
+            path = os.path.join(root, name, ".instance.json.gz")
+            os.makedirs(os.path.dirname(path))
+            entries.append({
+                "id": name,
+                "name": name,
+                "version": 1,
+                "childInstances": children,
+                "dump": path,
+            })
+            dumps.write(path, {"id": name,
+                               "contextDump": None,
+                               "repr.%s._stage" % name: "/stage"})
+
+        context_path = os.path.join(root, ".context.user.0.json.gz")
+        dumps.write(context_path, {"by": "user",
+                                   "date": "today",
+                                   "from": "scene.ma",
+                                   "comment": "",
+                                   "instances": entries})
+        for entry in entries:
+            data = dumps.read(entry["dump"])
+            data["contextDump"] = context_path
+            dumps.write(entry["dump"], data)
+
+        # Instance "C" is not needed, and should not be read
+        os.remove(entries[2]["dump"])
+
+        context = pyblish.api.Context()
+        context.data["_pyblishDumpFile"] = entries[0]["dump"]
+        Plugin().process(context)
+
+        names = sorted(instance.name for instance in context)
+        assert names == ["A", "B"]
+        instance = next(i for i in context if i.name == "A")
+        assert instance.data["repr.A._stage"] == "/stage"
+        assert [c.name for c in instance.data["childInstances"]] == ["B"]
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,131 @@
+import os
+import runpy
+import struct
+import shutil
+import tempfile
+
+import pytest
+import pyblish.api
+
+from reveries import PLUGINS_DIR
+from reveries.vendor import parse_exr_header as exrheader
+
+
+def _attr(name, attr_type, value):
+    return (name.encode() + b"\x00" + attr_type.encode() + b"\x00"
+            + struct.pack("<i", len(value)) + value)
+
+
+def make_exr(path, channels="RGBA", data_window=(0, 0, 1919, 1079),
+             compression=3, extra=b""):
+    chlist = b"".join(name.encode() + b"\x00" + struct.pack("<iB3xii", 1, 0,
+                                                            1, 1)
+                      for name in channels) + b"\x00"
+    header = (struct.pack("<iI", exrheader.EXR_MAGIC, 2)
+              + _attr("channels", "chlist", chlist)
+              + _attr("compression", "compression",
+                      struct.pack("<B", compression))
+              + _attr("dataWindow", "box2i", struct.pack("<4i", *data_window))
+              + _attr("displayWindow", "box2i",
+                      struct.pack("<4i", 0, 0, 1919, 1079))
+              + _attr("lineOrder", "lineOrder", b"\x00")
+              + _attr("pixelAspectRatio", "float", struct.pack("<f", 1.0))
+              + _attr("screenWindowCenter", "v2f", struct.pack("<2f", 0, 0))
+              + _attr("owner", "string", b"moonshine")
+              + extra
+              + b"\x00")
+    with open(path, "wb") as fp:
+        fp.write(header)
+        fp.write(b"\x00" * 1024)  # Offset table and pixels
+
+
+def test_read_header():
+    root = tempfile.mkdtemp(prefix="test_exr")
+    try:
+        path = os.path.join(root, "beauty.1001.exr")
+        make_exr(path, extra=_attr("custom", "unknownType", b"abc"))
+
+        metadata = exrheader.read_header(path)
+        assert sorted(metadata["channels"]) == ["A", "B", "G", "R"]
+        assert metadata["channels"]["R"]["pixel_type"] == 1
+        assert metadata["compression"] == "ZIP_COMPRESSION"
+        assert metadata["dataWindow"] == {"xMin": 0, "yMin": 0,
+                                          "xMax": 1919, "yMax": 1079}
+        assert metadata["lineOrder"] == "INCREASING_Y"
+        assert metadata["pixelAspectRatio"] == 1.0
+        assert metadata["screenWindowCenter"] == [0.0, 0.0]
+        assert metadata["owner"] == "moonshine"
+        assert metadata["custom"] == b"abc"
+
+        # Header larger than mapped region
+        assert exrheader.read_header(path, map_size=32) == metadata
+    finally:
+        shutil.rmtree(root)
+
+
+def test_summarize_sequence():
+    root = tempfile.mkdtemp(prefix="test_exr")
+    try:
+        paths = list()
+        for frame in range(1001, 1011):
+            path = os.path.join(root, "beauty.%04d.exr" % frame)
+            if frame == 1005:
+                make_exr(path, data_window=(10, 10, 100, 100))
+            elif frame == 1007:
+                make_exr(path, channels="RGB", compression=0)
+            else:
+                make_exr(path)
+            paths.append(path)
+
+        broken = os.path.join(root, "beauty.1011.exr")
+        with open(broken, "wb") as fp:
+            fp.write(b"not an exr")
+        paths.append(broken)
+
+        summary = exrheader.summarize_sequence(paths, workers=4)
+        assert summary["first"] == paths[0]
+        assert summary["count"] == 11
+        assert summary["header"]["channels"] == ["A", "B", "G", "R"]
+        assert summary["differ"] == {
+            paths[4]: ["dataWindow"],
+            paths[6]: ["channels", "compression"],
+        }
+        assert summary["failed"] == [broken]
+    finally:
+        shutil.rmtree(root)
+
+
+def test_validate_render_exr_headers():
+    path = os.path.join(PLUGINS_DIR, "filesys", "publish",
+                        "validate_render_exr_headers.py")
+    Plugin = runpy.run_path(path)["ValidateRenderEXRHeaders"]
+
+    root = tempfile.mkdtemp(prefix="test_exr")
+    try:
+        for frame in range(1001, 1006):
+            path = os.path.join(root, "beauty.%04d.exr" % frame)
+            if frame == 1002:
+                make_exr(path, data_window=(10, 10, 100, 100))
+            elif frame == 1004:
+                open(path, "wb").close()  # Zero-byte, reported elsewhere
+            else:
+                make_exr(path)
+
+        instance = pyblish.api.Context().create_instance("beauty")
+        instance.data.update({
+            "stagingDir": root,
+            "isStereo": False,
+            "sequences": {"beauty": {"fpattern": "beauty.%04d.exr",
+                                     "start": 1001,
+                                     "end": 1005,
+                                     "frameRanges": [[1001, 1005]],
+                                     "emptyFrames": [1004]}},
+        })
+        # Data window differs, warning only
+        Plugin().process(instance)
+
+        make_exr(os.path.join(root, "beauty.1005.exr"), channels="RGB")
+        with pytest.raises(Exception):
+            Plugin().process(instance)
+    finally:
+        shutil.rmtree(root)
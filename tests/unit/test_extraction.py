@@ -0,0 +1,122 @@
+import os
+import time
+import shutil
+import tempfile
+
+import pytest
+
+from reveries import extraction
+
+
+def test_dependencies():
+    extractors = [
+        ("Alembic", {}),
+        ("GPUCache", {}),
+        ("USD", {"order": 10}),
+        ("FBXCache", {"dependsOn": ["Alembic"]}),
+    ]
+    graph = extraction.dependencies(extractors)
+
+    assert graph["Alembic"] == []
+    assert graph["GPUCache"] == []
+    assert graph["USD"] == ["Alembic", "FBXCache", "GPUCache"]
+    assert graph["FBXCache"] == ["Alembic"]
+
+    graph = extraction.dependencies(extractors[1:], done=["Alembic"])
+    assert graph["FBXCache"] == []
+
+    with pytest.raises(ValueError):
+        extraction.dependencies(extractors[1:])
+
+
+def test_runner_inline():
+    ran = list()
+    finished = dict()
+
+    def execute(name):
+        ran.append(name)
+        if name == "b":
+            raise RuntimeError("Boom")
+
+    runner = extraction.ExtractionRunner(
+        execute,
+        on_finish=lambda name, result: finished.update({name: result}))
+    results = runner.run({"a": [], "b": ["a"], "c": ["b"], "d": ["a"]},
+                         done=["a"])
+
+    assert "a" not in ran
+    assert sorted(ran) == ["b", "d"]
+    assert results["b"]["status"] == extraction.FAILED
+    assert "Boom" in results["b"]["error"]
+    assert results["c"]["status"] == extraction.BLOCKED
+    assert results["d"]["status"] == extraction.DONE
+    assert finished == results
+
+    with pytest.raises(ValueError):
+        runner.run({"a": ["b"], "b": ["a"]})
+
+
+def _sleep_and_touch(path):
+    with open(path + ".start", "w") as fp:
+        fp.write(repr(time.time()))
+    time.sleep(0.5)
+    with open(path + ".end", "w") as fp:
+        fp.write(repr(time.time()))
+
+
+def _read_time(path):
+    with open(path, "r") as fp:
+        return float(fp.read())
+
+
+def test_runner_pool():
+    root = tempfile.mkdtemp(prefix="test_extraction")
+    try:
+        a, b, c = [os.path.join(root, name) for name in "abc"]
+        runner = extraction.ExtractionRunner(_sleep_and_touch, workers=2)
+        results = runner.run({a: [], b: [], c: [a]})
+
+        assert all(r["status"] == extraction.DONE for r in results.values())
+        # Independent jobs overlapped, dependent job started after
+        assert _read_time(b + ".start") < _read_time(a + ".end")
+        assert _read_time(c + ".start") >= _read_time(a + ".end")
+    finally:
+        shutil.rmtree(root)
+
+
+def _exit_on_crash(name):
+    if name == "crash":
+        os._exit(1)
+
+
+def test_runner_pool_worker_failed():
+    # Job can not be sent to worker, `execute` is not picklable
+    runner = extraction.ExtractionRunner(lambda name: None, workers=2)
+    results = runner.run({"a": [], "b": [], "c": ["a"]})
+
+    assert results["a"]["status"] == extraction.FAILED
+    assert results["b"]["status"] == extraction.FAILED
+    assert results["c"]["status"] == extraction.BLOCKED
+
+    # Worker process died, job never returns
+    runner = extraction.ExtractionRunner(_exit_on_crash,
+                                         workers=2,
+                                         timeout=2)
+    results = runner.run({"crash": [], "ok": [], "after": ["crash"]})
+
+    assert results["crash"]["status"] == extraction.FAILED
+    assert results["ok"]["status"] == extraction.DONE
+    assert results["after"]["status"] == extraction.BLOCKED
+
+
+def test_update_dump():
+    root = tempfile.mkdtemp(prefix="test_extraction")
+    try:
+        path = os.path.join(root, ".extractor.json")
+        extraction.save_dump(path, {"class": "Foo", "status": "pending"})
+        extraction.update_dump(path, status=extraction.DONE, seconds=1.5)
+
+        data = extraction.load_dump(path)
+        assert data == {"class": "Foo", "status": "done", "seconds": 1.5}
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,100 @@
+import os
+import time
+import shutil
+import tempfile
+
+from reveries import integration
+
+
+def test_spool_merge():
+    root = tempfile.mkdtemp(prefix="test_integration")
+    try:
+        spool = integration.Spool(root)
+        assert not spool.alive()
+        spool.heartbeat()
+        assert spool.alive()
+
+        environ = {"AVALON_PROJECT": "Foo", "PATH": "/bin"}
+        spool.enqueue("/a/.instance.json", ["f.1.exr", "f.2.exr"], 2,
+                      jobid="job", environ=environ)
+        spool.enqueue("/a/.instance.json", ["f.2.exr", "f.3.exr"], 1,
+                      jobid="job", environ=environ)
+        spool.enqueue("/b/.instance.json", environ=environ)
+
+        claimed = spool.claim(spool.pending())
+        assert len(claimed) == 3
+        assert spool.pending() == []
+
+        batches = integration.merge(claimed)
+        assert len(batches) == 2
+
+        progressive, whole = batches
+        assert progressive["update"] == ["f.1.exr", "f.2.exr", "f.3.exr"]
+        # Second request re-rendered "f.2.exr", not counted
+        assert progressive["progress"] == 2
+        assert progressive["steps"] == [[["f.1.exr", "f.2.exr"], 2],
+                                        [["f.2.exr", "f.3.exr"], 0]]
+        assert progressive["environ"] == {"AVALON_PROJECT": "Foo"}
+        assert len(progressive["paths"]) == 2
+        assert whole["update"] is None
+
+        now = progressive["time"]
+        ready = integration.ready_batches(batches, delay=30, now=now)
+        assert ready == [whole]
+        ready = integration.ready_batches(batches, delay=30, now=now + 30)
+        assert ready == batches
+
+        # Flush on job finished
+        spool.enqueue("/a/.instance.json", [], flush=True, environ=environ)
+        claimed += spool.claim(spool.pending())
+        batches = integration.merge(claimed)
+        ready = integration.ready_batches(batches, delay=30, now=now)
+        assert len(ready) == 2
+        assert ready[0]["flush"]
+        assert len(ready[0]["update"]) == 3
+
+        spool.done(ready[0]["paths"])
+        spool.fail(ready[1]["paths"], "Boom")
+        assert os.listdir(spool.working) == []
+        assert len(os.listdir(spool.failed)) == 2  # Request and log
+    finally:
+        shutil.rmtree(root)
+
+
+def test_spool_recover():
+    root = tempfile.mkdtemp(prefix="test_integration")
+    try:
+        spool = integration.Spool(root)
+        spool.enqueue("/a/.instance.json", ["f.1.exr"], 1)
+        spool.claim(spool.pending())
+        assert spool.pending() == []
+
+        spool.recover()
+        assert len(spool.pending()) == 1
+        assert not spool.alive()
+
+        spool.heartbeat()
+        old = time.time() - integration.HEARTBEAT_TIMEOUT - 1
+        os.utime(spool.heartbeat_file, (old, old))
+        assert not spool.alive()
+    finally:
+        shutil.rmtree(root)
+
+
+def test_merge_steps():
+    requests = [
+        ("1.json", {"dump": "/a/.instance.json", "update": ["f.1.exr"],
+                    "progress": 1, "jobid": "job", "flush": False,
+                    "environ": {}, "time": 1.0}),
+        ("2.json", {"dump": "/a/.instance.json", "update": ["f.2.exr"],
+                    "progress": 1, "jobid": "job", "flush": False,
+                    "environ": {}, "time": 2.0}),
+        ("3.json", {"dump": "/a/.instance.json", "update": [],
+                    "progress": -1, "jobid": "job", "flush": True,
+                    "environ": {}, "time": 3.0}),
+    ]
+    batch, = integration.merge(requests)
+    assert batch["progress"] == 2
+    # Flush request has no frame count
+    assert batch["steps"] == [[["f.1.exr"], 1], [["f.2.exr"], 1]]
+    assert batch["paths"] == ["1.json", "2.json", "3.json"]
@@ -0,0 +1,163 @@
+import pytest
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from bson import ObjectId
+
+import reveries.lib
+
+
+@pytest.fixture
+def project_collection():
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient().db["TestProject"]
+
+    with mock.patch.dict("avalon.api.Session",
+                         {"AVALON_PROJECT": "TestProject"}):
+        with mock.patch("reveries.lib._aggregate",
+                        side_effect=collection.aggregate):
+            reveries.lib.version_resolver.clear()
+            yield collection
+
+
+def _insert_subset(collection, version_count):
+    subset = collection.insert_one({"type": "subset"}).inserted_id
+    representations = list()
+    for name in range(1, version_count + 1):
+        version = collection.insert_one({"type": "version",
+                                         "name": name,
+                                         "parent": subset}).inserted_id
+        representation = {"type": "representation", "parent": version}
+        representations.append(
+            collection.insert_one(representation).inserted_id)
+
+    return representations
+
+
+def test_version_resolver(project_collection):
+    reprs_a = _insert_subset(project_collection, 3)
+    reprs_b = _insert_subset(project_collection, 1)
+    missing = ObjectId()
+
+    resolver = reveries.lib.VersionResolver(ttl=60)
+    resolved = resolver.resolve(reprs_a + reprs_b + [missing])
+
+    assert [resolved[_id]["version"] for _id in reprs_a] == [1, 2, 3]
+    assert all(resolved[_id]["latest"] == 3 for _id in reprs_a)
+    assert resolved[reprs_b[0]]["latest"] == 1
+    assert resolved[missing] is None
+
+    # All resolved in one query
+    assert reveries.lib._aggregate.call_count == 1
+
+    # Cached
+    resolver.resolve(reprs_a)
+    assert reveries.lib._aggregate.call_count == 1
+
+    # Expired
+    resolver.ttl = 0
+    resolver.resolve(reprs_a)
+    assert reveries.lib._aggregate.call_count == 2
+
+
+@mock.patch("avalon.api.registered_host")
+def test_any_outdated(registered_host, project_collection):
+    reprs_a = _insert_subset(project_collection, 2)
+
+    def containers(representations):
+        return [{"objectName": "container%d" % i,
+                 "representation": str(_id)}
+                for i, _id in enumerate(representations)]
+
+    registered_host.return_value.ls.return_value = containers(reprs_a[1:])
+    assert not reveries.lib.any_outdated()
+
+    registered_host.return_value.ls.return_value = containers(reprs_a)
+    assert reveries.lib.any_outdated()
+
+    outdated, missing = reveries.lib.ls_outdated(containers(reprs_a))
+    assert list(outdated) == [reprs_a[0]]
+    assert not missing
+
+    assert not reveries.lib.is_latest({"_id": reprs_a[0]})
+    assert reveries.lib.is_latest({"_id": reprs_a[1]})
+
+
+@pytest.fixture
+def representation_cache(project_collection):
+    with mock.patch("avalon.io.find",
+                    side_effect=project_collection.find,
+                    create=True), \
+            mock.patch("avalon.io.find_one",
+                       side_effect=project_collection.find_one,
+                       create=True):
+        yield reveries.lib.RepresentationCache(maxsize=4, batch=2)
+
+
+def test_representation_cache(project_collection, representation_cache):
+    cache = representation_cache
+    representations = _insert_subset(project_collection, 5)
+
+    # Fetched in batches of `$in` query
+    assert cache.prefetch(representations[:3]) == 3
+    assert reveries.lib.avalon.io.find.call_count == 2
+    assert cache.prefetch(representations[:3]) == 0
+    assert reveries.lib.avalon.io.find.call_count == 2
+
+    assert cache.get(str(representations[0]))["_id"] == representations[0]
+    assert cache.get(representations[1])["_id"] == representations[1]
+    assert reveries.lib.avalon.io.find_one.call_count == 0
+
+    # Least recently used is dropped
+    cache.prefetch(representations[3:])
+    assert str(representations[2]) not in cache._documents
+    assert str(representations[0]) in cache._documents
+    cache.get(representations[2])
+    assert reveries.lib.avalon.io.find_one.call_count == 1
+
+    with pytest.raises(RuntimeError):
+        cache.get(ObjectId())
+
+    # Cleared on project change
+    with mock.patch.dict("avalon.api.Session",
+                         {"AVALON_PROJECT": "OtherProject"}):
+        cache.get(representations[0])
+    assert reveries.lib.avalon.io.find_one.call_count == 3
+
+
+@mock.patch("avalon.api.loaders_from_representation", create=True)
+@mock.patch("avalon.api.discover")
+def test_representation_cache_loaders(discover,
+                                      loaders_from_representation,
+                                      project_collection,
+                                      representation_cache):
+    cache = representation_cache
+    representations = _insert_subset(project_collection, 3)
+
+    class ModelLoader(object):
+        pass
+
+    class RigLoader(object):
+        pass
+
+    discover.return_value = [ModelLoader, RigLoader]
+    loaders_from_representation.side_effect = lambda loaders, doc: loaders
+
+    for _id in representations:
+        assert cache.loader("RigLoader", _id) is RigLoader
+        assert cache.loader("ModelLoader", _id) is ModelLoader
+    assert cache.loader("RigLoader", representations[2]) is RigLoader
+
+    # Discovered once
+    assert discover.call_count == 1
+    assert loaders_from_representation.call_count == 6
+
+    with pytest.raises(RuntimeError):
+        cache.loader("LookLoader", representations[0])
+
+    cache.clear()
+    cache.loader("RigLoader", representations[0])
+    assert discover.call_count == 2
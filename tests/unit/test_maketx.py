@@ -0,0 +1,93 @@
+import os
+import sys
+import shutil
+import tempfile
+
+from reveries import maketx, utils
+
+
+# Stub converter, copy source into .tx and record the call
+STUB = """
+import sys
+src, dst, colorspace = sys.argv[1:4]
+if "bad" in src:
+    sys.exit("Unreadable image")
+with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+    fdst.write(fsrc.read() + colorspace.encode())
+with open(src + ".calls", "a") as log:
+    log.write("1")
+"""
+
+
+def _calls(src):
+    path = src + ".calls"
+    if not os.path.isfile(path):
+        return 0
+    with open(path) as file:
+        return len(file.read())
+
+
+def test_convert_sequence():
+    root = tempfile.mkdtemp(prefix="test_maketx")
+    try:
+        stub = os.path.join(root, "stub.py")
+        with open(stub, "w") as file:
+            file.write(STUB)
+
+        fnames = ["diffuse.1001.tif", "diffuse.1002.tif", "diffuse.1011.tif"]
+        for fname in fnames + ["bad.tif"]:
+            with open(os.path.join(root, fname), "wb") as file:
+                file.write(fname.encode())
+
+        file_data = [
+            {"node": "file1", "dir": root, "fnames": fnames,
+             "colorSpace": "Raw"},
+            {"node": "file2", "dir": root, "fnames": ["missing.tif"],
+             "colorSpace": "sRGB"},
+            {"node": "file3", "dir": root, "fnames": ["bad.tif"],
+             "colorSpace": "sRGB"},
+        ]
+        jobs = maketx.jobs_from_file_data(file_data, ignore=["file3"])
+        assert len(jobs) == 3  # Missing and ignored are skipped
+
+        converter = maketx.TxConverter(
+            command=[sys.executable, stub, "{src}", "{dst}", "{colorspace}"],
+            workers=2,
+            index=maketx.FreshnessIndex(os.path.join(root, "index.json")),
+            hasher=utils.AssetHasher(cache=utils.HashCache()),
+        )
+
+        results = converter.convert(jobs)
+        assert not any(r["skipped"] or r["error"] for r in results.values())
+
+        src = os.path.join(root, fnames[0])
+        tx = maketx.to_tx(src)
+        with open(tx, "rb") as file:
+            assert file.read() == fnames[0].encode() + b"linear"
+        assert int(os.path.getmtime(tx)) == int(os.path.getmtime(src))
+
+        # Up to date
+        results = converter.convert(jobs)
+        assert all(r["skipped"] for r in results.values())
+        assert _calls(src) == 1
+
+        # No index on this machine, fall back to modification time
+        index = maketx.FreshnessIndex(os.path.join(root, "other.json"))
+        assert index.is_fresh(tx, "c4id", "linear", src)
+        assert index.is_fresh(tx, "c4id", "linear")  # Seeded
+        os.utime(tx, (0, 0))
+        assert not maketx.FreshnessIndex().is_fresh(tx, "c4id", "linear", src)
+
+        # Colorspace changed
+        jobs[tx] = (src, "sRGB")
+        results = converter.convert(jobs)
+        assert not results[tx]["skipped"]
+        assert _calls(src) == 2
+
+        # Failed conversion
+        results = converter.convert(maketx.jobs_from_file_data(file_data))
+        bad = maketx.to_tx(os.path.join(root, "bad.tif"))
+        assert "Unreadable image" in results[bad]["error"]
+
+    finally:
+        shutil.rmtree(root)
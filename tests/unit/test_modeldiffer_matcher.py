@@ -0,0 +1,77 @@
+import os
+import runpy
+
+from reveries import PACKAGE_DIR
+
+
+# Load from file, `reveries.tools.modeldiffer` package requires Qt
+matcher = runpy.run_path(os.path.join(PACKAGE_DIR,
+                                      "tools",
+                                      "modeldiffer",
+                                      "matcher.py"))
+
+
+def _data(id, long_name):
+    return {"avalonId": id,
+            "longName": long_name,
+            "shortName": long_name.rsplit("|", 1)[-1]}
+
+
+def test_suffix_trie_first():
+    trie = matcher["SuffixTrie"]()
+    trie.add("|root|grp|mesh", 0)
+    trie.add("|other|mesh", 1)
+    trie.add("|mesh", 2)
+
+    # Entries which path ends with given path
+    assert trie.first("|grp|mesh", set()) == 0
+    assert trie.first("|mesh", set()) == 0
+    assert trie.first("|mesh", {0}) == 1
+    # Entries which path is the tail of given path
+    assert trie.first("|foo|bar|mesh", {0, 1}) == 2
+    # Component-wise, "|grp|mesh" does not end with "|rp|mesh"
+    assert trie.first("|rp|mesh", {2}) is None
+
+
+def test_match_passes():
+    items = [
+        ("A", "|asset|body", "body"),
+        ("B", "|asset|arm", "arm"),
+        ("", "|asset|leg", "leg"),
+        ("", "|asset|hand", "finger"),
+        ("", "|asset|eye", "eye"),
+    ]
+    data_list = [
+        _data("A", "|asset|body"),
+        _data("B", "|rig|arm_old"),
+        _data("C", "|asset|leg"),
+        _data("D", "|x|finger"),
+        _data("E", "|x|tail"),
+    ]
+
+    matched, not_matched = matcher["match"](items, data_list)
+
+    MATCH_ID = matcher["MATCH_ID"]
+    MATCH_NAME = matcher["MATCH_NAME"]
+    assert sorted(matched) == [
+        (0, 0, MATCH_ID | MATCH_NAME),
+        (1, 1, MATCH_ID),
+        (2, 2, MATCH_NAME),
+        (3, 3, 0),
+    ]
+    assert not_matched == [4]
+
+
+def test_match_first_row_wins():
+    items = [("A", "|a|mesh", "mesh"),
+             ("A", "|b|mesh", "mesh")]
+    data_list = [_data("A", "|b|mesh"),
+                 _data("A", "|a|mesh"),
+                 _data("A", "|c|mesh")]
+
+    matched, not_matched = matcher["match"](items, data_list)
+
+    # Same as previous nested loop, first not matched row is taken
+    assert matched == [(0, 0, matcher["MATCH_ID"]),
+                       (1, 1, matcher["MATCH_ID"])]
+    assert not_matched == [2]
@@ -0,0 +1,285 @@
+
+import os
+import stat
+import shutil
+import tempfile
+
+import pytest
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from bson import ObjectId
+
+from avalon import io, api
+from reveries.common.publish import (
+    engine,
+    publish_instance,
+    publish_subset,
+    publish_version,
+    publish_representation,
+)
+
+
+TEMPLATE = ("{root}/{project}/{silo}/{asset}/publish/"
+            "{subset}/v{version:0>3}/{representation}")
+
+
+@pytest.fixture
+def project():
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient().db["TestProject"]
+
+    root = tempfile.mkdtemp(prefix="test_publish_engine")
+    stage = os.path.join(root, "stage")
+    os.makedirs(stage)
+
+    project_id = collection.insert_one({
+        "type": "project",
+        "name": "TestProject",
+        "config": {"template": {"publish": TEMPLATE}},
+    }).inserted_id
+    for name in ("BoxA", "BoxB"):
+        collection.insert_one({"type": "asset",
+                               "name": name,
+                               "silo": "Set",
+                               "parent": project_id,
+                               "data": {}})
+
+    calls = {"find_one": 0, "insert_many": 0, "insert_one": 0}
+
+    def counted(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    session = {"AVALON_PROJECT": "TestProject",
+               "AVALON_LOCATION": "http://127.0.0.1",
+               "AVALON_WORKDIR": "/work",
+               "AVALON_TASK": "setdress"}
+
+    io_patch = mock.patch.multiple(
+        io,
+        find=collection.find,
+        find_one=counted("find_one", collection.find_one),
+        insert_one=counted("insert_one", collection.insert_one),
+        insert_many=counted("insert_many", collection.insert_many),
+        update_many=collection.update_many,
+        ObjectId=ObjectId,
+        create=True,
+    )
+    api_patch = mock.patch.multiple(api,
+                                    Session=session,
+                                    registered_root=lambda: root,
+                                    time=lambda: "20201018T000000Z",
+                                    create=True)
+    with io_patch, api_patch:
+        engine.parenthood.clear()
+        yield collection, root, stage, calls
+
+    shutil.rmtree(root)
+
+
+def _stage_files(stage, name):
+    stage_dir = os.path.join(stage, name)
+    os.makedirs(stage_dir)
+    files = list()
+    for file_name in ("asset_prim.usda", "subAsset_data.json"):
+        path = os.path.join(stage_dir, file_name)
+        with open(path, "w") as file:
+            file.write(name * 100)
+        files.append(path)
+    return files
+
+
+def test_publish_representation(project):
+    collection, root, stage, calls = project
+
+    asset = collection.find_one({"type": "asset", "name": "BoxA"})
+    subset_id = publish_subset.publish(asset["_id"], "assetPrim", ["usd"])
+    version_id = publish_version.publish(subset_id)
+    files = _stage_files(stage, "BoxA")
+
+    reps_id = publish_representation.publish(version_id, "USD", files,
+                                             delete_source=True,
+                                             data={"entryFileName": "a"})
+
+    pub_dir = os.path.join(root, "TestProject", "Set", "BoxA", "publish",
+                           "assetPrim", "v001", "USD")
+    assert sorted(os.listdir(pub_dir)) == ["asset_prim.usda",
+                                           "subAsset_data.json"]
+    assert stat.S_IMODE(os.stat(pub_dir).st_mode) == 0o777
+    assert not os.path.exists(os.path.dirname(files[0]))
+
+    representation = collection.find_one({"_id": reps_id})
+    assert representation["parent"] == version_id
+    assert representation["data"] == {"entryFileName": "a"}
+
+    # Missing file, nothing written
+    assert not publish_representation.publish(version_id, "USD", files)
+    assert collection.count_documents({"type": "representation"}) == 1
+
+
+def test_batched_publish(project):
+    collection, root, stage, calls = project
+
+    publish_engine = engine.PublishEngine(workers=4)
+    assets = list(collection.find({"type": "asset"}))
+
+    for asset in assets * 2:
+        subset_id = publish_subset.publish(asset["_id"], "assetPrim",
+                                           ["usd"], engine=publish_engine)
+        version_id = publish_version.publish(subset_id,
+                                             engine=publish_engine)
+        files = _stage_files(stage, "%s_%s" % (asset["name"], version_id))
+        publish_representation.publish(version_id, "USD", files,
+                                       engine=publish_engine)
+
+    # Nothing written before commit
+    assert collection.count_documents({"type": "version"}) == 0
+    find_one_calls = calls["find_one"]
+
+    publish_engine.commit()
+
+    assert calls["insert_one"] == 0
+    assert calls["insert_many"] == 3
+    assert calls["find_one"] == find_one_calls
+
+    versions = sorted((v["parent"], v["name"]) for v in
+                      collection.find({"type": "version"}))
+    assert [name for _, name in versions] == [1, 2, 1, 2]
+    assert collection.count_documents({"type": "subset"}) == 2
+    assert collection.count_documents({"type": "representation"}) == 4
+
+    pub_dir = os.path.join(root, "TestProject", "Set", "BoxB", "publish",
+                           "assetPrim", "v002", "USD")
+    assert len(os.listdir(pub_dir)) == 2
+
+
+def test_publish_instance_run(project):
+    collection, root, stage, calls = project
+
+    asset = collection.find_one({"type": "asset", "name": "BoxA"})
+    stage_dir = os.path.dirname(_stage_files(stage, "prim")[0])
+
+    def instance_data():
+        return {
+            "assetDoc": asset,
+            "subset": "assetPrim",
+            "family": "reveries.look.asset_prim",
+            "versionNext": 1,
+            "dependencies": {},
+            "publishPathTemplate": os.path.join(root, "{representation}"),
+            "publishPathTemplateData": {},
+            "repr.USD._stage": stage_dir,
+            "repr.USD._files": ["asset_prim.usda", "subAsset_data.json"],
+            "repr.USD._hardlinks": ["asset_prim.usda"],
+            "repr.USD.entryFileName": "asset_prim.usda",
+        }
+
+    context_data = {"results": [{"success": True}],
+                    "time": "20201018T000000Z",
+                    "user": "artist",
+                    "currentMaking": os.path.join(root, "scene.ma")}
+
+    publish_instance.run(instance_data(), context=context_data)
+
+    # Duplicated destination is transferred once
+    assert sorted(os.listdir(os.path.join(root, "USD"))) == [
+        "asset_prim.usda", "subAsset_data.json"]
+
+    version = collection.find_one({"type": "version"})
+    representation = collection.find_one({"type": "representation"})
+    assert representation["parent"] == version["_id"]
+    assert representation["data"] == {"entryFileName": "asset_prim.usda"}
+
+    # Publish again, version existed, representation data updated
+    data = instance_data()
+    data["repr.USD.entryFileName"] = "other.usda"
+    publish_instance.run(data, context=context_data)
+
+    assert collection.count_documents({"type": "version"}) == 1
+    representation = collection.find_one({"type": "representation"})
+    assert representation["data"] == {"entryFileName": "other.usda"}
+
+
+def test_failed_before_commit(project):
+    collection, root, stage, calls = project
+
+    asset = collection.find_one({"type": "asset", "name": "BoxA"})
+
+    publish_engine = engine.PublishEngine()
+    subset_id = publish_subset.publish(asset["_id"], "assetPrim", ["usd"],
+                                       engine=publish_engine)
+    # Queued document is visible to the engine only
+    assert publish_engine.child(asset["_id"], "subset", "assetPrim")
+    assert engine.parenthood.child(asset["_id"], "subset", "assetPrim") is None
+
+    # Failed before commit, engine dropped
+    del publish_engine
+
+    new_subset_id = publish_subset.publish(asset["_id"], "assetPrim", ["usd"])
+    assert new_subset_id != subset_id
+    subset = collection.find_one({"type": "subset"})
+    assert subset["_id"] == new_subset_id
+
+    # Cached after written
+    find_one_calls = calls["find_one"]
+    assert engine.parenthood.child(asset["_id"], "subset", "assetPrim")
+    assert calls["find_one"] == find_one_calls
+
+
+def test_publish_instance_transfer_failed(project):
+    collection, root, stage, calls = project
+
+    asset = collection.find_one({"type": "asset", "name": "BoxA"})
+    stage_dir = os.path.dirname(_stage_files(stage, "prim")[0])
+
+    def instance_data(subset, dependencies):
+        return {
+            "assetDoc": asset,
+            "subset": subset,
+            "family": "reveries.look.asset_prim",
+            "versionNext": 1,
+            "dependencies": dependencies,
+            "publishPathTemplate": os.path.join(root, subset,
+                                                "{representation}"),
+            "publishPathTemplateData": {},
+            "repr.USD._stage": stage_dir,
+            "repr.USD._files": ["asset_prim.usda"],
+            "repr.USD.entryFileName": "asset_prim.usda",
+        }
+
+    context_data = {"results": [{"success": True}],
+                    "time": "20201018T000000Z",
+                    "user": "artist",
+                    "currentMaking": os.path.join(root, "scene.ma")}
+
+    publish_instance.run(instance_data("assetPrim", {}),
+                         context=context_data)
+    version = collection.find_one({"type": "version"})
+
+    os.remove(os.path.join(stage_dir, "asset_prim.usda"))
+    context_data["time"] = "20201019T000000Z"
+
+    # Existed version, data not updated
+    data = instance_data("assetPrim", {})
+    data["repr.USD.entryFileName"] = "other.usda"
+    with pytest.raises(Exception):
+        publish_instance.run(data, context=context_data)
+
+    assert collection.find_one({"type": "version"}) == version
+    representation = collection.find_one({"type": "representation"})
+    assert representation["data"] == {"entryFileName": "asset_prim.usda"}
+
+    # New version, dependency not updated
+    dependencies = {str(version["_id"]): {"count": 1}}
+    with pytest.raises(Exception):
+        publish_instance.run(instance_data("lookPrim", dependencies),
+                             context=context_data)
+
+    assert collection.count_documents({"type": "version"}) == 1
+    assert collection.find_one({"type": "version"}) == version
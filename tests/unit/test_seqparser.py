@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from avalon.vendor import clique
+
+from reveries import lib
+from reveries.tools.seqparser import command
+
+
+FILES = (
+    ["beauty.%04d.exr" % i for i in range(1, 100)] +
+    ["beauty.%d.exr" % i for i in range(1000, 1010)] +
+    ["a_%d.png" % i for i in range(8, 12)] +
+    ["shot.0001.mp4", "shot.0002.mp4", "readme.txt"]
+)
+
+
+def test_find_sequences():
+    patterns = [
+        clique.PATTERNS["frames"],
+        clique.DIGITS_PATTERN,
+    ]
+    collections, _ = clique.assemble(FILES,
+                                     patterns=patterns,
+                                     minimum_items=2)
+    expected = sorted((c.head, c.padding, c.tail, list(c.indexes))
+                      for c in collections)
+
+    found = sorted((s["head"], s["padding"], s["tail"], s["indexes"])
+                   for s in command.find_sequences(FILES))
+
+    assert found == expected
+
+
+def test_scan_sequences_cached():
+    root = tempfile.mkdtemp(prefix="test_seqparser")
+    scan_dir = tempfile.mkdtemp(prefix="test_seqparser_scan")
+    environ = mock.patch.dict(os.environ,
+                              {"REVERIES_SEQPARSER_SCAN_DIR": scan_dir})
+    environ.start()
+
+    for sub in ("", "a", os.path.join("a", "b")):
+        dir_path = os.path.join(root, sub)
+        if not os.path.isdir(dir_path):
+            os.makedirs(dir_path)
+        for name in FILES:
+            open(os.path.join(dir_path, name), "w").close()
+
+    root_mtime = os.stat(root).st_mtime
+    scanned = list(command.scan_sequences(root))
+    assert [relative for relative, _ in scanned] == ["", "a", "a/b"]
+    # Scanning result is not written into render tree
+    assert not os.path.exists(os.path.join(root, command.CACHE_FILE_NAME))
+    assert os.stat(root).st_mtime == root_mtime
+    assert len(os.listdir(scan_dir)) == 1
+
+    list_dir = command._list_dir
+
+    # Rescan from cache
+    with mock.patch.object(command, "_list_dir", wraps=list_dir) as listed:
+        assert list(command.scan_sequences(root)) == scanned
+        assert listed.call_count == 0
+
+    # Only the modified and new directory will be listed
+    os.makedirs(os.path.join(root, "a", "x"))
+    with mock.patch.object(command, "_list_dir", wraps=list_dir) as listed:
+        rescanned = list(command.scan_sequences(root))
+        assert listed.call_args_list == [
+            mock.call(os.path.join(root, "a")),
+            mock.call(os.path.join(root, "a/x")),
+        ]
+
+    assert rescanned == scanned
+    assert "a/x" in command.load_scan(root)
+
+    environ.stop()
+    shutil.rmtree(root)
+    shutil.rmtree(scan_dir)
+
+
+def test_frame_index():
+    index = lib.FrameIndex.from_frames([10, 1, 2, 3, 7, 8, 3])
+
+    assert index.ranges == [[1, 3], [7, 8], [10, 10]]
+    assert len(index) == 6
+    assert list(index) == [1, 2, 3, 7, 8, 10]
+    assert 7 in index
+    assert 4 not in index
+    assert 0 not in index
+    assert 11 not in index
+
+    assert index.gaps() == [[4, 6], [9, 9]]
+    assert index.gaps(0, 12) == [[0, 0], [4, 6], [9, 9], [11, 12]]
+    assert list(index.missing(2, 9)) == [4, 5, 6, 9]
+    assert lib.FrameIndex().gaps() == []
+
+
+def test_scan_sequences_frame_index():
+    root = tempfile.mkdtemp(prefix="test_seqparser")
+    for frame in (1, 2, 3, 5, 6, 9):
+        with open(os.path.join(root, "beauty.%04d.exr" % frame), "w") as fp:
+            fp.write("" if frame == 5 else "exr")
+
+    sequences = list(command.ls_sequences(root))
+    assert len(sequences) == 1
+    sequence = sequences[0]
+
+    assert sequence["frameRanges"] == [[1, 3], [5, 6], [9, 9]]
+    assert sequence["emptyFrames"] == [5]
+
+    index = lib.FrameIndex(sequence["frameRanges"])
+    assert index.gaps(1, 10) == [[4, 4], [7, 8], [10, 10]]
+
+    # From cache
+    assert list(command.ls_sequences(root)) == sequences
+
+    shutil.rmtree(root)
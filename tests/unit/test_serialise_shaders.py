@@ -0,0 +1,60 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def cmds():
+    pytest.importorskip("maya.standalone")
+
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+    return cmds
+
+
+def _assign(cmds, name, members):
+    shader = cmds.shadingNode("lambert", asShader=True, name=name)
+    sg = cmds.sets(renderable=True,
+                   noSurfaceShader=True,
+                   empty=True,
+                   name=name + "SG")
+    cmds.connectAttr(shader + ".outColor", sg + ".surfaceShader")
+    cmds.sets(members, forceElement=sg)
+    return sg
+
+
+def test_serialise_shaders(cmds):
+    from reveries.maya import lib
+
+    cmds.file(new=True, force=True)
+
+    cmds.namespace(add="ns")
+    group = cmds.group(empty=True, name="ROOT")
+    body = cmds.polyCube(name="ns:body")[0]
+    head = cmds.polyCube(name="ns:head")[0]
+    other = cmds.polyCube(name="other")[0]
+    cmds.parent(body, head, group)
+
+    _assign(cmds, "skin", ["|ROOT|ns:body.f[0:2]", "|ROOT|ns:head"])
+    _assign(cmds, "cloth", ["|ROOT|ns:body.f[3:5]", other])
+    _assign(cmds, "unused", [other])
+
+    # Recorded relationships
+    expected = {
+        "skinSG": [
+            "|*:ROOT|*:body.f[0:2]",
+            "|*:ROOT|*:head",
+        ],
+        "clothSG": [
+            "|*:ROOT|*:body.f[3:5]",
+        ],
+    }
+
+    members = [group] + cmds.listRelatives(group,
+                                           allDescendents=True,
+                                           fullPath=True)
+    shader_by_id = lib.serialise_shaders(members, by_name=True)
+
+    assert set(shader_by_id) == set(expected)
+    for shader, shaded in expected.items():
+        assert sorted(shader_by_id[shader]) == sorted(shaded)
@@ -0,0 +1,47 @@
+import os
+import sys
+import runpy
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from reveries import PACKAGE_DIR
+
+
+# Load from file, `reveries.maya` package requires Maya
+shader_memo = runpy.run_path(os.path.join(PACKAGE_DIR,
+                                          "maya",
+                                          "usd",
+                                          "shader_memo.py"))
+ShaderNodeMemo = shader_memo["ShaderNodeMemo"]
+
+
+def test_memo_queries_once():
+    cmds = mock.MagicMock()
+    cmds.nodeType.return_value = "file"
+    cmds.listAttr.return_value = ["fileTextureName", "colorGain"]
+    cmds.getAttr.return_value = [(1.0, 1.0, 1.0)]
+    cmds.listConnections.return_value = None
+    maya = mock.MagicMock(cmds=cmds)
+
+    with mock.patch.dict(sys.modules, {"maya": maya, "maya.cmds": cmds}):
+        memo = ShaderNodeMemo()
+        for material in range(3):
+            assert memo.node_type("file1") == "file"
+            assert memo.attrs("file1") == ["fileTextureName", "colorGain"]
+            assert memo.value("file1", "colorGain") == [(1.0, 1.0, 1.0)]
+            assert memo.value("file1", "fileTextureName",
+                              lambda node, attr: node + ".tif") == "file1.tif"
+            assert memo.connections("file1") == []
+
+    assert cmds.nodeType.call_count == 1
+    assert cmds.listAttr.call_count == 1
+    assert cmds.getAttr.call_count == 1
+    assert cmds.listConnections.call_count == 1
+
+    built = memo.built("/ROOT/Looks/mtl1")
+    built.add("file1")
+    assert "file1" in memo.built("/ROOT/Looks/mtl1")
+    assert "file1" not in memo.built("/ROOT/Looks/mtl2")
@@ -0,0 +1,199 @@
+
+import os
+import time
+import types
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from reveries.common import shotgun_io
+from reveries.common.shotgun_cache import (
+    ShotgunCache,
+    MemoryBackend,
+    SQLiteBackend,
+    JSONBackend,
+)
+
+
+PROJECT = {"type": "Project", "id": 85, "name": "ChimelongPreshow"}
+SHOTS = [
+    {"type": "Shot", "id": i, "code": "Seq01Sh%04d" % (i * 10),
+     "sg_cut_in": 1001, "sg_cut_out": 1001 + i}
+    for i in range(1, 51)
+]
+ASSETS = [
+    {"type": "Asset", "id": 900, "code": "BoxGroup", "name": None,
+     "sg_asset_type": "Set", "tags": [{"name": "USD_SetGroup"}],
+     "assets": [{"name": "BoxA"}, {"name": "BoxB"}]},
+    {"type": "Asset", "id": 901, "code": "BoxA", "name": None,
+     "sg_asset_type": "Prop", "tags": [], "assets": []},
+]
+
+
+def _fake_shotgun_api3():
+    """Fake `shotgun_api3` module which records every server call"""
+    module = types.ModuleType("shotgun_api3")
+    module.calls = list()
+    module.online = True
+
+    def _query(entity_type, filters):
+        entities = {"Project": [PROJECT], "Shot": SHOTS, "Asset": ASSETS}
+        entities = entities[entity_type]
+        for field, _, value in filters:
+            if field != "project":
+                entities = [e for e in entities if e.get(field) == value]
+        return entities
+
+    class Shotgun(object):
+        def __init__(self, server, login=None, password=None):
+            module.calls.append(("connect", server))
+
+        def _request(self, *args):
+            if not module.online:
+                raise socket.error("Connection refused")
+            module.calls.append(args)
+            time.sleep(0.01)
+
+        def find(self, entity_type, filters, fields=None):
+            self._request("find", entity_type)
+            return _query(entity_type, filters)
+
+        def find_one(self, entity_type, filters, fields=None):
+            self._request("find_one", entity_type)
+            found = _query(entity_type, filters)
+            return found[0] if found else None
+
+    module.Shotgun = Shotgun
+    return module
+
+
+@pytest.fixture
+def tempdir():
+    path = tempfile.mkdtemp(prefix="test_shotgun_io")
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    module = _fake_shotgun_api3()
+    monkeypatch.setattr(shotgun_io, "shotgun_api3", module)
+    return module
+
+
+def _requests(module, name=None):
+    return [call for call in module.calls
+            if call[0] != "connect" and (name is None or call[0] == name)]
+
+
+def test_project_and_shot_cached(fake_api):
+    cache = ShotgunCache(backends=[MemoryBackend()], ttl=60)
+
+    for _ in range(5):
+        sg = shotgun_io.ShotgunIO(db_show_name="201912_ChimelongPreshow",
+                                  cache=cache)
+        assert sg.sg_project == PROJECT
+        frame_range = sg.get_frame_range("Seq01Sh0020")
+        assert frame_range["sg_cut_out"] == 1003
+
+    # Tank name missed then fall back to name, one shot query
+    assert len(_requests(fake_api)) == 3
+    # Not connected if all resolved from cache
+    assert len(fake_api.calls) == 4
+
+
+def test_prefetch(fake_api):
+    cache = ShotgunCache(backends=[MemoryBackend()], ttl=60)
+    sg = shotgun_io.ShotgunIO(sg_show_name="ChimelongPreshow", cache=cache)
+    assert sg.prefetch()
+    assert sg.prefetch()
+    assert len(_requests(fake_api, "find")) == 2
+
+    for shot in SHOTS:
+        assert sg.get_frame_range(shot["code"]) == shot
+
+    sets = sg.get_assets(fields=["tags", "assets"],
+                         filters=[["sg_asset_type", "is", "Set"]])
+    assert [asset["code"] for asset in sets] == ["BoxGroup"]
+
+    # All resolved from prefetched data
+    assert len(_requests(fake_api)) == 3
+
+    # Fields not prefetched
+    sg.get_assets(fields=["description"])
+    assert len(_requests(fake_api)) == 4
+
+    # Multi-entity field, "is" means membership, asked to server
+    sg.get_assets(fields=["tags"],
+                  filters=[["tags", "is", {"name": "USD_SetGroup"}]])
+    assert len(_requests(fake_api)) == 5
+
+
+@pytest.mark.parametrize("backend", [SQLiteBackend, JSONBackend])
+def test_offline_mirror(fake_api, tempdir, backend):
+    path = os.path.join(tempdir, "mirror")
+
+    def new_process_cache():
+        return ShotgunCache(backends=[MemoryBackend(), backend(path)],
+                            ttl=60)
+
+    sg = shotgun_io.ShotgunIO(sg_show_name="ChimelongPreshow",
+                              cache=new_process_cache())
+    sg.prefetch()
+    online_requests = len(_requests(fake_api))
+
+    # Other process reads from mirror
+    sg = shotgun_io.ShotgunIO(sg_show_name="ChimelongPreshow",
+                              cache=new_process_cache())
+    assert sg.get_frame_range("Seq01Sh0100")["sg_cut_out"] == 1011
+    assert len(_requests(fake_api)) == online_requests
+
+    # Expired mirror, and server is down
+    fake_api.online = False
+    cache = new_process_cache()
+    cache.ttl = 0
+    sg = shotgun_io.ShotgunIO(sg_show_name="ChimelongPreshow", cache=cache)
+    assert sg.sg_project == PROJECT
+    assert sg.get_frame_range("Seq01Sh0100")["sg_cut_out"] == 1011
+    assert sg.get_frame_range("Seq99Sh0010") == {}
+    assert sg.prefetch()  # Served from expired mirror
+
+    # Nothing cached and server is down
+    sg = shotgun_io.ShotgunIO(sg_show_name="Other",
+                              cache=new_process_cache())
+    assert sg.sg_project is None
+
+
+def test_coalescing():
+    cache = ShotgunCache(backends=[MemoryBackend()], ttl=60)
+    calls = list()
+
+    def fetch():
+        calls.append(None)
+        time.sleep(0.2)
+        return {"code": "Seq01Sh0010"}
+
+    results = list()
+    threads = [threading.Thread(target=lambda: results.append(
+                   cache.get("key", fetch)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"code": "Seq01Sh0010"}] * 8
+
+
+def test_offline_without_cache():
+    cache = ShotgunCache(backends=[MemoryBackend()], ttl=60)
+
+    def fetch():
+        raise socket.error("Connection refused")
+
+    with pytest.raises(socket.error):
+        cache.get("key", fetch)
@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+
+from reveries import texstore, utils
+
+
+def _write(path, content):
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def test_store_dedup():
+    root = tempfile.mkdtemp(prefix="test_texstore")
+    try:
+        src = os.path.join(root, "src")
+        os.makedirs(src)
+        _write(os.path.join(src, "a.tif"), b"texture")
+        _write(os.path.join(src, "b.tif"), b"texture")
+        _write(os.path.join(src, "c.tif"), b"other")
+
+        hasher = utils.AssetHasher(cache=utils.HashCache())
+        store = texstore.TextureStore(os.path.join(root, "store"), hasher)
+
+        paths = [os.path.join(src, name) for name in ("a.tif",
+                                                      "b.tif",
+                                                      "c.tif")]
+        ids = store.ids(paths)
+        a, b, c = (ids[path] for path in paths)
+        assert a == b != c
+        assert a.startswith("c4") and len(a) == 90
+        assert a == utils.hash_file(paths[0])
+
+        assert store.add(paths[0], a)
+        assert not store.add(paths[1], b)  # Same content, not copied
+        assert store.add(paths[2], c)
+        assert store.has(a) and store.has(c)
+
+        dst = os.path.join(root, "publish", "v001", "a.tif")
+        assert store.link(a, dst)
+        assert os.path.samefile(dst, store.blob_path(a))
+
+        store.record(a, version=1, fpattern="a.tif", file="a.tif")
+        store.record(a, version=2, fpattern="b.tif", file="b.tif")
+        assert [e["version"] for e in store.owners(a)] == [1, 2]
+        assert store.owners(c) == []
+
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,105 @@
+import os
+import shutil
+import tempfile
+
+try:
+    import mock
+except ImportError:
+    import unittest.mock as mock
+
+from reveries.transfer import FileTransfer, TransferJournal
+
+
+def _make_files(root, names):
+    paths = list()
+    for name in names:
+        path = os.path.join(root, name)
+        with open(path, "w") as fp:
+            fp.write(name * 100)
+        paths.append(path)
+    return paths
+
+
+def test_file_transfer():
+    src_dir = tempfile.mkdtemp(prefix="test_transfer")
+    dst_dir = os.path.join(tempfile.mkdtemp(prefix="test_transfer"), "v001")
+    sources = _make_files(src_dir, ["a.1001.exr", "a.1002.exr", "b.ma"])
+
+    transfer = FileTransfer(workers=2)
+    for src in sources[:2]:
+        dst = os.path.join(dst_dir, "files", os.path.basename(src))
+        assert transfer.add("files", src, dst)
+        # Duplicated destination
+        assert not transfer.add("files", src, dst)
+
+    dst = os.path.join(dst_dir, "links", "b.ma")
+    assert transfer.add("hardlinks", sources[2], dst)
+
+    stats = transfer.run()
+    assert stats["files"]["count"] == 2
+    assert stats["files"]["bytes"] == 2 * 1000
+    assert stats["hardlinks"]["count"] == 1
+    assert sorted(os.listdir(os.path.join(dst_dir, "files"))) == [
+        "a.1001.exr", "a.1002.exr"]
+
+    # Unchanged files will be skipped
+    transfer = FileTransfer(workers=2)
+    for src in sources[:2]:
+        transfer.add("files", src, os.path.join(dst_dir, "files",
+                                                os.path.basename(src)))
+    stats = transfer.run()
+    assert stats["files"]["count"] == 0
+    assert stats["files"]["skipped"] == 2
+
+    shutil.rmtree(src_dir)
+    shutil.rmtree(os.path.dirname(dst_dir))
+
+
+def test_file_transfer_resume():
+    src_dir = tempfile.mkdtemp(prefix="test_transfer")
+    dst_dir = tempfile.mkdtemp(prefix="test_transfer")
+    journal = os.path.join(dst_dir, ".transfer.journal")
+    sources = _make_files(src_dir, ["a", "b", "c"])
+
+    def add_all(transfer):
+        for src in sources:
+            transfer.add("files", src, os.path.join(dst_dir, "files",
+                                                    os.path.basename(src)))
+
+    # Crash on the second file
+    copy2 = shutil.copy2
+    copied = list()
+
+    def crash_copy(src, dst):
+        if copied:
+            raise OSError("Crashed")
+        copied.append(dst)
+        return copy2(src, dst)
+
+    transfer = FileTransfer(workers=1, journal=journal)
+    add_all(transfer)
+    with mock.patch("shutil.copy2", side_effect=crash_copy):
+        try:
+            transfer.run()
+        except OSError:
+            pass
+        else:
+            assert False, "Should have crashed."
+
+    assert os.path.isfile(journal)
+    assert TransferJournal(journal).done(copied[0])
+
+    # Resume, the first file should not be copied again
+    transfer = FileTransfer(workers=1, journal=journal)
+    add_all(transfer)
+    with mock.patch("shutil.copy2", side_effect=copy2) as copy:
+        stats = transfer.run()
+        assert copy.call_count == 2
+
+    assert stats["files"]["count"] == 2
+    assert stats["files"]["skipped"] == 1
+    # Journal removed after all transfers completed
+    assert not os.path.isfile(journal)
+
+    shutil.rmtree(src_dir)
+    shutil.rmtree(dst_dir)
@@ -1,7 +1,10 @@
 
 import os
+import hashlib
 import tempfile
 
+import pytest
+
 try:
     import mock
 except ImportError:
@@ -187,6 +190,67 @@ def test_asset_hasher():
     hasher.clear()
 
 
+def test_asset_hasher_add_dir_once():
+    import hashlib
+
+    wdir = tempfile.mkdtemp(prefix="test_hash")
+    paths = list()
+    for sub in ("b", "a", os.path.join("a", "c")):
+        os.makedirs(os.path.join(wdir, sub))
+        for name in ("2.txt", "1.txt"):
+            path = os.path.join(wdir, sub, name)
+            with open(path, "w") as foo:
+                foo.write(path)
+            paths.append(path)
+
+    # Each file hashed once, digests combined in walking order
+    expected = reveries.utils.AssetHasher()
+    for path in expected.walk(wdir):
+        with open(path, "rb") as foo:
+            expected.hash_obj.update(hashlib.sha512(foo.read()).digest())
+
+    hasher = reveries.utils.AssetHasher(workers=4)
+    hasher.add_dir(wdir)
+    assert hasher.digest() == expected.digest()
+
+    # Walking order is stable
+    walked = list(hasher.walk(wdir))
+    assert walked == list(hasher.walk(wdir))
+    assert len(walked) == len(paths)
+
+
+def test_asset_hasher_cache():
+    wdir = tempfile.mkdtemp(prefix="test_hash")
+    for name in ("foo", "bar"):
+        with open(os.path.join(wdir, name), "w") as foo:
+            foo.write(name)
+
+    cache_path = os.path.join(tempfile.mkdtemp(), "cache.json")
+    hasher = reveries.utils.AssetHasher(
+        cache=reveries.utils.HashCache(cache_path))
+    hasher.add_dir(wdir)
+    hash_val = hasher.digest()
+    assert os.path.isfile(cache_path)
+
+    cache = reveries.utils.HashCache(cache_path)
+    assert len(cache) == 2
+
+    hasher = reveries.utils.AssetHasher(cache=cache)
+    with mock.patch("hashlib.sha512", wraps=hashlib.sha512) as sha512:
+        hasher.add_dir(wdir)
+        # No file been read
+        assert sha512.call_count == 0
+
+    assert hasher.digest() == hash_val
+
+    # Changed file will be hashed again
+    with open(os.path.join(wdir, "foo"), "w") as foo:
+        foo.write("changed")
+    hasher.clear()
+    hasher.add_dir(wdir)
+    assert hasher.digest() != hash_val
+
+
 @mock.patch.dict('avalon.Session', {"AVALON_APP": "Maya"})
 @mock.patch('avalon.api.registered_root')
 def test_get_representation_path_(registered_root):
@@ -212,3 +276,53 @@ def test_get_representation_path_(registered_root):
 
     assert path == ("ROOT/Blockbuster/Maya/Asset/Hero/publish/"
                     "modelDefault/v005/MayaBinary")
+
+
+def test_geometry_hash_terms():
+    numpy = pytest.importorskip("numpy")
+
+    points = [(0.1 * i, -0.2 * i, 0.3 * i, 1.0) for i in range(1000)]
+
+    # Same as hashing in Python loop
+    expected = 0
+    for i, vt in enumerate(points):
+        expected += reveries.utils._hash_MPoint(*vt) + i
+
+    rows = reveries.utils.as_hash_rows(points, 4)
+    assert isinstance(rows, numpy.ndarray)
+    terms = reveries.utils.geometry_hash_terms("points", rows)
+    assert reveries.utils.accumulate_hash(0, terms) == expected
+
+    # Flatten input
+    flatten = [value for vt in points for value in vt]
+    rows = reveries.utils.as_hash_rows(flatten, 4)
+    terms = reveries.utils.geometry_hash_terms("points", rows)
+    assert reveries.utils.accumulate_hash(0, terms) == expected
+
+    # Pure Python fallback
+    with mock.patch("reveries.utils.numpy", None):
+        rows = reveries.utils.as_hash_rows(points, 4)
+        assert isinstance(rows, list)
+        terms = reveries.utils.geometry_hash_terms("points", rows)
+        assert reveries.utils.accumulate_hash(0, terms) == expected
+
+
+def test_geometry_hash_terms_quantised():
+    pytest.importorskip("numpy")
+
+    uvs = [(0.25 * i, 0.5 * i) for i in range(100)]
+    noisy = [(u + 1e-9, v - 1e-9) for u, v in uvs]
+
+    def uv_hash(data, decimals):
+        rows = reveries.utils.as_hash_rows(data, 2)
+        terms = reveries.utils.geometry_hash_terms("uvmap", rows, decimals)
+        return reveries.utils.accumulate_hash(0, terms)
+
+    assert uv_hash(uvs, None) != uv_hash(noisy, None)
+    assert uv_hash(uvs, 6) == uv_hash(noisy, 6)
+
+    with mock.patch("reveries.utils.numpy", None):
+        assert uv_hash(noisy, 6) == uv_hash(uvs, 6)
+        fallback = uv_hash(noisy, 6)
+
+    assert fallback == uv_hash(noisy, 6)
@@ -0,0 +1,114 @@
+
+import os
+import re
+import random
+import runpy
+
+
+MODULE = os.path.join(os.path.dirname(__file__),
+                      "..", "..", "reveries", "maya", "xgen", "expression.py")
+
+expression = runpy.run_path(MODULE)
+tokenize = expression["tokenize"]
+PATTERNS = expression["PATTERNS"]
+
+
+def parse_by_patterns(text):
+    """Matching patterns one after another like `ExpressionUI`"""
+    modes = ["3dpaint", "file", "vpaint", "", "", "_plain", "_plain"]
+    poses = []
+    result = []
+    for pattern, mode in zip(PATTERNS, modes):
+        regex = re.compile(pattern)
+        offset = 0
+        while True:
+            match = regex.search(text, offset)
+            if match is None:
+                break
+            pos = match.start()
+            offset = pos + 1
+            if pos in poses:
+                continue
+            poses.append(pos)
+
+            if mode == "_plain":
+                item = ("", match.group(1), "", pos)
+            elif mode == "3dpaint":
+                item = (match.group(1), match.group(2),
+                        mode + "," + match.group(3), pos)
+            else:
+                item = (match.group(1), match.group(2), mode, pos)
+            result.append(item)
+
+    return result
+
+
+EXPRESSIONS = [
+    "$x=map('${DESC}/paintmaps/mask');",
+    "$a=map('${DESC}/${HAHA}/mask');#3dpaint,5.0",
+    "$b=map('${DESC}/paintmaps/regionMask/pSphere2.ptx');#3dpaint,5.0aa",
+    "$c=map('${DESC}/paintmaps/mask_${PAL,mySeq}.ptx');#file",
+    "$d=map('${DESC}/noise.%d.map.ptx', 10);#3dpaint,5.0",
+    "$e=map('${DESC}/fenceColor-%04d.ptx', 12);",
+    "$f=map('${DESC}/map_%d', $objectId);#3dpaint,5.0",
+    "$g=map('${DESC}/map-%d.ptx', cycle($objectId, 10, 20));",
+    "$h=map('${DESC}/map-%d.ptx', pick($objectId, 10, 20));#3dpaint,5.0",
+    "map('${DESC}/groom/orient/',0)",
+    "$v = vmap(\"${DESC}/paintmaps/color\");#vpaint",
+    "$v=vmap('${DESC}/paintmaps/color');#file",
+    "$v=map('${DESC}/paintmaps/color');#vpaint",
+    "$w=vmap('${DESC}/paintmaps/color');",
+    "vmap('${DESC}/paintmaps/color')",
+    "$a=map('${DESC}/paintmaps/length');#3dpaint,5.0\n"
+    "$b=map('${DESC}/paintmaps/variate/tweak.ptx');#3dpaint,-1.\n"
+    "$a = $a * $b;\n"
+    "$a",
+    "$a=map('${DESC}/a');   #3dpaint,\n$b=map('${DESC}/b');#file\n"
+    "$c=vmap('${DESC}/c');#vpaint\n$d=map('${DESC}/d');\n"
+    "$e=vmap('${DESC}/e');\nmap('${DESC}/f', 1)\nvmap('${DESC}/g')",
+    "$broken=map(${DESC}/no/quote);",
+    "rand(0, 1)",
+    "",
+]
+
+
+def test_known_expressions():
+    for text in EXPRESSIONS:
+        assert tokenize(text) == parse_by_patterns(text), text
+
+
+def test_token_fields():
+    tokens = tokenize(EXPRESSIONS[1])
+    assert tokens[0] == ("a", "${DESC}/${HAHA}/mask", "3dpaint,5.0", 0)
+    assert tokens[0].file == "${DESC}/${HAHA}/mask"
+    # plain map() inside the named one is matched, too
+    assert tokens[1] == ("", "${DESC}/${HAHA}/mask", "", 3)
+
+
+def _random_statement(rng):
+    return "".join([
+        rng.choice(["", "$a", "$b1", "$", "x"]),
+        rng.choice(["", "=", " = "]),
+        rng.choice(["map(", "vmap(", "map (", "mmap("]),
+        rng.choice(["'", "\"", ""]),
+        rng.choice(["${DESC}/paint/mask", "${DESC}/m_%04d.ptx", "a,b", ""]),
+        rng.choice(["'", "\"", ""]),
+        rng.choice(["", ", 10", ", $objectId", ", cycle($objectId, 1, 2)"]),
+        rng.choice([")", ");", "", ") ;"]),
+        rng.choice(["", "#3dpaint,5.0", " #3dpaint,-1.", "#file", "#vpaint",
+                    "#3dpaint", "#other"]),
+        rng.choice(["", "\n", " ", "$a * $b;\n"]),
+    ])
+
+
+def test_random_expressions():
+    rng = random.Random(0)
+    matched = 0
+    for _ in range(3000):
+        text = "".join(_random_statement(rng)
+                       for _ in range(rng.randint(1, 4)))
+        tokens = tokenize(text)
+        assert tokens == parse_by_patterns(text), text
+        matched += bool(tokens)
+
+    assert matched > 1000